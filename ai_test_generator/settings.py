@@ -164,6 +164,11 @@ CACHES = {
     }
 }
 
+# Wall-clock budget (seconds) for one generate / regenerate request. Keep it
+# below gunicorn's --timeout 180 (docker/start.sh) so functions that run out
+# degrade to template fallbacks instead of the worker being killed.
+GENERATION_BUDGET_S = config("GENERATION_BUDGET_S", default=150, cast=float)
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
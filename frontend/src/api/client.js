@@ -28,6 +28,21 @@ function setAccessToken(access) {
   }
 }
 
+// --------- refresh the access token (also used by fetch-based callers) ---------
+export async function refreshAccessToken() {
+  const refresh = getRefreshToken();
+  if (!refresh) throw new Error("No refresh token.");
+
+  const { data } = await axios.post(
+    `${import.meta.env.VITE_API_BASE}/token/refresh/`,
+    { refresh }
+  );
+
+  // Save new access token in the correct storage
+  setAccessToken(data.access);
+  return data.access;
+}
+
 // --------- attach access token on every request ---------
 client.interceptors.request.use((config) => {
   const token = getAccessToken(); // now checks both storages
@@ -66,16 +81,10 @@ client.interceptors.response.use(
       refreshing = true;
 
       try {
-        const { data } = await axios.post(
-          `${import.meta.env.VITE_API_BASE}/token/refresh/`,
-          { refresh }
-        );
-
-        // Save new access token in the correct storage
-        setAccessToken(data.access);
+        const access = await refreshAccessToken();
 
         // Update the header for the original request
-        original.headers.Authorization = `Bearer ${data.access}`;
+        original.headers.Authorization = `Bearer ${access}`;
 
         // Resolve queued requests
         queue.forEach(({ res }) => res(client(original)));
@@ -1,5 +1,6 @@
 // src/api/items.js
-import client from "./client";
+import client, { refreshAccessToken } from "./client";
+import { getAccessToken, clearTokens } from "./auth";
 
 export async function addItem(sessionId, { pasted_code, file, modelMode = "base" }) {
   if (file) {
@@ -19,12 +20,116 @@ export async function addItem(sessionId, { pasted_code, file, modelMode = "base"
   return data;
 }
 
-export async function regenerate(sessionId, itemId, modelMode = "base") {
+export async function regenerate(sessionId, itemId, modelMode = "base", functions = null) {
   const params = new URLSearchParams();
   if (itemId) params.set("item_id", itemId);
   params.set("mode", modelMode); // ✅ backend reads query_params too
+  // optional: only regenerate these function names, keep the rest
+  if (functions && functions.length) params.set("functions", functions.join(","));
 
   const qs = params.toString() ? `?${params.toString()}` : "";
   const { data } = await client.post(`/regenerate/${sessionId}/${qs}`);
   return data;
-}
\ No newline at end of file
+}
+
+// Streaming variant of addItem: the backend sends server-sent events
+// (functions / phase / rejected / accepted / item / error) while it works.
+// onEvent(kind, data) is called for each one; resolves with the saved item.
+// Falls back to addItem (no progress events) where streaming is unavailable.
+export async function addItemStream(
+  sessionId,
+  { pasted_code, file, modelMode = "base" },
+  onEvent = () => {}
+) {
+  if (typeof ReadableStream === "undefined" || typeof TextDecoder === "undefined") {
+    return addItem(sessionId, { pasted_code, file, modelMode });
+  }
+
+  let body;
+  const headers = { Accept: "text/event-stream" };
+
+  if (file) {
+    body = new FormData();
+    body.append("uploaded_code", file);
+    body.append("mode", modelMode);
+  } else {
+    body = JSON.stringify({ pasted_code, mode: modelMode });
+    headers["Content-Type"] = "application/json";
+  }
+
+  // fetch skips the axios interceptors, so refresh + retry once on 401 here
+  const post = (token) =>
+    fetch(`${import.meta.env.VITE_API_BASE}/sessions/${sessionId}/items/stream/`, {
+      method: "POST",
+      headers: token ? { ...headers, Authorization: `Bearer ${token}` } : headers,
+      body,
+    });
+
+  let res = await post(getAccessToken());
+  if (res.status === 401) {
+    let access;
+    try {
+      access = await refreshAccessToken();
+    } catch (e) {
+      clearTokens();
+      window.location.replace("/login");
+      throw e;
+    }
+    res = await post(access);
+  }
+
+  // no stream endpoint (older backend / proxy): use the plain request
+  if (res.status === 404 || res.status === 405) {
+    return addItem(sessionId, { pasted_code, file, modelMode });
+  }
+  if (!res.ok) {
+    let msg = `Generation failed (${res.status}).`;
+    try {
+      const data = await res.json();
+      msg = data.error || data.detail || msg;
+    } catch {
+      // not JSON (e.g. an HTML error page)
+    }
+    throw new Error(msg);
+  }
+  if (!res.body) return addItem(sessionId, { pasted_code, file, modelMode });
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  let item = null;
+  let error = null;
+
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    // events are separated by a blank line
+    let sep;
+    while ((sep = buffer.indexOf("\n\n")) !== -1) {
+      const raw = buffer.slice(0, sep);
+      buffer = buffer.slice(sep + 2);
+
+      let kind = "message";
+      let data = "";
+      for (const line of raw.split("\n")) {
+        if (line.startsWith("event: ")) kind = line.slice(7);
+        else if (line.startsWith("data: ")) data += line.slice(6);
+      }
+      if (!data) continue; // keep-alive comment
+
+      const parsed = JSON.parse(data);
+      if (kind === "item") item = parsed;
+      else if (kind === "error") error = parsed;
+      onEvent(kind, parsed);
+    }
+  }
+
+  if (error || !item) {
+    const msg =
+      (error && (error.error || error.detail)) || "Generation failed.";
+    throw new Error(msg);
+  }
+  return item;
+}
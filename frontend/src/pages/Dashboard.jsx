@@ -15,7 +15,7 @@ import {
   deleteSession,
   updateSession,
 } from "../api/sessions";
-import { addItem, regenerate } from "../api/items";
+import { addItemStream, regenerate } from "../api/items";
 import Logo from "../components/Logo";
 import CodeEditor from "../components/CodeEditor";
 
@@ -157,6 +157,8 @@ export default function Dashboard() {
   const [file, setFile] = useState(null);
   const [fileErr, setFileErr] = useState("");
   const [toast, setToast] = useState("");
+  // Live progress while a generation streams in (function -> test)
+  const [liveTests, setLiveTests] = useState({});
   const fileRef = useRef(null);
   const [code, setCode] = useState("");
   const [menuOpenId, setMenuOpenId] = useState(null);
@@ -250,14 +252,30 @@ export default function Dashboard() {
     onError: () => setToast("Failed to create session."),
   });
 
+  function handleStreamEvent(kind, data) {
+    if (kind === "functions") {
+      setLiveTests(
+        Object.fromEntries((data.names || []).map((n) => [n, null]))
+      );
+    } else if (kind === "phase") {
+      setToast(`${data.function}(): ${data.phase}…`);
+    } else if (kind === "accepted") {
+      setLiveTests((prev) => ({ ...prev, [data.function]: data.test }));
+    }
+  }
+
   const addItemMut = useMutation({
     mutationFn: async (payload) => {
       if (!activeId) throw new Error("No active session.");
-      return addItem(activeId, payload);
+      return addItemStream(activeId, payload, handleStreamEvent);
     },
     onMutate: () => {
+      setLiveTests({});
       setToast("Generation started…");
     },
+    onSettled: () => {
+      setLiveTests({});
+    },
     onSuccess: () => {
       qc.invalidateQueries({ queryKey: ["session", activeId] });
       qc.invalidateQueries({ queryKey: ["sessions"] });
@@ -841,6 +859,9 @@ export default function Dashboard() {
                   <option value="edge" style={{ color: "#111" }}>
                     Edge (Edge-case)
                   </option>
+                  <option value="small" style={{ color: "#111" }}>
+                    Fast (Small model)
+                  </option>
                 </select>
               </div>
             </div>
@@ -982,6 +1003,38 @@ export default function Dashboard() {
             )}
           </div>
 
+          {/* Live (streaming) results for the generation in progress */}
+          {isGenerating && Object.keys(liveTests).length > 0 && (
+            <div
+              style={{
+                marginTop: 20,
+                background: theme.cardBg,
+                border: theme.cardBorder,
+                borderRadius: 12,
+                padding: 16,
+              }}
+            >
+              <div style={{ opacity: 0.8, marginBottom: 6 }}>
+                Generating tests…
+              </div>
+              {Object.entries(liveTests).map(([fn, test]) => (
+                <pre
+                  key={fn}
+                  style={{
+                    margin: "0 0 10px",
+                    whiteSpace: "pre-wrap",
+                    fontFamily:
+                      "ui-monospace, SFMono-Regular, Menlo, monospace",
+                    fontSize: 13,
+                    opacity: test ? 1 : 0.6,
+                  }}
+                >
+                  {test || `# ${fn}(): waiting…`}
+                </pre>
+              ))}
+            </div>
+          )}
+
           {/* Results */}
           {activeItems.length > 0 && (
             <div style={{ marginTop: 20, display: "grid", gap: 20 }}>
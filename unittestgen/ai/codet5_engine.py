@@ -2,9 +2,17 @@
 # pylint: disable=eval-used
 import os
 import re
+import sys
 import ast
+import signal
+import time
+import hashlib
 import textwrap
-from functools import lru_cache
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from multiprocessing import Pipe
 import math
 import difflib
 import unicodedata
@@ -12,7 +20,16 @@ import pytest
 from typing import Any, Tuple, List, Optional
 
 import torch
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+from transformers import (
+    AutoTokenizer,
+    AutoModelForSeq2SeqLM,
+    LogitsProcessor,
+    LogitsProcessorList,
+    StoppingCriteria,
+    StoppingCriteriaList,
+)
+
+from .verdict_cache import VerdictCache
 
 
 # -----------------------------
@@ -32,6 +49,42 @@ _VALIDATOR_DEBUG = os.environ.get("VALIDATOR_DEBUG", "0") not in {
     "", "0", "false", "False"}
 _BYPASS_VALIDATOR = os.environ.get("BYPASS_VALIDATOR", "0") not in {
     "", "0", "false", "False"}
+# Header of BYPASS_VALIDATOR output; callers use it to tell unvalidated tests apart
+UNVALIDATED_ORIGIN = "# origin: raw_unvalidated"
+# Stop decoding a candidate once its test function is complete (see _test_end)
+_STOP_AT_TEST_END = os.environ.get("STOP_AT_TEST_END", "1") not in {
+    "", "0", "false", "False"}
+# Validator verdict memo (see _check_test). Bump VALIDATOR_VERSION whenever
+# a validator rule changes so stale verdicts are never reused.
+VALIDATOR_VERSION = "1"
+_VERDICTS = VerdictCache(
+    os.environ.get("VERDICT_CACHE_PATH", ".verdict_cache.sqlite3"),
+    max_entries=int(os.environ.get("VERDICT_CACHE_SIZE", "4096")),
+    max_db_entries=int(os.environ.get("VERDICT_CACHE_DB_SIZE", "100000")),
+)
+# Candidate execution: in-process exec by default. The per-function fork
+# server (see _ForkServer, Linux only) costs ~5 ms per candidate against
+# <1 ms in-process, so it is opt-in: EXEC_FORK_SERVER=1 for every function,
+# =auto only for snippets with top-level imports (re-exec'd per candidate
+# otherwise). See _ForkServer for the fork-in-a-threaded-process caveat.
+_EXEC_FORK_SERVER = os.environ.get("EXEC_FORK_SERVER", "0").strip().lower()
+_USE_FORK_SERVER = (
+    sys.platform.startswith("linux") and hasattr(os, "fork")
+    and _EXEC_FORK_SERVER not in {"", "0", "false"}
+)
+CANDIDATE_TIMEOUT_S = float(os.environ.get("CANDIDATE_TIMEOUT_S", "5"))
+# Opt-in: rewrite wrong literal RHS values of `assert fn(...) == rhs` and
+# re-validate instead of discarding the candidate (see _repair_assert_rhs)
+_REPAIR_ASSERTS = os.environ.get("REPAIR_ASSERTS", "0") not in {
+    "", "0", "false", "False"}
+# Extra passing candidates kept per function for later regenerations
+# (see _collect_spares); 0 disables the reservoir
+REGEN_RESERVOIR_SIZE = int(os.environ.get("REGEN_RESERVOIR_SIZE", "3"))
+# Constrained decoding (see _decode_constraints); both off by default
+_FORCE_TEST_HEADER = os.environ.get("FORCE_TEST_HEADER", "0") not in {
+    "", "0", "false", "False"}
+_BAN_FOREIGN_CALLS = os.environ.get("BAN_FOREIGN_CALLS", "0") not in {
+    "", "0", "false", "False"}
 
 
 def _vd(msg: str) -> None:
@@ -39,6 +92,45 @@ def _vd(msg: str) -> None:
         print(f"[validator] {msg}")
 
 
+def _emit(on_event, kind: str, **data) -> None:
+    """
+    Report a progress event to an optional listener (e.g. the SSE view).
+    Kinds: functions, phase, rejected, duplicates, spare, degraded, accepted.
+    A broken listener must never break generation.
+    """
+    if on_event is None:
+        return
+    try:
+        on_event(kind, data)
+    except Exception as e:   # pylint: disable=broad-exception-caught
+        print(f"[events] listener failed on {kind!r}: {e}")
+
+
+def _time_left(deadline: float | None) -> float:
+    """Seconds until a time.monotonic() deadline (inf when there is none)."""
+    return math.inf if deadline is None else deadline - time.monotonic()
+
+
+def _function_deadline(deadline: float | None, n_left: int) -> float | None:
+    """Fair share of what is left of a request deadline for the next of
+    `n_left` functions, so one slow function can't starve the rest."""
+    if deadline is None:
+        return None
+    return time.monotonic() + max(0.0, _time_left(deadline)) / max(1, n_left)
+
+
+def _generate_time_limit(deadline: float | None) -> dict:
+    """generate() kwargs that stop decoding at `deadline` (none without one)."""
+    if deadline is None:
+        return {}
+    return {"max_time": max(0.1, _time_left(deadline))}
+
+
+def _degraded(on_event, func_name: str, reason: str) -> None:
+    print(f"[budget] {func_name}: {reason}")
+    _emit(on_event, "degraded", function=func_name, reason=reason)
+
+
 # -----------------------------
 # Model path (from env)
 # -----------------------------
@@ -50,6 +142,119 @@ EDGE_MODEL_DIR = os.environ.get(
     "EDGE_MODEL_PATH",
     "Oluwaferanmiii/codet5p-220m-pytest-edge-generator",
 )
+# Distilled student (manage.py distill + finetune --profile student).
+# Behaves like "base" everywhere except which weights are loaded.
+SMALL_MODEL_DIR = os.environ.get("SMALL_MODEL_PATH", "")
+
+# mode -> model dir actually loaded; use_model_dir() swaps entries at runtime
+_MODEL_DIRS = {
+    "base": BASE_MODEL_DIR,
+    "edge": EDGE_MODEL_DIR,
+    "small": SMALL_MODEL_DIR,
+}
+SERVING_MODES = tuple(_MODEL_DIRS)
+
+
+def _validator_mode(mode: str | None) -> str:
+    """The validator rule set for a serving mode: "edge" keeps its own,
+    everything else (incl. the "small" student) is held to the base rules."""
+    mode = (mode or "base").strip().lower()
+    return mode if mode == "edge" else "base"
+
+# -----------------------------
+# Inference backend (from env)
+# -----------------------------
+# "torch" (default) or "onnx": ONNX Runtime on CPU via optimum. The first
+# load exports encoder / decoder / decoder-with-past to ONNX_CACHE_DIR;
+# later loads reuse the export while the source weights are unchanged.
+INFERENCE_BACKEND = os.environ.get("INFERENCE_BACKEND", "torch").strip().lower()
+ONNX_CACHE_DIR = os.environ.get("ONNX_CACHE_DIR", ".onnx_cache")
+
+
+# Written next to an export: _weights_fingerprint of the weights it came from
+_ONNX_SOURCE_STAMP = "source_fingerprint.txt"
+
+
+def onnx_export_dir(model_dir: str) -> str:
+    """Where the ONNX export of `model_dir` (local path or hub id) is kept."""
+    slug = re.sub(r"[^\w.-]+", "_", model_dir).strip("._") or "model"
+    return os.path.join(ONNX_CACHE_DIR, slug)
+
+
+def _weights_fingerprint(model_dir: str) -> str:
+    """
+    Cheap identity of a local model dir: name, size and mtime of its files,
+    so retraining into the same dir invalidates the export. A hub id has no
+    local files and is its own identity.
+    """
+    if not os.path.isdir(model_dir):
+        return model_dir
+    h = hashlib.sha256()
+    for name in sorted(os.listdir(model_dir)):
+        path = os.path.join(model_dir, name)
+        if os.path.isfile(path):
+            st = os.stat(path)
+            h.update(f"{name}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _onnx_export_is_current(export_dir: str, fingerprint: str) -> bool:
+    try:
+        with open(os.path.join(export_dir, _ONNX_SOURCE_STAMP), "r", encoding="utf-8") as fh:
+            return fh.read().strip() == fingerprint
+    except OSError:
+        return False
+
+
+def _load_onnx_model(model_dir: str):
+    """ORTModelForSeq2SeqLM for `model_dir`, exporting on first use; None if unavailable."""
+    try:
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    except ImportError:
+        print("[codet5_engine] INFERENCE_BACKEND=onnx needs optimum[onnxruntime]; "
+              "using torch")
+        return None
+
+    export_dir = onnx_export_dir(model_dir)
+    fingerprint = _weights_fingerprint(model_dir)
+    if _onnx_export_is_current(export_dir, fingerprint):
+        return ORTModelForSeq2SeqLM.from_pretrained(
+            export_dir, use_cache=True, provider="CPUExecutionProvider")
+    if os.path.isdir(export_dir):
+        print(f"[codet5_engine] ONNX export {export_dir} does not match the "
+              f"weights in {model_dir} (retrained?); re-exporting")
+
+    print(f"[codet5_engine] Exporting {model_dir} to ONNX: {export_dir}")
+    mdl = ORTModelForSeq2SeqLM.from_pretrained(
+        model_dir, export=True, use_cache=True, provider="CPUExecutionProvider")
+    mdl.save_pretrained(export_dir)
+    with open(os.path.join(export_dir, _ONNX_SOURCE_STAMP), "w", encoding="utf-8") as fh:
+        fh.write(fingerprint)
+    return mdl
+
+
+def use_model_dir(mode: str, model_dir: str) -> None:
+    """
+    Serve `mode` from `model_dir` (e.g. a training checkpoint) from now on.
+    Drops every cached model so the next call loads the new weights.
+    """
+    _MODEL_DIRS[mode] = model_dir
+    _load_model_and_tokenizer.cache_clear()
+
+
+@contextmanager
+def fresh_verdict_cache():
+    """
+    Validate with an empty, memory-only verdict cache inside the block;
+    the shared one is restored afterwards. For timings that must not
+    depend on verdicts an earlier run left in the shared cache.
+    """
+    global _VERDICTS   # pylint: disable=global-statement
+    shared, _VERDICTS = _VERDICTS, VerdictCache()
+    try:
+        yield _VERDICTS
+    finally:
+        _VERDICTS = shared
 
 # -----------------------------
 # Lazy single-load (cached)
@@ -57,26 +262,31 @@ EDGE_MODEL_DIR = os.environ.get(
 
 
 @lru_cache(maxsize=None)
-def _load_model_and_tokenizer(mode: str = "base"):
+def _load_model_and_tokenizer(mode: str = "base", backend: str | None = None):
     """
     Load tokenizer + model for either:
       - mode='base'  → BASE_MODEL_DIR
       - mode='edge'  → EDGE_MODEL_DIR  (falls back to base if env not set)
+      - mode='small' → SMALL_MODEL_DIR (falls back to base if env not set)
+
+    backend: "torch" (eager PyTorch) or "onnx" (ONNX Runtime, CPU);
+    defaults to INFERENCE_BACKEND. Both expose the same .generate().
     """
-    if mode == "edge":
-        model_dir = EDGE_MODEL_DIR
-    else:
-        # default / unknown → base
-        model_dir = BASE_MODEL_DIR
+    # default / unknown → base
+    model_dir = _MODEL_DIRS.get(mode) or _MODEL_DIRS["base"]
+    backend = (backend or INFERENCE_BACKEND).strip().lower()
 
     tok = AutoTokenizer.from_pretrained(model_dir)
-    mdl = AutoModelForSeq2SeqLM.from_pretrained(model_dir)
-    mdl.to(DEVICE)
-    mdl.eval()
+    mdl = _load_onnx_model(model_dir) if backend == "onnx" else None
+    if mdl is None:
+        backend = "torch"
+        mdl = AutoModelForSeq2SeqLM.from_pretrained(model_dir)
+        mdl.to(DEVICE)
+        mdl.eval()
     torch.set_grad_enabled(False)
     print(
         f"[codet5_engine] Model & tokenizer loaded (cached) "
-        f"- mode={mode}, dir={model_dir}"
+        f"- mode={mode}, backend={backend}, dir={model_dir}"
     )
     return tok, mdl
 
@@ -102,6 +312,31 @@ def _extract_function_defs(code_snippet: str) -> list[tuple[str, str]]:
     return fn_defs
 
 
+def _function_fingerprint(func_src: str) -> str:
+    """
+    Content hash of a function's *normalized* AST: formatting, comments and
+    the docstring do not change it, any change to the code does.
+    """
+    src = textwrap.dedent(func_src or "").strip()
+    try:
+        tree = ast.parse(src)
+    except SyntaxError:
+        return hashlib.sha256(src.encode("utf-8")).hexdigest()
+
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            body = node.body
+            if (
+                len(body) > 1
+                and isinstance(body[0], ast.Expr)
+                and isinstance(body[0].value, ast.Constant)
+                and isinstance(body[0].value.value, str)
+            ):
+                node.body = body[1:]
+
+    return hashlib.sha256(ast.dump(tree).encode("utf-8")).hexdigest()
+
+
 def _extract_function_name(code_snippet: str) -> str:
     """
     Extract a function name from the snippet.
@@ -399,27 +634,44 @@ def _normalize_test_for_similarity(txt: str) -> str:
     return joined.lower().strip()
 
 
-def _too_similar(a: str, b: str, *, threshold: float = 0.88) -> bool:
+def _similarity_profile(txt: str) -> tuple[str, Counter]:
     """
-    Return True if two tests are "too similar" to be considered a regeneration.
-    Uses:
-      - normalized text similarity
-      - argument patterns of calls to the target function
+    Normalized text + its character counts. Build it once per test and pass
+    it to _too_similar instead of the text to skip re-normalizing.
     """
-    na = _normalize_test_for_similarity(a)
-    nb = _normalize_test_for_similarity(b)
+    norm = _normalize_test_for_similarity(txt)
+    return norm, Counter(norm)
+
 
+def _too_similar(a, b, *, threshold: float = 0.88) -> bool:
+    """
+    Return True if two tests are "too similar" to be considered a regeneration.
+    `a` (the earlier test) / `b` are test sources or _similarity_profile()s.
+
+    The verdict is exactly SequenceMatcher(None, a, b).ratio() >= threshold
+    on the normalized texts. ratio() is quadratic-ish, so it only runs when
+    both of its cheap upper bounds (real_quick_ratio: lengths, quick_ratio:
+    character counts) reach the threshold; most candidates stop there.
+    Call argument patterns are compared in the regen helper, which knows
+    func_name.
+    """
+    na, ca = a if isinstance(a, tuple) else _similarity_profile(a)
+    nb, cb = b if isinstance(b, tuple) else _similarity_profile(b)
     if not na or not nb:
         return False
 
-    ratio = difflib.SequenceMatcher(None, na, nb).ratio()
-    if ratio >= threshold:
-        return True
+    total = len(na) + len(nb)
+    if 2.0 * min(len(na), len(nb)) / total < threshold:
+        return False
+    if 2.0 * sum((ca & cb).values()) / total < threshold:
+        return False
+    return difflib.SequenceMatcher(None, na, nb).ratio() >= threshold
 
-    # Optional: compare literal call argument patterns if same target used.
-    # We don't know func_name here, so this part will be done in the regen helper
-    # where func_name is known.
-    return False
+
+def _too_similar_any(profile: tuple[str, Counter], history: list[tuple[str, Counter]],
+                     *, threshold: float = 0.88) -> bool:
+    """_too_similar(earlier, profile) for every profile of an item's earlier tests."""
+    return any(_too_similar(h, profile, threshold=threshold) for h in history)
 
 # ---------- NEW: stronger AST-based operation inference ----------
 
@@ -624,7 +876,7 @@ def _has_foreign_calls(test_src: str, target: str, *, mode: str = "base") -> boo
         "list", "tuple", "dict", "str", "reversed"
     }
 
-    if mode == "edge":
+    if _validator_mode(mode) == "edge":
         allow_names |= {"isinstance", "type",
                         "repr", "bool", "map", "filter", "zip"}
 
@@ -722,6 +974,326 @@ def _count_checks(src: str) -> int:
     return checks
 
 
+def _clean_code(s: str) -> str:
+    """Minimal hardening: normalize newlines, remove invisible/control chars."""
+    if not s:
+        return ""
+    # Normalize newlines
+    s = s.replace("\r\n", "\n").replace("\r", "\n")
+    # Strip a run of BOM/ZW/RTL/NBSP at the very start (common cause of "line 1" SyntaxError)
+    s = re.sub(
+        r"^[\ufeff\u200b\u200c\u200d\u202a-\u202e\u2060-\u2063\u00a0]+", "", s)
+    # Remove other control characters globally (keep newline and tab)
+    s = "".join(ch for ch in s if (
+        unicodedata.category(ch)[0] != "C" or ch in "\n\t"))
+    return s
+
+
+# -----------------------------
+# Candidate execution (fork server)
+# -----------------------------
+# Verdicts that depend on load, not on the code, are never memoized
+_TRANSIENT_REASONS = ("timed out", "candidate process died", "fork server")
+
+
+def _serve_candidates(conn, func_src: str, timeout: float) -> None:
+    """
+    Fork-server loop (runs in the server process). The user module is
+    exec'd once; every job runs in a copy-on-write child of this process,
+    so it sees the module's globals but can't disturb them. Jobs:
+      ("check", test_src, target_name, mode, num_asserts) -> (ok, reason)
+      ("calls", target_name, calls)                       -> _call_target()
+    """
+    ns: dict = {"pytest": pytest}
+    try:
+        exec(func_src, ns, ns)   # pylint: disable=exec-used
+        setup_error = None
+    except Exception as e:       # pylint: disable=broad-exception-caught
+        setup_error = f"exec raised: {type(e).__name__}: {e}"
+
+    while True:
+        try:
+            msg = conn.recv()
+        except (EOFError, OSError):
+            break
+        if msg is None:
+            break
+        kind, args = msg[0], msg[1:]
+        if setup_error:
+            conn.send((False, setup_error) if kind == "check" else None)
+            continue
+
+        reader, writer = Pipe(duplex=False)
+        pid = os.fork()
+        if pid == 0:
+            reader.close()
+            try:
+                if kind == "check":
+                    result = _exec_checks(func_src, *args, ns=ns)
+                else:
+                    result = _call_target(ns, *args)
+            except BaseException as e:   # pylint: disable=broad-exception-caught
+                result = (False, f"exec raised: {type(e).__name__}: {e}")
+            try:
+                writer.send(result)
+            finally:
+                os._exit(0)
+
+        writer.close()
+        if reader.poll(timeout):
+            try:
+                result = reader.recv()
+            except (EOFError, OSError):
+                result = (False, "candidate process died")
+        else:
+            os.kill(pid, signal.SIGKILL)
+            result = (False, f"timed out after {timeout:g}s")
+        reader.close()
+        os.waitpid(pid, 0)
+        conn.send(result)
+
+
+class _ForkServer:
+    """
+    Per-function candidate runner: a forked process that holds the exec'd
+    user module and forks one child per candidate (see _serve_candidates).
+    Started lazily, so verdict-cache hits never pay for the fork.
+
+    Caveat: os.fork() from a threaded process (gunicorn threads, the SSE /
+    archive worker threads, torch's thread pools) copies only the calling
+    thread. A lock another thread held at fork time (stdout, logging, the
+    allocator) stays locked in the child forever. The server then hangs
+    until the `timeout + 5` poll gives up; it is marked broken and the
+    function falls back to in-process exec. Hence opt-in (EXEC_FORK_SERVER).
+    """
+
+    def __init__(self, func_src: str, timeout: float | None = None):
+        self.func_src = func_src
+        self.timeout = CANDIDATE_TIMEOUT_S if timeout is None else timeout
+        self.pid = None
+        self.conn = None
+        self.broken = False
+
+    def _start(self) -> None:
+        parent_conn, child_conn = Pipe()
+        pid = os.fork()
+        if pid == 0:
+            parent_conn.close()
+            try:
+                _serve_candidates(child_conn, self.func_src, self.timeout)
+            finally:
+                os._exit(0)
+        child_conn.close()
+        self.pid, self.conn = pid, parent_conn
+
+    def check(self, test_src: str, target_name: str, mode: str,
+              num_asserts: int) -> tuple[bool, str] | None:
+        """Verdict from a forked child, or None if the server is unusable."""
+        return self._run("check", test_src, target_name, mode, num_asserts)
+
+    def call_target(self, target_name: str, calls: list) -> list | None:
+        """_call_target() in a forked child, or None if unusable / timed out."""
+        result = self._run("calls", target_name, calls)
+        return result if isinstance(result, list) else None
+
+    def _run(self, *job):
+        if self.broken:
+            return None
+        try:
+            if self.conn is None:
+                self._start()
+            self.conn.send(job)
+            if not self.conn.poll(self.timeout + 5):
+                raise TimeoutError("no reply")
+            return self.conn.recv()
+        except (OSError, EOFError, TimeoutError) as e:
+            print(f"[exec] fork server failed ({e}); running candidates in-process")
+            self.broken = True
+            self.close()
+            return None
+
+    def close(self) -> None:
+        if self.conn is not None:
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+            self.conn.close()
+            self.conn = None
+        if self.pid is not None:
+            try:
+                if os.waitpid(self.pid, os.WNOHANG) == (0, 0):
+                    os.kill(self.pid, signal.SIGKILL)
+                    os.waitpid(self.pid, 0)
+            except ChildProcessError:
+                pass
+            self.pid = None
+
+
+_EXEC_LOCAL = threading.local()
+
+
+def _has_top_level_imports(src: str) -> bool:
+    """True when exec'ing `src` imports modules, i.e. worth a fork server."""
+    try:
+        tree = ast.parse(_clean_code(src))
+    except (SyntaxError, ValueError):
+        return False
+    return any(isinstance(node, (ast.Import, ast.ImportFrom)) for node in tree.body)
+
+
+@contextmanager
+def _fork_server(func_src: str):
+    """Route _check_test calls for `func_src` through a _ForkServer while active."""
+    if (not _USE_FORK_SERVER or getattr(_EXEC_LOCAL, "server", None) is not None
+            or (_EXEC_FORK_SERVER == "auto" and not _has_top_level_imports(func_src))):
+        yield
+        return
+    server = _ForkServer(_clean_code(func_src))
+    _EXEC_LOCAL.server = server
+    try:
+        yield
+    finally:
+        _EXEC_LOCAL.server = None
+        server.close()
+
+
+def _with_fork_server(fn):
+    """Decorator: one fork server per call, for functions taking code_snippet first."""
+    @wraps(fn)
+    def wrapper(code_snippet, *args, **kwargs):
+        with _fork_server(code_snippet):
+            return fn(code_snippet, *args, **kwargs)
+    return wrapper
+
+
+def _call_target(ns: dict, target_name: str, calls: list) -> list:
+    """
+    Evaluate target(*args, **kwargs) for literal argument lists. Each entry
+    is ("ok", value) when the value can be written back as a literal, else
+    ("skip", None).
+    """
+    def _plain(v) -> bool:
+        if v is None or isinstance(v, (bool, int, str, bytes)):
+            return True
+        if isinstance(v, float):
+            return math.isfinite(v)
+        if isinstance(v, (list, tuple, set)):
+            return all(_plain(x) for x in v)
+        if isinstance(v, dict):
+            return all(_plain(k) and _plain(x) for k, x in v.items())
+        return False
+
+    f = ns.get(target_name)
+    out = []
+    for args, kwargs in calls:
+        try:
+            value = f(*args, **kwargs)
+        except Exception:   # pylint: disable=broad-exception-caught
+            value = _call_target      # sentinel: not a literal
+        out.append(("ok", value) if _plain(value) else ("skip", None))
+    return out
+
+
+def _literal_call(node: ast.AST, func_name: str):
+    """(args, kwargs) if `node` is func_name(<literals only>), else None."""
+    if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+            and node.func.id == func_name):
+        return None
+    try:
+        args = [ast.literal_eval(a) for a in node.args]
+        kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in node.keywords if kw.arg}
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+    if any(kw.arg is None for kw in node.keywords):
+        return None
+    return args, kwargs
+
+
+def _repair_assert_rhs(func_src: str, test_src: str, func_name: str) -> str | None:
+    """
+    For every `assert fn(<literals>) == <literal>` (either side), run fn on
+    the literal arguments and rewrite the literal to the actual result.
+    Returns the repaired test, or None when nothing could be changed.
+    Execution goes through the active fork server when there is one.
+    """
+    try:
+        tree = ast.parse(test_src)
+    except SyntaxError:
+        return None
+
+    sites = []   # (compare node, literal side: 0 = left / 1 = right, (args, kwargs))
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Assert) and isinstance(node.test, ast.Compare)):
+            continue
+        cmp_ = node.test
+        if len(cmp_.ops) != 1 or not isinstance(cmp_.ops[0], ast.Eq):
+            continue
+        left, right = cmp_.left, cmp_.comparators[0]
+        for call_node, lit_node, side in ((left, right, 1), (right, left, 0)):
+            call = _literal_call(call_node, func_name)
+            if call is None:
+                continue
+            try:
+                ast.literal_eval(lit_node)
+            except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                continue
+            sites.append((cmp_, side, call))
+            break
+    if not sites:
+        return None
+
+    calls = [call for _c, _s, call in sites]
+    server = getattr(_EXEC_LOCAL, "server", None)
+    cleaned = _clean_code(func_src)
+    if server is not None and server.func_src == cleaned:
+        results = server.call_target(func_name, calls)
+    else:
+        ns: dict = {"pytest": pytest}
+        try:
+            exec(cleaned, ns, ns)   # pylint: disable=exec-used
+            results = _call_target(ns, func_name, calls)
+        except Exception:           # pylint: disable=broad-exception-caught
+            results = None
+    if not results:
+        return None
+
+    changed = False
+    for (cmp_, side, _call), (status, value) in zip(sites, results):
+        if status != "ok":
+            continue
+        current = ast.literal_eval(cmp_.comparators[0] if side == 1 else cmp_.left)
+        if _is_number(current) and _is_number(value):
+            if _num_equal(current, value):
+                continue
+        elif type(current) is type(value) and current == value:
+            continue
+        new_node = ast.parse(_format_literal(value), mode="eval").body
+        if side == 1:
+            cmp_.comparators[0] = new_node
+        else:
+            cmp_.left = new_node
+        changed = True
+    if not changed:
+        return None
+
+    ast.fix_missing_locations(tree)
+    return ast.unparse(tree)
+
+
+def _try_repair(func_src: str, candidate: str, func_name: str, mode: str) -> str | None:
+    """Repaired candidate if it failed only on assert values and now passes."""
+    _ok, why = _check_test(func_src, candidate, func_name=func_name, mode=mode)
+    if why != "semantic re-check failed":
+        return None    # structural / exec problems aren't fixed by new values
+    repaired = _repair_assert_rhs(func_src, candidate, func_name)
+    if repaired is None or not _run_test_safely(func_src, repaired,
+                                                func_name=func_name, mode=mode):
+        return None
+    print(f"[repair] {func_name}: candidate passes after fixing assert values")
+    return repaired
+
+
 def _run_test_safely(func_src: str, test_src: str, *, func_name: str | None = None, mode: str = "base",) -> bool:
     """
     Execute function + test in an isolated namespace.
@@ -732,31 +1304,43 @@ def _run_test_safely(func_src: str, test_src: str, *, func_name: str | None = No
       - Assert focus ratio is satisfied (only when asserts exist),
       - Executing the test raises no unexpected exceptions (asserts/raises pass),
       - Optional semantic probe passes for simple arithmetic functions (base only).
+
+    Verdicts are memoized across requests (see _check_test).
     """
+    return _check_test(func_src, test_src, func_name=func_name, mode=mode)[0]
 
-    # --- Minimal hardening: normalize and remove invisible/control chars ---
-    def _clean_code(s: str) -> str:
-        if not s:
-            return ""
-        # Normalize newlines
-        s = s.replace("\r\n", "\n").replace("\r", "\n")
-        # Strip a run of BOM/ZW/RTL/NBSP at the very start (common cause of "line 1" SyntaxError)
-        s = re.sub(
-            r"^[\ufeff\u200b\u200c\u200d\u202a-\u202e\u2060-\u2063\u00a0]+", "", s)
-        # Remove other control characters globally (keep newline and tab)
-        s = "".join(ch for ch in s if (
-            unicodedata.category(ch)[0] != "C" or ch in "\n\t"))
-        return s
 
+def _check_test(func_src: str, test_src: str, *, func_name: str | None = None,
+                mode: str = "base") -> tuple[bool, str]:
+    """
+    _run_test_safely with its rejection reason ("" when it passes).
+    Looks the cleaned (func_src, test_src, mode, target) up in _VERDICTS
+    first; only misses are executed.
+    """
     func_src = _clean_code(func_src)
     test_src = _clean_code(test_src)
 
-    mode = (mode or "base").strip().lower()
-    if mode not in {"base", "edge"}:
-        mode = "base"
-
+    mode = _validator_mode(mode)
     target_name = func_name or _extract_function_name(func_src)
 
+    key = _VERDICTS.key_for(VALIDATOR_VERSION, mode, target_name, func_src, test_src)
+    cached = _VERDICTS.get(key)
+    if cached is not None:
+        ok, reason = cached
+        _vd(f"cached verdict: {'pass' if ok else 'reject: ' + reason}")
+        return ok, reason
+
+    ok, reason = _validate_test(func_src, test_src, target_name, mode)
+    if not ok:
+        _vd(f"reject: {reason}")
+    if not reason.startswith(_TRANSIENT_REASONS):
+        _VERDICTS.put(key, ok, reason)
+    return ok, reason
+
+
+def _validate_test(func_src: str, test_src: str, target_name: str, mode: str) -> tuple[bool, str]:
+    """The uncached checks behind _check_test (inputs already cleaned)."""
+    mode = _validator_mode(mode)
     # strip import pytest from the test body
     lines = test_src.splitlines()
     lines = [ln for ln in lines if not ln.strip().startswith("import pytest")]
@@ -772,70 +1356,75 @@ def _run_test_safely(func_src: str, test_src: str, *, func_name: str | None = No
         # - raises-only tests: 0 asserts + pytest.raises
         if num_asserts == 0:
             if not has_raises:
-                _vd("reject: edge requires >=1 assert OR pytest.raises")
-                return False
+                return False, "edge requires >=1 assert OR pytest.raises"
     else:
         # Base: requires asserts
         if num_asserts < 1 or num_asserts > 12:
-            _vd(f"reject: bad assert count={num_asserts} (base)")
-            return False
+            return False, f"bad assert count={num_asserts} (base)"
 
     if not _calls_target(test_src, target_name):
-        _vd("reject: test does not call target")
-        return False
+        return False, "test does not call target"
 
     if num_asserts > 0:
         focus_ratio = 1.0 if mode == "base" else 0.66
         if not _asserts_focus_on_target(test_src, target_name, min_ratio=focus_ratio):
-            _vd("reject: assert focus ratio not satisfied")
-            return False
+            return False, "assert focus ratio not satisfied"
 
     if _has_foreign_calls(test_src, target_name, mode=mode):
-        _vd("reject: foreign user-level calls detected")
-        return False
+        return False, "foreign user-level calls detected"
 
     # --- Syntax precheck ---
     try:
         ast.parse(func_src)
         ast.parse(test_src)
     except SyntaxError as e:
-        _vd(f"reject: syntax precheck failed: {e}")
-        return False
+        return False, f"syntax precheck failed: {e}"
 
-    # --- Execute in a fresh namespace ---
-    ns: dict = {"pytest": pytest}
+    server = getattr(_EXEC_LOCAL, "server", None)
+    if server is not None and server.func_src == func_src:
+        verdict = server.check(test_src, target_name, mode, num_asserts)
+        if verdict is not None:
+            return verdict
+    return _exec_checks(func_src, test_src, target_name, mode, num_asserts)
+
+
+def _exec_checks(func_src: str, test_src: str, target_name: str, mode: str,
+                 num_asserts: int, *, ns: dict | None = None) -> tuple[bool, str]:
+    """
+    Run the test (and the post-exec checks). `ns` is a namespace the user
+    module was already exec'd into (fork-server child); otherwise the
+    module is exec'd into a fresh one here.
+    """
+    mode = _validator_mode(mode)
     try:
-        exec(func_src, ns, ns)   # pylint: disable=exec-used
+        if ns is None:
+            ns = {"pytest": pytest}
+            exec(func_src, ns, ns)   # pylint: disable=exec-used
         exec(test_src, ns, ns)   # pylint: disable=exec-used
     except Exception as e:       # pylint: disable=broad-exception-caught
-        _vd(f"reject: exec raised: {type(e).__name__}: {e}")
-        return False
+        return False, f"exec raised: {type(e).__name__}: {e}"
 
     # --- Post-exec semantic checks ---
     if num_asserts > 0:
         if not _asserts_semantically_true(ns, test_src):
-            _vd("reject: semantic re-check failed")
-            return False
+            return False, "semantic re-check failed"
 
     f = ns.get(target_name)
 
     if mode == "base" and callable(f) and _is_arithmetic_function(target_name, func_src):
         if not _arithmetic_oracle(target_name, f, func_src=func_src):
-            _vd("reject: arithmetic oracle failed")
-            return False
+            return False, "arithmetic oracle failed"
 
     if mode == "base" and target_name.lower() in {"add", "subtract", "multiply", "power"}:
         for args, _ in _extract_calls_in_test(test_src, target_name):
             try:
                 out = f(*args)
             except Exception:   # pylint: disable=broad-exception-caught
-                _vd("reject: arithmetic target raised on literal replay")
-                return False
+                return False, "arithmetic target raised on literal replay"
             if isinstance(out, float) and math.isnan(out):
-                _vd("reject: arithmetic returned NaN")
-                return False
+                return False, "arithmetic returned NaN"
 
-    return True
+    return True, ""
 
 
 def _standardize_test_name(generated: str, function_name: str) -> str:
@@ -1051,6 +1640,243 @@ def _format_literal(v: Any) -> str:
 #         return test_src
 
 
+# -----------------------------
+# End of the generated test (early stopping + tail trimming)
+# -----------------------------
+_DEF_RE = re.compile(r"(?<![\w.])def\s+\w+\s*\(")
+_NEXT_DEF_RE = re.compile(r"(?<![\w.])def\s+\w")   # no "(" yet: stop a few tokens earlier
+
+
+def _code_mask(txt: str) -> tuple[list[bool], list[int]]:
+    """
+    Per character of (possibly unfinished) source: is it code, i.e. not
+    inside a string literal or comment, and the bracket depth there.
+    tokenize can't do this: mid-generation text is routinely unterminated.
+    """
+    n = len(txt)
+    code = [True] * n
+    depth = [0] * n
+    d = 0
+    quote = None            # ', ", ''' or """ while inside a string
+
+    def _not_code(start: int, end: int) -> int:
+        end = min(end, n)
+        code[start:end] = [False] * (end - start)
+        depth[start:end] = [d] * (end - start)
+        return end
+
+    i = 0
+    while i < n:
+        ch = txt[i]
+        depth[i] = d
+        if quote:
+            if ch == "\\":
+                i = _not_code(i, i + 2)             # escaped char
+            elif ch == "\n" and len(quote) == 1:
+                quote = None                        # unterminated one-line string
+                i += 1
+            elif txt.startswith(quote, i):
+                i = _not_code(i, i + len(quote))
+                quote = None
+            else:
+                i = _not_code(i, i + 1)
+        elif ch == "#":
+            nl = txt.find("\n", i)
+            i = _not_code(i, n if nl < 0 else nl)
+        elif ch in "'\"":
+            quote = ch * 3 if txt.startswith(ch * 3, i) else ch
+            i = _not_code(i, i + len(quote))
+        else:
+            if ch in "([{":
+                d += 1
+            elif ch in ")]}":
+                d = max(0, d - 1)
+            i += 1
+    return code, depth
+
+
+def _test_end(txt: str) -> int | None:
+    """
+    Offset where the first generated test function ends, or None while it
+    may still be going. The test ends at:
+      - a second top-level def (same line for one-liners, or column 0)
+      - the first non-indented, non-comment line after the body started
+      - a ``` fence
+    Only code counts: a "def", fence or column-0 line inside a string
+    literal, comment or open bracket is not a boundary (see _code_mask).
+    Text without a def header (body-only output) never ends here.
+    """
+    code, depth = _code_mask(txt)
+
+    def _is_code(pos: int) -> bool:
+        return code[pos] and depth[pos] == 0
+
+    first = next((m for m in _DEF_RE.finditer(txt) if _is_code(m.start())), None)
+    if not first:
+        return None
+
+    end = None
+    fence = txt.find("```", first.end())
+    while fence >= 0:
+        if _is_code(fence):
+            end = fence
+            break
+        fence = txt.find("```", fence + 3)
+
+    for m in _NEXT_DEF_RE.finditer(txt, first.end()):
+        if not _is_code(m.start()):
+            continue    # "def" inside a string / comment / call
+        line_start = txt.rfind("\n", 0, m.start()) + 1
+        prefix = txt[line_start:m.start()]
+        if prefix and not prefix.strip():
+            continue    # nested def inside the test body
+        end = m.start() if end is None else min(end, m.start())
+        break
+
+    header_end = txt.find("\n", first.end())
+    if header_end >= 0:
+        body_started = bool(txt[first.end():header_end].partition(":")[2].strip())
+        pos = header_end + 1
+        for line in txt[pos:].split("\n"):
+            stripped = line.strip()
+            if stripped and not line[0].isspace() and not stripped.startswith("#"):
+                # a continuation of a string / bracket is not a dedent
+                if body_started and _is_code(pos):
+                    end = pos if end is None else min(end, pos)
+                    break
+            elif stripped and not stripped.startswith("#"):
+                body_started = True
+            pos += len(line) + 1
+
+    return end
+
+
+def _trim_after_test(txt: str) -> str:
+    """Drop whatever the model emitted after the first complete test."""
+    end = _test_end(txt)
+    return txt if end is None else txt[:end].rstrip()
+
+
+@lru_cache(maxsize=8)
+def _boundary_token_ids(tokenizer) -> torch.Tensor:
+    """Mask over the vocab: tokens that can complete a test boundary."""
+    mask = torch.zeros(len(tokenizer), dtype=torch.bool)
+    for tid in range(len(tokenizer)):
+        piece = tokenizer.decode([tid])
+        if "\n" in piece or "def" in piece or "`" in piece or "\\" in piece:
+            mask[tid] = True
+    return mask
+
+
+class _StopAtTestEnd(StoppingCriteria):
+    """
+    Per-sequence stopping criterion for model.generate: a row is done once
+    _test_end() finds the end of its first test function. Rows are only
+    re-decoded when one of their last few tokens is boundary-like (a dedent
+    shows up one token after the newline, an escaped "\\n" spans two).
+    """
+
+    window = 3
+
+    def __init__(self, tokenizer):
+        self.tokenizer = tokenizer
+        self.boundary = _boundary_token_ids(tokenizer)
+
+    def __call__(self, input_ids, scores, **kwargs) -> torch.BoolTensor:
+        done = torch.zeros(input_ids.shape[0], dtype=torch.bool, device=input_ids.device)
+        recent = input_ids[:, -self.window:].to(self.boundary.device)
+        recent = recent.clamp(0, self.boundary.shape[0] - 1)
+        rows = self.boundary[recent].any(dim=1).nonzero(as_tuple=True)[0].tolist()
+        if not rows:
+            return done
+        texts = self.tokenizer.batch_decode(input_ids[rows], skip_special_tokens=True)
+        for row, txt in zip(rows, texts):
+            if _test_end(txt.replace("\\n", "\n")) is not None:
+                done[row] = True
+        return done
+
+
+def _stopping_criteria(tokenizer) -> StoppingCriteriaList | None:
+    if not _STOP_AT_TEST_END:
+        return None
+    return StoppingCriteriaList([_StopAtTestEnd(tokenizer)])
+
+
+# -----------------------------
+# Constrained decoding (forced header, banned foreign calls)
+# -----------------------------
+
+
+class _ForcePrefix(LogitsProcessor):
+    """
+    Force the first decoder tokens of every row to its prompt's prefix
+    (e.g. _header_prefix_ids: "<s>def test_<fn>():"). Rows are grouped per
+    prompt, as generate() lays them out for beams and num_return_sequences.
+    """
+
+    def __init__(self, prefixes: list[list[int]]):
+        self.prefixes = prefixes
+        self.longest = max((len(p) for p in prefixes), default=0)
+
+    def __call__(self, input_ids, scores):
+        step = input_ids.shape[1] - 1          # decoder starts with one start token
+        if step >= self.longest:
+            return scores
+        per_prompt = max(1, input_ids.shape[0] // len(self.prefixes))
+        for row in range(input_ids.shape[0]):
+            prefix = self.prefixes[min(row // per_prompt, len(self.prefixes) - 1)]
+            if step < len(prefix):
+                scores[row, :] = -float("inf")
+                scores[row, prefix[step]] = 0.0
+        return scores
+
+
+def _header_prefix_ids(tokenizer, func_name: str) -> list[int]:
+    """
+    Token ids that start a training label for `func_name`'s test: the header
+    tokenized the way labels are (text_target=, default special tokens, so a
+    leading <s> stays) minus the trailing </s>.
+    """
+    ids = list(tokenizer(text_target=f"def test_{func_name}():")["input_ids"])
+    if ids and ids[-1] == tokenizer.eos_token_id:
+        ids.pop()
+    return ids
+
+
+def _foreign_function_names(prompt: str, targets: set[str]) -> set[str]:
+    """Functions defined in the prompt (few-shot examples etc.) that aren't targets."""
+    names = set(re.findall(r"\bdef\s+(\w+)\s*\(", prompt))
+    return {n for n in names if n not in targets and not n.startswith("test_")}
+
+
+def _decode_constraints(tokenizer, func_names: list[str], prompts: list[str]) -> dict:
+    """
+    Extra model.generate kwargs for one call over `prompts` (one target per
+    prompt). FORCE_TEST_HEADER forces "def test_<fn>():" as the decoder
+    prefix; BAN_FOREIGN_CALLS bans "<name>(" for functions the prompt
+    defines besides the targets. Empty when both are off.
+    """
+    kwargs: dict = {}
+    if _FORCE_TEST_HEADER:
+        prefixes = [_header_prefix_ids(tokenizer, name) for name in func_names]
+        kwargs["logits_processor"] = LogitsProcessorList([_ForcePrefix(prefixes)])
+
+    if _BAN_FOREIGN_CALLS:
+        targets = set(func_names)
+        banned = set()
+        for prompt in prompts:
+            banned |= _foreign_function_names(prompt, targets)
+        bad_words = []
+        for name in sorted(banned):
+            for text in (f"{name}(", f" {name}("):
+                ids = tokenizer(text, add_special_tokens=False)["input_ids"]
+                if ids and ids not in bad_words:
+                    bad_words.append(ids)
+        if bad_words:
+            kwargs["bad_words_ids"] = bad_words
+    return kwargs
+
+
 def _wrap_as_test_if_needed(body_or_test: str, func_name: str) -> str:
     """
     If the model returns only a body with asserts, wrap it into:
@@ -1174,6 +2000,7 @@ def _decode_and_clean(tokenizer, seq_ids, func_name: str, *, func_src: str = "")
 
     txt = txt.replace("\\n", "\n").replace("\\t", "\t")
 
+    txt = _trim_after_test(txt)
     txt = _wrap_as_test_if_needed(txt, func_name)
     txt = _standardize_test_name(txt, func_name)
     txt = _normalize_calls_to_target(txt, func_name)
@@ -1589,6 +2416,38 @@ def _regen_prompt_for(
     return base + extra
 
 
+def _candidate_generate_kwargs(
+    tokenizer,
+    *,
+    max_new_tokens: int,
+    do_sample: bool,
+    num_return: int,
+    num_beams: int = 1,
+    temperature: float = 0.7,
+    top_k: int = 50,
+    constraints: dict | None = None,
+    deadline: float | None = None,
+) -> dict:
+    """
+    generate() kwargs of the beam / sampling phases. Shared with the ONNX
+    parity check (management/onnx_parity.py) so the two can't drift.
+    """
+    return dict(
+        max_new_tokens=max_new_tokens,
+        min_length=0,
+        no_repeat_ngram_size=0 if not do_sample else 0,  # keep your behavior
+        early_stopping=False,
+        do_sample=do_sample,
+        temperature=max(0.1, float(temperature)) if do_sample else None,
+        top_k=max(0, int(top_k)) if do_sample else None,
+        num_beams=max(1, int(num_beams)),
+        num_return_sequences=max(1, int(num_return)),
+        stopping_criteria=_stopping_criteria(tokenizer),
+        **_generate_time_limit(deadline),
+        **(constraints or {}),
+    )
+
+
 def _try_candidates(
     tokenizer,
     model,
@@ -1603,28 +2462,179 @@ def _try_candidates(
     temperature: float = 0.7,
     top_k: int = 50,
     mode: str = "base",
+    on_event=None,
+    constraints: dict | None = None,
+    seen: set | None = None,
+    deadline: float | None = None,
+    collect_spares: bool = False,
 ):
-    """Generate `num_return` candidates and return the first passing one, else None."""
+    """
+    Generate `num_return` candidates and return the first passing one, else None.
+    `constraints` are extra generate() kwargs from _decode_constraints;
+    `seen` is the candidate-key set shared across phases; validation stops
+    at `deadline`; `collect_spares` as for _pick_passing_candidate.
+    """
     with torch.inference_mode():
         outs = model.generate(
             enc_inputs["input_ids"],
             attention_mask=enc_inputs["attention_mask"],
-            max_new_tokens=max_new_tokens,
-            min_length=0,
-            no_repeat_ngram_size=0 if not do_sample else 0,  # keep your behavior
-            early_stopping=False,
-            do_sample=do_sample,
-            temperature=max(0.1, float(temperature)) if do_sample else None,
-            top_k=max(0, int(top_k)) if do_sample else None,
-            num_beams=max(1, int(num_beams)),
-            num_return_sequences=max(1, int(num_return)),
+            **_candidate_generate_kwargs(
+                tokenizer,
+                max_new_tokens=max_new_tokens,
+                do_sample=do_sample,
+                num_return=num_return,
+                num_beams=num_beams,
+                temperature=temperature,
+                top_k=top_k,
+                constraints=constraints,
+                deadline=deadline,
+            ),
         )
 
+    return _pick_passing_candidate(
+        tokenizer,
+        outs,
+        code_snippet=code_snippet,
+        func_name=func_name,
+        mode=mode,
+        on_event=on_event,
+        seen=seen,
+        deadline=deadline,
+        collect_spares=collect_spares,
+    )
+
+
+def _collect_spares(
+    tokenizer,
+    seqs,
+    accepted: str,
+    *,
+    code_snippet: str,
+    func_name: str,
+    mode: str,
+    seen: set,
+    on_event,
+    deadline: float | None = None,
+) -> int:
+    """
+    Keep validating the rest of a batch whose first passing candidate was
+    already found, and emit up to REGEN_RESERVOIR_SIZE passing ones, none
+    too similar to each other or the accepted test, as "spare" events.
+    The views store them on the item so the next regenerate can use one
+    without a model call.
+
+    This runs in the request path, so at most 2 * REGEN_RESERVOIR_SIZE
+    candidates are validated, however few of them pass, and none past
+    `deadline`.
+    """
+    kept = [_similarity_profile(accepted)]
+    found = 0
+    budget = 2 * REGEN_RESERVOIR_SIZE
+    for i in range(seqs.shape[0]):
+        if found >= REGEN_RESERVOIR_SIZE or budget <= 0 or _time_left(deadline) <= 0:
+            break
+        candidate = _decode_and_clean(
+            tokenizer, seqs[i], func_name, func_src=code_snippet
+        )
+        if mode != "edge":
+            candidate = _strip_non_target_asserts(candidate, func_name)
+        key = _candidate_key(candidate)
+        if key in seen:
+            continue
+        seen.add(key)
+        profile = _similarity_profile(candidate)
+        if _too_similar_any(profile, kept):
+            continue
+        budget -= 1
+        if _run_test_safely(code_snippet, candidate, func_name=func_name, mode=mode):
+            kept.append(profile)
+            found += 1
+            _emit(on_event, "spare", function=func_name, test=candidate)
+    if found:
+        print(f"[reservoir] {func_name}: kept {found} spare passing test(s)")
+    return found
+
+
+def _pop_spare(
+    reservoir: list[str],
+    code_snippet: str,
+    func_name: str,
+    history: list[tuple[str, Counter]],
+    mode: str,
+) -> str | None:
+    """
+    Take the first spare that differs enough from every test in `history`
+    (similarity profiles) and still passes (a verdict-cache hit in the
+    common case). Spares that no longer pass are dropped; too-similar ones
+    stay for a later regenerate.
+    """
+    for idx, spare in enumerate(list(reservoir)):
+        if _too_similar_any(_similarity_profile(spare), history):
+            continue
+        reservoir.remove(spare)
+        if _run_test_safely(code_snippet, spare, func_name=func_name, mode=mode):
+            print(f"[reservoir] {func_name}: using spare #{idx + 1}, no model call")
+            return spare
+    return None
+
+
+def _candidate_key(test_src: str) -> str:
+    """
+    Identity of a cleaned candidate that ignores formatting: hash of its
+    AST dump (whitespace-collapsed text when it doesn't parse).
+    """
+    try:
+        canon = ast.dump(ast.parse(test_src))
+    except (SyntaxError, ValueError):     # ValueError: null bytes
+        canon = " ".join(test_src.split())
+    return hashlib.blake2b(canon.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _report_duplicates(func_name: str, duplicates: int, total: int, on_event=None) -> None:
+    if duplicates:
+        print(f"[dedupe] {func_name}: skipped {duplicates}/{total} duplicate candidates")
+    _emit(on_event, "duplicates", function=func_name, count=duplicates, total=total)
+
+
+def _pick_passing_candidate(
+    tokenizer,
+    seqs,
+    *,
+    code_snippet: str,
+    func_name: str,
+    mode: str = "base",
+    on_event=None,
+    seen: set | None = None,
+    deadline: float | None = None,
+    collect_spares: bool = False,
+):
+    """
+    Decode + validate already-generated sequences for ONE function and
+    return the first passing candidate, else None.
+
+    Split out of _try_candidates so batched generation (several prompts in
+    one model.generate call) can validate each function's slice of outputs.
+
+    Candidates whose _candidate_key is in `seen` (already validated, e.g. in
+    the beam phase) are skipped; pass the same set across phases.
+
+    Past `deadline` (time.monotonic()) no further candidate is validated;
+    the first one always is, since its generation is already paid for.
+
+    collect_spares=True also validates the rest of the batch for "spare"
+    events (_collect_spares); only the item views want those.
+    """
     rejections = []
+    seen = set() if seen is None else seen
+    duplicates = 0
 
-    for i in range(outs.shape[0]):
+    for i in range(seqs.shape[0]):
+        if i and _time_left(deadline) <= 0:
+            _degraded(on_event, func_name,
+                      f"validation stopped after {i}/{seqs.shape[0]} candidates")
+            break
         candidate = _decode_and_clean(
-            tokenizer, outs[i], func_name, func_src=code_snippet
+            tokenizer, seqs[i], func_name, func_src=code_snippet
         )
         # If _decode_and_clean doesn't call the sanitizer internally,
         # uncomment the next line:
@@ -1633,6 +2643,12 @@ def _try_candidates(
         if mode != "edge":
             candidate = _strip_non_target_asserts(candidate, func_name)
 
+        key = _candidate_key(candidate)
+        if key in seen:
+            duplicates += 1
+            continue
+        seen.add(key)
+
         if _VALIDATOR_DEBUG:
             print("\n[validator] ---------- CANDIDATE BEGIN ----------")
             print(candidate)
@@ -1645,6 +2661,8 @@ def _try_candidates(
             if _VALIDATOR_DEBUG:
                 print("[validator] REJECT (pre): syntax")
             rejections.append((candidate, "syntax"))
+            _emit(on_event, "rejected", function=func_name,
+                  candidate=i, reason="syntax")
             continue
 
         # Quick pre-checks to collect reason strings
@@ -1675,17 +2693,33 @@ def _try_candidates(
             if _VALIDATOR_DEBUG:
                 print(f"[validator] REJECT (pre): {reason}")
             rejections.append((candidate, reason))
+            _emit(on_event, "rejected", function=func_name,
+                  candidate=i, reason=reason)
             continue
 
         ok = _run_test_safely(code_snippet, candidate,
                               func_name=func_name, mode=mode,)
+        if not ok and _REPAIR_ASSERTS:
+            repaired = _try_repair(code_snippet, candidate, func_name, mode)
+            if repaired is not None:
+                candidate, ok = repaired, True
         if ok:
+            _report_duplicates(func_name, duplicates, i + 1, on_event)
+            if (collect_spares and REGEN_RESERVOIR_SIZE > 0
+                    and _time_left(deadline) > 0):
+                _collect_spares(tokenizer, seqs[i + 1:], candidate,
+                                code_snippet=code_snippet, func_name=func_name,
+                                mode=mode, seen=seen, on_event=on_event,
+                                deadline=deadline)
             return candidate
         else:
             if _VALIDATOR_DEBUG:
                 print("[validator] REJECT (run): failed in exec/semantic/oracle")
             rejections.append((candidate, "exec/semantic/oracle"))
+            _emit(on_event, "rejected", function=func_name,
+                  candidate=i, reason="exec/semantic/oracle")
 
+    _report_duplicates(func_name, duplicates, seqs.shape[0], on_event)
     if _VALIDATOR_DEBUG and rejections:
         print("\n[validator] SUMMARY: all candidates rejected.")
         for idx, (_cand, why) in enumerate(rejections, 1):
@@ -1750,6 +2784,9 @@ _DECODE_PRESETS = {
     },
 }
 
+# Default generation length of the serving entry points
+MAX_NEW_TOKENS = 240
+
 # -----------------------------
 # Public API: auto-validated generation (beams → sampling → fallback)
 # -----------------------------
@@ -1759,6 +2796,7 @@ _DECODE_PRESETS = {
 # -----------------------------
 
 
+@_with_fork_server
 def _generate_for_single_function(
     code_snippet: str,
     func_name: str,
@@ -1770,12 +2808,24 @@ def _generate_for_single_function(
     temperature: float,
     top_k: int,
     mode: str = "base",
+    skip_beams: bool = False,
+    on_event=None,
+    deadline: float | None = None,
+    collect_spares: bool = False,
 ) -> str:
     """
     Core generation/validation pipeline for a SINGLE function name.
 
     This is essentially my old generate_test_from_code logic, but
     parameterized by func_name so we can reuse it for multi-function files.
+
+    skip_beams=True starts at the sampling phase; used by the batched
+    generator, which already ran the beam phase for many functions at once.
+
+    deadline (time.monotonic()) bounds the work: beams are skipped once it
+    has passed, sampling is skipped or shrunk when less time is left than
+    the beam phase took, and the function then ends on a template fallback.
+    Every such cut is reported as a "degraded" event.
     """
     print(
         f"[validator] generate(single): {func_name} - beams→sampling→fallback")
@@ -1798,6 +2848,8 @@ def _generate_for_single_function(
     tokenizer, model = _load_model_and_tokenizer(mode)
     # NOTE: we now pass func_name into the prompt, instead of re-extracting it
     prompt = _prompt_for(code_snippet, func_name)
+    constraints = _decode_constraints(tokenizer, [func_name], [prompt])
+    seen: set = set()   # candidate keys already validated (beams → sampling)
 
     enc = tokenizer(
         prompt,
@@ -1806,7 +2858,7 @@ def _generate_for_single_function(
         max_length=512,
         padding=True,
         return_attention_mask=True,
-    ).to(DEVICE)
+    ).to(model.device)
 
     # -------------------------
     # Optional: bypass validator
@@ -1828,50 +2880,83 @@ def _generate_for_single_function(
                 top_p=(0.92),
                 num_beams=4,
                 num_return_sequences=1,
+                stopping_criteria=_stopping_criteria(tokenizer),
+                **_generate_time_limit(deadline),
             )
         txt = _decode_and_clean(tokenizer, raw[0], func_name)
-        return "# origin: raw_unvalidated\n" + txt
+        return UNVALIDATED_ORIGIN + "\n" + txt
 
     # -------------------------
     # 1) Deterministic beams
     # -------------------------
-    passing = _try_candidates(
-        tokenizer,
-        model,
-        enc,
-        code_snippet=code_snippet,
-        func_name=func_name,
-        max_new_tokens=max_new_tokens,
-        do_sample=False,
-        num_return=max(1, int(beam_candidates)),
-        num_beams=max(1, int(num_beams)),
-        mode=mode,
-    )
-    if passing:
-        return "# Origin: Beams \n" + passing
+    beams_start = time.monotonic()
+    if not skip_beams and _time_left(deadline) <= 0:
+        _degraded(on_event, func_name, "no time left, beams skipped")
+    elif not skip_beams:
+        _emit(on_event, "phase", function=func_name, phase="beams")
+        passing = _try_candidates(
+            tokenizer,
+            model,
+            enc,
+            code_snippet=code_snippet,
+            func_name=func_name,
+            max_new_tokens=max_new_tokens,
+            do_sample=False,
+            num_return=max(1, int(beam_candidates)),
+            num_beams=max(1, int(num_beams)),
+            mode=mode,
+            on_event=on_event,
+            constraints=constraints,
+            seen=seen,
+            deadline=deadline,
+            collect_spares=collect_spares,
+        )
+        if passing:
+            return "# Origin: Beams \n" + passing
+    beams_s = time.monotonic() - beams_start
 
     # -------------------------
     # 2) Sampling for diversity
     # -------------------------
-    passing = _try_candidates(
-        tokenizer,
-        model,
-        enc,
-        code_snippet=code_snippet,
-        func_name=func_name,
-        max_new_tokens=max_new_tokens,
-        do_sample=True,
-        num_return=max(1, int(sample_candidates)),
-        temperature=temperature,
-        top_k=top_k,
-        mode=mode,
-    )
+    # The beam phase is the cost estimate for sampling: shrink the number
+    # of samples in proportion when less than that is left.
+    left = _time_left(deadline)
+    if left <= 0:
+        _degraded(on_event, func_name, "no time left, sampling skipped")
+        passing = None
+    else:
+        if left < beams_s:
+            shrunk = max(1, int(int(sample_candidates) * left / beams_s))
+            if shrunk < int(sample_candidates):
+                _degraded(on_event, func_name,
+                          f"sampling shrunk to {shrunk}/{int(sample_candidates)} candidates")
+                sample_candidates = shrunk
+        _emit(on_event, "phase", function=func_name, phase="sampling")
+        passing = _try_candidates(
+            tokenizer,
+            model,
+            enc,
+            code_snippet=code_snippet,
+            func_name=func_name,
+            max_new_tokens=max_new_tokens,
+            do_sample=True,
+            num_return=max(1, int(sample_candidates)),
+            temperature=temperature,
+            top_k=top_k,
+            mode=mode,
+            on_event=on_event,
+            constraints=constraints,
+            seen=seen,
+            deadline=deadline,
+            collect_spares=collect_spares,
+        )
     if passing:
         return "# Origin : sampling \n" + passing
 
     # -------------------------
     # 3) Fallbacks
     # -------------------------
+    _emit(on_event, "phase", function=func_name, phase="fallback")
     fn = func_name
     op = _infer_simple_op(code_snippet, target_name=fn) or fn.lower()
 
@@ -2088,13 +3173,17 @@ def _merge_multi_function_tests(
     snippets: list[str],
     *,
     origin: str = "Beams (multi-function)",
+    extra_imports: list[str] | None = None,
 ) -> str:
     """
     Merge several single-function test snippets into one block:
     - keep a single `import pytest` at the top
     - drop per-snippet '# Origin: ...' comments
     - allow a custom origin string for the combined header
+    - optionally add `extra_imports` lines right after `import pytest`
+      (e.g. "from pkg.mod import add" when writing a standalone test module)
     """
+    extra_imports = list(extra_imports or [])
     bodies: list[str] = []
     saw_import = False
 
@@ -2109,6 +3198,7 @@ def _merge_multi_function_tests(
             if stripped.startswith("import pytest"):
                 if not saw_import:
                     lines_out.append("import pytest")
+                    lines_out.extend(extra_imports)
                     saw_import = True
                 continue
 
@@ -2119,6 +3209,8 @@ def _merge_multi_function_tests(
             bodies.append(body)
 
     header = f"# Origin: {origin}\n"
+    if extra_imports and not saw_import:
+        header += "\n".join(extra_imports) + "\n\n"
     return header + "\n\n".join(bodies)
 
 
@@ -2175,7 +3267,7 @@ def generate_test_from_code(
     code_snippet: str,
     *,
     # decoding size
-    max_new_tokens: int = 240,
+    max_new_tokens: int = MAX_NEW_TOKENS,
     # candidate budgets (None = choose from presets)
     beam_candidates: int | None = None,
     sample_candidates: int | None = None,
@@ -2185,6 +3277,10 @@ def generate_test_from_code(
     temperature: float | None = None,
     top_k: int | None = None,
     mode: str = "base",
+    reuse_tests: dict[str, str] | None = None,
+    on_event=None,
+    budget_s: float | None = None,
+    collect_spares: bool = False,
 ) -> str:
     """
     Generate PyTest-style unit tests and validate them automatically.
@@ -2194,6 +3290,23 @@ def generate_test_from_code(
     - If there are 2+ functions: generate tests for each (using each
       function's own source) and merge them.
 
+    reuse_tests maps _function_fingerprint(func_src) -> an earlier validated
+    test for that exact function. Functions found there are not sent to the
+    model again; only changed / new functions are generated.
+
+    on_event(kind, data) receives progress events as they happen (functions
+    detected, phase started, candidate rejected + reason, test accepted).
+
+    budget_s bounds the wall-clock time of the whole call: each function
+    gets a fair share of what is left, and functions that run out degrade
+    to fewer samples / a template fallback ("degraded" events) instead of
+    the request outliving the worker timeout.
+
+    collect_spares=True keeps validating each function's batch after the
+    first pass and emits extra passing tests as "spare" events, for the
+    item views' regeneration reservoir. Off by default: it costs up to
+    2 * REGEN_RESERVOIR_SIZE extra validations per function.
+
     If decode params are not provided (None), we infer a rough task kind
     ('numeric' vs 'string') from the code and pull defaults from
     _DECODE_PRESETS. This means:
@@ -2215,19 +3328,32 @@ def generate_test_from_code(
     if top_k is None:
         top_k = preset["top_k"]
 
+    deadline = time.monotonic() + budget_s if budget_s is not None else None
+
     # ---- 2) Extract functions (same behaviour as your existing code) ----
     fn_defs = _extract_function_defs(code_snippet)
+    reuse_tests = reuse_tests or {}
+    _emit(on_event, "functions", names=[n for n, _ in fn_defs])
+
+    def _reused(fn_src: str) -> str | None:
+        prev = reuse_tests.get(_function_fingerprint(fn_src))
+        return _ensure_pytest_import(prev.strip()) if prev else None
 
     # 0 or 1 function → single-function path
     if len(fn_defs) <= 1:
         if fn_defs:
             single_name, single_src = fn_defs[0]
+            reused = _reused(single_src)
+            if reused:
+                print(f"[incremental] {single_name}: unchanged, reusing test")
+                _emit(on_event, "accepted", function=single_name, test=reused)
+                return "# Origin: Reused (unchanged function)\n" + reused
         else:
             # fallback: no explicit def found, keep current behaviour
             single_name = _extract_function_name(code_snippet)
             single_src = code_snippet
 
-        return _generate_for_single_function(
+        result = _generate_for_single_function(
             # <- isolated src (or whole snippet if unknown)
             single_src,
             single_name,
@@ -2238,14 +3364,29 @@ def generate_test_from_code(
             temperature=temperature,
             top_k=top_k,
             mode=mode,
+            on_event=on_event,
+            deadline=deadline,
+            collect_spares=collect_spares,
         )
+        _emit(on_event, "accepted", function=single_name, test=result)
+        return result
 
     # ---- 3) Multi-function path ----
     print(
         f"[multi] Detected {len(fn_defs)} functions: {[n for n, _ in fn_defs]}")
     snippets: list[str] = []
+    n_reused = 0
+    n_left = sum(1 for _n, fn_src in fn_defs if not _reused(fn_src))
 
     for func_name, fn_src in fn_defs:
+        reused = _reused(fn_src)
+        if reused:
+            print(f"[incremental] {func_name}: unchanged, reusing test")
+            _emit(on_event, "accepted", function=func_name, test=reused)
+            snippets.append(reused)
+            n_reused += 1
+            continue
+
         tests_for_fn = _generate_for_single_function(
             fn_src,
             func_name,
@@ -2256,35 +3397,187 @@ def generate_test_from_code(
             temperature=temperature,
             top_k=top_k,
             mode=mode,
+            on_event=on_event,
+            deadline=_function_deadline(deadline, n_left),
+            collect_spares=collect_spares,
         )
+        n_left -= 1
+        _emit(on_event, "accepted", function=func_name, test=tests_for_fn)
         snippets.append(tests_for_fn)
 
+    if n_reused:
+        return _merge_multi_function_tests(
+            snippets,
+            origin=f"Beams (multi-function, {n_reused} reused)",
+        )
     return _merge_multi_function_tests(snippets)
 
+# -----------------------------
+# Batched generation (many functions, e.g. a whole project archive)
+# -----------------------------
+
+
+def generate_tests_batched(
+    units: list[tuple[str, str]],
+    *,
+    batch_size: int = 8,
+    max_new_tokens: int = MAX_NEW_TOKENS,
+    mode: str = "base",
+    on_result=None,
+) -> list[str]:
+    """
+    Generate validated tests for many (func_name, func_src) units.
+
+    The beam phase runs for up to `batch_size` prompts per model.generate
+    call (units are grouped by task kind so they share a decode preset).
+    Only functions whose beams all fail go through the per-function
+    sampling → fallback pipeline.
+
+    Returns one test snippet per unit, in input order. If `on_result` is
+    given it is called as on_result(index, snippet) as soon as each unit
+    is finished, so callers can report progress.
+    """
+    results: list[str | None] = [None] * len(units)
+    batch_size = max(1, int(batch_size))
+    kinds = [
+        "numeric" if _guess_task_kind(src) == "numeric" else "string"
+        for _name, src in units
+    ]
+
+    def _finish(idx: int, snippet: str) -> None:
+        results[idx] = snippet
+        if on_result is not None:
+            on_result(idx, snippet)
+
+    def _single(idx: int, *, skip_beams: bool) -> None:
+        func_name, func_src = units[idx]
+        preset = _DECODE_PRESETS[kinds[idx]]
+        _finish(idx, _generate_for_single_function(
+            func_src,
+            func_name,
+            max_new_tokens=max_new_tokens,
+            beam_candidates=preset["beam_candidates"],
+            sample_candidates=preset["sample_candidates"],
+            num_beams=preset["num_beams"],
+            temperature=preset["temperature"],
+            top_k=preset["top_k"],
+            mode=mode,
+            skip_beams=skip_beams,
+        ))
+
+    if _BYPASS_VALIDATOR:
+        for idx in range(len(units)):
+            _single(idx, skip_beams=False)
+        return results
+
+    tokenizer, model = _load_model_and_tokenizer(mode)
+
+    for kind in ("numeric", "string"):
+        preset = _DECODE_PRESETS[kind]
+        per_fn = max(1, int(preset["beam_candidates"]))
+        indices = [i for i, k in enumerate(kinds) if k == kind]
+
+        for start in range(0, len(indices), batch_size):
+            chunk = indices[start:start + batch_size]
+            prompts = [_prompt_for(units[i][1], units[i][0]) for i in chunk]
+            print(f"[batch] beams for {len(chunk)} {kind} function(s)")
+
+            enc = tokenizer(
+                prompts,
+                return_tensors="pt",
+                truncation=True,
+                max_length=512,
+                padding=True,
+                return_attention_mask=True,
+            ).to(model.device)
+
+            with torch.inference_mode():
+                outs = model.generate(
+                    enc["input_ids"],
+                    attention_mask=enc["attention_mask"],
+                    max_new_tokens=max_new_tokens,
+                    min_length=0,
+                    early_stopping=False,
+                    do_sample=False,
+                    num_beams=max(1, int(preset["num_beams"])),
+                    num_return_sequences=per_fn,
+                    stopping_criteria=_stopping_criteria(tokenizer),
+                    **_decode_constraints(
+                        tokenizer, [units[i][0] for i in chunk], prompts),
+                )
+
+            # generate() returns num_return_sequences rows per prompt, in order
+            for pos, idx in enumerate(chunk):
+                func_name, func_src = units[idx]
+                with _fork_server(func_src):
+                    passing = _pick_passing_candidate(
+                        tokenizer,
+                        outs[pos * per_fn:(pos + 1) * per_fn],
+                        code_snippet=func_src,
+                        func_name=func_name,
+                        mode=mode,
+                    )
+                if passing:
+                    _finish(idx, "# Origin: Beams \n" + passing)
+                else:
+                    _single(idx, skip_beams=True)
+
+    return results
+
 # -----------------------------
 # Regeneration helper (NEW)
 # -----------------------------
 
 
+@_with_fork_server
 def regenerate_test_for_function(
     code_snippet: str,
     func_name: str,
     previous_test: str,
     *,
-    max_new_tokens: int = 240,
+    max_new_tokens: int = MAX_NEW_TOKENS,
     sample_candidates: int = 12,
     temperature: float = 0.95,
     top_k: int = 120,
     mode: str = "base",
+    reservoir: list[str] | None = None,
+    history: list[str] | None = None,
+    deadline: float | None = None,
+    on_event=None,
 ) -> str:
     """
     Regenerate a *different* test for a single function.
 
-    - Uses sampling-only (no beams) to increase diversity.
+    - Uses a spare from `reservoir` (passing tests kept at generation time,
+      consumed in place) when one differs enough from the previous test.
+    - Otherwise uses sampling-only (no beams) to increase diversity.
     - Uses a regen-specific prompt that shows the previous test.
-    - Rejects tests that are too similar to the previous one.
+    - Rejects tests that are too similar to the previous one or to any
+      earlier test of the function in `history` (TestItem.meta).
+    - Past `deadline` the previous test is kept ("degraded" event).
+    - "phase" events say where the result came from: reservoir, sampling,
+      or fallback (previous test kept).
     """
+    # Profiles are built once; each candidate then costs one profile + a
+    # Counter intersection per earlier test.
+    prev_profiles = [_similarity_profile(t) for t in [previous_test, *(history or [])]]
+
+    if reservoir:
+        # spares were validated against the function's own source (see
+        # generate_test_from_code), so re-check them against the same
+        fn_src = dict(_extract_function_defs(code_snippet)).get(func_name, code_snippet)
+        spare = _pop_spare(reservoir, fn_src, func_name, prev_profiles, mode)
+        if spare is not None:
+            _emit(on_event, "phase", function=func_name, phase="reservoir")
+            return "# Origin: Regen (reservoir)\n" + spare
+
+    if _time_left(deadline) <= 0:
+        _degraded(on_event, func_name, "no time left, previous test kept")
+        _emit(on_event, "phase", function=func_name, phase="fallback")
+        return "# Origin: Regen (fallback - reused previous)\n" + previous_test
+
     print(f"[validator] regenerate(single): {func_name} - sampling-only")
+    _emit(on_event, "phase", function=func_name, phase="sampling")
 
     # ---- NEW: tweak regen sampling per task kind ----
     task_kind = _guess_task_kind(code_snippet)
@@ -2310,7 +3603,7 @@ def regenerate_test_for_function(
         max_length=512,
         padding=True,
         return_attention_mask=True,
-    ).to(DEVICE)
+    ).to(model.device)
 
     with torch.inference_mode():
         outs = model.generate(
@@ -2325,14 +3618,23 @@ def regenerate_test_for_function(
             top_k=max(0, int(top_k)),
             num_beams=1,
             num_return_sequences=max(1, int(sample_candidates)),
+            stopping_criteria=_stopping_criteria(tokenizer),
+            **_generate_time_limit(deadline),
+            **_decode_constraints(tokenizer, [func_name], [prompt]),
         )
 
-    norm_prev = _normalize_test_for_similarity(previous_test)
+    prev_calls = sorted(_extract_calls_in_test(previous_test, func_name), key=repr)
 
     best_candidate: str | None = None
     rejections = []
+    seen: set = set()
+    duplicates = 0
 
     for i in range(outs.shape[0]):
+        if i and _time_left(deadline) <= 0:
+            _degraded(on_event, func_name,
+                      f"validation stopped after {i}/{outs.shape[0]} candidates")
+            break
         raw_candidate = _decode_and_clean(
             tokenizer,
             outs[i],
@@ -2341,6 +3643,12 @@ def regenerate_test_for_function(
         )
         candidate = _strip_non_target_asserts(raw_candidate, func_name)
 
+        key = _candidate_key(candidate)
+        if key in seen:
+            duplicates += 1
+            continue
+        seen.add(key)
+
         if _VALIDATOR_DEBUG:
             print("\n[regen] ---------- CANDIDATE BEGIN ----------")
             print(candidate)
@@ -2355,22 +3663,18 @@ def regenerate_test_for_function(
             rejections.append((candidate, "syntax"))
             continue
 
-        # --- Similarity check vs previous test ---
-        norm_cand = _normalize_test_for_similarity(candidate)
-        if _too_similar(norm_prev, norm_cand):
+        # --- Similarity check vs previous tests ---
+        if _too_similar_any(_similarity_profile(candidate), prev_profiles):
             if _VALIDATOR_DEBUG:
                 print("[regen] REJECT: too similar (text)")
             rejections.append((candidate, "too similar (text)"))
             continue
 
         # Extra: compare literal call argument patterns if possible
-        prev_calls = _extract_calls_in_test(previous_test, func_name)
         cand_calls = _extract_calls_in_test(candidate, func_name)
         if prev_calls and cand_calls:
             # sort for deterministic comparison
-            prev_set = sorted(prev_calls, key=repr)
-            cand_set = sorted(cand_calls, key=repr)
-            if prev_set == cand_set:
+            if prev_calls == sorted(cand_calls, key=repr):
                 if _VALIDATOR_DEBUG:
                     print("[regen] REJECT: same call argument patterns")
                 rejections.append((candidate, "same call args"))
@@ -2398,6 +3702,10 @@ def regenerate_test_for_function(
 
         ok = _run_test_safely(code_snippet, candidate,
                               func_name=func_name, mode=mode,)
+        if not ok and _REPAIR_ASSERTS:
+            repaired = _try_repair(code_snippet, candidate, func_name, mode)
+            if repaired is not None:
+                candidate, ok = repaired, True
         if ok:
             best_candidate = candidate
             break
@@ -2406,6 +3714,10 @@ def regenerate_test_for_function(
                 print("[regen] REJECT (run): failed in exec/semantic/oracle")
             rejections.append((candidate, "exec/semantic/oracle"))
 
+    if duplicates:
+        print(f"[dedupe] {func_name}: skipped {duplicates}/{outs.shape[0]} "
+              f"duplicate regen candidates")
+
     if best_candidate is not None:
         return "# Origin: Regen (sampling)\n" + best_candidate
 
@@ -2416,6 +3728,7 @@ def regenerate_test_for_function(
         for idx, (_cand, why) in enumerate(rejections, 1):
             print(f"[regen]  {idx:02d}. reason: {why}")
 
+    _emit(on_event, "phase", function=func_name, phase="fallback")
     return "# Origin: Regen (fallback - reused previous)\n" + previous_test
 
 
@@ -2423,11 +3736,16 @@ def regenerate_tests_from_code(
     code_snippet: str,
     previous_tests: str,
     *,
-    max_new_tokens: int = 240,
+    max_new_tokens: int = MAX_NEW_TOKENS,
     sample_candidates: int = 12,
     temperature: float = 0.95,
     top_k: int = 120,
     mode: str = "base",
+    functions: list[str] | None = None,
+    reservoir: dict[str, list[str]] | None = None,
+    history: dict[str, list[str]] | None = None,
+    budget_s: float | None = None,
+    on_event=None,
 ) -> str:
     """
     Multi-function aware regeneration entry point.
@@ -2435,8 +3753,22 @@ def regenerate_tests_from_code(
     - If there are 0 functions: return previous_tests (or a noop comment).
     - If there is 1 function: delegate to regenerate_test_for_function.
     - If there are 2+ functions: regen each function separately and merge.
+
+    If `functions` is given, only those function names are regenerated;
+    every other function keeps its previous test verbatim (no model call).
+
+    `reservoir` maps function name -> spare passing tests (TestItem.meta);
+    used spares are removed from it in place. `history` maps function name
+    -> earlier tests a regeneration must also differ from.
+
+    budget_s / on_event: as for generate_test_from_code; a function that
+    runs out of time keeps its previous test (reported as "degraded").
     """
     fn_defs = _extract_function_defs(code_snippet)
+    reservoir = reservoir if reservoir is not None else {}
+    history = history or {}
+    deadline = time.monotonic() + budget_s if budget_s is not None else None
+    selected = set(functions) if functions else None
 
     # 0 functions -> nothing we can meaningfully regen
     if not fn_defs:
@@ -2445,6 +3777,8 @@ def regenerate_tests_from_code(
     # Single-function case: reuse the existing helper
     if len(fn_defs) == 1:
         func_name, _ = fn_defs[0]
+        if selected is not None and func_name not in selected and previous_tests:
+            return previous_tests
         return regenerate_test_for_function(
             code_snippet,
             func_name,
@@ -2454,6 +3788,10 @@ def regenerate_tests_from_code(
             temperature=temperature,
             top_k=top_k,
             mode=mode,
+            reservoir=reservoir.get(func_name),
+            history=history.get(func_name),
+            deadline=deadline,
+            on_event=on_event,
         )
 
     # ---------------- Multi-function path ----------------
@@ -2465,10 +3803,19 @@ def regenerate_tests_from_code(
     )
 
     snippets: list[str] = []
+    n_left = sum(
+        1 for name in func_names
+        if selected is None or name in selected or not prev_by_func.get(name)
+    )
 
     for func_name, _fn_src in fn_defs:
         per_func_prev = prev_by_func.get(func_name, "")
 
+        if selected is not None and func_name not in selected and per_func_prev:
+            print(f"[regen] {func_name}: not selected, keeping previous test")
+            snippets.append(_ensure_pytest_import(per_func_prev))
+            continue
+
         new_test = regenerate_test_for_function(
             code_snippet,
             func_name,
@@ -2478,7 +3825,12 @@ def regenerate_tests_from_code(
             temperature=temperature,
             top_k=top_k,
             mode=mode,
+            reservoir=reservoir.get(func_name),
+            history=history.get(func_name),
+            deadline=_function_deadline(deadline, n_left),
+            on_event=on_event,
         )
+        n_left -= 1
         snippets.append(new_test)
 
     # Use a different origin label so you can distinguish in UI/logs
@@ -0,0 +1,150 @@
+"""
+Cross-request memo of validator verdicts.
+
+_run_test_safely is a pure function of (function source, test source,
+mode, validator version), and the same pairs come back constantly: beam
+outputs are deterministic, common functions are pasted by many users, and
+regenerations re-propose old candidates. VerdictCache keeps
+
+- a bounded in-process LRU (OrderedDict) in front of
+- an optional SQLite table shared by workers and restarts, capped at
+  `max_db_entries` rows (oldest writes pruned every PRUNE_EVERY puts)
+
+so a repeated candidate skips exec and the semantic re-checks.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+# put()s between two prunes of the SQLite table
+PRUNE_EVERY = 256
+
+
+class VerdictCache:
+    """(ok, reason) per key; memory LRU backed by SQLite when `path` is set."""
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 4096,
+                 max_db_entries: int = 100_000):
+        self.path = path or None
+        self.max_entries = max(1, max_entries)
+        self.max_db_entries = max(1, max_db_entries)
+        self._puts = 0
+        self.hits = 0
+        self.misses = 0
+        self._mem: "OrderedDict[str, Tuple[bool, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_failed = False
+
+    @staticmethod
+    def key_for(*parts: str) -> str:
+        h = hashlib.sha256()
+        for part in parts:
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    # -----------------------------
+    # SQLite (opened lazily, never fatal)
+    # -----------------------------
+
+    def _conn(self) -> Optional[sqlite3.Connection]:
+        if self._db is not None or self._db_failed or not self.path:
+            return self._db
+        try:
+            db = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS verdicts "
+                "(key TEXT PRIMARY KEY, ok INTEGER NOT NULL, reason TEXT NOT NULL)"
+            )
+            db.commit()
+            self._db = db
+            self._prune()       # the cap may have shrunk since the last run
+        except sqlite3.Error as e:
+            print(f"[verdicts] SQLite cache disabled ({self.path}): {e}")
+            self._db_failed = True
+        return self._db
+
+    def _db_get(self, key: str) -> Optional[Tuple[bool, str]]:
+        db = self._conn()
+        if db is None:
+            return None
+        try:
+            row = db.execute(
+                "SELECT ok, reason FROM verdicts WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"[verdicts] read failed: {e}")
+            return None
+        return (bool(row[0]), row[1]) if row else None
+
+    def _db_put(self, key: str, ok: bool, reason: str) -> None:
+        db = self._conn()
+        if db is None:
+            return
+        try:
+            db.execute("INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?)",
+                       (key, int(ok), reason))
+            db.commit()
+        except sqlite3.Error as e:
+            print(f"[verdicts] write failed: {e}")
+            return
+        self._puts += 1
+        if self._puts % PRUNE_EVERY == 0:
+            self._prune()
+
+    def _prune(self) -> None:
+        """Keep the newest `max_db_entries` rows. INSERT OR REPLACE gives a
+        rewritten key a new rowid, so rowid order is write order."""
+        try:
+            self._db.execute(
+                "DELETE FROM verdicts WHERE rowid <= ("
+                "SELECT rowid FROM verdicts ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+                (self.max_db_entries,))
+            self._db.commit()
+        except sqlite3.Error as e:
+            print(f"[verdicts] prune failed: {e}")
+
+    # -----------------------------
+    # Public API
+    # -----------------------------
+
+    def get(self, key: str) -> Optional[Tuple[bool, str]]:
+        with self._lock:
+            verdict = self._mem.get(key)
+            if verdict is not None:
+                self._mem.move_to_end(key)
+            else:
+                verdict = self._db_get(key)
+                if verdict is not None:
+                    self._remember(key, verdict)
+            if verdict is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return verdict
+
+    def put(self, key: str, ok: bool, reason: str = "") -> None:
+        with self._lock:
+            self._remember(key, (bool(ok), reason))
+            self._db_put(key, ok, reason)
+
+    def _remember(self, key: str, verdict: Tuple[bool, str]) -> None:
+        self._mem[key] = verdict
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_entries:
+            self._mem.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mem.clear()
+            db = self._conn()
+            if db is not None:
+                db.execute("DELETE FROM verdicts")
+                db.commit()
@@ -0,0 +1,113 @@
+# unittestgen/archive.py
+"""
+Helpers for reading a project archive (.zip / .tar / .tar.gz) upload.
+
+Members are read one at a time, so a large archive never has to be loaded
+into memory at once. Only `.py` modules are yielded; tests, caches and
+suspicious paths are skipped.
+"""
+import posixpath
+import tarfile
+import zipfile
+from typing import Iterator, Tuple
+
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz")
+
+MAX_MEMBER_BYTES = 200_000   # same per-file cap as single .py uploads
+MAX_MODULES = 200
+
+_SKIP_DIRS = {"__pycache__", "tests", "test",
+              ".git", ".venv", "venv", "site-packages", "migrations"}
+
+
+class ArchiveError(ValueError):
+    """Raised when the uploaded archive cannot be read."""
+
+
+def is_supported_archive(filename: str) -> bool:
+    return (filename or "").lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def _decode_source(raw: bytes) -> str:
+    # same policy as views.decode_uploaded_py: utf-8, then latin-1 (never fails)
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return raw.decode("latin-1")
+
+
+def is_source_module(path: str) -> bool:
+    """Keep plain source modules only (no tests, caches or path tricks)."""
+    path = path.replace("\\", "/")
+    if path.startswith("/") or not path.endswith(".py"):
+        return False
+    parts = path.split("/")
+    if ".." in parts:
+        return False
+    if any(p in _SKIP_DIRS or p.startswith(".") for p in parts[:-1]):
+        return False
+    base = parts[-1]
+    if base.startswith("test_") or base.endswith("_test.py") or base == "conftest.py":
+        return False
+    return base not in {"setup.py", "manage.py"}
+
+
+def module_name_for(path: str) -> str:
+    """
+    Turn an archive path into a dotted module name:
+      "pkg/utils/strings.py" -> "pkg.utils.strings"
+      "pkg/__init__.py"      -> "pkg"
+    """
+    path = posixpath.normpath(path.replace("\\", "/"))
+    stem = path[:-3] if path.endswith(".py") else path
+    parts = [p for p in stem.split("/") if p and p != "."]
+    if parts and parts[-1] == "__init__":
+        parts = parts[:-1]
+    if parts and parts[0] == "src" and len(parts) > 1:
+        parts = parts[1:]
+    return ".".join(parts) or "module"
+
+
+def iter_archive_modules(fileobj, filename: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (member_path, source_text) for every wanted .py member.
+
+    Zip archives are read member by member from their central directory;
+    tar archives are read in stream mode ("r|*"), so the upload is walked
+    exactly once front-to-back.
+    """
+    name = (filename or "").lower()
+    yielded = 0
+
+    try:
+        if name.endswith(".zip"):
+            with zipfile.ZipFile(fileobj) as zf:
+                for info in zf.infolist():
+                    if info.is_dir() or not is_source_module(info.filename):
+                        continue
+                    if info.file_size > MAX_MEMBER_BYTES:
+                        continue
+                    with zf.open(info) as fh:
+                        raw = fh.read(MAX_MEMBER_BYTES + 1)
+                    if len(raw) > MAX_MEMBER_BYTES:
+                        continue   # header lied about the size
+                    yield info.filename, _decode_source(raw)
+                    yielded += 1
+                    if yielded >= MAX_MODULES:
+                        return
+        else:
+            with tarfile.open(fileobj=fileobj, mode="r|*") as tf:
+                for member in tf:
+                    if not member.isfile() or not is_source_module(member.name):
+                        continue
+                    if member.size > MAX_MEMBER_BYTES:
+                        continue
+                    fh = tf.extractfile(member)
+                    if fh is None:
+                        continue
+                    yield member.name, _decode_source(fh.read())
+                    yielded += 1
+                    if yielded >= MAX_MODULES:
+                        return
+    except (zipfile.BadZipFile, tarfile.TarError, EOFError, OSError) as e:
+        raise ArchiveError(f"Could not read archive: {e}") from e
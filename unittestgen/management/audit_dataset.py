@@ -7,6 +7,10 @@ Audit and normalize arithmetic function-test pairs.
   * executes the function in a restricted env to compute true RHS values
   * rewrites assert RHS if wrong; rejects suspicious lines
 - Writes dataset.cleaned.jsonl and dataset.rejected.jsonl
+- Runs sharded on a process pool (AUDIT_WORKERS, default one per core);
+  each record gets AUDIT_RECORD_TIMEOUT seconds before it is rejected
+- Keeps dataset.audit.manifest.jsonl so unchanged records reuse their
+  previous verdict instead of being executed again
 """
 
 from __future__ import annotations
@@ -14,12 +18,28 @@ from __future__ import annotations
 import ast
 import json
 import math
+import os
 import re
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional
+
+from unittestgen.management.sharding import (
+    DEFAULT_CHUNK_SIZE,
+    AuditManifest,
+    RecordTimeout,
+    run_sharded_audit,
+    time_limit,
+)
 
 SRC = "dataset.jsonl"
 OUT_CLEAN = "dataset.cleaned.jsonl"
 OUT_REJECT = "dataset.rejected.audit.jsonl"
+MANIFEST = "dataset.audit.manifest.jsonl"
+
+# Bump whenever the checks below change; invalidates every cached verdict
+AUDIT_RULES_VERSION = "1"
+
+# Wall-clock cap for executing one record's asserts (seconds, 0 = no cap)
+RECORD_TIMEOUT_S = float(os.environ.get("AUDIT_RECORD_TIMEOUT", "2"))
 
 ARITH_FAMILIES = {"add", "subtract", "multiply", "divide", "power"}
 
@@ -262,49 +282,69 @@ def correct_asserts(func_src: str, test_src: str, fname: str) -> Tuple[bool, str
     return (True, test_src)
 
 
-# --- main --------------------------------------------------------------------
+# --- per-record audit --------------------------------------------------------
 
 
-def main() -> None:
-    kept, rej = 0, 0
-    with open(SRC, "r", encoding="utf-8") as fi, \
-            open(OUT_CLEAN, "w", encoding="utf-8") as fo, \
-            open(OUT_REJECT, "w", encoding="utf-8") as fr:
+def audit_line(line: str) -> Tuple[Optional[bool], str]:
+    """
+    Audit one raw JSONL line.
 
-        for line in fi:
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                rej += 1
-                fr.write(line)
-                continue
+    Returns:
+        (True, cleaned_json_line) to keep the record,
+        (False, original_line) to reject it (malformed, wrong RHS),
+        (None, original_line) on timeout (rejected, but not cached).
+    """
+    try:
+        obj = json.loads(line)
+    except json.JSONDecodeError:
+        return (False, line)
 
-            func = obj.get("input", "")
-            test = obj.get("output", "")
+    func = obj.get("input", "")
+    test = obj.get("output", "")
 
-            m = re.search(r"def\s+([a-zA-Z_]\w*)\s*\(", func)
-            if not m:
-                rej += 1
-                fr.write(line)
-                continue
+    m = re.search(r"def\s+([a-zA-Z_]\w*)\s*\(", func)
+    if not m:
+        return (False, line)
 
-            fname = m.group(1)
-            family = fname.split("_")[0]
+    fname = m.group(1)
+    family = fname.split("_")[0]
 
-            if family in ARITH_FAMILIES:
+    if family in ARITH_FAMILIES:
+        try:
+            with time_limit(RECORD_TIMEOUT_S):
                 ok, fixed = correct_asserts(func, test, fname)
-                if ok:
-                    obj["output"] = fixed
-                    fo.write(json.dumps(obj, ensure_ascii=False) + "\n")
-                    kept += 1
-                else:
-                    fr.write(line)
-                    rej += 1
-            else:
-                fo.write(json.dumps(obj, ensure_ascii=False) + "\n")
-                kept += 1
+        except RecordTimeout:
+            return (None, line)
+        if not ok:
+            return (False, line)
+        obj["output"] = fixed
+
+    return (True, json.dumps(obj, ensure_ascii=False) + "\n")
+
+
+# --- main --------------------------------------------------------------------
 
-    print(f"[audit] kept={kept} rejected={rej} -> {OUT_CLEAN} / {OUT_REJECT}")
+
+def main(
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    incremental: bool = True,
+) -> None:
+    """
+    Audit SRC into OUT_CLEAN / OUT_REJECT.
+
+    `workers` defaults to AUDIT_WORKERS (or one per core); chunks are merged
+    back in input order, so output is identical to a single-process run.
+    With `incremental`, records already in MANIFEST are not re-executed.
+    """
+    manifest = AuditManifest(MANIFEST, AUDIT_RULES_VERSION) if incremental else None
+    kept, rej = run_sharded_audit(
+        SRC, OUT_CLEAN, OUT_REJECT, audit_line,
+        workers=workers, chunk_size=chunk_size, manifest=manifest,
+    )
+    reused = manifest.reused if manifest else 0
+    print(f"[audit] kept={kept} rejected={rej} reused={reused} "
+          f"-> {OUT_CLEAN} / {OUT_REJECT}")
 
 
 if __name__ == "__main__":
@@ -12,17 +12,30 @@ Audit and normalize *edge-case* function-test pairs.
 - Writes:
     dataset.edge.cleaned.jsonl
     dataset.edge.rejected.audit.jsonl
+
+- Runs sharded on a process pool (AUDIT_WORKERS, default one per core)
+- Reuses verdicts for unchanged records from dataset.edge.audit.manifest.jsonl
 """
 
 from __future__ import annotations
 
 import ast
 import json
-from typing import List, Set
+from typing import List, Optional, Set, Tuple
+
+from unittestgen.management.sharding import (
+    DEFAULT_CHUNK_SIZE,
+    AuditManifest,
+    run_sharded_audit,
+)
 
 SRC = "dataset.edge.jsonl"
 OUT_CLEAN = "dataset.edge.cleaned.jsonl"
 OUT_REJECT = "dataset.edge.rejected.audit.jsonl"
+MANIFEST = "dataset.edge.audit.manifest.jsonl"
+
+# Bump whenever the checks below change; invalidates every cached verdict
+AUDIT_RULES_VERSION = "1"
 
 # ----------------- helpers -----------------
 
@@ -90,79 +103,77 @@ def test_module_references_funcs(tree: ast.AST, func_names: List[str]) -> bool:
             return True
     return False
 
-# ----------------- main audit -----------------
+# ----------------- per-record audit -----------------
+
+
+def audit_line(line: str) -> Tuple[bool, str]:
+    """
+    Audit one raw JSONL line.
+
+    Returns (True, cleaned_json_line) to keep it, (False, raw_line) to reject.
+    """
+    raw = line.rstrip("\n")
+    reject = (False, raw + "\n")
+
+    if not raw.strip():
+        return reject
+
+    try:
+        obj = json.loads(raw)
+    except json.JSONDecodeError:
+        return reject
 
+    func_src = (obj.get("input") or "").strip()
+    test_src = (obj.get("output") or "").strip()
+
+    if not func_src or not test_src:
+        return reject
+
+    # 1) Parse function source & collect function names
+    func_names = get_function_names_from_src(func_src)
+    if not func_names:
+        # either parse failed or no functions present
+        return reject
+
+    # 2) Parse test source
+    try:
+        test_tree = ast.parse(test_src)
+    except SyntaxError:
+        return reject
+
+    # 3) At least one test_* function
+    if not test_module_has_test_functions(test_tree):
+        return reject
+
+    # 4) At least one assert or pytest.raises
+    if not test_module_has_assert_or_raises(test_tree):
+        return reject
+
+    # 5) Test references at least one of the functions
+    if not test_module_references_funcs(test_tree, func_names):
+        return reject
+
+    # If we got here, we keep it
+    return (True, json.dumps(obj, ensure_ascii=False) + "\n")
+
+# ----------------- main audit -----------------
 
-def main() -> None:
-    kept, rej = 0, 0
-
-    with open(SRC, "r", encoding="utf-8") as fi, \
-            open(OUT_CLEAN, "w", encoding="utf-8") as fo, \
-            open(OUT_REJECT, "w", encoding="utf-8") as fr:
-
-        for line in fi:
-            raw = line.rstrip("\n")
-
-            if not raw.strip():
-                rej += 1
-                fr.write(raw + "\n")
-                continue
-
-            try:
-                obj = json.loads(raw)
-            except json.JSONDecodeError:
-                rej += 1
-                fr.write(raw + "\n")
-                continue
-
-            func_src = (obj.get("input") or "").strip()
-            test_src = (obj.get("output") or "").strip()
-
-            if not func_src or not test_src:
-                rej += 1
-                fr.write(raw + "\n")
-                continue
-
-            # 1) Parse function source & collect function names
-            func_names = get_function_names_from_src(func_src)
-            if not func_names:
-                # either parse failed or no functions present
-                rej += 1
-                fr.write(raw + "\n")
-                continue
-
-            # 2) Parse test source
-            try:
-                test_tree = ast.parse(test_src)
-            except SyntaxError:
-                rej += 1
-                fr.write(raw + "\n")
-                continue
-
-            # 3) At least one test_* function
-            if not test_module_has_test_functions(test_tree):
-                rej += 1
-                fr.write(raw + "\n")
-                continue
-
-            # 4) At least one assert or pytest.raises
-            if not test_module_has_assert_or_raises(test_tree):
-                rej += 1
-                fr.write(raw + "\n")
-                continue
-
-            # 5) Test references at least one of the functions
-            if not test_module_references_funcs(test_tree, func_names):
-                rej += 1
-                fr.write(raw + "\n")
-                continue
-
-            # If we got here, we keep it
-            fo.write(json.dumps(obj, ensure_ascii=False) + "\n")
-            kept += 1
 
+def main(
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    incremental: bool = True,
+) -> None:
+    """Sharded audit of SRC; output order always matches the input."""
+    manifest = AuditManifest(MANIFEST, AUDIT_RULES_VERSION) if incremental else None
+    kept, rej = run_sharded_audit(
+        SRC, OUT_CLEAN, OUT_REJECT, audit_line,
+        workers=workers, chunk_size=chunk_size, manifest=manifest,
+    )
+    reused = manifest.reused if manifest else 0
     print(
-        f"[edge-audit] kept={kept} rejected={rej} -> {OUT_CLEAN} / {OUT_REJECT}")
+        f"[edge-audit] kept={kept} rejected={rej} reused={reused} "
+        f"-> {OUT_CLEAN} / {OUT_REJECT}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,163 @@
+"""
+Length-grouped, token-budget batching for the fine-tuning scripts.
+
+Random fixed-size batches mix one-line seed tests with long edge tests, so
+DataCollatorForSeq2Seq pads most of every batch. Instead:
+
+- shuffle, then cut the data into windows of `window` examples
+- sort each window by length and pack greedily while
+  batch_size * (longest source + longest target) <= max_tokens
+- shuffle the resulting batches, so epochs still see a random order
+
+TokenBudgetTrainer plugs the sampler into Trainer and logs the padding
+ratio (share of padded positions) next to what fixed batches would pay.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Iterator, List, Optional, Sequence
+
+from torch.utils.data import DataLoader, Sampler
+from transformers import Trainer
+
+MAX_BATCH_TOKENS = 4096
+
+
+def padding_ratio(batches: Sequence[Sequence[int]],
+                  src_lengths: Sequence[int],
+                  tgt_lengths: Sequence[int]) -> float:
+    """Share of padded (wasted) positions when each batch pads to its longest."""
+    real = padded = 0
+    for batch in batches:
+        if not batch:
+            continue
+        src = [src_lengths[i] for i in batch]
+        tgt = [tgt_lengths[i] for i in batch]
+        real += sum(src) + sum(tgt)
+        padded += len(batch) * (max(src) + max(tgt))
+    return 1.0 - real / padded if padded else 0.0
+
+
+class TokenBudgetBatchSampler(Sampler):
+    """Yields lists of indices whose padded size stays under `max_tokens`."""
+
+    def __init__(
+        self,
+        src_lengths: Sequence[int],
+        tgt_lengths: Sequence[int],
+        max_tokens: int = MAX_BATCH_TOKENS,
+        *,
+        max_batch_size: Optional[int] = 64,
+        window: int = 1024,
+        shuffle: bool = True,
+        seed: int = 42,
+    ):
+        self.src_lengths = list(src_lengths)
+        self.tgt_lengths = list(tgt_lengths)
+        self.max_tokens = max_tokens
+        self.max_batch_size = max_batch_size
+        self.window = max(1, window)
+        self.shuffle = shuffle
+        self.seed = seed
+        self.epoch = 0
+
+        # attributes some DataLoader wrappers (accelerate) look for
+        self.sampler = range(len(self.src_lengths))
+        self.batch_size = max_batch_size
+        self.drop_last = False
+
+        self._plan = self._build(self.epoch)
+
+    def set_epoch(self, epoch: int) -> None:
+        self.epoch = epoch
+        self._plan = self._build(epoch)
+
+    def _build(self, epoch: int) -> List[List[int]]:
+        rng = random.Random(self.seed + epoch)
+        order = list(range(len(self.src_lengths)))
+        if self.shuffle:
+            rng.shuffle(order)
+
+        batches: List[List[int]] = []
+        for start in range(0, len(order), self.window):
+            window = sorted(
+                order[start:start + self.window],
+                key=lambda i: (self.src_lengths[i] + self.tgt_lengths[i], i),
+            )
+            batch: List[int] = []
+            max_src = max_tgt = 0
+            for i in window:
+                new_src = max(max_src, self.src_lengths[i])
+                new_tgt = max(max_tgt, self.tgt_lengths[i])
+                cost = (len(batch) + 1) * (new_src + new_tgt)
+                full = self.max_batch_size and len(batch) >= self.max_batch_size
+                if batch and (cost > self.max_tokens or full):
+                    batches.append(batch)
+                    batch, new_src, new_tgt = [], self.src_lengths[i], self.tgt_lengths[i]
+                batch.append(i)
+                max_src, max_tgt = new_src, new_tgt
+            if batch:
+                batches.append(batch)
+
+        if self.shuffle:
+            rng.shuffle(batches)
+        return batches
+
+    def padding_ratio(self) -> float:
+        return padding_ratio(self._plan, self.src_lengths, self.tgt_lengths)
+
+    def __iter__(self) -> Iterator[List[int]]:
+        plan = self._plan
+        # next pass gets a fresh order even if nobody calls set_epoch()
+        self.epoch += 1
+        self._plan = self._build(self.epoch)
+        return iter(plan)
+
+    def __len__(self) -> int:
+        # packing varies slightly per epoch; Trainer only needs an estimate
+        return len(self._plan)
+
+
+class TokenBudgetTrainer(Trainer):
+    """Trainer whose train dataloader packs batches by token budget."""
+
+    def __init__(self, *args, max_batch_tokens: int = MAX_BATCH_TOKENS,
+                 max_batch_size: Optional[int] = 64, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max_batch_size
+
+    def get_train_dataloader(self) -> DataLoader:
+        ds = self.train_dataset
+        if "src_len" in ds.column_names:
+            src, tgt = ds["src_len"], ds["tgt_len"]
+        else:
+            src = [len(x) for x in ds["input_ids"]]
+            tgt = [len(x) for x in ds["labels"]]
+
+        sampler = TokenBudgetBatchSampler(
+            src, tgt, self.max_batch_tokens,
+            max_batch_size=self.max_batch_size,
+            seed=self.args.seed,
+        )
+
+        fixed = list(range(len(src)))
+        random.Random(self.args.seed).shuffle(fixed)
+        bs = self.args.per_device_train_batch_size
+        baseline = padding_ratio([fixed[i:i + bs] for i in range(0, len(fixed), bs)],
+                                 src, tgt)
+        ratio = sampler.padding_ratio()
+        print(f"[train] token-budget batches: {len(sampler)} "
+              f"(<= {self.max_batch_tokens} tokens), padding ratio {ratio:.1%} "
+              f"(random batches of {bs}: {baseline:.1%})")
+
+        ds = self._remove_unused_columns(ds, description="training")
+        loader = DataLoader(
+            ds,
+            batch_sampler=sampler,
+            collate_fn=self.data_collator,
+            num_workers=self.args.dataloader_num_workers,
+            pin_memory=self.args.dataloader_pin_memory,
+        )
+        return self.accelerator.prepare(loader)
@@ -0,0 +1,40 @@
+# unittestgen/management/commands/distill.py
+"""
+Collect validated teacher outputs for the student model.
+
+    python manage.py distill [--teacher base] [--dataset dataset.cleaned.jsonl]
+                             [--out dataset.distill.jsonl] [--limit N]
+
+Then: `manage.py finetune --profile student`, and compare with
+`manage.py evalmodel <teacher dir> <student dir>` before pointing
+SMALL_MODEL_PATH at the student.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from unittestgen.ai.codet5_engine import SERVING_MODES
+from unittestgen.management.distill import OUT, SRC, main
+
+
+class Command(BaseCommand):
+    help = "Build the distillation dataset from validator-approved teacher tests."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--teacher", default="base",
+                            choices=[m for m in SERVING_MODES if m != "small"],
+                            help="Serving mode whose model acts as the teacher.")
+        parser.add_argument("--dataset", default=SRC,
+                            help="Cleaned dataset; only its training split is used.")
+        parser.add_argument("--out", default=OUT,
+                            help="Distillation dataset (appended to, resumable).")
+        parser.add_argument("--limit", type=int, default=None,
+                            help="Stop after this many new inputs.")
+
+    def handle(self, *args, **opts):
+        try:
+            stats = main(teacher=opts["teacher"], src=opts["dataset"],
+                         out=opts["out"], limit=opts["limit"])
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(str(e)) from e
+        self.stdout.write(self.style.SUCCESS(
+            f"[distill] Kept {stats['kept']} of {stats['run']} teacher tests in {opts['out']}"
+        ))
@@ -0,0 +1,89 @@
+# unittestgen/management/commands/evalmodel.py
+"""
+Evaluate checkpoints the way they will be served.
+
+    python manage.py evalmodel [<model_dir> ...] [--mode base|edge]
+                               [--dataset dataset.cleaned.jsonl | --functions <file|dir>]
+                               [--limit 200] [--k 1,4,16] [--out report.json]
+
+Each model dir (a final model or a Trainer checkpoint-N folder) is loaded
+into the engine in turn and scored on the same held-out functions: pass@k,
+mean candidates to first pass, fallback rate and latency. With no model
+dir, the currently configured model for --mode is evaluated.
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from unittestgen.ai.codet5_engine import use_model_dir
+from unittestgen.management.evaluation import (
+    DEFAULT_KS,
+    evaluate,
+    format_report,
+    load_functions_file,
+    load_heldout_functions,
+)
+
+
+class Command(BaseCommand):
+    help = "Score model checkpoints with the validator-in-the-loop serving pipeline."
+
+    def add_arguments(self, parser):
+        parser.add_argument("model_dirs", nargs="*",
+                            help="Model / checkpoint directories to compare.")
+        parser.add_argument("--mode", default="base",
+                            help="Serving mode the checkpoint is loaded as.")
+        parser.add_argument("--dataset", default="dataset.cleaned.jsonl",
+                            help="Cleaned dataset; its held-out clusters are used.")
+        parser.add_argument("--functions", default=None,
+                            help="Explicit function set (.jsonl, .py or directory).")
+        parser.add_argument("--limit", type=int, default=200,
+                            help="Max inputs to evaluate (0 = all).")
+        parser.add_argument("--k", default=",".join(str(k) for k in DEFAULT_KS),
+                            help="Comma-separated k values for pass@k.")
+        parser.add_argument("--out", default=None,
+                            help="Write the full JSON report(s) here.")
+
+    def handle(self, *args, **opts):
+        try:
+            ks = sorted({int(k) for k in opts["k"].split(",") if k.strip()})
+        except ValueError as e:
+            raise CommandError(f"--k must be comma-separated integers: {e}") from e
+
+        try:
+            if opts["functions"]:
+                functions = load_functions_file(opts["functions"])
+            else:
+                functions = load_heldout_functions(opts["dataset"])
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f"Could not load evaluation functions: {e}") from e
+
+        if opts["limit"]:
+            functions = functions[:opts["limit"]]
+        if not functions:
+            raise CommandError("No functions to evaluate.")
+        self.stdout.write(f"[eval] {len(functions)} inputs, mode={opts['mode']}")
+
+        reports = {}
+        for model_dir in opts["model_dirs"] or [None]:
+            label = model_dir or f"current {opts['mode']} model"
+            if model_dir:
+                use_model_dir(opts["mode"], model_dir)
+
+            def _progress(n, total, elapsed):
+                if n % 10 == 0 or n == total:
+                    self.stdout.write(f"[eval] {label}: {n}/{total} ({elapsed:.2f}s last)")
+
+            report = evaluate(functions, mode=opts["mode"], ks=ks, on_progress=_progress)
+            reports[label] = report
+            self.stdout.write(format_report(report, label))
+
+        if len(reports) > 1:
+            self.stdout.write("[eval] ---- summary ----")
+            for label, report in reports.items():
+                self.stdout.write(format_report(report, label))
+
+        if opts["out"]:
+            with open(opts["out"], "w", encoding="utf-8") as fh:
+                json.dump(reports, fh, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"[eval] Report written to {opts['out']}"))
@@ -0,0 +1,52 @@
+# unittestgen/management/commands/finetune.py
+"""
+Fine-tune the base, edge or student model from finetune_config.json.
+
+    python manage.py finetune --profile base|edge|student [--config path.json]
+                              [--resume auto|<checkpoint>] [--epochs N]
+                              [--threads N] [--interop-threads N]
+                              [--gradient-checkpointing] [--bf16 auto|on|off]
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from unittestgen.management.finetune import load_profile, run
+
+
+class Command(BaseCommand):
+    help = "Fine-tune a CodeT5 model using a profile from finetune_config.json."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--profile", default="base",
+                            help="Profile name in the config (base, edge, ...).")
+        parser.add_argument("--config", default=None,
+                            help="Config file (default: management/finetune_config.json).")
+        parser.add_argument("--resume", default=None,
+                            help="'auto' for the latest checkpoint in the save path, "
+                                 "or a checkpoint directory.")
+        parser.add_argument("--epochs", type=float, default=None)
+        parser.add_argument("--threads", type=int, default=None,
+                            help="torch intra-op threads (CPU).")
+        parser.add_argument("--interop-threads", type=int, default=None,
+                            help="torch inter-op threads (CPU).")
+        parser.add_argument("--gradient-checkpointing", action="store_true", default=None,
+                            help="Trade compute for activation memory.")
+        parser.add_argument("--bf16", choices=["auto", "on", "off"], default=None,
+                            help="bf16 mixed precision on CPU (default off; auto = if supported).")
+
+    def handle(self, *args, **opts):
+        try:
+            cfg = load_profile(opts["profile"], opts["config"])
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e)) from e
+
+        overrides = {
+            "num_train_epochs": opts["epochs"],
+            "torch_threads": opts["threads"],
+            "interop_threads": opts["interop_threads"],
+            "gradient_checkpointing": opts["gradient_checkpointing"],
+            "bf16": opts["bf16"],
+        }
+        cfg.update({k: v for k, v in overrides.items() if v is not None})
+
+        save_path = run(cfg, resume=opts["resume"])
+        self.stdout.write(self.style.SUCCESS(f"[finetune] Done. Model in {save_path}"))
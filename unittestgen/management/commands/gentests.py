@@ -0,0 +1,197 @@
+# unittestgen/management/commands/gentests.py
+"""
+Headless batch test generation over a source tree.
+
+    python manage.py gentests <path> [--out tests] [--mode base|edge|small]
+                                     [--workers 2] [--batch-size 8] [--force]
+
+- walks <path> for source modules (same filter as archive uploads)
+- finds top-level functions with _extract_function_defs
+- generates tests in batches (generate_tests_batched) on a worker pool
+- writes <out>/test_<module>.py per source module
+- keeps <out>/.gentests_manifest.json with a content hash per function,
+  so re-runs only send new / changed functions to the model
+"""
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand, CommandError
+
+from unittestgen.ai.codet5_engine import (
+    SERVING_MODES,
+    generate_tests_batched,
+    _extract_function_defs,
+    _function_fingerprint,
+    _merge_multi_function_tests,
+)
+from unittestgen.archive import is_source_module, module_name_for
+
+MANIFEST_NAME = ".gentests_manifest.json"
+
+
+def _load_manifest(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_atomic(path: str, text: str) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        fh.write(text)
+    os.replace(tmp, path)
+
+
+def _test_path(out_dir: str, module: str) -> str:
+    return os.path.join(out_dir, f"test_{module.replace('.', '_')}.py")
+
+
+def _iter_modules(root: str, out_dir: str):
+    """Yield (relative_posix_path, source) for every source module under root."""
+    out_abs = os.path.abspath(out_dir)
+    for dirpath, dirnames, filenames in os.walk(root):
+        # never descend into the output directory itself
+        dirnames[:] = sorted(
+            d for d in dirnames
+            if os.path.abspath(os.path.join(dirpath, d)) != out_abs
+        )
+        for fname in sorted(filenames):
+            full = os.path.join(dirpath, fname)
+            rel = os.path.relpath(full, root).replace(os.sep, "/")
+            if not is_source_module(rel):
+                continue
+            with open(full, "rb") as fh:
+                raw = fh.read()
+            try:
+                yield rel, raw.decode("utf-8")
+            except UnicodeDecodeError:
+                yield rel, raw.decode("latin-1")
+
+
+class Command(BaseCommand):
+    help = "Generate pytest files for every top-level function under a directory."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Source tree to scan.")
+        parser.add_argument("--out", default=None,
+                            help="Output directory (default: <path>/tests).")
+        parser.add_argument("--mode", default="base", choices=list(SERVING_MODES))
+        parser.add_argument("--workers", type=int, default=1,
+                            help="Batches generated concurrently.")
+        parser.add_argument("--batch-size", type=int, default=8,
+                            help="Functions per batched beam call.")
+        parser.add_argument("--force", action="store_true",
+                            help="Ignore the manifest and regenerate everything.")
+
+    def handle(self, *args, **opts):
+        root = opts["path"]
+        if not os.path.isdir(root):
+            raise CommandError(f"Not a directory: {root}")
+
+        mode = opts["mode"]
+        out_dir = opts["out"] or os.path.join(root, "tests")
+        os.makedirs(out_dir, exist_ok=True)
+        manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+        manifest = {} if opts["force"] else _load_manifest(manifest_path)
+
+        # ---- 1) Scan + diff against the manifest ----
+        modules: dict[str, dict] = {}
+        pending: list[tuple[str, str, str, str]] = []   # (rel, name, src, hash)
+        for rel, source in _iter_modules(root, out_dir):
+            fn_defs = _extract_function_defs(source)
+            if not fn_defs:
+                continue
+            known = manifest.get(rel, {}).get("functions", {})
+            functions = {}
+            for name, src in fn_defs:
+                fp = _function_fingerprint(src)
+                prev = known.get(name) or {}
+                if prev.get("hash") == fp and prev.get("mode") == mode and prev.get("test"):
+                    functions[name] = prev
+                else:
+                    functions[name] = {"hash": fp, "mode": mode, "test": None}
+                    pending.append((rel, name, src, fp))
+            modules[rel] = {
+                "module": module_name_for(rel),
+                "order": [name for name, _ in fn_defs],
+                "functions": functions,
+            }
+
+        # Test files are flat (test_<module with dots -> _>.py), so e.g.
+        # pkg/a.py and pkg_a.py would silently overwrite each other
+        by_path: dict[str, list[str]] = {}
+        for rel in modules:
+            by_path.setdefault(_test_path(out_dir, modules[rel]["module"]), []).append(rel)
+        clashes = {p: rels for p, rels in by_path.items() if len(rels) > 1}
+        if clashes:
+            raise CommandError("Several modules map to the same test file:\n" + "\n".join(
+                f"  {os.path.relpath(p, out_dir)} <- {', '.join(rels)}"
+                for p, rels in sorted(clashes.items())))
+
+        skipped = sum(len(m["functions"]) for m in modules.values()) - len(pending)
+        self.stdout.write(
+            f"[gentests] {len(modules)} modules, {len(pending)} to generate, "
+            f"{skipped} unchanged (reused)"
+        )
+
+        lock = threading.Lock()
+        remaining = {rel: 0 for rel in modules}
+        for rel, *_ in pending:
+            remaining[rel] += 1
+
+        def _write_module(rel: str) -> None:
+            mod = modules[rel]
+            names = mod["order"]
+            tests = _merge_multi_function_tests(
+                [mod["functions"][n]["test"] for n in names],
+                origin=f"gentests - {rel}",
+                extra_imports=[f"from {mod['module']} import {', '.join(names)}"],
+            )
+            _write_atomic(_test_path(out_dir, mod["module"]), tests + "\n")
+
+        def _save_manifest() -> None:
+            data = {rel: {"functions": m["functions"]}
+                    for rel, m in modules.items()}
+            _write_atomic(manifest_path, json.dumps(data, indent=2))
+
+        # Modules with nothing to generate only need their file (re)written
+        for rel, count in remaining.items():
+            if count == 0 and not os.path.exists(_test_path(out_dir, modules[rel]["module"])):
+                _write_module(rel)
+
+        # ---- 2) Generate in batches on a worker pool ----
+        batch_size = max(1, opts["batch_size"])
+        batches = [pending[i:i + batch_size]
+                   for i in range(0, len(pending), batch_size)]
+
+        def _run(batch):
+            return batch, generate_tests_batched(
+                [(name, src) for _rel, name, src, _fp in batch],
+                batch_size=batch_size,
+                mode=mode,
+            )
+
+        done = 0
+        with ThreadPoolExecutor(max_workers=max(1, opts["workers"])) as pool:
+            futures = [pool.submit(_run, b) for b in batches]
+            for fut in as_completed(futures):
+                batch, results = fut.result()
+                with lock:
+                    for (rel, name, _src, _fp), snippet in zip(batch, results):
+                        modules[rel]["functions"][name]["test"] = snippet
+                        remaining[rel] -= 1
+                        if remaining[rel] == 0:
+                            _write_module(rel)
+                    # persist after every batch so an interrupted run resumes here
+                    _save_manifest()
+                    done += len(batch)
+                self.stdout.write(f"[gentests] {done}/{len(pending)} functions")
+
+        _save_manifest()
+        self.stdout.write(self.style.SUCCESS(
+            f"[gentests] Done. Test files in {out_dir}"))
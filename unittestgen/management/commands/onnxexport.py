@@ -0,0 +1,82 @@
+# unittestgen/management/commands/onnxexport.py
+"""
+Export a serving model to ONNX and check it against the torch backend.
+
+    python manage.py onnxexport [--mode base|edge|small]
+                                [--dataset dataset.cleaned.jsonl | --functions <file|dir>]
+                                [--limit 50] [--skip-parity]
+
+The export lands in ONNX_CACHE_DIR and is what INFERENCE_BACKEND=onnx
+serves. Parity compares beam-search candidates on held-out functions.
+"""
+import importlib.util
+
+from django.core.management.base import BaseCommand, CommandError
+
+from unittestgen.ai.codet5_engine import (
+    SERVING_MODES,
+    _MODEL_DIRS,
+    _load_model_and_tokenizer,
+    onnx_export_dir,
+)
+from unittestgen.management.evaluation import load_functions_file, load_heldout_functions
+
+
+class Command(BaseCommand):
+    help = "Export a model to ONNX Runtime and check beam-search parity with torch."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--mode", default="base", choices=list(SERVING_MODES))
+        parser.add_argument("--dataset", default="dataset.cleaned.jsonl",
+                            help="Cleaned dataset; its held-out clusters are the corpus.")
+        parser.add_argument("--functions", default=None,
+                            help="Explicit corpus (.jsonl, .py or directory).")
+        parser.add_argument("--limit", type=int, default=50,
+                            help="Max functions for the parity check (0 = all).")
+        parser.add_argument("--skip-parity", action="store_true",
+                            help="Only export.")
+
+    def handle(self, *args, **opts):
+        if any(importlib.util.find_spec(m) is None for m in ("optimum", "onnxruntime")):
+            raise CommandError("ONNX export needs `pip install optimum[onnxruntime]`.")
+
+        mode = opts["mode"]
+        model_dir = _MODEL_DIRS.get(mode) or _MODEL_DIRS["base"]
+        _load_model_and_tokenizer(mode, "onnx")
+        self.stdout.write(f"[onnx] {model_dir} -> {onnx_export_dir(model_dir)}")
+        if opts["skip_parity"]:
+            return
+
+        from unittestgen.management.onnx_parity import check_parity
+
+        try:
+            if opts["functions"]:
+                functions = load_functions_file(opts["functions"])
+            else:
+                functions = load_heldout_functions(opts["dataset"])
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f"Could not load parity corpus: {e}") from e
+        if opts["limit"]:
+            functions = functions[:opts["limit"]]
+        if not functions:
+            raise CommandError("No functions to compare.")
+
+        def _progress(n, total, row):
+            if not row["exact"]:
+                self.stdout.write(f"[onnx] {n}/{total}: candidates differ "
+                                  f"(top-1 {'same' if row['top1'] else 'differs'})")
+
+        report = check_parity(functions, mode=mode, on_progress=_progress)
+        lat = report["latency_s"]
+        speedup = lat["torch"] / lat["onnx"] if lat["onnx"] else 0.0
+        self.stdout.write(
+            f"[onnx] {report['functions']} functions | exact={report['exact']:.1%} "
+            f"top1={report['top1']:.1%} | torch={lat['torch']:.2f}s "
+            f"onnx={lat['onnx']:.2f}s ({speedup:.2f}x)"
+        )
+        if report["top1"] < 1.0:
+            self.stdout.write(self.style.WARNING(
+                "[onnx] Top-1 beams differ on some inputs; check with evalmodel before switching."
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS("[onnx] Backends agree on the top beam."))
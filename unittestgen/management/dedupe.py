@@ -0,0 +1,197 @@
+"""
+Streaming, bounded-memory pair dedupe for the dataset generators.
+
+- Keys are 16-byte blake2b digests of the normalized (input, output) pair,
+  not the full strings, so the index costs ~16 bytes per record
+- The index lives in memory (a set) or, for datasets larger than RAM, in a
+  throwaway SQLite file next to the dataset (DEDUPE_INDEX=sqlite)
+- Append-only: the index is seeded from the existing dataset, then only
+  new unique pairs are appended to it. Existing records are never
+  rewritten, so an update costs one read of the file plus the new lines
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+from collections import Counter
+from typing import Callable, Dict, Iterable, Optional
+
+DIGEST_SIZE = 16
+
+
+def normalize_pair(inp: str, out: str):
+    return (inp or "").strip(), (out or "").strip()
+
+
+def pair_digest(inp: str, out: str) -> bytes:
+    h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    h.update(inp.encode("utf-8"))
+    h.update(b"\0")
+    h.update(out.encode("utf-8"))
+    return h.digest()
+
+
+def input_digest(inp: str) -> bytes:
+    return hashlib.blake2b(inp.encode("utf-8"), digest_size=DIGEST_SIZE).digest()
+
+
+# -----------------------------
+# Digest indexes
+# -----------------------------
+class MemoryIndex:
+    def __init__(self):
+        self._seen = set()
+        self._per_input = Counter()
+
+    def __contains__(self, digest: bytes) -> bool:
+        return digest in self._seen
+
+    def add(self, digest: bytes) -> None:
+        self._seen.add(digest)
+
+    def input_count(self, digest: bytes) -> int:
+        return self._per_input[digest]
+
+    def bump_input(self, digest: bytes) -> None:
+        self._per_input[digest] += 1
+
+    def close(self) -> None:
+        self._seen.clear()
+        self._per_input.clear()
+
+
+class SqliteIndex:
+    """Same interface as MemoryIndex, backed by a temporary SQLite file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        if os.path.exists(path):
+            os.remove(path)
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=OFF")
+        self._db.execute("PRAGMA synchronous=OFF")
+        self._db.execute(
+            "CREATE TABLE pairs (d BLOB PRIMARY KEY) WITHOUT ROWID")
+        self._db.execute(
+            "CREATE TABLE inputs (d BLOB PRIMARY KEY, n INTEGER) WITHOUT ROWID")
+
+    def __contains__(self, digest: bytes) -> bool:
+        return self._db.execute(
+            "SELECT 1 FROM pairs WHERE d = ?", (digest,)).fetchone() is not None
+
+    def add(self, digest: bytes) -> None:
+        self._db.execute("INSERT OR IGNORE INTO pairs (d) VALUES (?)", (digest,))
+
+    def input_count(self, digest: bytes) -> int:
+        row = self._db.execute(
+            "SELECT n FROM inputs WHERE d = ?", (digest,)).fetchone()
+        return row[0] if row else 0
+
+    def bump_input(self, digest: bytes) -> None:
+        self._db.execute(
+            "INSERT INTO inputs (d, n) VALUES (?, 1) "
+            "ON CONFLICT(d) DO UPDATE SET n = n + 1", (digest,))
+
+    def close(self) -> None:
+        self._db.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def make_index(kind: str, dataset_path: str):
+    if kind == "sqlite":
+        return SqliteIndex(f"{dataset_path}.dedupe.sqlite")
+    if kind == "memory":
+        return MemoryIndex()
+    raise ValueError(f"Unknown dedupe index {kind!r} (expected 'memory' or 'sqlite')")
+
+
+# -----------------------------
+# Streaming dedupe
+# -----------------------------
+def stream_dedupe(
+    dataset_path: str,
+    rejected_path: str,
+    existing: Iterable[dict],
+    incoming: Iterable[dict],
+    *,
+    is_valid: Callable[[str], bool],
+    per_input_cap: Optional[int] = None,
+    index: str = "memory",
+) -> Dict[str, int]:
+    """
+    Append the new unique, valid pairs of `incoming` to `dataset_path`.
+
+    `existing` (usually a reader over `dataset_path`) only seeds the index
+    and the per-input counts; it is consumed before the file is opened for
+    appending, and the records already in the file are left as they are.
+    Rejected pairs go to `rejected_path` (left untouched when none).
+    Returns counts: existing, incoming, kept, appended, duplicates, rejected.
+    """
+    stats = Counter()
+    idx = make_index(index, dataset_path)
+    tmp_rejected = f"{rejected_path}.tmp"
+
+    try:
+        for example in existing:
+            stats["existing"] += 1
+            in_src, tgt = normalize_pair(example.get("input"), example.get("output"))
+            key = pair_digest(in_src, tgt)
+            if key in idx:
+                continue
+            idx.add(key)
+            stats["kept"] += 1
+            if per_input_cap is not None:
+                idx.bump_input(input_digest(in_src))
+
+        # a file cut off mid-line must not glue the first new record onto it
+        needs_newline = False
+        if os.path.exists(dataset_path) and os.path.getsize(dataset_path):
+            with open(dataset_path, "rb") as fh:
+                fh.seek(-1, os.SEEK_END)
+                needs_newline = fh.read(1) != b"\n"
+
+        with open(dataset_path, "a", encoding="utf-8") as fo, \
+                open(tmp_rejected, "w", encoding="utf-8") as fr:
+            if needs_newline:
+                fo.write("\n")
+            for example in incoming:
+                stats["incoming"] += 1
+                in_src, tgt = normalize_pair(example.get("input"), example.get("output"))
+                key = pair_digest(in_src, tgt)
+
+                if key in idx:
+                    stats["duplicates"] += 1
+                    continue
+
+                if not (is_valid(in_src) and is_valid(tgt)):
+                    fr.write(json.dumps({"input": in_src, "output": tgt},
+                                        ensure_ascii=False) + "\n")
+                    stats["rejected"] += 1
+                    continue
+
+                if per_input_cap is not None:
+                    in_key = input_digest(in_src)
+                    if idx.input_count(in_key) >= per_input_cap:
+                        continue
+                    idx.bump_input(in_key)
+
+                fo.write(json.dumps({"input": in_src, "output": tgt},
+                                    ensure_ascii=False) + "\n")
+                idx.add(key)
+                stats["kept"] += 1
+                stats["appended"] += 1
+
+        if stats["rejected"]:
+            os.replace(tmp_rejected, rejected_path)
+    finally:
+        idx.close()
+        if os.path.exists(tmp_rejected):
+            os.remove(tmp_rejected)
+
+    return dict(stats)
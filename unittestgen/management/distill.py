@@ -0,0 +1,132 @@
+"""
+Teacher-output collection for distilling a smaller student model.
+
+    python manage.py distill [--teacher base] [--dataset dataset.cleaned.jsonl]
+                             [--out dataset.distill.jsonl] [--limit N]
+
+Every training-split input of the cleaned dataset goes through the teacher
+via generate_test_from_code (the serving path). Only tests the validator
+accepted from beams / sampling are kept; template fallbacks are dropped.
+Held-out clusters are skipped so `manage.py evalmodel` on the cleaned
+dataset stays an honest comparison between teacher and student.
+
+The output is appended to and inputs already in it are skipped, so an
+interrupted run picks up where it stopped. Train the student with
+`manage.py finetune --profile student`, then serve it as mode="small"
+(SMALL_MODEL_PATH).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Dict, Optional
+
+from unittestgen.ai.codet5_engine import generate_test_from_code
+from unittestgen.management.near_dupes import eval_clusters
+
+SRC = os.environ.get("DATASET_PATH", "dataset.cleaned.jsonl")
+OUT = os.environ.get("DISTILL_DATASET_PATH", "dataset.distill.jsonl")
+
+# -----------------------------
+# Inputs
+# -----------------------------
+
+
+def load_training_inputs(dataset_path: str, *, test_size: float = 0.1,
+                         seed: int = 42) -> Dict[str, Optional[int]]:
+    """Unique inputs of the training split -> their near-dup cluster id."""
+    with open(dataset_path, "r", encoding="utf-8") as fh:
+        records = [json.loads(line) for line in fh if line.strip()]
+
+    held_out = set()
+    if records and all("cluster" in r for r in records):
+        held_out = eval_clusters([r["cluster"] for r in records],
+                                 test_size=test_size, seed=seed)
+
+    inputs: Dict[str, Optional[int]] = {}
+    for r in records:
+        src = (r.get("input") or "").strip()
+        if src and r.get("cluster") not in held_out:
+            inputs.setdefault(src, r.get("cluster"))
+    return inputs
+
+
+def _already_collected(out_path: str) -> set:
+    if not os.path.exists(out_path):
+        return set()
+    with open(out_path, "r", encoding="utf-8") as fh:
+        return {json.loads(line)["input"] for line in fh if line.strip()}
+
+
+# -----------------------------
+# Collection
+# -----------------------------
+
+
+def as_target(test: str) -> str:
+    """Serving output -> dataset target (no "# Origin" header / pytest import)."""
+    lines = [ln for ln in test.splitlines()
+             if not ln.strip().startswith("# Origin") and ln.strip() != "import pytest"]
+    return "\n".join(lines).strip() + "\n"
+
+
+def teacher_test(func_src: str, mode: str = "base") -> Optional[str]:
+    """The teacher's validated test for one function, or None on fallback."""
+    phase, accepted = {}, {}
+
+    def on_event(kind, data):
+        if kind == "phase":
+            phase[data["function"]] = data["phase"]
+        elif kind == "accepted":
+            accepted[data["function"]] = data["test"]
+
+    generate_test_from_code(func_src, mode=mode, on_event=on_event)
+    if len(accepted) != 1:
+        return None
+    (name, test), = accepted.items()
+    return test if phase.get(name) in {"beams", "sampling"} else None
+
+
+def main(
+    teacher: str = "base",
+    src: str = SRC,
+    out: str = OUT,
+    limit: Optional[int] = None,
+) -> Dict[str, int]:
+    inputs = load_training_inputs(src)
+    done = _already_collected(out)
+    todo = [(s, c) for s, c in inputs.items() if s not in done]
+    if limit:
+        todo = todo[:limit]
+    print(f"[distill] teacher={teacher} inputs={len(inputs)} "
+          f"already collected={len(done)} to run={len(todo)}")
+
+    stats = {"run": 0, "kept": 0, "dropped": 0}
+    start = time.perf_counter()
+    with open(out, "a", encoding="utf-8") as fh:
+        for func_src, cluster in todo:
+            stats["run"] += 1
+            test = teacher_test(func_src, mode=teacher)
+            if test is None:
+                stats["dropped"] += 1
+            else:
+                stats["kept"] += 1
+                rec = {"input": func_src, "output": as_target(test),
+                       "teacher": teacher}
+                if cluster is not None:
+                    rec["cluster"] = cluster
+                fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                fh.flush()
+            if stats["run"] % 50 == 0:
+                rate = stats["run"] / (time.perf_counter() - start)
+                print(f"[distill] {stats['run']}/{len(todo)} kept={stats['kept']} "
+                      f"({rate:.2f} inputs/s)")
+
+    print(f"[distill] done: kept={stats['kept']} dropped={stats['dropped']} -> {out}")
+    return stats
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Validator-in-the-loop evaluation of a served / trained model.
+
+Runs held-out functions through generate_test_from_code (the real serving
+path: beams → sampling → fallback, validated by _run_test_safely) and
+reports what serving actually costs:
+
+- pass@k            share of functions with a validated test within the
+                    first k candidates (across beams + sampling)
+- mean candidates   distinct candidates validated until the first passing one
+- duplicate rate    share of decoded candidates skipped as duplicates
+- fallback rate     share of functions that ended on a template fallback
+- latency           seconds per input (mean / p50 / p95)
+
+Used by `manage.py evalmodel`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Iterable, List, Optional, Sequence
+
+from unittestgen.ai.codet5_engine import (
+    _BYPASS_VALIDATOR,
+    _extract_function_defs,
+    fresh_verdict_cache,
+    generate_test_from_code,
+)
+from unittestgen.archive import is_source_module
+from unittestgen.management.near_dupes import eval_clusters
+
+DEFAULT_KS = (1, 4, 16)
+
+# Run once, untimed, before the timed inputs: loads the model (use_model_dir
+# drops the cached one) and pays the first-decode warm-up
+WARMUP_SNIPPET = "def add(a, b):\n    return a + b\n"
+
+# -----------------------------
+# Held-out inputs
+# -----------------------------
+
+
+def load_heldout_functions(
+    dataset_path: str,
+    *,
+    test_size: float = 0.1,
+    seed: int = 42,
+) -> List[str]:
+    """
+    Unique function sources from the eval split of a cleaned dataset.
+    Needs the "cluster" ids written by near_dupes.py so the split matches
+    training exactly; otherwise every unique input is used.
+    """
+    with open(dataset_path, "r", encoding="utf-8") as fh:
+        records = [json.loads(line) for line in fh if line.strip()]
+
+    if records and all("cluster" in r for r in records):
+        held_out = eval_clusters([r["cluster"] for r in records],
+                                 test_size=test_size, seed=seed)
+        records = [r for r in records if r["cluster"] in held_out]
+    else:
+        print(f"[eval] {dataset_path} has no cluster ids; using every input")
+
+    return list(dict.fromkeys(r["input"].strip() for r in records if r.get("input")))
+
+
+def load_functions_file(path: str) -> List[str]:
+    """A .jsonl with "input" fields, a .py file, or a directory of modules."""
+    if os.path.isdir(path):
+        sources = []
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for fname in sorted(filenames):
+                rel = os.path.relpath(os.path.join(dirpath, fname), path)
+                if is_source_module(rel.replace(os.sep, "/")):
+                    with open(os.path.join(dirpath, fname), "r", encoding="utf-8") as fh:
+                        sources.extend(src for _n, src in _extract_function_defs(fh.read()))
+        return sources
+
+    with open(path, "r", encoding="utf-8") as fh:
+        if path.endswith(".jsonl"):
+            return [json.loads(line)["input"] for line in fh if line.strip()]
+        return [src for _n, src in _extract_function_defs(fh.read())]
+
+
+# -----------------------------
+# Evaluation
+# -----------------------------
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def evaluate(
+    functions: Iterable[str],
+    *,
+    mode: str = "base",
+    ks: Sequence[int] = DEFAULT_KS,
+    on_progress=None,
+) -> dict:
+    """
+    Run every input through the serving pipeline and aggregate metrics.
+    Latencies exclude the model load (untimed warm-up first) and are
+    measured against an empty verdict cache.
+    """
+    if _BYPASS_VALIDATOR:
+        print("[eval] WARNING: BYPASS_VALIDATOR is set; nothing is validated")
+
+    rows: List[dict] = []
+    latencies: List[float] = []
+    functions = list(functions)
+
+    if functions:
+        with fresh_verdict_cache():
+            generate_test_from_code(WARMUP_SNIPPET, mode=mode)
+
+    # A fresh verdict cache per call, so checkpoints evaluated later in the
+    # same process (or after earlier runs) don't validate from cached verdicts
+    with fresh_verdict_cache():
+        for n, src in enumerate(functions, 1):
+            per_fn: dict = {}
+
+            def on_event(kind, data, per_fn=per_fn):
+                name = data.get("function")
+                if kind == "functions":
+                    for fn in data.get("names", []):
+                        per_fn.setdefault(fn, {"rejected": 0, "phase": None,
+                                               "decoded": 0, "duplicates": 0})
+                    return
+                if name is None:
+                    return
+                row = per_fn.setdefault(name, {"rejected": 0, "phase": None,
+                                               "decoded": 0, "duplicates": 0})
+                if kind == "rejected":
+                    row["rejected"] += 1
+                elif kind == "duplicates":
+                    row["decoded"] += data.get("total", 0)
+                    row["duplicates"] += data.get("count", 0)
+                elif kind == "phase":
+                    row["phase"] = data.get("phase")
+
+            start = time.perf_counter()
+            generate_test_from_code(src, mode=mode, on_event=on_event)
+            elapsed = time.perf_counter() - start
+            latencies.append(elapsed)
+
+            for name, row in per_fn.items():
+                passed = row["phase"] in {"beams", "sampling"}
+                rows.append({
+                    "function": name,
+                    "passed": passed,
+                    "phase": row["phase"],
+                    "candidates": row["rejected"] + 1 if passed else None,
+                    "rejected": row["rejected"],
+                    "decoded": row["decoded"],
+                    "duplicates": row["duplicates"],
+                })
+            if on_progress:
+                on_progress(n, len(functions), elapsed)
+
+    total = len(rows)
+    passed = [r for r in rows if r["passed"]]
+    decoded = sum(r["decoded"] for r in rows)
+    report = {
+        "mode": mode,
+        "inputs": len(functions),
+        "functions": total,
+        "pass_rate": len(passed) / total if total else 0.0,
+        "pass_at_k": {
+            str(k): (sum(1 for r in passed if r["candidates"] <= k) / total if total else 0.0)
+            for k in ks
+        },
+        "mean_candidates_to_first_pass": (
+            sum(r["candidates"] for r in passed) / len(passed) if passed else None
+        ),
+        "duplicate_rate": (
+            sum(r["duplicates"] for r in rows) / decoded if decoded else 0.0
+        ),
+        "fallback_rate": (
+            sum(1 for r in rows if r["phase"] == "fallback") / total if total else 0.0
+        ),
+        "latency_s": {
+            "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+            "p50": _percentile(latencies, 0.50),
+            "p95": _percentile(latencies, 0.95),
+        },
+        "rows": rows,
+    }
+    return report
+
+
+def format_report(report: dict, label: Optional[str] = None) -> str:
+    pass_at = "  ".join(f"pass@{k}={v:.1%}" for k, v in report["pass_at_k"].items())
+    mean_c = report["mean_candidates_to_first_pass"]
+    lat = report["latency_s"]
+    return (
+        f"[eval] {label or report['mode']}: {report['functions']} functions | "
+        f"{pass_at} | pass={report['pass_rate']:.1%} | "
+        f"mean candidates={'n/a' if mean_c is None else f'{mean_c:.2f}'} | "
+        f"duplicates={report.get('duplicate_rate', 0.0):.1%} | "
+        f"fallback={report['fallback_rate']:.1%} | "
+        f"latency mean={lat['mean']:.2f}s p50={lat['p50']:.2f}s p95={lat['p95']:.2f}s"
+    )
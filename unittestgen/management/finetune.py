@@ -0,0 +1,253 @@
+"""
+Fine-tuning entry point shared by the base, edge and student models.
+
+    python manage.py finetune --profile base|edge|student [--config finetune_config.json]
+                              [--resume auto|<checkpoint>] [--threads N]
+                              [--interop-threads N] [--gradient-checkpointing]
+                              [--bf16 auto|on|off]
+
+Hyperparameters live in finetune_config.json ("defaults" merged with one
+of "profiles"). Each profile's "env" block names environment variables
+that override single keys (e.g. EDGE_SAVE_PATH), so existing .env files
+keep working. train.py / train_edge.py are thin wrappers around main().
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Optional
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           "finetune_config.json")
+
+# ---------- Prompts ----------
+
+
+def build_prompt(func: str) -> str:
+    """Builds the natural-language prompt for the model."""
+    return (
+        "Given this Python function:\n```python\n"
+        f"{func}\n"
+        "```, write a PyTest unit test function in Python with at least one assert "
+        "statement to verify its behavior."
+    )
+
+
+def build_edge_prompt(func: str) -> str:
+    """
+    Prompt for the edge-case model.
+
+    We keep it very close to the base prompt so the model doesn't get confused,
+    but we explicitly mention "edge cases" and "boundary conditions".
+    """
+    return (
+        "Given this Python function:\n```python\n"
+        f"{func}\n"
+        "```, write a PyTest unit test function in Python that focuses on "
+        "edge cases and boundary conditions (empty inputs, None, extremes, "
+        "errors, invalid types, etc.) with assert statements to verify behavior."
+    )
+
+
+PROMPTS = {"base": build_prompt, "edge": build_edge_prompt}
+
+# ---------- Config ----------
+
+
+def _coerce(value: str, like):
+    if isinstance(like, bool):
+        return value.strip().lower() in {"1", "true", "yes", "on"}
+    if isinstance(like, int):
+        return int(value)
+    if isinstance(like, float):
+        return float(value)
+    return value
+
+
+def load_profile(name: str, config_path: Optional[str] = None) -> dict:
+    """defaults + profiles[name], then per-key env overrides."""
+    with open(config_path or CONFIG_PATH, "r", encoding="utf-8") as fh:
+        config = json.load(fh)
+
+    profiles = config.get("profiles", {})
+    if name not in profiles:
+        raise ValueError(f"Unknown profile {name!r} (expected one of {sorted(profiles)})")
+
+    defaults = dict(config.get("defaults", {}))
+    profile = dict(profiles[name])
+    env_map = {**defaults.pop("env", {}), **profile.pop("env", {})}
+    cfg = {**defaults, **profile, "profile": name}
+
+    for key, var in env_map.items():
+        if os.environ.get(var):
+            cfg[key] = _coerce(os.environ[var], cfg.get(key))
+    return cfg
+
+
+# ---------- CPU tuning ----------
+
+
+def cpu_bf16_supported() -> bool:
+    import torch
+    try:
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except (AttributeError, RuntimeError):
+        return False
+
+
+def configure_threads(torch_threads: Optional[int], interop_threads: Optional[int]) -> None:
+    """Must run before any parallel torch work (interop threads can only be set once)."""
+    import torch
+    if torch_threads:
+        torch.set_num_threads(int(torch_threads))
+    if interop_threads:
+        try:
+            torch.set_interop_threads(int(interop_threads))
+        except RuntimeError as e:
+            print(f"[finetune] Could not set interop threads: {e}")
+
+
+# ---------- Training ----------
+
+
+def run(cfg: dict, resume: Optional[str] = None) -> str:
+    """Fine-tune according to `cfg` (see load_profile). Returns the save path."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    configure_threads(cfg.get("torch_threads"), cfg.get("interop_threads"))
+
+    import torch
+    from transformers import (
+        AutoTokenizer,
+        AutoModelForSeq2SeqLM,
+        DataCollatorForSeq2Seq,
+        TrainingArguments,
+    )
+    from transformers.trainer_utils import get_last_checkpoint
+
+    from unittestgen.management.batching import TokenBudgetTrainer
+    from unittestgen.management.tokenized_cache import load_tokenized_splits
+
+    tag = cfg.get("log_tag", "train")
+
+    # ---------- Device ----------
+    device = torch.device(
+        "cuda" if torch.cuda.is_available()
+        else "mps" if torch.backends.mps.is_available()
+        else "cpu"
+    )
+    print(f"[{tag}] Using device: {device} (threads={torch.get_num_threads()})")
+
+    bf16_opt = str(cfg.get("bf16", "off")).lower()
+    use_bf16 = device.type == "cpu" and (
+        bf16_opt in {"on", "true", "1"}
+        or (bf16_opt == "auto" and cpu_bf16_supported())
+    )
+
+    save_path = cfg["save_path"]
+    print(f"[{tag}] Loading dataset from: {cfg['dataset_path']}")
+    print(f"[{tag}] Starting from model: {cfg['base_model']}")
+    print(f"[{tag}] Will save model to: {save_path}")
+
+    # ---------- Tokenizer / Model ----------
+    tokenizer = AutoTokenizer.from_pretrained(cfg["base_model"])
+    model = AutoModelForSeq2SeqLM.from_pretrained(cfg["base_model"]).to(device)
+
+    # Ensure model embeddings match tokenizer vocab (prevents missing-keys weirdness)
+    model.resize_token_embeddings(len(tokenizer))
+    model.config.tie_word_embeddings = True
+    model.tie_weights()
+
+    if cfg.get("gradient_checkpointing"):
+        model.config.use_cache = False   # incompatible with checkpointing
+
+    # ---------- Tokenized dataset (cached, memory-mapped) ----------
+    # Near-duplicate clusters stay on one side of the split (see near_dupes.py)
+    split = load_tokenized_splits(
+        cfg["dataset_path"],
+        tokenizer,
+        PROMPTS[cfg.get("prompt", cfg["profile"])],
+        prompt_version=cfg["prompt_version"],
+        max_src_len=cfg["max_src_len"],
+        max_tgt_len=cfg["max_tgt_len"],
+        test_size=cfg["test_size"],
+        seed=cfg["seed"],
+    )
+
+    # ---------- Data Collator ----------
+    data_collator = DataCollatorForSeq2Seq(tokenizer=tokenizer, model=model)
+
+    # ---------- Training args ----------
+    args = TrainingArguments(
+        output_dir=save_path,
+        num_train_epochs=cfg["num_train_epochs"],
+        # padding-log baseline; batches come from max_batch_tokens
+        per_device_train_batch_size=cfg["per_device_train_batch_size"],
+        gradient_accumulation_steps=cfg["gradient_accumulation_steps"],
+        learning_rate=cfg["learning_rate"],
+        lr_scheduler_type=cfg["lr_scheduler_type"],
+        warmup_ratio=cfg["warmup_ratio"],
+        weight_decay=cfg["weight_decay"],
+        label_smoothing_factor=cfg["label_smoothing_factor"],
+        seed=cfg["seed"],
+
+        # Logging / eval / saving
+        logging_dir=cfg["logging_dir"],
+        logging_steps=cfg["logging_steps"],
+        evaluation_strategy="epoch",
+        save_strategy="epoch",
+        save_total_limit=cfg["save_total_limit"],
+        load_best_model_at_end=True,
+        metric_for_best_model="eval_loss",
+        greater_is_better=False,
+
+        # Speed / memory
+        gradient_checkpointing=bool(cfg.get("gradient_checkpointing")),
+        bf16=use_bf16,
+        fp16=torch.cuda.is_available(),
+
+        # Misc
+        push_to_hub=False,
+        report_to=["tensorboard"],
+        dataloader_pin_memory=False,
+    )
+    if use_bf16:
+        print(f"[{tag}] bf16 mixed precision on CPU")
+
+    # ---------- Trainer ----------
+    trainer = TokenBudgetTrainer(
+        model=model,
+        args=args,
+        train_dataset=split["train"],
+        eval_dataset=split["test"],
+        tokenizer=tokenizer,
+        data_collator=data_collator,
+        max_batch_tokens=cfg["max_batch_tokens"],
+        max_batch_size=cfg["max_batch_size"],
+    )
+
+    # ---------- Train ----------
+    checkpoint = None
+    if resume == "auto":
+        checkpoint = get_last_checkpoint(save_path) if os.path.isdir(save_path) else None
+        print(f"[{tag}] Resuming from: {checkpoint or 'scratch (no checkpoint found)'}")
+    elif resume:
+        checkpoint = resume
+        print(f"[{tag}] Resuming from: {checkpoint}")
+    trainer.train(resume_from_checkpoint=checkpoint)
+
+    # ---------- Save ----------
+    model.tie_weights()
+    trainer.save_model(save_path)
+    tokenizer.save_pretrained(save_path)
+    print(f"[{tag}] Model + tokenizer saved to: {save_path}")
+    return save_path
+
+
+def main(profile: str = "base", config_path: Optional[str] = None,
+         resume: Optional[str] = None, **overrides) -> str:
+    cfg = load_profile(profile, config_path)
+    cfg.update({k: v for k, v in overrides.items() if v is not None})
+    return run(cfg, resume=resume)
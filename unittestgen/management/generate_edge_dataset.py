@@ -3,8 +3,10 @@
 Build / update the *edge-case* training dataset.
 
 - Reads / appends to `dataset.edge.jsonl`
+- Streams seed pairs from `data/edge_seeds.jsonl.gz` (see seeds.py)
 - Validates that both function & test are valid Python
-- Does exact pair-level dedupe (and optional per-input caps)
+- Does exact pair-level dedupe on pair digests (and optional per-input caps),
+  appending only new unique pairs to the existing file (see dedupe.py)
 - Writes:
     - dataset.edge.jsonl                (raw but deduped)
     - dataset.edge.rejected.gen.jsonl   (rejected at generation stage)
@@ -12,17243 +14,33 @@ Build / update the *edge-case* training dataset.
     - dataset.edge.cleaned.jsonl
     - dataset.edge.rejected.audit.jsonl
     - dataset.edge.rejected.jsonl       (merged view of all rejects)
+- Then clusters near-duplicates in the cleaned file (near_dupes.py)
 """
 import ast
 import json
 import os
-from collections import defaultdict
 
-# ----------------------------
-# Config (edge-specific paths)
-# ----------------------------
-DATASET_FILE = "dataset.edge.jsonl"
-REJECTED_FILE = "dataset.edge.rejected.gen.jsonl"
-
-# To limit how many test variants one input function can have:
-PER_INPUT_CAP = None  # None == no cap
-
-# ----------------------------
-# Edge-case seeds
-# ----------------------------
-# IMPORTANT:
-# - `edge_functions[i]` pairs with `edge_tests[i]`
-# - Keep them 1:1 and same length
-# - These should be *edge-focused* tests, not the “normal” ones used for the base model.
-
-edge_functions = [
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def add(a,b): return a+b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def subtract(a, b): return a - b",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def rotate_right(s):\n    return s[-1:] + s[:-1]",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def divide(a, b): return a / b if b != 0 else 0",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def reverse_string(s): return s[::-1]",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_digits(s):\n    return ''.join(ch for ch in s if not ch.isdigit())",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def remove_vowels(s): return ''.join(ch for ch in s if ch.lower() not in 'aeiou')",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def join_strings(strings, sep):\n    return sep.join(strings)",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def find_duplicates(lst):\n    seen, dupes = set(), []\n    for x in lst:\n        if x in seen and x not in dupes:\n            dupes.append(x)\n        else:\n            seen.add(x)\n    return dupes",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def count_uppercase(s): return sum(1 for c in s if c.isupper())",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def reverse_words(s): return ' '.join(s.split()[::-1])",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def is_anagram(a, b): return sorted(a) == sorted(b)",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def rotate_left(s):\n    return s[1:] + s[:1]",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def square(n):\n    return n * n",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def to_camel_case(s):\n    return s[0].lower() + s[1:] if s else s",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def reverse_list(lst):\n    return lst[::-1]",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def pad_string(s, width, char=\" \"):\n    if len(s) >= width:\n        return s\n    return s + char * (width - len(s))",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_even(n): return n % 2 == 0",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def is_upper(s): return s.isupper()",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def flatten_once(xs):\n    out=[]\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(x)\n        else:\n            out.append(x)\n    return out",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def median(xs):\n    s = sorted(xs)\n    n = len(s)\n    mid = n // 2\n    if n % 2 == 1:\n        return s[mid]\n    return (s[mid - 1] + s[mid]) / 2",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def increment_elements(xs, n):\n    return [x + n for x in xs]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def chunk_list(lst, size): return [lst[i:i+size] for i in range(0, len(lst), size)]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def square_list(xs):\n    return [x * x for x in xs]",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def replace_substring(s, old, new): return s.replace(old, new)",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def get_middle(s):\n    mid = len(s) // 2\n    if len(s) % 2 == 1:\n        return s[mid]\n    return s[mid - 1 : mid + 1]",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def truncate_string(s, length):\n    return s[:length] + '...' if len(s) > length else s",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def is_perfect_square(n):\n    if n < 0: return False\n    r = int(n**0.5)\n    return r*r == n",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def group_by_length(words):\n    groups = {}; [groups.setdefault(len(w), []).append(w) for w in words]; return groups",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def dedupe_preserve_order(xs):\n    seen = set()\n    out = []\n    for x in xs:\n        if x not in seen:\n            seen.add(x)\n            out.append(x)\n    return out",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def char_frequency(s):\n    return {c: s.count(c) for c in set(s)}",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def max_three(xs): return sorted(xs)[-3:]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def min_three(xs): return sorted(xs)[:3]",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def remove_duplicates_set(xs):\n    return set(xs)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_max(lst):\n    return max(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def find_min(lst):\n    return min(lst)",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def is_empty(x):\n    return not x",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def remove_spaces(s):\n    return s.replace(' ', '')",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def is_odd(n):\n    return (n%2)!=0",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def cumulative_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def is_palindrome(s): return str(s) == str(s)[::-1]",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def fibonacci(n):\n    if n < 0: raise ValueError\n    a, b = 0, 1\n    for _ in range(n): a, b = b, a + b\n    return a",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def multiply(a, b): return a * b",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def sum_of_squares(nums): return sum(n*n for n in nums)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def get_abs(n): return abs(n)",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def factorial(n):\n    if n < 0: raise ValueError\n    r = 1\n    for i in range(2, n + 1): r *= i\n    return r",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def every_other(xs):\n    return xs[1::2]",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def starts_with_vowel(s):\n    return s[0].lower() in 'aeiou' if s else False",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def unique_list(lst): return list(dict.fromkeys(lst))",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def average(lst):\n    return sum(lst) / len(lst)",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def power(a, b): return a ** b",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def sort_list(lst): return sorted(lst)",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def normalize_case(s):\n    return s.capitalize()",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def prefix_sum(xs):\n    total = 0\n    out = []\n    for x in xs:\n        total += x\n        out.append(total)\n    return out",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def factorial_recursive(n):\n    if n < 0: raise ValueError('Negative not allowed')\n    if n == 0: return 1\n    return n * factorial_recursive(n-1)",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def split_and_strip(s, sep):\n    return [w.strip() for w in s.split(sep)]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def interleave_lists(a, b):\n    return [x for pair in zip(a, b) for x in pair]",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def second_largest(lst):\n    uniq = sorted(set(lst))\n    return uniq[-2] if len(uniq) >= 2 else None",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def invert_dict(d): return {v: k for k, v in d.items()}",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def clamp(x, low, high): return max(low, min(x, high))",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def list_difference(a, b): return [x for x in a if x not in b]",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def remove_char(s, c):\n    return s.replace(c, '')",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def list_intersection(a, b): return list(set(a) & set(b))",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def unique_chars(s):\n    return set(s)",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def running_total(nums):\n    total = 0\n    out = []\n    for n in nums:\n        total += n\n        out.append(total)\n    return out",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def filter_falsey(lst): return [x for x in lst if x]",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def sum_nested_list(xs):\n    total = 0\n    for x in xs:\n        if isinstance(x, list):\n            total += sum_nested_list(x)\n        else:\n            total += x\n    return total",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def filter_none(lst): return [x for x in lst if x is not None]",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_first(lst): return lst[0] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def get_last(lst): return lst[-1] if lst and len(lst) > 0 else None",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def max_of_two(a, b): return a if a > b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def min_of_two(a, b): return a if a < b else b",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_even(lst): return [x for x in lst if x % 2 == 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def filter_odd(lst): return [x for x in lst if x % 2 != 0]",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def safe_divide(a, b):\n    return a / b if b != 0 else 0",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def filter_positive(xs):\n    return [x for x in xs if x > 0]",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def even_or_odd(n):\n    return n % 2 == 0",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def remove_negative(xs):\n    return [x for x in xs if x >= 0]",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def flatten_full(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list):\n            out.extend(flatten_full(x))\n        else:\n            out.append(x)\n    return out",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def absolute(n):\n    return abs(n)",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def capitalize_words(s):\n    return ' '.join(w.capitalize() for w in s.split())",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def all_positive(xs):\n    return all(x > 0 for x in xs)",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def swap_case(s):\n    return s.swapcase()",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def any_negative(xs):\n    return any(x < 0 for x in xs)",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def index_of(xs, value):\n    return xs.index(value) if value in xs else -1",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def trim_string(s):\n    return s.strip()",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def average_list(xs):\n    return sum(xs) / len(xs) if xs else 0",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def remove_keys(d, keys): return {k: v for k, v in d.items() if k not in keys}",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def longest_word(s):\n    return max(s.split(' '), key=len) if s.split() else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def shortest_word(s):\n    words = s.split(); return min(words, key=len) if words else ''",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def capitalize_str(s):\n    return s.capitalize()",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def binary_search(arr, target):\n    low, high = 0, len(arr)-1\n    while low <= high:\n        mid = (low+high)//2\n        if arr[mid] == target: return mid\n        elif arr[mid] < target: low = mid+1\n        else: high = mid-1\n    return -1",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def remove_empty(lst):\n    return [x for x in lst if x]",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def sum_list(xs):\n    return sum(xs)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def starts_with(s, prefix):\n    return s.startswith(prefix)",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def flatten_deep(xs):\n    out = []\n    for x in xs:\n        if isinstance(x, list): out.extend(flatten_deep(x))\n        else: out.append(x)\n    return out",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def concat_str(a, b):\n    return a + b",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def is_divisible(a, b):\n    if b == 0: return False\n    return a % b == 0",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def string_to_int(s):\n    return int(s)",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def product_list(nums):\n    if not nums: return 0\n    result = 1\n    for n in nums: result *= n\n    return result",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def ends_with(s, suffix):\n    return s.endswith(suffix)",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "def is_lower(s): return s.islower()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef normalize_whitespace(s): return re.sub(r'\\s+', ' ', s).strip()",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "import re\ndef strip_numbers(s): return re.sub(r'\\d+', '', s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_vowels(s):\n    return sum(ch.lower() in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def count_consonants(s):\n    return sum(ch.isalpha() and ch.lower() not in 'aeiou' for ch in s)",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def to_snake_case(s):\n    out=\"\"\n    for c in s:\n        if c.isupper(): out+=\"_\"+c.lower()\n        else: out+=c\n    return out.lstrip(\"_\")",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def count_words(s):\n    return len(s.split())",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def is_positive(n):\n    return n > 0",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-    "def harmonic_mean(xs):\n    if not xs: return 0\n    return len(xs) / sum(1/x for x in xs)",
-]
-
-edge_tests = [
-    "def test_add():\n"
-    "    assert add(0, 0) == 0\n"
-    "    assert add(-1, 1) == 0\n"
-    "    assert add(1, -1) == 0",
-
-    "def test_add():\n"
-    "    assert add(10**12, 1) == 10**12 + 1\n"
-    "    assert add(-10**12, -1) == -(10**12 + 1)\n"
-    "    assert add(10**12, -10**12) == 0",
-
-    "def test_add():\n"
-    "    assert add(1e308, 1e308) == float('inf')\n"
-    "    assert add(-1e308, -1e308) == -float('inf')\n"
-    "    assert add(1e308, -1e308) == 0.0",
-
-    "def test_add():\n"
-    "    assert add(0.1, 0.2) == 0.30000000000000004\n"
-    "    assert add(-0.5, 0.5) == 0.0\n"
-    "    assert add(1.5, -1.5) == 0.0",
-
-    "def test_add():\n"
-    "    assert add(True, True) == 2\n"
-    "    assert add(True, False) == 1\n"
-    "    assert add(False, False) == 0",
-
-    "def test_add():\n"
-    "    assert add('', '') == ''\n"
-    "    assert add('', 'abc') == 'abc'\n"
-    "    assert add('abc', '') == 'abc'",
-
-    "def test_add():\n"
-    "    assert add('🔥', '🔥') == '🔥🔥'\n"
-    "    assert add('🙂', '🙃') == '🙂🙃'\n"
-    "    assert add('á', 'é') == 'áé'",
-
-    "def test_add():\n"
-    "    assert add([], []) == []\n"
-    "    assert add([1], []) == [1]\n"
-    "    assert add([], [1, 2, 3]) == [1, 2, 3]",
-
-    "def test_add():\n"
-    "    assert add([1], [2]) == [1, 2]\n"
-    "    assert add([[], []], [1]) == [[], [], 1]\n"
-    "    assert add([0], [[]]) == [0, []]",
-
-    "def test_add():\n"
-    "    assert add((), ()) == ()\n"
-    "    assert add((1,), (2,)) == (1, 2)\n"
-    "    assert add((), (3, 4)) == (3, 4)",
-
-    "def test_add():\n"
-    "    assert add((-1,), (-2,)) == (-1, -2)\n"
-    "    assert add((), (1,)) == (1,)\n"
-    "    assert add((0,), ()) == (0,)",
-
-    "def test_add():\n"
-    "    assert add(0.0, -0.0) == 0.0\n"
-    "    assert add(-0.0, -0.0) == 0.0\n"
-    "    assert add(0, -0) == 0",
-
-    "def test_add():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add('1', 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add(2, '1')",
-
-    "def test_add():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add([1, 2], (3, 4))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add((1, 2), [3, 4])",
-
-    "def test_add():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add({'a': 1}, {'b': 2})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add({'x': 1}, {})",
-
-    "def test_add():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add(None, 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add(1, None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add(None, None)",
-
-    "def test_add():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add('abc', ['d'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add({'k': 'v'}, ['list'])",
-
-    "def test_add():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add({'k': 'v'}, ('tuple',))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add({1, 2}, {3, 4})",
-
-    "def test_add():\n"
-    "    large_list = list(range(1000))\n"
-    "    result = add(large_list, [])\n"
-    "    assert len(result) == 1000\n"
-    "    assert result[0] == 0\n"
-    "    assert result[-1] == 999",
-
-    "def test_add():\n"
-    "    large_list = list(range(500))\n"
-    "    result = add([], large_list)\n"
-    "    assert len(result) == 500\n"
-    "    assert result[0] == 0\n"
-    "    assert result[-1] == 499",
-
-    "def test_add():\n"
-    "    assert add(1e-12, 1e-12) == 2e-12\n"
-    "    assert add(-1e-12, 1e-12) == 0.0\n"
-    "    assert add(3.14, -3.14) == 0.0",
-
-    "def test_add():\n"
-    "    assert add(1 + 2j, 3 + 4j) == 4 + 6j\n"
-    "    assert add(1 + 0j, 0) == 1 + 0j\n"
-    "    assert add(0, 1 + 0j) == 1 + 0j",
-
-    "def test_add():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add('bytes', b'bytes')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add(b'bytes', 'bytes')",
-
-    "def test_add():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add(object(), 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add(1, object())",
-
-    "def test_add():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add(add, 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        add(1, add)",
-
-    "def test_subtract():\n"
-    "    assert subtract(0, 0) == 0\n"
-    "    assert subtract(-1, 0) == -1\n"
-    "    assert subtract(0, -1) == 1",
-
-    "def test_subtract():\n"
-    "    assert subtract(10**12, 10**12) == 0\n"
-    "    assert subtract(10**12, -10**12) == 2 * 10**12\n"
-    "    assert subtract(-10**12, 10**12) == -2 * 10**12",
-
-    "def test_subtract():\n"
-    "    assert subtract(1e308, 1e308) == 0.0\n"
-    "    assert subtract(1e308, -1e308) == float('inf')\n"
-    "    assert subtract(-1e308, 1e308) == -float('inf')",
-
-    "def test_subtract():\n"
-    "    assert subtract(1e-12, 1e-12) == 0.0\n"
-    "    assert subtract(-1e-12, 1e-12) == -2e-12\n"
-    "    assert subtract(1e-12, -1e-12) == 2e-12",
-
-    "def test_subtract():\n"
-    "    assert subtract(0.1, 0.2) == -0.1\n"
-    "    assert subtract(-0.5, -0.25) == -0.25\n"
-    "    assert subtract(1.5, -1.5) == 3.0",
-
-    "def test_subtract():\n"
-    "    assert subtract(True, True) == 0\n"
-    "    assert subtract(True, False) == 1\n"
-    "    assert subtract(False, True) == -1",
-
-    "def test_subtract():\n"
-    "    assert subtract(0, True) == -1\n"
-    "    assert subtract(True, 0) == 1\n"
-    "    assert subtract(False, False) == 0",
-
-    "def test_subtract():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract('abc', 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract(1, 'abc')",
-
-    "def test_subtract():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract([], {})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract({}, [])",
-
-    "def test_subtract():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract('🔥', '🔥')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract('🙂', '🙃')",
-
-    "def test_subtract():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract([1, 2, 3], [1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract([], [1])",
-
-    "def test_subtract():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract((1,), (1,))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract((), (1,))",
-
-    "def test_subtract():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract({'a': 1}, {'b': 2})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract({'x': 1}, {})",
-
-    "def test_subtract():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract(None, 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract(1, None)",
-
-    "def test_subtract():\n"
-    "    large_list = list(range(500))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract(large_list, [])",
-
-    "def test_subtract():\n"
-    "    tiny = [1e-12] * 3\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract(tiny, tiny)",
-
-    "def test_subtract():\n"
-    "    assert subtract(0.0, -0.0) == 0.0\n"
-    "    assert subtract(-0.0, 0.0) == -0.0\n"
-    "    assert subtract(-0.0, -0.0) == 0.0",
-
-    "def test_subtract():\n"
-    "    assert subtract(2**63 - 1, 0) == 2**63 - 1\n"
-    "    assert subtract(-(2**63 - 1), 0) == -(2**63 - 1)\n"
-    "    assert subtract(2**63 - 1, -(2**63 - 1)) == 2 * (2**63 - 1)",
-
-    "def test_subtract():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract({'k': 'v'}, ['list'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract(['list'], {'k': 'v'})",
-
-    "def test_subtract():\n"
-    "    assert subtract(3.14, 3.14) == 0.0\n"
-    "    assert subtract(3.14, 0.0) == 3.14\n"
-    "    assert subtract(0.0, 3.14) == -3.14",
-
-    "def test_subtract():\n"
-    "    assert subtract(-3.14, -3.14) == 0.0\n"
-    "    assert subtract(-3.14, 3.14) == -6.28\n"
-    "    assert subtract(3.14, -3.14) == 6.28",
-
-    "def test_subtract():\n"
-    "    assert subtract(1e5, 1e5 - 1) == 1.0\n"
-    "    assert subtract(1e5 - 1, 1e5) == -1.0\n"
-    "    assert subtract(-1e5, 1e5 - 1) == -2e5 + 1",
-
-    "def test_subtract():\n"
-    "    assert subtract(1 + 2j, 3 + 4j) == (-2 - 2j)\n"
-    "    assert subtract(1 + 0j, 0) == 1 + 0j\n"
-    "    assert subtract(0, 1 + 0j) == -1 - 0j",
-
-    "def test_subtract():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract(b'bytes', 'str')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract('str', b'bytes')",
-
-    "def test_subtract():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract(object(), 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        subtract(1, object())",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('') == ''\n"
-    "    assert rotate_right('a') == 'a'\n"
-    "    assert rotate_right('aa') == 'aa'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('ab') == 'ba'\n"
-    "    assert rotate_right('abc') == 'cab'\n"
-    "    assert rotate_right('abcd') == 'dabc'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('aaa') == 'aaa'\n"
-    "    assert rotate_right('bbbb') == 'bbbb'\n"
-    "    assert rotate_right('aba') == 'aab'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('   ') == '   '\n"
-    "    assert rotate_right(' a ') == ' a '\n"
-    "    assert rotate_right('  a') == 'a  '",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('a b') == 'b a'\n"
-    "    assert rotate_right(' hi') == 'ihi'\n"
-    "    assert rotate_right('hi ') == ' hi'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('café') == 'écaf'\n"
-    "    assert rotate_right(' Café') == 'é Caf'\n"
-    "    assert rotate_right('ño') == 'oñ'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('😊a') == 'a😊'\n"
-    "    assert rotate_right('a😊') == '😊a'\n"
-    "    assert rotate_right('😊😊') == '😊😊'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('😊😊a') == 'a😊😊'\n"
-    "    assert rotate_right('a😊😊') == '😊a😊'\n"
-    "    assert rotate_right('😊a😊') == '😊😊a'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('日本語') == '語日本'\n"
-    "    assert rotate_right('語日') == '日語'\n"
-    "    assert rotate_right('語') == '語'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('0') == '0'\n"
-    "    assert rotate_right('01') == '10'\n"
-    "    assert rotate_right('010') == '001'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('0a0') == '00a'\n"
-    "    assert rotate_right('a0a') == 'aa0'\n"
-    "    assert rotate_right('00a') == 'a00'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('123') == '312'\n"
-    "    assert rotate_right('001') == '100'\n"
-    "    assert rotate_right('10') == '01'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('!@#') == '#@!'\n"
-    "    assert rotate_right('?.') == '.?'\n"
-    "    assert rotate_right('---') == '---'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('#tag') == 'g#ta'\n"
-    "    assert rotate_right('##tag') == 'g##ta'\n"
-    "    assert rotate_right('tag#') == '#tag'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('A') == 'A'\n"
-    "    assert rotate_right('Aa') == 'aA'\n"
-    "    assert rotate_right('ABc') == 'cAB'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('mixedCASE') == 'EmixedCAS'\n"
-    "    assert rotate_right('TestIng') == 'gTestIn'\n"
-    "    assert rotate_right('CamelCase') == 'eCamelCas'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('_hidden') == 'n_hidde'\n"
-    "    assert rotate_right('__x') == 'x__'\n"
-    "    assert rotate_right('_') == '_'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('ab cd') == 'dab c'\n"
-    "    assert rotate_right(' cdab') == 'b cda'\n"
-    "    assert rotate_right('abcd ') == ' abcd'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('longstring') == 'glongstrin'\n"
-    "    assert rotate_right('rotate') == 'erotat'\n"
-    "    assert rotate_right('python') == 'npytho'",
-
-    "def test_rotate_right():\n"
-    "    s = 'abcabc'\n"
-    "    r1 = rotate_right(s)\n"
-    "    r2 = rotate_right(r1)\n"
-    "    assert r1 == 'cabcab'\n"
-    "    assert r2 == 'bcabca'",
-
-    "def test_rotate_right():\n"
-    "    s = 'abc'\n"
-    "    t = s\n"
-    "    for _ in range(len(s)):\n"
-    "        t = rotate_right(t)\n"
-    "    assert t == s\n"
-    "    assert len(t) == len(s)",
-
-    "def test_rotate_right():\n"
-    "    s = 'a' * 1000\n"
-    "    r = rotate_right(s)\n"
-    "    assert len(r) == 1000\n"
-    "    assert r[0] == 'a'\n"
-    "    assert r[-1] == 'a'",
-
-    "def test_rotate_right():\n"
-    "    s = ' ' * 100\n"
-    "    r = rotate_right(s)\n"
-    "    assert r == s\n"
-    "    assert len(r) == len(s)",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('tab\\t') == '\\ttab'\n"
-    "    assert rotate_right('\\ttab') == 'b\\tta'\n"
-    "    assert rotate_right('a\\tb') == 'ba\\t'",
-
-    "def test_rotate_right():\n"
-    "    assert rotate_right('line\\n') == '\\nline'\n"
-    "    assert rotate_right('\\nline') == 'eline\\n'\n"
-    "    assert rotate_right('a\\nb') == 'ba\\n'",
-
-    "def test_divide():\n"
-    "    assert divide(0, 1) == 0\n"
-    "    assert divide(0, -5) == 0\n"
-    "    assert divide(1, 0) == 0",
-
-    "def test_divide():\n"
-    "    assert divide(10**12, 1) == 10**12\n"
-    "    assert divide(10**12, -1) == -10**12\n"
-    "    assert divide(-10**12, 1) == -10**12",
-
-    "def test_divide():\n"
-    "    assert divide(1e308, 1e308) == 1.0\n"
-    "    assert divide(1e308, -1e308) == -1.0\n"
-    "    assert divide(-1e308, 1e308) == -1.0",
-
-    "def test_divide():\n"
-    "    assert divide(1e308, 1e-308) == float('inf')\n"
-    "    assert divide(-1e308, 1e-308) == -float('inf')\n"
-    "    assert divide(1e-308, 1e308) == 0.0",
-
-    "def test_divide():\n"
-    "    assert divide(1e-12, 1) == 1e-12\n"
-    "    assert divide(1, 1e-12) == 1e12\n"
-    "    assert divide(-1, 1e-12) == -1e12",
-
-    "def test_divide():\n"
-    "    assert divide(0.5, 0.25) == 2.0\n"
-    "    assert divide(-0.5, 0.25) == -2.0\n"
-    "    assert divide(0.5, -0.25) == -2.0",
-
-    "def test_divide():\n"
-    "    assert divide(2.5, 0.5) == 5.0\n"
-    "    assert divide(2.5, -0.5) == -5.0\n"
-    "    assert divide(-2.5, 0.5) == -5.0",
-
-    "def test_divide():\n"
-    "    assert divide(0.0001, 0.0002) == 0.5\n"
-    "    assert divide(0.0002, 0.0001) == 2.0\n"
-    "    assert divide(-0.0002, 0.0001) == -2.0",
-
-    "def test_divide():\n"
-    "    assert divide(3.14159, 1) == 3.14159\n"
-    "    assert divide(3.14159, 2) == 3.14159 / 2\n"
-    "    assert divide(-3.14159, 2) == -3.14159 / 2",
-
-    "def test_divide():\n"
-    "    assert divide(0, 0.1) == 0\n"
-    "    assert divide(0, -0.1) == 0\n"
-    "    assert divide(0, 100) == 0",
-
-    "def test_divide():\n"
-    "    assert divide(999999999, 3) == 333333333\n"
-    "    assert divide(3, 999999999) == 3 / 999999999\n"
-    "    assert divide(-3, 999999999) == -3 / 999999999",
-
-    "def test_divide():\n"
-    "    assert divide(123456789, 1) == 123456789\n"
-    "    assert divide(123456789, 9) == 13717421\n"
-    "    assert divide(9, 123456789) == 9 / 123456789",
-
-    "def test_divide():\n"
-    "    assert divide(2**20, 2) == 2**19\n"
-    "    assert divide(2**10, 2) == 512\n"
-    "    assert divide(2**10, -2) == -512",
-
-    "def test_divide():\n"
-    "    assert divide(8, 4) == 2\n"
-    "    assert divide(8, 3) == 8 / 3\n"
-    "    assert divide(8, -3) == -8 / 3",
-
-    "def test_divide():\n"
-    "    assert divide(-8, 4) == -2\n"
-    "    assert divide(-8, -4) == 2\n"
-    "    assert divide(-8, 3) == -8 / 3",
-
-    "def test_divide():\n"
-    "    assert divide(7, 7) == 1\n"
-    "    assert divide(-7, 7) == -1\n"
-    "    assert divide(7, -7) == -1",
-
-    "def test_divide():\n"
-    "    assert divide(-100, -1) == 100\n"
-    "    assert divide(-100, 1) == -100\n"
-    "    assert divide(100, -1) == -100",
-
-    "def test_divide():\n"
-    "    assert divide(1, 0.1) == 10\n"
-    "    assert divide(1, -0.1) == -10\n"
-    "    assert divide(-1, 0.1) == -10",
-
-    "def test_divide():\n"
-    "    assert divide(3, 1) == 3\n"
-    "    assert divide(3, -1) == -3\n"
-    "    assert divide(-3, -1) == 3",
-
-    "def test_divide():\n"
-    "    assert divide(10, 3) == 10 / 3\n"
-    "    assert divide(10, 5) == 2\n"
-    "    assert divide(10, 10) == 1",
-
-    "def test_divide():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        divide('a', 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        divide(1, 'a')",
-
-    "def test_divide():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        divide([], 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        divide(1, [])",
-
-    "def test_divide():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        divide({}, 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        divide(1, {})",
-
-    "def test_divide():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        divide(None, 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        divide(1, None)",
-
-    "def test_divide():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        divide(object(), 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        divide(2, object())",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('') == ''\n"
-    "    assert reverse_string('a') == 'a'\n"
-    "    assert reverse_string('aa') == 'aa'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('😊') == '😊'\n"
-    "    assert reverse_string('ab😊') == '😊ba'\n"
-    "    assert reverse_string('😊á') == 'á😊'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('   ') == '   '\n"
-    "    assert reverse_string(' a ') == ' a '\n"
-    "    assert reverse_string('  abc') == 'cba  '",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('ABC') == 'CBA'\n"
-    "    assert reverse_string('AbC') == 'CbA'\n"
-    "    assert reverse_string('aBcD') == 'DcBa'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('café') == 'éfac'\n"
-    "    assert reverse_string('ñandú') == 'údnañ'\n"
-    "    assert reverse_string('åäö') == 'öäå'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('hello world') == 'dlrow olleh'\n"
-    "    assert reverse_string(' hi ') == ' ih '\n"
-    "    assert reverse_string('end.') == '.dne'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('12345') == '54321'\n"
-    "    assert reverse_string('00120') == '02100'\n"
-    "    assert reverse_string('-123') == '321-'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('ab cd') == 'dc ba'\n"
-    "    assert reverse_string('a ') == ' a'\n"
-    "    assert reverse_string(' ') == ' '",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('🙂🙃') == '🙃🙂'\n"
-    "    assert reverse_string('🔥a') == 'a🔥'\n"
-    "    assert reverse_string('❤️ok') == 'ko❤️'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('tab\\t') == '\\ttab'\n"
-    "    assert reverse_string('\\t') == '\\t'\n"
-    "    assert reverse_string('a\\tb') == 'b\\ta'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('MixED') == 'DExiM'\n"
-    "    assert reverse_string('TeSt') == 'tSeT'\n"
-    "    assert reverse_string('PYthon') == 'nohtYP'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('  spaced') == 'decaps  '\n"
-    "    assert reverse_string(' spaced ') == ' decaps '\n"
-    "    assert reverse_string('space  ') == '  ecaps'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('.,!?') == '?!,.'\n"
-    "    assert reverse_string('a,b.c') == 'c.b,a'\n"
-    "    assert reverse_string('end!') == '!dne'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('a b c') == 'c b a'\n"
-    "    assert reverse_string(' word ') == ' drow '\n"
-    "    assert reverse_string('multi  space') == 'ecaps  itlum'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('0') == '0'\n"
-    "    assert reverse_string('00') == '00'\n"
-    "    assert reverse_string('010') == '010'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('あい') == 'いあ'\n"
-    "    assert reverse_string('こんにちは') == 'はちにんこ'\n"
-    "    assert reverse_string('さようなら') == 'らなうよさ'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('Русский') == 'йикссуР'\n"
-    "    assert reverse_string('тест') == 'тсет'\n"
-    "    assert reverse_string('привет') == 'тевирп'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('قاعدة') == 'ةدعاق'\n"
-    "    assert reverse_string('سلام') == 'مالس'\n"
-    "    assert reverse_string('كتاب') == 'باتك'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('a😊b😊c') == 'c😊b😊a'\n"
-    "    assert reverse_string('💙x') == 'x💙'\n"
-    "    assert reverse_string('xy💛') == '💛yx'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('word line') == 'enil drow'\n"
-    "    assert reverse_string(' abc') == 'cba '\n"
-    "    assert reverse_string('abc ') == ' cba'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string(' spaced\\tout ') == ' tuo\\td decaps '\n"
-    "    assert reverse_string('\\tstart') == 'trats\\t'\n"
-    "    assert reverse_string('end\\t') == '\\tdne'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('  mix  ed ') == ' de  xim  '\n"
-    "    assert reverse_string('ab  cd') == 'dc  ba'\n"
-    "    assert reverse_string('a  b  c') == 'c  b  a'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('#$%&') == '&%$#'\n"
-    "    assert reverse_string('a#b$c') == 'c$b#a'\n"
-    "    assert reverse_string('!!??') == '??!!'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('abc123😊') == '😊321cba'\n"
-    "    assert reverse_string('😊123') == '321😊'\n"
-    "    assert reverse_string('x😊y') == 'y😊x'",
-
-    "def test_reverse_string():\n"
-    "    assert reverse_string('NoRmAlIzE') == 'EzIlAmRoN'\n"
-    "    assert reverse_string('EDGE') == 'EGDE'\n"
-    "    assert reverse_string('Case') == 'esaC'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('') == ''\n"
-    "    assert remove_digits('123') == ''\n"
-    "    assert remove_digits('000') == ''",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('a1b2c3') == 'abc'\n"
-    "    assert remove_digits('1a2') == 'a'\n"
-    "    assert remove_digits('b3c') == 'bc'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('😊1😊2') == '😊😊'\n"
-    "    assert remove_digits('3😊') == '😊'\n"
-    "    assert remove_digits('x4😊') == 'x😊'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('café123') == 'café'\n"
-    "    assert remove_digits('4café') == 'café'\n"
-    "    assert remove_digits('c4a5f6é') == 'café'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits(' 1 2 3 ') == '   '\n"
-    "    assert remove_digits(' a1 ') == ' a '\n"
-    "    assert remove_digits('0 a 0') == ' a '",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('abc') == 'abc'\n"
-    "    assert remove_digits('no digits') == 'no digits'\n"
-    "    assert remove_digits('digits?') == 'digits?'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('123abc') == 'abc'\n"
-    "    assert remove_digits('abc123xyz') == 'abcxyz'\n"
-    "    assert remove_digits('1a2b3c') == 'abc'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('!1@2#3') == '!@#'\n"
-    "    assert remove_digits('$4%5') == '$%'\n"
-    "    assert remove_digits('&6*7') == '&*'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('\\n1a') == '\\na'\n"
-    "    assert remove_digits('2\\n') == '\\n'\n"
-    "    assert remove_digits('a3\\nb') == 'a\\nb'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('0zero0') == 'zero'\n"
-    "    assert remove_digits('1one') == 'one'\n"
-    "    assert remove_digits('two2') == 'two'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('abc000xyz') == 'abcxyz'\n"
-    "    assert remove_digits('0a0b0') == 'ab'\n"
-    "    assert remove_digits('x9y9') == 'xy'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('å1ä2ö3') == 'åäö'\n"
-    "    assert remove_digits('4åäö') == 'åäö'\n"
-    "    assert remove_digits('ö5ä') == 'öä'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('سلام123') == 'سلام'\n"
-    "    assert remove_digits('4سلام') == 'سلام'\n"
-    "    assert remove_digits('س5ل6ا7م') == 'سلام'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('рус123ский') == 'русский'\n"
-    "    assert remove_digits('т4ест') == 'тест'\n"
-    "    assert remove_digits('0привет') == 'привет'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('a😊1b2') == 'a😊b'\n"
-    "    assert remove_digits('3😊x') == '😊x'\n"
-    "    assert remove_digits('y4😊') == 'y😊'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('---123---') == '------'\n"
-    "    assert remove_digits('-1-2-') == '---'\n"
-    "    assert remove_digits('1-2-3') == '---'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('abc\\t123') == 'abc\\t'\n"
-    "    assert remove_digits('1\\t2') == '\\t'\n"
-    "    assert remove_digits('x3\\ty') == 'x\\ty'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits(' 0abc ') == ' abc '\n"
-    "    assert remove_digits('1 2 3') == '   '\n"
-    "    assert remove_digits(' a0 b ') == ' a b '",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('file9name') == 'filename'\n"
-    "    assert remove_digits('version2.0') == 'version.'\n"
-    "    assert remove_digits('123json') == 'json'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('UPPER9lower') == 'UPPERlower'\n"
-    "    assert remove_digits('A1B2C3') == 'ABC'\n"
-    "    assert remove_digits('Z9z') == 'Zz'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('abc💛3') == 'abc💛'\n"
-    "    assert remove_digits('1💙2') == '💙'\n"
-    "    assert remove_digits('💜4x') == '💜x'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('end5.') == 'end.'\n"
-    "    assert remove_digits('0.start') == '.start'\n"
-    "    assert remove_digits('mid7dle') == 'middle'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('  ') == '  '\n"
-    "    assert remove_digits('1 ') == ' '\n"
-    "    assert remove_digits(' 2') == ' '",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('12😊34') == '😊'\n"
-    "    assert remove_digits('5😊6x') == '😊x'\n"
-    "    assert remove_digits('y7😊8') == 'y😊'",
-
-    "def test_remove_digits():\n"
-    "    assert remove_digits('mixed123digits!') == 'mixeddigits!'\n"
-    "    assert remove_digits('test0case') == 'testcase'\n"
-    "    assert remove_digits('a1b!2c') == 'ab!c'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('') == ''\n"
-    "    assert remove_vowels('aeiouAEIOU') == ''\n"
-    "    assert remove_vowels('bcdfgBCDFG') == 'bcdfgBCDFG'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('hello') == 'hll'\n"
-    "    assert remove_vowels('world') == 'wrld'\n"
-    "    assert remove_vowels('python') == 'pythn'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('AEiOu') == ''\n"
-    "    assert remove_vowels('cOde') == 'cd'\n"
-    "    assert remove_vowels('AI') == ''",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('yyy') == 'yyy'\n"
-    "    assert remove_vowels('YyY') == 'YyY'\n"
-    "    assert remove_vowels('yay') == 'yy'",
-
-    "def test_remove_vowels():\n"
-    "    s = 'a' * 1000\n"
-    "    r = remove_vowels(s)\n"
-    "    assert r == ''\n"
-    "    assert len(r) == 0",
-
-    "def test_remove_vowels():\n"
-    "    s = 'b' * 1000\n"
-    "    r = remove_vowels(s)\n"
-    "    assert r == s\n"
-    "    assert len(r) == 1000",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('😀a😀') == '😀😀'\n"
-    "    assert remove_vowels('e😊x') == '😊x'\n"
-    "    assert remove_vowels('😊i') == '😊'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('café') == 'cfé'\n"
-    "    assert remove_vowels('déjà') == 'djé'\n"
-    "    assert remove_vowels('naïve') == 'nïvé'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('123') == '123'\n"
-    "    assert remove_vowels('1a2') == '12'\n"
-    "    assert remove_vowels('e4b') == '4b'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('   a   ') == '      '\n"
-    "    assert remove_vowels('e   ') == '   '\n"
-    "    assert remove_vowels('   i') == '   '",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('!!!') == '!!!'\n"
-    "    assert remove_vowels('!a!') == '!!'\n"
-    "    assert remove_vowels('e!!') == '!!'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('\\nabc') == '\\nbc'\n"
-    "    assert remove_vowels('a\\n') == '\\n'\n"
-    "    assert remove_vowels('e\\nx') == '\\nx'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('zero') == 'zr'\n"
-    "    assert remove_vowels('one') == 'n'\n"
-    "    assert remove_vowels('two') == 'tw'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('AaBbCc') == 'BbCc'\n"
-    "    assert remove_vowels('EeFf') == 'Ff'\n"
-    "    assert remove_vowels('IiJj') == 'Jj'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('PYTHON') == 'PYTHN'\n"
-    "    assert remove_vowels('AEIOUxyz') == 'xyz'\n"
-    "    assert remove_vowels('HELLO') == 'HLL'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('åäö') == 'åäö'\n"
-    "    assert remove_vowels('öa') == 'ö'\n"
-    "    assert remove_vowels('üei') == 'ü'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('سلام') == 'سلام'\n"
-    "    assert remove_vowels('سلاaم') == 'سلام'\n"
-    "    assert remove_vowels('اHelloا') == 'Hll'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('привет') == 'првт'\n"
-    "    assert remove_vowels('мир') == 'мр'\n"
-    "    assert remove_vowels('ауу') == ''",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('file9name') == 'fl9nm'\n"
-    "    assert remove_vowels('version2.0') == 'vrsn2.0'\n"
-    "    assert remove_vowels('audio') == 'd'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('abc\\tdef') == 'bc\\tdf'\n"
-    "    assert remove_vowels('e\\tf') == '\\tf'\n"
-    "    assert remove_vowels('i\\tj') == '\\tj'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('-a-e-i-') == '----'\n"
-    "    assert remove_vowels('--o--') == '----'\n"
-    "    assert remove_vowels('u---') == '---'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('💛ae') == '💛'\n"
-    "    assert remove_vowels('e💙x') == '💙x'\n"
-    "    assert remove_vowels('💜i') == '💜'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('.a.e.i.') == '....'\n"
-    "    assert remove_vowels('o..') == '..'\n"
-    "    assert remove_vowels('..u') == '..'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('MixedCASE') == 'MxdCS'\n"
-    "    assert remove_vowels('AeIoUxYz') == 'xYz'\n"
-    "    assert remove_vowels('LOWER') == 'LWR'",
-
-    "def test_remove_vowels():\n"
-    "    assert remove_vowels('test123case') == 'tst123cs'\n"
-    "    assert remove_vowels('alpha0beta') == 'lph0bt'\n"
-    "    assert remove_vowels('i/o/u') == '/'",
-
-    "def test_join_strings():\n"
-    "    assert join_strings([], ',') == ''\n"
-    "    assert join_strings([], '') == ''\n"
-    "    assert join_strings([''], ',') == ''",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(['a'], ',') == 'a'\n"
-    "    assert join_strings([''], '-') == ''\n"
-    "    assert join_strings(['', ''], ',') == ','",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(['a', 'b'], '') == 'ab'\n"
-    "    assert join_strings(['hello', 'world'], '') == 'helloworld'\n"
-    "    assert join_strings(['x', '', 'y'], '') == 'xy'",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(['a', 'b', 'c'], ',') == 'a,b,c'\n"
-    "    assert join_strings(['1', '2', '3'], ';') == '1;2;3'\n"
-    "    assert join_strings(['x', 'y'], '|') == 'x|y'",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(['😀', 'a'], '-') == '😀-a'\n"
-    "    assert join_strings(['😊', 'x'], '') == '😊x'\n"
-    "    assert join_strings(['x', '😀', 'y'], ':') == 'x:😀:y'",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(['café', 'latte'], ' ') == 'café latte'\n"
-    "    assert join_strings(['déjà', 'vu'], '_') == 'déjà_vu'\n"
-    "    assert join_strings(['naïve', 'test'], '-') == 'naïve-test'",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(['a', '1', 'b'], '-') == 'a-1-b'\n"
-    "    assert join_strings(['1', '2'], 'x') == '1x2'\n"
-    "    assert join_strings(['0', '0', '0'], '+') == '0+0+0'",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(['   ', 'a'], '|') == '   |a'\n"
-    "    assert join_strings([' ', ' '], ':') == ' : '\n"
-    "    assert join_strings(['', ' x '], '-') == '- x '",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(['!', '@', '#'], '.') == '!.@.#'\n"
-    "    assert join_strings(['!a', 'b!'], '!') == '!a!b!'\n"
-    "    assert join_strings(['?', '?'], '?') == '??'",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(['file', 'name'], '.') == 'file.name'\n"
-    "    assert join_strings(['path', 'to', 'dir'], '/') == 'path/to/dir'\n"
-    "    assert join_strings(['C:', 'temp'], '\\\\') == 'C:\\\\temp'",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(['aa', 'bb'], '--') == 'aa--bb'\n"
-    "    assert join_strings(['x', 'y', 'z'], '--') == 'x--y--z'\n"
-    "    assert join_strings(['--'], '--') == '--'",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(['x', 'y'], ' ') == 'x y'\n"
-    "    assert join_strings(['a', 'b', 'c'], '  ') == 'a  b  c'\n"
-    "    assert join_strings([' ', 'x'], ' ') == '  x'",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(['🙂', '🙃'], '-') == '🙂-🙃'\n"
-    "    assert join_strings(['a🙂', '🙂b'], '.') == 'a🙂.🙂b'\n"
-    "    assert join_strings(['🙂'], ':') == '🙂'",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(['c', 'a', 's', 'e'], '') == 'case'\n"
-    "    assert join_strings(['0', '', '1'], ',') == '0,,1'\n"
-    "    assert join_strings(['', ''], '') == ''",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(['...', '...'], '') == '......'\n"
-    "    assert join_strings(['.', '.'], '.') == '..'\n"
-    "    assert join_strings(['.', 'a', '.'], '.') == '.a.'",
-
-    "def test_join_strings():\n"
-    "    s = ['x'] * 1000\n"
-    "    result = join_strings(s, ',')\n"
-    "    assert result.count(',') == 999\n"
-    "    assert result.replace(',', '') == 'x' * 1000",
-
-    "def test_join_strings():\n"
-    "    s = ['a' * 100, 'b' * 100]\n"
-    "    result = join_strings(s, '-')\n"
-    "    assert result.startswith('a' * 100)\n"
-    "    assert result.endswith('b' * 100)\n"
-    "    assert result.count('-') == 1",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(['line1', 'line2'], '\\n') == 'line1\\nline2'\n"
-    "    assert join_strings(['', 'line'], '\\n') == '\\nline'\n"
-    "    assert join_strings(['line', ''], '\\n') == 'line\\n'",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(['a', 'b'], '\\t') == 'a\\tb'\n"
-    "    assert join_strings(['\\t', 'b'], '-') == '\\t-b'\n"
-    "    assert join_strings(['a', '\\t'], '-') == 'a-\\t'",
-
-    "def test_join_strings():\n"
-    "    assert join_strings(('a', 'b'), ',') == 'a,b'\n"
-    "    assert join_strings(('x',), ',') == 'x'\n"
-    "    assert join_strings(tuple(), ',') == ''",
-
-    "def test_join_strings():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        join_strings(['a', 1], ',')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        join_strings([1, 2], ',')",
-
-    "def test_join_strings():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        join_strings(['a', None], ',')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        join_strings([None], ',')",
-
-    "def test_join_strings():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        join_strings(['x', 1.5], '-')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        join_strings([object()], ',')",
-
-    "def test_join_strings():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        join_strings(['a', 'b'], 1)\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        join_strings(['a'], None)",
-
-    "def test_join_strings():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        join_strings(['x', 'y'], 3.14)\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        join_strings(['x', 'y'], True)",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates([]) == []\n"
-    "    assert find_duplicates([1]) == []\n"
-    "    assert find_duplicates([0, 0]) == [0]",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates([1, 2, 3, 1]) == [1]\n"
-    "    assert find_duplicates([2, 2, 3, 3]) == [2, 3]\n"
-    "    assert find_duplicates([4, 5, 6]) == []",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates([1, 1, 1, 1]) == [1]\n"
-    "    assert find_duplicates([0, 0, 0, 0]) == [0]\n"
-    "    assert find_duplicates([2, 2, 2, 3, 3, 3]) == [2, 3]",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates([1, 2, 1, 3, 2, 3]) == [1, 2, 3]\n"
-    "    assert find_duplicates([3, 1, 3, 1, 3]) == [3, 1]\n"
-    "    assert find_duplicates([5, 6, 7, 5, 7]) == [5, 7]",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates(['a', 'a']) == ['a']\n"
-    "    assert find_duplicates(['x', 'y', 'x']) == ['x']\n"
-    "    assert find_duplicates(['z', 'z', 'z']) == ['z']",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates(['a', 'A', 'a']) == ['a']\n"
-    "    assert find_duplicates(['A', 'a', 'A']) == ['A']\n"
-    "    assert find_duplicates(['x', 'X', 'x', 'X']) == ['x', 'X']",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates([None, None]) == [None]\n"
-    "    assert find_duplicates([None, 1, None]) == [None]\n"
-    "    assert find_duplicates([1, None, 1, None]) == [1, None]",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates(['', '', 'x']) == ['']\n"
-    "    assert find_duplicates(['x', '', 'x']) == ['x']\n"
-    "    assert find_duplicates(['', 'x', '']) == ['']",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates([True, True]) == [True]\n"
-    "    assert find_duplicates([False, False, True]) == [False]\n"
-    "    assert find_duplicates([True, False, True, False]) == [True, False]",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates([1, 1.0]) == [1.0]\n"
-    "    assert find_duplicates([1.0, 1]) == [1]\n"
-    "    assert find_duplicates([1, 2.0, 1]) == [1]",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates(['a', 'á', 'a']) == ['a']\n"
-    "    assert find_duplicates(['á', 'a', 'á']) == ['á']\n"
-    "    assert find_duplicates(['é', 'e', 'é', 'e']) == ['é', 'e']",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates(['🙂', '🙂']) == ['🙂']\n"
-    "    assert find_duplicates(['🙂', '🙃', '🙂']) == ['🙂']\n"
-    "    assert find_duplicates(['🙃', '🙂', '🙃']) == ['🙃']",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates([' ', ' ']) == [' ']\n"
-    "    assert find_duplicates([' ', 'x', ' ']) == [' ']\n"
-    "    assert find_duplicates(['x', ' ', 'x', ' ']) == ['x', ' ']",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates([10**9, 10**9]) == [10**9]\n"
-    "    assert find_duplicates([10**9, -10**9, 10**9, -10**9]) == [10**9, -10**9]\n"
-    "    assert find_duplicates([-1, -1, 0]) == [-1]",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates([(1, 2), (1, 2)]) == [(1, 2)]\n"
-    "    assert find_duplicates([(0,), 0, (0,)]) == [(0,)]\n"
-    "    assert find_duplicates([(), (), 1]) == [()]",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates(['longstring', 'longstring']) == ['longstring']\n"
-    "    assert find_duplicates(['x', '' * 1, 'x']) == ['x']\n"
-    "    assert find_duplicates(['', 'x', '']) == ['']",
-
-    "def test_find_duplicates():\n"
-    "    lst = list(range(1000)) + [0, 1]\n"
-    "    result = find_duplicates(lst)\n"
-    "    assert result == [0, 1]\n"
-    "    assert len(result) == 2",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates(['1', 1, '1']) == ['1']\n"
-    "    assert find_duplicates([1, '1', 1]) == [1]\n"
-    "    assert find_duplicates(['1', 1, '1', 1]) == ['1', 1]",
-
-    "def test_find_duplicates():\n"
-    "    fs = frozenset({1})\n"
-    "    assert find_duplicates([fs, fs]) == [fs]\n"
-    "    assert find_duplicates([fs, 2, fs]) == [fs]\n"
-    "    assert find_duplicates([2, fs, 2, fs]) == [2, fs]",
-
-    "def test_find_duplicates():\n"
-    "    assert find_duplicates([0, False, 0, False]) == [False]\n"
-    "    assert find_duplicates([False, 0, False]) == [False]\n"
-    "    assert find_duplicates([0, 0, False]) == [0]",
-
-    "def test_find_duplicates():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        find_duplicates([[1], [1]])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        find_duplicates([[1], [2], [1]])",
-
-    "def test_find_duplicates():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        find_duplicates([{'a': 1}, {'a': 1}])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        find_duplicates([{'x': 1}, {'x': 1}, 2])",
-
-    "def test_find_duplicates():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        find_duplicates([{1}, {1}])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        find_duplicates([{1, 2}, {1, 2}, 3])",
-
-    "def test_find_duplicates():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        find_duplicates(1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        find_duplicates(3.14)",
-
-    "def test_find_duplicates():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        find_duplicates(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        find_duplicates(True)",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('') == 0\n"
-    "    assert count_uppercase('123') == 0\n"
-    "    assert count_uppercase('   ') == 0",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('ABC') == 3\n"
-    "    assert count_uppercase('abc') == 0\n"
-    "    assert count_uppercase('AaAa') == 2",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('A') == 1\n"
-    "    assert count_uppercase('a') == 0\n"
-    "    assert count_uppercase('Z') == 1",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('HelloWORLD') == 6\n"
-    "    assert count_uppercase('HeLLo') == 3\n"
-    "    assert count_uppercase('python') == 0",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('🙂ABC') == 3\n"
-    "    assert count_uppercase('XYZ🙂') == 3\n"
-    "    assert count_uppercase('🙂🙂') == 0",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('Café') == 1\n"
-    "    assert count_uppercase('ÉCOLE') == 5\n"
-    "    assert count_uppercase('école') == 0",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('A1B2C3') == 3\n"
-    "    assert count_uppercase('1A2') == 1\n"
-    "    assert count_uppercase('2b3') == 0",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('\\tA\\t') == 1\n"
-    "    assert count_uppercase('\\t') == 0\n"
-    "    assert count_uppercase('A\\tB') == 2",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('ΣΤΑ') == 3\n"
-    "    assert count_uppercase('σ') == 0\n"
-    "    assert count_uppercase('ΣσΣ') == 2",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('ØøØ') == 2\n"
-    "    assert count_uppercase('øø') == 0\n"
-    "    assert count_uppercase('ÅaÅ') == 2",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('ZzZzZ') == 3\n"
-    "    assert count_uppercase('zZz') == 1\n"
-    "    assert count_uppercase('zzz') == 0",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('A B C') == 3\n"
-    "    assert count_uppercase(' a B ') == 1\n"
-    "    assert count_uppercase('   ') == 0",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('A😊B😊C') == 3\n"
-    "    assert count_uppercase('😊A😊') == 1\n"
-    "    assert count_uppercase('😊') == 0",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('A'*1000) == 1000\n"
-    "    assert count_uppercase('A' + 'a'*999) == 1\n"
-    "    assert count_uppercase('a'*1000) == 0",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('AB\\tC') == 3\n"
-    "    assert count_uppercase('Ab\\tC') == 2\n"
-    "    assert count_uppercase('a\\tb') == 0",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('ÜBER') == 4\n"
-    "    assert count_uppercase('über') == 0\n"
-    "    assert count_uppercase('ÜbEr') == 2",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('ß') == 0\n"
-    "    assert count_uppercase('SS') == 2\n"
-    "    assert count_uppercase('sS') == 1",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('Ü̈') == 1\n"
-    "    assert count_uppercase('A\u0301') == 1\n"
-    "    assert count_uppercase('a\u0301') == 0",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('!@#ABC') == 3\n"
-    "    assert count_uppercase('$A$') == 1\n"
-    "    assert count_uppercase('#$%') == 0",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('A😊A😊A') == 3\n"
-    "    assert count_uppercase('😊😊A😊') == 1\n"
-    "    assert count_uppercase('😊😊😊') == 0",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('A-Z') == 2\n"
-    "    assert count_uppercase('a-z') == 0\n"
-    "    assert count_uppercase('A-z') == 1",
-
-    "def test_count_uppercase():\n"
-    "    assert count_uppercase('CaseCHECK') == 6\n"
-    "    assert count_uppercase('Check') == 1\n"
-    "    assert count_uppercase('check') == 0",
-
-    "def test_count_uppercase():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_uppercase(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_uppercase(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_uppercase(3.14)",
-
-    "def test_count_uppercase():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_uppercase(['A', 'B'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_uppercase(['x'])",
-
-    "def test_count_uppercase():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_uppercase(True)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_uppercase(object())",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('') == ''\n"
-    "    assert reverse_words('   ') == ''\n"
-    "    assert reverse_words('\\n\\t') == ''",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('hello') == 'hello'\n"
-    "    assert reverse_words('  hello') == 'hello'\n"
-    "    assert reverse_words('hello   ') == 'hello'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('hello world') == 'world hello'\n"
-    "    assert reverse_words('a b') == 'b a'\n"
-    "    assert reverse_words('a b c') == 'c b a'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('  spaced   words  ') == 'words spaced'\n"
-    "    assert reverse_words(' one   two ') == 'two one'\n"
-    "    assert reverse_words(' x   y ') == 'y x'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('😊 hello') == 'hello 😊'\n"
-    "    assert reverse_words('hi 😊') == '😊 hi'\n"
-    "    assert reverse_words('😊 😊') == '😊 😊'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('Café au lait') == 'lait au Café'\n"
-    "    assert reverse_words('École Française') == 'Française École'\n"
-    "    assert reverse_words('naïve test') == 'test naïve'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('123 456') == '456 123'\n"
-    "    assert reverse_words('1 2 3') == '3 2 1'\n"
-    "    assert reverse_words('1000 2000') == '2000 1000'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('\\nhello world') == 'world hello'\n"
-    "    assert reverse_words('hello world\\n') == 'world hello'\n"
-    "    assert reverse_words('a b\\n c') == 'c b a'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('\\tHello World') == 'World Hello'\n"
-    "    assert reverse_words('Hello\\tWorld') == 'World Hello'\n"
-    "    assert reverse_words('A\\tB C') == 'C B A'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('UPPER lower CASE') == 'CASE lower UPPER'\n"
-    "    assert reverse_words('MixED CaSe WoRdS') == 'WoRdS CaSe MixED'\n"
-    "    assert reverse_words('single') == 'single'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('word 123 test') == 'test 123 word'\n"
-    "    assert reverse_words('42 answer') == 'answer 42'\n"
-    "    assert reverse_words('no numbers') == 'numbers no'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('a b c d e') == 'e d c b a'\n"
-    "    assert reverse_words('one two three four') == 'four three two one'\n"
-    "    assert reverse_words('x y z') == 'z y x'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('A B C D') == 'D C B A'\n"
-    "    assert reverse_words('AA BB CC') == 'CC BB AA'\n"
-    "    assert reverse_words('ZZ zz') == 'zz ZZ'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('hello  world   again') == 'again world hello'\n"
-    "    assert reverse_words(' spaced   test ') == 'test spaced'\n"
-    "    assert reverse_words('x   y') == 'y x'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('word! punctuation? here.') == 'here. punctuation? word!'\n"
-    "    assert reverse_words('one, two three.') == 'three. two one,'\n"
-    "    assert reverse_words('... hi ...') == '... hi ...'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('Hello🙂 World🙂') == 'World🙂 Hello🙂'\n"
-    "    assert reverse_words('🙂test🙂 case') == 'case 🙂test🙂'\n"
-    "    assert reverse_words('🙂 🙂test') == '🙂test 🙂'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words(('a ' * 100).strip()) == ('a ' * 100).strip()\n"
-    "    assert reverse_words(('x ' * 50).strip()) == ('x ' * 50).strip()\n"
-    "    assert reverse_words('singleword') == 'singleword'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('A\\nB C') == 'C B A'\n"
-    "    assert reverse_words('A B\\nC D') == 'D C B A'\n"
-    "    assert reverse_words('A\\nB\\nC') == 'C B A'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('A\\tB\\tC') == 'C B A'\n"
-    "    assert reverse_words('hello\\tthere world') == 'world there hello'\n"
-    "    assert reverse_words('\\tA B') == 'B A'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('!!!! !!!!') == '!!!! !!!!'\n"
-    "    assert reverse_words('! ! !') == '! ! !'\n"
-    "    assert reverse_words('word! word?') == 'word? word!'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('word word123') == 'word123 word'\n"
-    "    assert reverse_words('abc123 xyz456') == 'xyz456 abc123'\n"
-    "    assert reverse_words('test123 test') == 'test test123'",
-
-    "def test_reverse_words():\n"
-    "    assert reverse_words('ß test') == 'test ß'\n"
-    "    assert reverse_words('über cool') == 'cool über'\n"
-    "    assert reverse_words('Ö Ä Ü') == 'Ü Ä Ö'",
-
-    "def test_reverse_words():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        reverse_words(123)\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        reverse_words(3.14)\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        reverse_words(None)",
-
-    "def test_reverse_words():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        reverse_words(['a', 'b'])\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        reverse_words(('a', 'b'))\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        reverse_words(True)",
-
-    "def test_reverse_words():\n"
-    "    s = ' '.join(str(i) for i in range(100))\n"
-    "    r = reverse_words(s)\n"
-    "    assert r.split()[0] == '99'\n"
-    "    assert r.split()[-1] == '0'\n"
-    "    assert len(r.split()) == 100",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('', '') == True\n"
-    "    assert is_anagram('a', '') == False\n"
-    "    assert is_anagram('', 'a') == False",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('a', 'a') == True\n"
-    "    assert is_anagram('A', 'a') == False\n"
-    "    assert is_anagram('á', 'a') == False",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('ab', 'ba') == True\n"
-    "    assert is_anagram('abc', 'cab') == True\n"
-    "    assert is_anagram('abc', 'cbaa') == False",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('listen', 'silent') == True\n"
-    "    assert is_anagram('triangle', 'integral') == True\n"
-    "    assert is_anagram('apple', 'papel') == True",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('hello', 'bello') == False\n"
-    "    assert is_anagram('world', 'dlorw') == True\n"
-    "    assert is_anagram('test', 'sett') == True",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('aaab', 'abaa') == True\n"
-    "    assert is_anagram('aaab', 'aaba') == True\n"
-    "    assert is_anagram('aaab', 'aaaba') == False",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('123', '321') == True\n"
-    "    assert is_anagram('112233', '332211') == True\n"
-    "    assert is_anagram('12', '122') == False",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('!@#', '#@!') == True\n"
-    "    assert is_anagram('!?', '?!') == True\n"
-    "    assert is_anagram('!!', '!') == False",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('a b', 'b a') == True\n"
-    "    assert is_anagram('ab ', ' ba') == True\n"
-    "    assert is_anagram('a b', 'ab') == False",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('😊a', 'a😊') == True\n"
-    "    assert is_anagram('😊😊', '😊😊') == True\n"
-    "    assert is_anagram('😊a', '😊b') == False",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('Café', 'fCéa') == True\n"
-    "    assert is_anagram('naïve', 'veïna') == True\n"
-    "    assert is_anagram('éa', 'ae') == False",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('abc', 'ABC') == False\n"
-    "    assert is_anagram('AbC', 'bCa') == False\n"
-    "    assert is_anagram('aaa', 'AAA') == False",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('rat', 'car') == False\n"
-    "    assert is_anagram('dog', 'god') == True\n"
-    "    assert is_anagram('dusty', 'study') == True",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('prefix', 'suffix') == False\n"
-    "    assert is_anagram('same', 'mesa') == True\n"
-    "    assert is_anagram('tone', 'note') == True",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('stop', 'pots') == True\n"
-    "    assert is_anagram('tops', 'spot') == True\n"
-    "    assert is_anagram('opts', 'post') == True",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('loop', 'pool') == True\n"
-    "    assert is_anagram('loop', 'polo') == True\n"
-    "    assert is_anagram('loop', 'lopo') == True",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('mississippi', 'imississipp') == True\n"
-    "    assert is_anagram('miss', 'misss') == False\n"
-    "    assert is_anagram('issi', 'sisi') == True",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('longword', 'wordlong') == False\n"
-    "    assert is_anagram('abcde', 'edcba') == True\n"
-    "    assert is_anagram('aaaaa', 'aaaab') == False",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('xy', 'yx') == True\n"
-    "    assert is_anagram('xy', 'yy') == False\n"
-    "    assert is_anagram('xyz', 'xzy') == True",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('one', 'neo') == True\n"
-    "    assert is_anagram('two', 'owt') == True\n"
-    "    assert is_anagram('red', 'der') == True",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('case', 'aces') == True\n"
-    "    assert is_anagram('Case', 'aces') == False\n"
-    "    assert is_anagram('aces', 'csae') == True",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('looped', 'poodle') == True\n"
-    "    assert is_anagram('elbow', 'below') == True\n"
-    "    assert is_anagram('state', 'taste') == True",
-
-    "def test_is_anagram():\n"
-    "    assert is_anagram('evil', 'vile') == True\n"
-    "    assert is_anagram('restful', 'fluster') == True\n"
-    "    assert is_anagram('python', 'typhon') == True",
-
-    "def test_is_anagram():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_anagram(None, 'abc')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_anagram('abc', None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_anagram(123, '321')",
-
-    "def test_is_anagram():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_anagram(['a'], ['a'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_anagram(['a', 'b'], 'ab')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_anagram('ab', ['a', 'b'])",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('') == ''\n"
-    "    assert rotate_left('a') == 'a'\n"
-    "    assert rotate_left('aa') == 'aa'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left(' ') == ' '\n"
-    "    assert rotate_left('  ') == '  '\n"
-    "    assert rotate_left('   ') == '   '",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('ab') == 'ba'\n"
-    "    assert rotate_left('abc') == 'bca'\n"
-    "    assert rotate_left('abcd') == 'bcda'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('😊') == '😊'\n"
-    "    assert rotate_left('😊a') == 'a😊'\n"
-    "    assert rotate_left('a😊') == '😊a'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('áb') == '́ba'\n"
-    "    assert rotate_left('é') == '́e'\n"
-    "    assert rotate_left('ño') == 'oñ'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left(' a ') == 'a '\n"
-    "    assert rotate_left('a  ') == '  a'\n"
-    "    assert rotate_left('  a') == 'a  '",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('\\txy') == 'xy\\t'\n"
-    "    assert rotate_left('xy\\t') == 'y\\tx'\n"
-    "    assert rotate_left('x\\ty') == 'y x\\t'.replace(' ', '')",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('\\nabc') == 'abc\\n'\n"
-    "    assert rotate_left('abc\\n') == 'bc\\na'\n"
-    "    assert rotate_left('bc\\na') == 'c\\nab'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('🔥a') == 'a🔥'\n"
-    "    assert rotate_left('a🔥') == '🔥a'\n"
-    "    assert rotate_left('🔥🔥') == '🔥🔥'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('Aa') == 'aA'\n"
-    "    assert rotate_left('AaA') == 'aAA'\n"
-    "    assert rotate_left('ABCabc') == 'BCabcA'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('123456') == '234561'\n"
-    "    assert rotate_left('001') == '010'\n"
-    "    assert rotate_left('10') == '01'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('!@#') == '@#!'\n"
-    "    assert rotate_left('@#!') == '#!@'\n"
-    "    assert rotate_left('#!@') == '!@#'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('abc ') == 'bc a'\n"
-    "    assert rotate_left(' spaced') == 'paced s'\n"
-    "    assert rotate_left('end ') == 'nd e'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('🙂🙃') == '🙃🙂'\n"
-    "    assert rotate_left('🙂a🙃') == 'a🙃🙂'\n"
-    "    assert rotate_left('🙃🙂🙃') == '🙂🙃🙃'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('aaaa') == 'aaaa'\n"
-    "    assert rotate_left('aaab') == 'aaba'\n"
-    "    assert rotate_left('baaa') == 'aaab'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('longstring') == 'ongstringl'\n"
-    "    assert rotate_left('rotateleft') == 'otateleftr'\n"
-    "    assert rotate_left('python') == 'ythonp'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('日本語') == '本語日'\n"
-    "    assert rotate_left('語日本') == '日本語'\n"
-    "    assert rotate_left('語') == '語'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left(' ') == ' '\n"
-    "    assert rotate_left('  a') == 'a  '\n"
-    "    assert rotate_left('a  ') == '  a'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('tab\\t') == 'ab\\tt'\n"
-    "    assert rotate_left('a\\tb') == 'b\\ta'\n"
-    "    assert rotate_left('\\ta') == 'a\\t'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('0a0') == 'a00'\n"
-    "    assert rotate_left('a0a') == '0aa'\n"
-    "    assert rotate_left('00a') == '0a0'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('#$%') == '$%#'\n"
-    "    assert rotate_left('?#') == '#?'\n"
-    "    assert rotate_left('---') == '---'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('CamelCase') == 'amelCaseC'\n"
-    "    assert rotate_left('TestIng') == 'estIngT'\n"
-    "    assert rotate_left('MIXed') == 'IXedM'",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('x y ') == ' y x'\n"
-    "    assert rotate_left(' y x') == 'y x '\n"
-    "    assert rotate_left(' x y') == 'x y '",
-
-    "def test_rotate_left():\n"
-    "    with pytest.raises(TypeError): rotate_left(None)\n"
-    "    with pytest.raises(TypeError): rotate_left(123)\n"
-    "    with pytest.raises(TypeError): rotate_left(['a'])",
-
-    "def test_rotate_left():\n"
-    "    assert rotate_left('a'*1000) == 'a'*1000\n"
-    "    assert rotate_left('abc'*50) == 'bc' * 50 + 'a' * 50\n"
-    "    assert rotate_left('z'*500) == 'z'*500",
-
-    "def test_square():\n"
-    "    assert square(0) == 0\n"
-    "    assert square(1) == 1\n"
-    "    assert square(-1) == 1",
-
-    "def test_square():\n"
-    "    assert square(True) == 1\n"
-    "    assert square(False) == 0\n"
-    "    assert square(-True) == 1",
-
-    "def test_square():\n"
-    "    assert square(10**12) == (10**12) * (10**12)\n"
-    "    assert square(-(10**12)) == (10**12) * (10**12)\n"
-    "    assert square(999999999) == 999999999 * 999999999",
-
-    "def test_square():\n"
-    "    assert square(1e308) == float('inf')\n"
-    "    assert square(-1e308) == float('inf')\n"
-    "    assert square(1e154) == 1e154 * 1e154",
-
-    "def test_square():\n"
-    "    assert square(float('inf')) == float('inf')\n"
-    "    assert square(float('-inf')) == float('inf')\n"
-    "    assert square(1) == 1",
-
-    "def test_square():\n"
-    "    assert square(float('nan')) != square(float('nan'))\n"
-    "    assert square(0.0) == 0.0\n"
-    "    assert square(-0.0) == 0.0",
-
-    "def test_square():\n"
-    "    assert square(1e-12) == 1e-24\n"
-    "    assert square(-1e-12) == 1e-24\n"
-    "    assert square(3.14) == 3.14 * 3.14",
-
-    "def test_square():\n"
-    "    assert square(1e-308) == 0.0\n"
-    "    assert square(-1e-308) == 0.0\n"
-    "    assert square(1e-200) == 1e-400",
-
-    "def test_square():\n"
-    "    assert square(250000) == 250000 * 250000\n"
-    "    assert square(-250000) == 250000 * 250000\n"
-    "    assert square(500) == 250000",
-
-    "def test_square():\n"
-    "    assert square(0.5) == 0.25\n"
-    "    assert square(-0.5) == 0.25\n"
-    "    assert square(0.1) == 0.01",
-
-    "def test_square():\n"
-    "    assert square(-2) == 4\n"
-    "    assert square(-3) == 9\n"
-    "    assert square(-4) == 16",
-
-    "def test_square():\n"
-    "    assert square(2**63 - 1) == (2**63 - 1) ** 2\n"
-    "    assert square(-(2**63 - 1)) == (2**63 - 1) ** 2\n"
-    "    assert square(2**32) == (2**32) * (2**32)",
-
-    "def test_square():\n"
-    "    assert square(0.0001) == 1e-8\n"
-    "    assert square(-0.0001) == 1e-8\n"
-    "    assert square(0.001) == 1e-6",
-
-    "def test_square():\n"
-    "    assert square(42) == 1764\n"
-    "    assert square(-42) == 1764\n"
-    "    assert square(100) == 10000",
-
-    "def test_square():\n"
-    "    assert square(999) == 998001\n"
-    "    assert square(-999) == 998001\n"
-    "    assert square(2) == 4",
-
-    "def test_square():\n"
-    "    assert square(3.14159) == 3.14159 * 3.14159\n"
-    "    assert square(-3.14159) == 3.14159 * 3.14159\n"
-    "    assert square(1.2345) == 1.2345 * 1.2345",
-
-    "def test_square():\n"
-    "    assert square(7) == 49\n"
-    "    assert square(-7) == 49\n"
-    "    assert square(8) == 64",
-
-    "def test_square():\n"
-    "    assert square(0.01) == 0.0001\n"
-    "    assert square(-0.01) == 0.0001\n"
-    "    assert square(0.333) == 0.333 * 0.333",
-
-    "def test_square():\n"
-    "    assert square(2**10) == (2**10) * (2**10)\n"
-    "    assert square(-(2**10)) == (2**10) * (2**10)\n"
-    "    assert square(6) == 36",
-
-    "def test_square():\n"
-    "    assert square(15) == 225\n"
-    "    assert square(-15) == 225\n"
-    "    assert square(1) == 1",
-
-    "def test_square():\n"
-    "    with pytest.raises(TypeError): square('a')\n"
-    "    with pytest.raises(TypeError): square('10')\n"
-    "    with pytest.raises(TypeError): square('3.14')",
-
-    "def test_square():\n"
-    "    with pytest.raises(TypeError): square([])\n"
-    "    with pytest.raises(TypeError): square([1])\n"
-    "    with pytest.raises(TypeError): square(['x'])",
-
-    "def test_square():\n"
-    "    with pytest.raises(TypeError): square(None)\n"
-    "    with pytest.raises(TypeError): square({})\n"
-    "    with pytest.raises(TypeError): square({'n': 2})",
-
-    "def test_square():\n"
-    "    assert square(1+2j) == (1+2j) * (1+2j)\n"
-    "    assert square(-3j) == (-3j) * (-3j)\n"
-    "    assert square(2j) == (2j) * (2j)",
-
-    "def test_square():\n"
-    "    assert square(5e100) == 25e200\n"
-    "    assert square(-5e100) == 25e200\n"
-    "    assert square(1e50) == 1e100",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('') == ''\n"
-    "    assert to_camel_case('A') == 'a'\n"
-    "    assert to_camel_case('Z') == 'z'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('Hello') == 'hello'\n"
-    "    assert to_camel_case('HELLO') == 'hELLO'\n"
-    "    assert to_camel_case('H') == 'h'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('abc') == 'abc'\n"
-    "    assert to_camel_case('Abc') == 'abc'\n"
-    "    assert to_camel_case('aBC') == 'aBC'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('123abc') == '123abc'\n"
-    "    assert to_camel_case('1Test') == '1Test'\n"
-    "    assert to_camel_case('9word') == '9word'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('!Bang') == '!Bang'\n"
-    "    assert to_camel_case('#Tag') == '#Tag'\n"
-    "    assert to_camel_case('@Home') == '@Home'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case(' Abc') == ' Abc'\n"
-    "    assert to_camel_case(' Test') == ' Test'\n"
-    "    assert to_camel_case(' Space') == ' Space'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('CamelCase') == 'camelCase'\n"
-    "    assert to_camel_case('SnakeCase') == 'snakeCase'\n"
-    "    assert to_camel_case('PascalCase') == 'pascalCase'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('Word ') == 'word '\n"
-    "    assert to_camel_case('TestCase ') == 'testCase '\n"
-    "    assert to_camel_case('Done ') == 'done '",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('😊Smile') == '😊Smile'\n"
-    "    assert to_camel_case('👍Up') == '👍Up'\n"
-    "    assert to_camel_case('😀Ok') == '😀Ok'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('😊abc') == '😊abc'\n"
-    "    assert to_camel_case('😀Hello') == '😀Hello'\n"
-    "    assert to_camel_case('😎World') == '😎World'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('aWord') == 'aWord'\n"
-    "    assert to_camel_case('bTest') == 'bTest'\n"
-    "    assert to_camel_case('cExample') == 'cExample'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('Àpple') == 'àpple'\n"
-    "    assert to_camel_case('Éclair') == 'éclair'\n"
-    "    assert to_camel_case('Örange') == 'örange'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('Test123') == 'test123'\n"
-    "    assert to_camel_case('HELLO123') == 'hELLO123'\n"
-    "    assert to_camel_case('A1') == 'a1'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('MixedCASE') == 'mixedCASE'\n"
-    "    assert to_camel_case('UPdownUP') == 'uPdownUP'\n"
-    "    assert to_camel_case('LOwerUP') == 'lOwerUP'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case(' spaced') == ' spaced'\n"
-    "    assert to_camel_case(' tabbed') == ' tabbed'\n"
-    "    assert to_camel_case('\\nLine') == '\\nLine'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('Zebra!') == 'zebra!'\n"
-    "    assert to_camel_case('Xylophone!') == 'xylophone!'\n"
-    "    assert to_camel_case('Quack!') == 'quack!'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('ßSharp') == 'ßSharp'\n"
-    "    assert to_camel_case('ŊLetter') == 'ŋLetter'\n"
-    "    assert to_camel_case('Œmega') == 'œmega'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('-Dash') == '-Dash'\n"
-    "    assert to_camel_case('_Under') == '_Under'\n"
-    "    assert to_camel_case('+Plus') == '+Plus'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('CaseTest1') == 'caseTest1'\n"
-    "    assert to_camel_case('DataClass2') == 'dataClass2'\n"
-    "    assert to_camel_case('Word3') == 'word3'",
-
-    "def test_to_camel_case():\n"
-    "    assert to_camel_case('UPPERlower') == 'uPPERlower'\n"
-    "    assert to_camel_case('MIXEDcase') == 'mIXEDcase'\n"
-    "    assert to_camel_case('EDGE') == 'eDGE'",
-
-    "def test_to_camel_case():\n"
-    "    s = 'A' * 1000\n"
-    "    r = to_camel_case(s)\n"
-    "    assert len(r) == 1000\n"
-    "    assert r[0] == 'a'\n"
-    "    assert r[1:] == s[1:]",
-
-    "def test_to_camel_case():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        to_camel_case(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        to_camel_case(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        to_camel_case(True)",
-
-    "def test_to_camel_case():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        to_camel_case(b'A')\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        to_camel_case(bytearray(b'A'))\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        to_camel_case([1])",
-
-    "def test_to_camel_case():\n"
-    "    with pytest.raises(IndexError):\n"
-    "        to_camel_case([])\n"
-    "    with pytest.raises(IndexError):\n"
-    "        to_camel_case(())",
-
-    "def test_to_camel_case():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        to_camel_case({'key': 'Value'})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        to_camel_case(set(['A']))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        to_camel_case(object())",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list([]) == []\n"
-    "    assert reverse_list([1]) == [1]\n"
-    "    assert reverse_list([1, 2, 3]) == [3, 2, 1]",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list(['a', 'b', 'c']) == ['c', 'b', 'a']\n"
-    "    assert reverse_list(['x']) == ['x']\n"
-    "    assert reverse_list(['a', 'a']) == ['a', 'a']",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list([[1, 2], [3, 4]]) == [[3, 4], [1, 2]]\n"
-    "    assert reverse_list([[], [1]]) == [[1], []]\n"
-    "    assert reverse_list([['x'], ['y', 'z']]) == [['y', 'z'], ['x']]",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list([None, 1, 2]) == [2, 1, None]\n"
-    "    assert reverse_list([None]) == [None]\n"
-    "    assert reverse_list([1, None, 2, None]) == [None, 2, None, 1]",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list(['😊', 'a']) == ['a', '😊']\n"
-    "    assert reverse_list(['😊']) == ['😊']\n"
-    "    assert reverse_list(['a', '😊', 'b']) == ['b', '😊', 'a']",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list([True, False]) == [False, True]\n"
-    "    assert reverse_list([False]) == [False]\n"
-    "    assert reverse_list([True, True, False]) == [False, True, True]",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list([(1, 2), (3, 4)]) == [(3, 4), (1, 2)]\n"
-    "    assert reverse_list([(1,)]) == [(1,)]\n"
-    "    assert reverse_list([(1, 2), (2, 1), (0,)]) == [(0,), (2, 1), (1, 2)]",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list(['', 'a']) == ['a', '']\n"
-    "    assert reverse_list(['', '']) == ['', '']\n"
-    "    assert reverse_list(['abc', '']) == ['', 'abc']",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list([1, 1, 2, 2]) == [2, 2, 1, 1]\n"
-    "    assert reverse_list([2, 2]) == [2, 2]\n"
-    "    assert reverse_list([3, 1, 3]) == [3, 1, 3]",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list([[1], [2], [3]]) == [[3], [2], [1]]\n"
-    "    assert reverse_list([[1]]) == [[1]]\n"
-    "    assert reverse_list([[1, 2], [], [3]]) == [[3], [], [1, 2]]",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list([10**5, 10**6]) == [10**6, 10**5]\n"
-    "    assert reverse_list([0]) == [0]\n"
-    "    assert reverse_list([10**9, 1]) == [1, 10**9]",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list([' spaced ', 'trim ']) == ['trim ', ' spaced ']\n"
-    "    assert reverse_list([' a ']) == [' a ']\n"
-    "    assert reverse_list([' x', 'y ']) == ['y ', ' x']",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list([b'a', b'b']) == [b'b', b'a']\n"
-    "    assert reverse_list([b'x']) == [b'x']\n"
-    "    assert reverse_list([b'hi', b'yo']) == [b'yo', b'hi']",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list([{'a': 1}, {'b': 2}]) == [{'b': 2}, {'a': 1}]\n"
-    "    assert reverse_list([{}]) == [{}]\n"
-    "    assert reverse_list([{'x': 1}, {}, {'y': 2}]) == [{'y': 2}, {}, {'x': 1}]",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list([set([1]), set([2])]) == [set([2]), set([1])]\n"
-    "    assert reverse_list([set()]) == [set()]\n"
-    "    assert reverse_list([set([1, 2]), set([3])]) == [set([3]), set([1, 2])]",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list(['\\n', 'a']) == ['a', '\\n']\n"
-    "    assert reverse_list(['\\n']) == ['\\n']\n"
-    "    assert reverse_list(['x', '\\n', 'y']) == ['y', '\\n', 'x']",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list(['\\t', 'x']) == ['x', '\\t']\n"
-    "    assert reverse_list(['\\t']) == ['\\t']\n"
-    "    assert reverse_list(['a', '\\t', 'b']) == ['b', '\\t', 'a']",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list(['😊a', 'b']) == ['b', '😊a']\n"
-    "    assert reverse_list(['']) == ['']\n"
-    "    assert reverse_list(['á', 'b́', 'c']) == ['c', 'b́', 'á']",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list([1.1, 2.2, 3.3]) == [3.3, 2.2, 1.1]\n"
-    "    assert reverse_list([0.0]) == [0.0]\n"
-    "    assert reverse_list([-1.5, 2.5]) == [2.5, -1.5]",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list(['UP', 'low']) == ['low', 'UP']\n"
-    "    assert reverse_list(['Aa']) == ['Aa']\n"
-    "    assert reverse_list(['Mix', 'Case']) == ['Case', 'Mix']",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list(['🍎', '🍌']) == ['🍌', '🍎']\n"
-    "    assert reverse_list(['🍎']) == ['🍎']\n"
-    "    assert reverse_list(['🍉', '🍇', '🍓']) == ['🍓', '🍇', '🍉']",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list(['ends', 'starts']) == ['starts', 'ends']\n"
-    "    assert reverse_list(['solo']) == ['solo']\n"
-    "    assert reverse_list(['mid', 'end', 'start']) == ['start', 'end', 'mid']",
-
-    "def test_reverse_list():\n"
-    "    assert reverse_list([float('inf'), 1]) == [1, float('inf')]\n"
-    "    assert reverse_list([float('-inf'), 0]) == [0, float('-inf')]\n"
-    "    assert reverse_list([float('nan'), 5]) != reverse_list([float('nan'), 5])",
-
-    "def test_reverse_list():\n"
-    "    with pytest.raises(TypeError): reverse_list(None)\n"
-    "    with pytest.raises(TypeError): reverse_list(123)\n"
-    "    with pytest.raises(TypeError): reverse_list('abc')",
-
-    "def test_reverse_list():\n"
-    "    with pytest.raises(TypeError): reverse_list({'a': 1})\n"
-    "    with pytest.raises(TypeError): reverse_list({1, 2})\n"
-    "    with pytest.raises(TypeError): reverse_list((x for x in range(3)))",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('', 5) == '     '\n"
-    "    assert pad_string('a', 1) == 'a'\n"
-    "    assert pad_string('abc', 2) == 'abc'",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('', 0) == ''\n"
-    "    assert pad_string('a', 0) == 'a'\n"
-    "    assert pad_string('abc', -1) == 'abc'",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('a', 10) == 'a' + ' ' * 9\n"
-    "    assert pad_string('long', 4) == 'long'\n"
-    "    assert pad_string('tiny', 8) == 'tiny' + ' ' * 4",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('x', 3, '_') == 'x__'\n"
-    "    assert pad_string('', 2, '_') == '__'\n"
-    "    assert pad_string('xx', 2, '_') == 'xx'",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('abc', 5, '.') == 'abc..'\n"
-    "    assert pad_string('', 1, '.') == '.'\n"
-    "    assert pad_string('abc', 3, '.') == 'abc'",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('😊', 3) == '😊  '\n"
-    "    assert pad_string('😊a', 3) == '😊a '\n"
-    "    assert pad_string('😊', 1) == '😊'",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('a', 3, '😊') == 'a😊😊'\n"
-    "    assert pad_string('', 2, '😊') == '😊😊'\n"
-    "    assert pad_string('ab', 2, '😊') == 'ab'",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('tab', 6, '\\t') == 'tab\\t\\t\\t'\n"
-    "    assert pad_string('', 3, '\\t') == '\\t\\t\\t'\n"
-    "    assert pad_string('t', 1, '\\t') == 't'",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('line', 9, '\\n') == 'line\\n\\n\\n\\n\\n'\n"
-    "    assert pad_string('', 2, '\\n') == '\\n\\n'\n"
-    "    assert pad_string('line', 4, '\\n') == 'line'",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('x', 5, '0') == 'x0000'\n"
-    "    assert pad_string('xyz', 5, '0') == 'xyz00'\n"
-    "    assert pad_string('xyz', 3, '0') == 'xyz'",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('UP', 4, '_') == 'UP__'\n"
-    "    assert pad_string('UP', 1, '_') == 'UP'\n"
-    "    assert pad_string('', 4, '_') == '____'",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('mix', 6, '-') == 'mix---'\n"
-    "    assert pad_string('', 2, '-') == '--'\n"
-    "    assert pad_string('mix', 3, '-') == 'mix'",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('a b', 6, '.') == 'a b...'\n"
-    "    assert pad_string('a b', 3, '.') == 'a b'\n"
-    "    assert pad_string('', 2, '.') == '..'",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('á', 4) == 'á   '\n"
-    "    assert pad_string('áb', 3) == 'áb'\n"
-    "    assert pad_string('', 2) == '  '",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('ß', 2) == 'ß '\n"
-    "    assert pad_string('ßSharp', 7) == 'ßSharp '\n"
-    "    assert pad_string('Ŋ', 1) == 'Ŋ'",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('path', 6, '/') == 'path//'\n"
-    "    assert pad_string('p', 3, '/') == 'p//'\n"
-    "    assert pad_string('path', 4, '/') == 'path'",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('aaa', 6, 'a') == 'aaaaaa'\n"
-    "    assert pad_string('a', 3, 'a') == 'aaa'\n"
-    "    assert pad_string('aaa', 3, 'a') == 'aaa'",
-
-    "def test_pad_string():\n"
-    "    s = 'x' * 100\n"
-    "    padded = pad_string(s, 150)\n"
-    "    assert len(padded) == 150\n"
-    "    assert padded.startswith('x' * 100)\n"
-    "    assert padded.endswith(' ' * 50)",
-
-    "def test_pad_string():\n"
-    "    s = 'emoji😊'\n"
-    "    padded = pad_string(s, len(s) + 3, '_')\n"
-    "    assert padded == s + '___'\n"
-    "    assert len(padded) == len(s) + 3\n"
-    "    assert padded[:len(s)] == s",
-
-    "def test_pad_string():\n"
-    "    assert pad_string(' spaced', 10) == ' spaced   '\n"
-    "    assert pad_string(' spaced', 7) == ' spaced'\n"
-    "    assert pad_string(' spaced ', 9) == ' spaced  '",
-
-    "def test_pad_string():\n"
-    "    assert pad_string('ab', 5, 'xy') == 'abxyxy'\n"
-    "    assert pad_string('', 4, 'xy') == 'xyxy'\n"
-    "    assert pad_string('xy', 2, 'xy') == 'xy'",
-
-    "def test_pad_string():\n"
-    "    with pytest.raises(TypeError): pad_string(123, 5)\n"
-    "    with pytest.raises(TypeError): pad_string(None, 3)\n"
-    "    with pytest.raises(TypeError): pad_string(['a'], 4)",
-
-    "def test_pad_string():\n"
-    "    with pytest.raises(TypeError): pad_string('abc', 5, 1)\n"
-    "    with pytest.raises(TypeError): pad_string('abc', 5, None)\n"
-    "    with pytest.raises(TypeError): pad_string('abc', 5, ['x'])",
-
-    "def test_pad_string():\n"
-    "    with pytest.raises(TypeError): pad_string('abc', 3.5)\n"
-    "    with pytest.raises(TypeError): pad_string('abc', '4')\n"
-    "    with pytest.raises(TypeError): pad_string('abc', None)",
-
-    "def test_pad_string():\n"
-    "    with pytest.raises(TypeError): pad_string((), 2)\n"
-    "    with pytest.raises(TypeError): pad_string({1: 'a'}, 3)\n"
-    "    with pytest.raises(TypeError): pad_string({1, 2}, 3)",
-
-    "def test_is_even():\n"
-    "    assert is_even(0) == True\n"
-    "    assert is_even(-0) == True\n"
-    "    assert is_even(2**10) == True",
-
-    "def test_is_even():\n"
-    "    assert is_even(-2) == True\n"
-    "    assert is_even(-3) == False\n"
-    "    assert is_even(1) == False",
-
-    "def test_is_even():\n"
-    "    assert is_even(99999998) == True\n"
-    "    assert is_even(99999999) == False\n"
-    "    assert is_even(-99999998) == True",
-
-    "def test_is_even():\n"
-    "    assert is_even(10**6) == True\n"
-    "    assert is_even(10**6 + 1) == False\n"
-    "    assert is_even(-(10**6)) == True",
-
-    "def test_is_even():\n"
-    "    assert is_even(-1) == False\n"
-    "    assert is_even(-4) == True\n"
-    "    assert is_even(4) == True",
-
-    "def test_is_even():\n"
-    "    assert is_even(3) == False\n"
-    "    assert is_even(5) == False\n"
-    "    assert is_even(8) == True",
-
-    "def test_is_even():\n"
-    "    assert is_even(-1001) == False\n"
-    "    assert is_even(-1000) == True\n"
-    "    assert is_even(1001) == False",
-
-    "def test_is_even():\n"
-    "    assert is_even(2**31) == True\n"
-    "    assert is_even(2**31 - 1) == False\n"
-    "    assert is_even(-(2**31)) == True",
-
-    "def test_is_even():\n"
-    "    assert is_even(6) == True\n"
-    "    assert is_even(-6) == True\n"
-    "    assert is_even(7) == False",
-
-    "def test_is_even():\n"
-    "    assert is_even(0b1010) == True\n"
-    "    assert is_even(0b1011) == False\n"
-    "    assert is_even(-0b1010) == True",
-
-    "def test_is_even():\n"
-    "    assert is_even(0x10) == True\n"
-    "    assert is_even(0x11) == False\n"
-    "    assert is_even(-0x10) == True",
-
-    "def test_is_even():\n"
-    "    assert is_even(True) == False\n"
-    "    assert is_even(False) == True\n"
-    "    assert is_even(int(True)) == False",
-
-    "def test_is_even():\n"
-    "    assert is_even(-999) == False\n"
-    "    assert is_even(-998) == True\n"
-    "    assert is_even(998) == True",
-
-    "def test_is_even():\n"
-    "    assert is_even(1_000_000_002) == True\n"
-    "    assert is_even(1_000_000_003) == False\n"
-    "    assert is_even(-1_000_000_003) == False",
-
-    "def test_is_even():\n"
-    "    assert is_even(4.0) == True\n"
-    "    assert is_even(4.5) == False\n"
-    "    assert is_even(-4.0) == True",
-
-    "def test_is_even():\n"
-    "    assert is_even(-12) == True\n"
-    "    assert is_even(13) == False\n"
-    "    assert is_even(14) == True",
-
-    "def test_is_even():\n"
-    "    assert is_even(22) == True\n"
-    "    assert is_even(-21) == False\n"
-    "    assert is_even(-22) == True",
-
-    "def test_is_even():\n"
-    "    assert is_even(1000000000000) == True\n"
-    "    assert is_even(1000000000001) == False\n"
-    "    assert is_even(-1000000000000) == True",
-
-    "def test_is_even():\n"
-    "    assert is_even(0.0000002) == True\n"
-    "    assert is_even(0.0000003) == False\n"
-    "    assert is_even(-0.0000002) == True",
-
-    "def test_is_even():\n"
-    "    assert is_even(50) == True\n"
-    "    assert is_even(51) == False\n"
-    "    assert is_even(-51) == False",
-
-    "def test_is_even():\n"
-    "    assert is_even(90) == True\n"
-    "    assert is_even(89) == False\n"
-    "    assert is_even(-90) == True",
-
-    "def test_is_even():\n"
-    "    assert is_even(-7) == False\n"
-    "    assert is_even(-8) == True\n"
-    "    assert is_even(7) == False",
-
-    "def test_is_even():\n"
-    "    assert is_even(72) == True\n"
-    "    assert is_even(73) == False\n"
-    "    assert is_even(-72) == True",
-
-    "def test_is_even():\n"
-    "    assert is_even(2.2) == False\n"
-    "    assert is_even(2.0) == True\n"
-    "    assert is_even(-2.2) == False",
-
-    "def test_is_even():\n"
-    "    assert is_even(-0.0) == True\n"
-    "    assert is_even(0.1) == False\n"
-    "    assert is_even(-0.1) == False",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('') == False\n"
-    "    assert is_upper(' ') == False\n"
-    "    assert is_upper('123') == False",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('A') == True\n"
-    "    assert is_upper('Z') == True\n"
-    "    assert is_upper('AZ') == True",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('a') == False\n"
-    "    assert is_upper('Aa') == False\n"
-    "    assert is_upper('aZ') == False",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('ABC!') == True\n"
-    "    assert is_upper('ABC123') == True\n"
-    "    assert is_upper('A_B') == True",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('123') == False\n"
-    "    assert is_upper('123!') == False\n"
-    "    assert is_upper('123😊') == False",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('ÄÖÜ') == True\n"
-    "    assert is_upper('äöü') == False\n"
-    "    assert is_upper('Äö') == False",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('ΓΔΘ') == True\n"
-    "    assert is_upper('γδθ') == False\n"
-    "    assert is_upper('Γδ') == False",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('ß') == False\n"
-    "    assert is_upper('SS') == True\n"
-    "    assert is_upper('ẞ') == True",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('Á') == True\n"
-    "    assert is_upper('ÁB') == True\n"
-    "    assert is_upper('áB') == False",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('A B C') == True\n"
-    "    assert is_upper('ABC ') == True\n"
-    "    assert is_upper(' ABC') == True",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('UPPER-case') == False\n"
-    "    assert is_upper('UPPER-CASE') == True\n"
-    "    assert is_upper('upper-CASE') == False",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('ABC\\nDEF') == True\n"
-    "    assert is_upper('ABC\\tDEF') == True\n"
-    "    assert is_upper('ABC\\rDEF') == True",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('A!') == True\n"
-    "    assert is_upper('!A') == True\n"
-    "    assert is_upper('!A!') == True",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('a!') == False\n"
-    "    assert is_upper('!a') == False\n"
-    "    assert is_upper('!a!') == False",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('Ω') == True\n"
-    "    assert is_upper('ΩΣ') == True\n"
-    "    assert is_upper('Ωσ') == False",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('A'*1000) == True\n"
-    "    assert is_upper('A'*999 + 'a') == False\n"
-    "    assert is_upper('A'*999 + '1') == True",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('A😊B') == True\n"
-    "    assert is_upper('😊AB') == True\n"
-    "    assert is_upper('A😊b') == False",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('CAPSLOCK') == True\n"
-    "    assert is_upper('CapsLock') == False\n"
-    "    assert is_upper('lock') == False",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('UPPER123!?') == True\n"
-    "    assert is_upper('UPPER!?') == True\n"
-    "    assert is_upper('upper123!?') == False",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('ßA') == False\n"
-    "    assert is_upper('ẞa') == False\n"
-    "    assert is_upper('ß1A') == False",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('😊') == False\n"
-    "    assert is_upper('😊😊') == False\n"
-    "    assert is_upper('😊!') == False",
-
-    "def test_is_upper():\n"
-    "    assert is_upper('ÜBER') == True\n"
-    "    assert is_upper('über') == False\n"
-    "    assert is_upper('ÜbEr') == False",
-
-    "def test_is_upper():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        is_upper(None)\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        is_upper(123)\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        is_upper(1.5)",
-
-    "def test_is_upper():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        is_upper(['A'])\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        is_upper({'s': 'ABC'})\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        is_upper(object())",
-
-    "def test_is_upper():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        is_upper(b'ABC')\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        is_upper(bytearray(b'ABC'))\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        is_upper(lambda: 'ABC')",
-
-    "def test_flatten_once():\n"
-    "    assert flatten_once([]) == []\n"
-    "    assert flatten_once([[]]) == []\n"
-    "    assert flatten_once([[], []]) == []",
-
-    "def test_flatten_once():\n"
-    "    assert flatten_once([[[]]]) == [[]]\n"
-    "    assert flatten_once([[[], []]]) == [[], []]\n"
-    "    assert flatten_once([[[], [1]]]) == [[], [1]]",
-
-    "def test_flatten_once():\n"
-    "    assert flatten_once([[1], [2, 3]]) == [1, 2, 3]\n"
-    "    assert flatten_once([[1, 2, 3]]) == [1, 2, 3]\n"
-    "    assert flatten_once([1, [2, 3]]) == [1, 2, 3]",
-
-    "def test_flatten_once():\n"
-    "    assert flatten_once([[[1, 2]], [3]]) == [[1, 2], 3]\n"
-    "    assert flatten_once([[1], [[2, 3]]]) == [1, [2, 3]]\n"
-    "    assert flatten_once([[[1]], [[2]]]) == [[1], [2]]",
-
-    "def test_flatten_once():\n"
-    "    assert flatten_once([0, [1, 2], []]) == [0, 1, 2]\n"
-    "    assert flatten_once([[0], 1, [2]]) == [0, 1, 2]\n"
-    "    assert flatten_once([[], 0]) == [0]",
-
-    "def test_flatten_once():\n"
-    "    assert flatten_once([['a'], ['b', 'c']]) == ['a', 'b', 'c']\n"
-    "    assert flatten_once(['x', ['y']]) == ['x', 'y']\n"
-    "    assert flatten_once([[], ['z']]) == ['z']",
-
-    "def test_flatten_once():\n"
-    "    assert flatten_once(['ab', ['c', 'd']]) == ['ab', 'c', 'd']\n"
-    "    assert flatten_once([['a', 'b'], 'cd']) == ['a', 'b', 'cd']\n"
-    "    assert flatten_once(['ab', 'cd']) == ['ab', 'cd']",
-
-    "def test_flatten_once():\n"
-    "    assert flatten_once([(1, 2), [3, 4]]) == [(1, 2), 3, 4]\n"
-    "    assert flatten_once([[1, 2], (3, 4)]) == [1, 2, (3, 4)]\n"
-    "    assert flatten_once([(1, 2), (3, 4)]) == [(1, 2), (3, 4)]",
-
-    "def test_flatten_once():\n"
-    "    xs = ([1, 2], [3, 4])\n"
-    "    assert flatten_once(xs) == [1, 2, 3, 4]\n"
-    "    xs2 = ([0], [])\n"
-    "    assert flatten_once(xs2) == [0]\n"
-    "    assert flatten_once(([1, 2], 3, [4])) == [1, 2, 3, 4]",
-
-    "def test_flatten_once():\n"
-    "    assert flatten_once('abc') == ['a', 'b', 'c']\n"
-    "    assert flatten_once(['abc']) == ['abc']\n"
-    "    assert flatten_once(['ab', ['c']]) == ['ab', 'c']",
-
-    "def test_flatten_once():\n"
-    "    assert flatten_once(b'ab') == [97, 98]\n"
-    "    assert flatten_once([b'ab']) == [b'ab']\n"
-    "    assert flatten_once([[b'a', b'b']]) == [b'a', b'b']",
-
-    "def test_flatten_once():\n"
-    "    assert flatten_once([[True], [False]]) == [True, False]\n"
-    "    assert flatten_once([[True, False], []]) == [True, False]\n"
-    "    assert flatten_once([True, [False]]) == [True, False]",
-
-    "def test_flatten_once():\n"
-    "    assert flatten_once([[{'a': 1}], [{'b': 2}]]) == [{'a': 1}, {'b': 2}]\n"
-    "    assert flatten_once([[{'k': 'v'}, 1], [2]]) == [{'k': 'v'}, 1, 2]\n"
-    "    assert flatten_once([[{1, 2}], [{3}]]) == [{1, 2}, {3}]",
-
-    "def test_flatten_once():\n"
-    "    assert flatten_once([[[], []], [1]]) == [[], [], 1]\n"
-    "    assert flatten_once([[[], 1], [2, []]]) == [[], 1, 2, []]\n"
-    "    assert flatten_once([[[]]]) == [[]]",
-
-    "def test_flatten_once():\n"
-    "    assert flatten_once([[0, 1], [[], 2]]) == [0, 1, [], 2]\n"
-    "    assert flatten_once([['a'], [], ['b', 'c']]) == ['a', 'b', 'c']\n"
-    "    assert flatten_once([[True], [[], False]]) == [True, [], False]",
-
-    "def test_flatten_once():\n"
-    "    assert flatten_once([[' '], ['\\t']]) == [' ', '\\t']\n"
-    "    assert flatten_once([' ', ['\\n']]) == [' ', '\\n']\n"
-    "    assert flatten_once([[''], [' ']]) == ['', ' ']",
-
-    "def test_flatten_once():\n"
-    "    assert flatten_once([['😊'], ['👍', '👀']]) == ['😊', '👍', '👀']\n"
-    "    assert flatten_once(['x', ['😊']]) == ['x', '😊']\n"
-    "    assert flatten_once([['😊', 'x']]) == ['😊', 'x']",
-
-    "def test_flatten_once():\n"
-    "    large = list(range(1000))\n"
-    "    result = flatten_once([large])\n"
-    "    assert len(result) == 1000\n"
-    "    assert result[0] == 0\n"
-    "    assert result[-1] == 999",
-
-    "def test_flatten_once():\n"
-    "    left = list(range(10))\n"
-    "    right = list(range(10, 20))\n"
-    "    result = flatten_once([left, right])\n"
-    "    assert result[0] == 0\n"
-    "    assert result[-1] == 19\n"
-    "    assert len(result) == 20",
-
-    "def test_flatten_once():\n"
-    "    xs = [[1, 'a'], [True]]\n"
-    "    assert flatten_once(xs) == [1, 'a', True]\n"
-    "    xs2 = [[None], ['x']]\n"
-    "    assert flatten_once(xs2) == [None, 'x']\n"
-    "    xs3 = [[''], [0]]\n"
-    "    assert flatten_once(xs3) == ['', 0]",
-
-    "def test_flatten_once():\n"
-    "    xs = [[10**5], [10**6]]\n"
-    "    assert flatten_once(xs) == [10**5, 10**6]\n"
-    "    xs2 = [[0], [10**3]]\n"
-    "    assert flatten_once(xs2) == [0, 10**3]\n"
-    "    xs3 = [[1e3], [2e3]]\n"
-    "    assert flatten_once(xs3) == [1e3, 2e3]",
-
-    "def test_flatten_once():\n"
-    "    obj1 = object()\n"
-    "    obj2 = object()\n"
-    "    result = flatten_once([[obj1], [obj2]])\n"
-    "    assert result[0] is obj1\n"
-    "    assert result[1] is obj2\n"
-    "    assert len(result) == 2",
-
-    "def test_flatten_once():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_once(1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_once(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_once(3.14)",
-
-    "def test_flatten_once():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_once(True)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_once(False)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_once(0)",
-
-    "def test_flatten_once():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_once(b'abc')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_once(object())\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_once(lambda: [1, 2])",
-
-    "def test_median():\n"
-    "    with pytest.raises(IndexError):\n"
-    "        median([])\n"
-    "    with pytest.raises(IndexError):\n"
-    "        median(())\n"
-    "    with pytest.raises(IndexError):\n"
-    "        median([] + [])",
-
-    "def test_median():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        median(1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        median(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        median(3.14)",
-
-    "def test_median():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        median([1, '1'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        median(['a', 2])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        median([0, 1 + 2j])",
-
-    "def test_median():\n"
-    "    assert median([0]) == 0\n"
-    "    assert median([-1]) == -1\n"
-    "    assert median([10**9]) == 10**9",
-
-    "def test_median():\n"
-    "    assert median([3, 1, 2]) == 2\n"
-    "    assert median([9, 7, 8]) == 8\n"
-    "    assert median([-3, -1, -2]) == -2",
-
-    "def test_median():\n"
-    "    assert median([1, 3]) == 2\n"
-    "    assert median([-5, 5]) == 0\n"
-    "    assert median([2.5, 7.5]) == 5.0",
-
-    "def test_median():\n"
-    "    assert median([1, 2, 3, 4]) == 2.5\n"
-    "    assert median([-4, -3, -2, -1]) == -2.5\n"
-    "    assert median([0, 10, 20, 30]) == 15",
-
-    "def test_median():\n"
-    "    assert median([0.1, 0.2]) == 0.15000000000000002\n"
-    "    assert median([0.1, 0.2, 0.3, 0.4]) == 0.25\n"
-    "    assert median([0.5, 1.5, 2.5]) == 1.5",
-
-    "def test_median():\n"
-    "    assert median([-1e-9, 0, 1e-9]) == 0\n"
-    "    assert median([1e-9, 0, 1e-8]) == 1e-9\n"
-    "    assert median([-1e-8, -1e-9, 0]) == -1e-9",
-
-    "def test_median():\n"
-    "    assert median([10**18, 0, -(10**18)]) == 0\n"
-    "    assert median([10**12, 10**6, 10**9]) == 10**9\n"
-    "    assert median([-10**9, -10**6, -10**3]) == -10**6",
-
-    "def test_median():\n"
-    "    assert median([1e308, 1e308, 1e308]) == 1e308\n"
-    "    assert median([1e308, 1e308]) == float('inf')\n"
-    "    assert median([1e308, 0, -1e308, 1e308]) == 5e307",
-
-    "def test_median():\n"
-    "    assert median([float('inf'), 0, float('-inf')]) == 0\n"
-    "    assert median([float('inf'), 1, 2]) == 2\n"
-    "    assert median([float('-inf'), -1, 0]) == -1",
-
-    "def test_median():\n"
-    "    assert median([float('inf'), 0]) == float('inf')\n"
-    "    assert median([0, float('inf')]) == float('inf')\n"
-    "    assert median([float('-inf'), 0]) == float('-inf')",
-
-    "def test_median():\n"
-    "    assert median([False, True]) == 0.5\n"
-    "    assert median([False, False, True]) == False\n"
-    "    assert median([True, True, False]) == True",
-
-    "def test_median():\n"
-    "    xs = list(range(1001))\n"
-    "    assert median(xs) == 500\n"
-    "    xs_rev = list(range(1000, -1, -1))\n"
-    "    assert median(xs_rev) == 500\n"
-    "    xs_shifted = list(range(-500, 501))\n"
-    "    assert median(xs_shifted) == 0",
-
-    "def test_median():\n"
-    "    xs = list(range(1000))\n"
-    "    assert median(xs) == 499.5\n"
-    "    xs_rev = list(range(999, -1, -1))\n"
-    "    assert median(xs_rev) == 499.5\n"
-    "    xs_even = [0, 0, 0, 1000000]\n"
-    "    assert median(xs_even) == 0.0",
-
-    "def test_median():\n"
-    "    assert median([1, 1, 1, 1]) == 1\n"
-    "    assert median([-2, -2, -2, -2]) == -2\n"
-    "    assert median([1, 1, 1, 1000]) == 1",
-
-    "def test_median():\n"
-    "    assert median([7, 7, 7, 7, 7]) == 7\n"
-    "    assert median([5, 4, 3, 2, 1]) == 3\n"
-    "    assert median([-5, -4, -3, -2, -1]) == -3",
-
-    "def test_median():\n"
-    "    assert median([2, 1, 0, -1, -2]) == 0\n"
-    "    assert median([100, 50, 0, -50, -100]) == 0\n"
-    "    assert median([3, 1, -1, -3, 0]) == 0",
-
-    "def test_median():\n"
-    "    assert median([3, 5, 7, 9, 11]) == 7\n"
-    "    assert median([10, 8, 6, 4, 2]) == 6\n"
-    "    assert median([-2, -4, -6, -8, -10]) == -6",
-
-    "def test_median():\n"
-    "    assert median([1.1, 2.2, 3.3, 4.4]) == 2.75\n"
-    "    assert median([-1.5, -2.5, -3.5, -4.5]) == -3.0\n"
-    "    assert median([0.5, 0.25, 0.75, 1.0]) == 0.625",
-
-    "def test_median():\n"
-    "    assert median([1.1, 5, 3.3]) == 3.3\n"
-    "    assert median([10, 2.5, 3]) == 3\n"
-    "    assert median([-10, -5.0, -1]) == -5.0",
-
-    "def test_median():\n"
-    "    assert median([float('inf')]) == float('inf')\n"
-    "    assert median([float('-inf')]) == float('-inf')\n"
-    "    assert median([3.14]) == 3.14",
-
-    "def test_median():\n"
-    "    assert median([True, 2, 3]) == 2\n"
-    "    assert median([False, 0, 1]) == 0\n"
-    "    assert median([True, False, 10]) == True",
-
-    "def test_median():\n"
-    "    assert median([-1000, -3, -2, -1, 0]) == -2\n"
-    "    assert median([1, 100, 1000]) == 100\n"
-    "    assert median([50, 49, 51]) == 50",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([], 5) == []\n"
-    "    assert increment_elements([], 0) == []\n"
-    "    assert increment_elements([], -3) == []",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([0], 0) == [0]\n"
-    "    assert increment_elements([0], 5) == [5]\n"
-    "    assert increment_elements([0], -5) == [-5]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([1, 2, 3], 0) == [1, 2, 3]\n"
-    "    assert increment_elements([-1, -2], 0) == [-1, -2]\n"
-    "    assert increment_elements([0, 0], 0) == [0, 0]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([1, 2, 3], -1) == [0, 1, 2]\n"
-    "    assert increment_elements([-1, -2, -3], 1) == [0, -1, -2]\n"
-    "    assert increment_elements([10], -10) == [0]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([1e9], 1) == [1e9 + 1]\n"
-    "    assert increment_elements([-1e9], -1) == [-1e9 - 1]\n"
-    "    assert increment_elements([1e9, -1e9], 0) == [1e9, -1e9]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([float('inf')], 1) == [float('inf')]\n"
-    "    assert increment_elements([float('-inf')], -1) == [float('-inf')]\n"
-    "    assert increment_elements([0], float('inf')) == [float('inf')]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([1, -1, 2], 3) == [4, 2, 5]\n"
-    "    assert increment_elements([-5, 5], 5) == [0, 10]\n"
-    "    assert increment_elements([100, -100], -100) == [0, -200]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([0.1, 0.2], 0.1) == [0.2, 0.30000000000000004]\n"
-    "    assert increment_elements([-0.1], 0.1) == [0.0]\n"
-    "    assert increment_elements([1.5], -0.5) == [1.0]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([10, 20, 30], -10) == [0, 10, 20]\n"
-    "    assert increment_elements([5], -5) == [0]\n"
-    "    assert increment_elements([-10, -20], 10) == [0, -10]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([True, False], 1) == [2, 1]\n"
-    "    assert increment_elements([True], -1) == [0]\n"
-    "    assert increment_elements([False], 5) == [5]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([0, 1, 2, 3], -3) == [-3, -2, -1, 0]\n"
-    "    assert increment_elements([3, 2, 1, 0], 3) == [6, 5, 4, 3]\n"
-    "    assert increment_elements([-1, 0, 1], 1) == [0, 1, 2]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([999999999], 1) == [1000000000]\n"
-    "    assert increment_elements([-999999999], -1) == [-1000000000]\n"
-    "    assert increment_elements([500000000], 500000000) == [1000000000]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([float('inf'), -1], 1) == [float('inf'), 0]\n"
-    "    assert increment_elements([float('-inf'), 1], -1) == [float('-inf'), 0]\n"
-    "    assert increment_elements([0], float('-inf')) == [float('-inf')]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([1, 1, 1], -1) == [0, 0, 0]\n"
-    "    assert increment_elements([-1, -1], 1) == [0, 0]\n"
-    "    assert increment_elements([2, 4, 6], -2) == [0, 2, 4]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([0.000001], 0.000001) == [0.000002]\n"
-    "    assert increment_elements([-0.000001], 0.000001) == [0.0]\n"
-    "    assert increment_elements([1e-9, 2e-9], 1e-9) == [2e-9, 3e-9]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([1, 2, 3], 100) == [101, 102, 103]\n"
-    "    assert increment_elements([-1, -2], 100) == [99, 98]\n"
-    "    assert increment_elements([50], 50) == [100]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([1, 2, 3], -100) == [-99, -98, -97]\n"
-    "    assert increment_elements([-1, -2], -100) == [-101, -102]\n"
-    "    assert increment_elements([0], -100) == [-100]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([10, 0, -10], 10) == [20, 10, 0]\n"
-    "    assert increment_elements([10, 0, -10], -10) == [0, -10, -20]\n"
-    "    assert increment_elements([0], 0) == [0]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([1, 2], float('inf')) == [float('inf'), float('inf')]\n"
-    "    assert increment_elements([-1], float('-inf')) == [float('-inf')]\n"
-    "    assert increment_elements([0], 1) == [1]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([True, False], -1) == [0, -1]\n"
-    "    assert increment_elements([True], 1) == [2]\n"
-    "    assert increment_elements([False], -5) == [-5]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([2, 4, 6], 0) == [2, 4, 6]\n"
-    "    assert increment_elements([-2, -4, -6], 2) == [0, -2, -4]\n"
-    "    assert increment_elements([3], -3) == [0]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([1e5, 1e6], 1) == [100001, 1000001]\n"
-    "    assert increment_elements([-1e5, -1e6], -1) == [-100001, -1000001]\n"
-    "    assert increment_elements([1e3], -1e3) == [0]",
-
-    "def test_increment_elements():\n"
-    "    assert increment_elements([9, 8, 7], -9) == [0, -1, -2]\n"
-    "    assert increment_elements([-9, -8, -7], 9) == [0, 1, 2]\n"
-    "    assert increment_elements([3], -4) == [-1]",
-
-    "def test_increment_elements():\n"
-    "    result1 = increment_elements([0], float('nan'))\n"
-    "    result2 = increment_elements([1], float('nan'))\n"
-    "    result3 = increment_elements([-1], float('nan'))\n"
-    "    assert result1[0] != result1[0]\n"
-    "    assert result2[0] != result2[0]\n"
-    "    assert result3[0] != result3[0]",
-
-    "def test_increment_elements():\n"
-    "    large = list(range(10000))\n"
-    "    out = increment_elements(large, -large[-1])\n"
-    "    assert out[0] == -(large[-1])\n"
-    "    assert out[-1] == 0\n"
-    "    assert len(out) == 10000",
-
-    "def test_chunk_list():\n"
-    "    assert chunk_list([], 3) == []\n"
-    "    assert chunk_list([], 1) == []\n"
-    "    assert chunk_list([], 10) == []",
-
-    "def test_chunk_list():\n"
-    "    assert chunk_list([1], 1) == [[1]]\n"
-    "    assert chunk_list([1], 5) == [[1]]\n"
-    "    assert chunk_list([1], 2) == [[1]]",
-
-    "def test_chunk_list():\n"
-    "    assert chunk_list([1, 2, 3], 5) == [[1, 2, 3]]\n"
-    "    assert chunk_list([1, 2], 3) == [[1, 2]]\n"
-    "    assert chunk_list([1, 2, 3, 4], 10) == [[1, 2, 3, 4]]",
-
-    "def test_chunk_list():\n"
-    "    assert chunk_list([1, 2, 3, 4], 2) == [[1, 2], [3, 4]]\n"
-    "    assert chunk_list([1, 2, 3], 2) == [[1, 2], [3]]\n"
-    "    assert chunk_list([1, 2], 2) == [[1, 2]]",
-
-    "def test_chunk_list():\n"
-    "    assert chunk_list([0, 0, 0, 0], 2) == [[0, 0], [0, 0]]\n"
-    "    assert chunk_list([0, 0, 0], 2) == [[0, 0], [0]]\n"
-    "    assert chunk_list([0], 2) == [[0]]",
-
-    "def test_chunk_list():\n"
-    "    assert chunk_list([-1, -2, -3], 2) == [[-1, -2], [-3]]\n"
-    "    assert chunk_list([-1, -2], 1) == [[-1], [-2]]\n"
-    "    assert chunk_list([-1], 1) == [[-1]]",
-
-    "def test_chunk_list():\n"
-    "    assert chunk_list([1.1, 2.2, 3.3], 2) == [[1.1, 2.2], [3.3]]\n"
-    "    assert chunk_list([1.1], 2) == [[1.1]]\n"
-    "    assert chunk_list([1.1, 2.2], 3) == [[1.1, 2.2]]",
-
-    "def test_chunk_list():\n"
-    "    assert chunk_list([True, False, True], 2) == [[True, False], [True]]\n"
-    "    assert chunk_list([False], 2) == [[False]]\n"
-    "    assert chunk_list([True, False], 1) == [[True], [False]]",
-
-    "def test_chunk_list():\n"
-    "    assert chunk_list(['a', 'b', 'c', 'd'], 2) == [['a', 'b'], ['c', 'd']]\n"
-    "    assert chunk_list(['a', 'b'], 3) == [['a', 'b']]\n"
-    "    assert chunk_list(['x'], 1) == [['x']]",
-
-    "def test_chunk_list():\n"
-    "    assert chunk_list([[1], [2], [3]], 2) == [[[1], [2]], [[3]]]\n"
-    "    assert chunk_list([[1], [2]], 1) == [[[1]], [[2]]]\n"
-    "    assert chunk_list([[1]], 5) == [[[1]]]",
-
-    "def test_chunk_list():\n"
-    "    assert chunk_list([1, 2, 3, 4, 5], 3) == [[1, 2, 3], [4, 5]]\n"
-    "    assert chunk_list([1, 2, 3], 3) == [[1, 2, 3]]\n"
-    "    assert chunk_list([1, 2, 3], 1) == [[1], [2], [3]]",
-
-    "def test_chunk_list():\n"
-    "    data = [0] * 10\n"
-    "    out = chunk_list(data, 3)\n"
-    "    assert out[:3] == [[0, 0, 0], [0, 0, 0], [0, 0, 0]]\n"
-    "    assert out[-1] == [0]\n"
-    "    assert sum(len(c) for c in out) == 10",
-
-    "def test_chunk_list():\n"
-    "    out = chunk_list(list(range(7)), 3)\n"
-    "    assert out == [[0, 1, 2], [3, 4, 5], [6]]\n"
-    "    out2 = chunk_list(list(range(5)), 4)\n"
-    "    assert out2 == [[0, 1, 2, 3], [4]]\n"
-    "    out3 = chunk_list(list(range(3)), 10)\n"
-    "    assert out3 == [[0, 1, 2]]",
-
-    "def test_chunk_list():\n"
-    "    assert chunk_list([-1, -2, -3, -4], 3) == [[-1, -2, -3], [-4]]\n"
-    "    assert chunk_list([-1, -2], 5) == [[-1, -2]]\n"
-    "    assert chunk_list([-1], 10) == [[-1]]",
-
-    "def test_chunk_list():\n"
-    "    assert chunk_list([float('inf'), 1, 2], 2) == [[float('inf'), 1], [2]]\n"
-    "    assert chunk_list([float('-inf')], 1) == [[float('-inf')]]\n"
-    "    assert chunk_list([0, 1], 5) == [[0, 1]]",
-
-    "def test_chunk_list():\n"
-    "    assert chunk_list(['', 'x', 'y'], 2) == [['', 'x'], ['y']]\n"
-    "    assert chunk_list([''], 1) == [['']]\n"
-    "    assert chunk_list(['', ''], 3) == [['', '']]",
-
-    "def test_chunk_list():\n"
-    "    assert chunk_list([[1, 2], [], [3]], 2) == [[[1, 2], []], [[3]]]\n"
-    "    assert chunk_list([[1], []], 2) == [[[1], []]]\n"
-    "    assert chunk_list([[1], []], 1) == [[[1]], [[]]]",
-
-    "def test_chunk_list():\n"
-    "    s = 'abcdef'\n"
-    "    assert chunk_list(s, 2) == ['ab', 'cd', 'ef']\n"
-    "    assert chunk_list(s, 4) == ['abcd', 'ef']\n"
-    "    assert chunk_list('', 3) == []",
-
-    "def test_chunk_list():\n"
-    "    t = (1, 2, 3, 4)\n"
-    "    assert chunk_list(t, 2) == [(1, 2), (3, 4)]\n"
-    "    assert chunk_list(t, 3) == [(1, 2, 3), (4,)]\n"
-    "    assert chunk_list((), 1) == []",
-
-    "def test_chunk_list():\n"
-    "    data = list(range(1000))\n"
-    "    out = chunk_list(data, 128)\n"
-    "    assert out[0][:3] == [0, 1, 2]\n"
-    "    assert out[-1][-1] == 999\n"
-    "    assert sum(len(c) for c in out) == 1000",
-
-    "def test_chunk_list():\n"
-    "    data = list(range(1000))\n"
-    "    out = chunk_list(data, 1)\n"
-    "    assert len(out) == 1000\n"
-    "    assert out[0] == [0]\n"
-    "    assert out[-1] == [999]",
-
-    "def test_chunk_list():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        chunk_list([], 0)\n"
-    "    with pytest.raises(ValueError):\n"
-    "        chunk_list([1], 0)\n"
-    "    with pytest.raises(ValueError):\n"
-    "        chunk_list([1, 2, 3], 0)",
-
-    "def test_chunk_list():\n"
-    "    out_neg = chunk_list([1, 2, 3], -1)\n"
-    "    assert out_neg == []\n"
-    "    out_neg2 = chunk_list([1, 2, 3, 4], -2)\n"
-    "    assert out_neg2 == []\n"
-    "    out_neg3 = chunk_list([], -5)\n"
-    "    assert out_neg3 == []",
-
-    "def test_chunk_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        chunk_list([1, 2, 3], 2.5)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        chunk_list([1, 2], '2')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        chunk_list([1], b'2')",
-
-    "def test_chunk_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        chunk_list(None, 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        chunk_list(123, 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        chunk_list(object(), 1)",
-
-    "def test_square_list():\n"
-    "    assert square_list([]) == []\n"
-    "    assert square_list([0]) == [0]\n"
-    "    assert square_list([-1, 1]) == [1, 1]",
-
-    "def test_square_list():\n"
-    "    assert square_list([10**9]) == [(10**9) * (10**9)]\n"
-    "    assert square_list([-10**9]) == [(10**9) * (10**9)]\n"
-    "    assert square_list([10**6, -10**6]) == [10**12, 10**12]",
-
-    "def test_square_list():\n"
-    "    assert square_list([2, -2, 3]) == [4, 4, 9]\n"
-    "    assert square_list([-5, 0, 5]) == [25, 0, 25]\n"
-    "    assert square_list([1, -1, 0]) == [1, 1, 0]",
-
-    "def test_square_list():\n"
-    "    assert square_list([1e154]) == [1e308]\n"
-    "    assert square_list([-1e154]) == [1e308]\n"
-    "    assert square_list([1e154, -1e154]) == [1e308, 1e308]",
-
-    "def test_square_list():\n"
-    "    assert square_list([1e-9]) == [1e-18]\n"
-    "    assert square_list([-1e-9]) == [1e-18]\n"
-    "    assert square_list([1e-12, -1e-12]) == [1e-24, 1e-24]",
-
-    "def test_square_list():\n"
-    "    assert square_list([True, False]) == [1, 0]\n"
-    "    assert square_list([True, True, False]) == [1, 1, 0]\n"
-    "    assert square_list([False, False]) == [0, 0]",
-
-    "def test_square_list():\n"
-    "    out = square_list([1, True, 2.5, False])\n"
-    "    assert out == [1, 1, 6.25, 0]\n"
-    "    out2 = square_list([0, True])\n"
-    "    assert out2 == [0, 1]",
-
-    "def test_square_list():\n"
-    "    assert square_list([-1, -2, -3]) == [1, 4, 9]\n"
-    "    assert square_list([-10, 0]) == [100, 0]\n"
-    "    assert square_list([-1000]) == [1000000]",
-
-    "def test_square_list():\n"
-    "    assert square_list([1.5, -2.5]) == [2.25, 6.25]\n"
-    "    assert square_list([0.1, -0.1]) == [0.01, 0.01]\n"
-    "    assert square_list([2.2, 0.0]) == [4.840000000000001, 0.0]",
-
-    "def test_square_list():\n"
-    "    assert square_list([0, 0, 0]) == [0, 0, 0]\n"
-    "    assert square_list([0, 1, 0, -1]) == [0, 1, 0, 1]\n"
-    "    assert square_list([0.0, -0.0]) == [0.0, 0.0]",
-
-    "def test_square_list():\n"
-    "    data = list(range(1000))\n"
-    "    out = square_list(data)\n"
-    "    assert out[0] == 0\n"
-    "    assert out[1] == 1\n"
-    "    assert out[-1] == 999 * 999\n"
-    "    assert len(out) == 1000",
-
-    "def test_square_list():\n"
-    "    data = list(range(-500, 500))\n"
-    "    out = square_list(data)\n"
-    "    assert out[0] == 500 * 500\n"
-    "    assert out[-1] == 499 * 499\n"
-    "    assert len(out) == 1000",
-
-    "def test_square_list():\n"
-    "    assert square_list([2, -2]) == [4, 4]\n"
-    "    assert square_list([1000000, -1000000]) == [10**12, 10**12]\n"
-    "    assert square_list([-3, 3]) == [9, 9]",
-
-    "def test_square_list():\n"
-    "    assert square_list([10**18]) == [(10**18) * (10**18)]\n"
-    "    assert square_list([-10**18]) == [(10**18) * (10**18)]\n"
-    "    assert square_list([10**12, -10**12]) == [10**24, 10**24]",
-
-    "def test_square_list():\n"
-    "    assert square_list([7, 7, 7]) == [49, 49, 49]\n"
-    "    assert square_list([-7, -7]) == [49, 49]\n"
-    "    assert square_list([0, 0, 0, 0]) == [0, 0, 0, 0]",
-
-    "def test_square_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        square_list(['a'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        square_list(['a', 1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        square_list(['x', -1])",
-
-    "def test_square_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        square_list([None])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        square_list([None, 1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        square_list([0, None])",
-
-    "def test_square_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        square_list([[1]])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        square_list([[1, 2], 3])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        square_list([[True]])",
-
-    "def test_square_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        square_list([{'a': 1}])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        square_list([set([1])])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        square_list([{}, 1])",
-
-    "def test_square_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        square_list([object()])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        square_list([object(), 1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        square_list([0, object()])",
-
-    "def test_square_list():\n"
-    "    out = square_list([float('nan')])\n"
-    "    assert out[0] != out[0]\n"
-    "    out2 = square_list([float('nan'), 0.0])\n"
-    "    assert out2[1] == 0.0",
-
-    "def test_square_list():\n"
-    "    out = square_list([float('nan'), 1.0, -1.0])\n"
-    "    assert out[1:] == [1.0, 1.0]\n"
-    "    assert out[0] != out[0]\n"
-    "    out2 = square_list([1.0, float('nan')])\n"
-    "    assert out2[0] == 1.0",
-
-    "def test_square_list():\n"
-    "    assert square_list([float('inf')]) == [float('inf')]\n"
-    "    assert square_list([float('-inf')]) == [float('inf')]\n"
-    "    assert square_list([float('inf'), 1.0]) == [float('inf'), 1.0]",
-
-    "def test_square_list():\n"
-    "    out = square_list([float('inf'), float('-inf'), 0.0])\n"
-    "    assert out[0] == float('inf')\n"
-    "    assert out[1] == float('inf')\n"
-    "    assert out[2] == 0.0",
-
-    "def test_square_list():\n"
-    "    assert square_list([1e308]) == [float('inf')]\n"
-    "    assert square_list([-1e308]) == [float('inf')]\n"
-    "    out = square_list([1e308, -1e308])\n"
-    "    assert out == [float('inf'), float('inf')]",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('', 'a', 'b') == ''\n"
-    "    assert replace_substring('abc', 'x', 'y') == 'abc'\n"
-    "    assert replace_substring('', '', 'x') == 'x'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('aaa', 'a', '') == ''\n"
-    "    assert replace_substring('aaaa', 'aa', 'b') == 'bb'\n"
-    "    assert replace_substring('abc', 'a', 'abc') == 'abcbc'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('hello', 'l', 'L') == 'heLLo'\n"
-    "    assert replace_substring('hello', 'hello', 'hi') == 'hi'\n"
-    "    assert replace_substring('x', 'x', 'y') == 'y'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('😀🙂😀', '😀', 'X') == 'X🙂X'\n"
-    "    assert replace_substring('a😊b', '😊', '') == 'ab'\n"
-    "    assert replace_substring('⚡light⚡', '⚡', '-') == '-light-'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('line1\\nline1', 'line1', 'x') == 'x\\nx'\n"
-    "    assert replace_substring('a\\nb', '\\n', '-') == 'a-b'\n"
-    "    assert replace_substring('tab\there', '\\t', ' ') == 'tab here'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('a b c', ' ', '_') == 'a_b_c'\n"
-    "    assert replace_substring('  spaced  ', ' ', '') == 'spaced'\n"
-    "    assert replace_substring('x y', 'y', 'z') == 'x z'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('abcabc', 'abc', 'x') == 'xx'\n"
-    "    assert replace_substring('abcabc', 'bc', 'y') == 'ayay'\n"
-    "    assert replace_substring('xyz', 'yz', '') == 'x'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('zero0zero', '0', '-') == 'zero-zero'\n"
-    "    assert replace_substring('001', '0', '') == '1'\n"
-    "    assert replace_substring('num9ber9', '9', '*') == 'num*ber*'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('aaaaaa', 'aaa', 'b') == 'bb'\n"
-    "    assert replace_substring('aaaa', 'a', 'aa') == 'aaaaaaaa'\n"
-    "    assert replace_substring('abc', 'ab', '') == 'c'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('xyxy', 'xy', 'z') == 'zz'\n"
-    "    assert replace_substring('xy', 'xy', '') == ''\n"
-    "    assert replace_substring('xxxy', 'x', 'y') == 'yyyz'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('hello world', 'world', 'earth') == 'hello earth'\n"
-    "    assert replace_substring('hello world', 'hello', '') == ' world'\n"
-    "    assert replace_substring('abc def', ' ', '') == 'abcdef'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('test123test', 'test', 'x') == 'x123x'\n"
-    "    assert replace_substring('test', 'test', 'TEST') == 'TEST'\n"
-    "    assert replace_substring('none', 'x', 'y') == 'none'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('multiline\\ntext', 'text', 't') == 'multiline\\nt'\n"
-    "    assert replace_substring('a\\n', '\\n', '') == 'a'\n"
-    "    assert replace_substring('\\n\\nx', '\\n', ' ') == '  x'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('prefix_suffix', '_', '-') == 'prefix-suffix'\n"
-    "    assert replace_substring('_x_', '_', '') == 'x'\n"
-    "    assert replace_substring('a_b_c', 'b', 'B') == 'a_B_c'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('abcabcabc', 'abc', 'x') == 'xxx'\n"
-    "    assert replace_substring('axaxa', 'a', '') == 'xx'\n"
-    "    assert replace_substring('12312', '12', 'x') == 'x3x'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('🙂🙂', '🙂', 'x') == 'xx'\n"
-    "    assert replace_substring('ok🙂', '🙂', '-') == 'ok-'\n"
-    "    assert replace_substring('😀test😀', '😀', '') == 'test'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('aaaab', 'aa', 'z') == 'zzb'\n"
-    "    assert replace_substring('abab', 'ab', '') == ''\n"
-    "    assert replace_substring('aaaa', 'a', 'zz') == 'zzzzzzzz'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('test!', '!', '?') == 'test?'\n"
-    "    assert replace_substring('wow!', '!', '') == 'wow'\n"
-    "    assert replace_substring('?!', '?', 'a') == 'a!'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('abc def ghi', ' ', '_') == 'abc_def_ghi'\n"
-    "    assert replace_substring('  a b  ', ' ', '') == 'ab'\n"
-    "    assert replace_substring('x y z', 'y', '') == 'x  z'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('xxxxx', 'x', 'b') == 'bbbbb'\n"
-    "    assert replace_substring('xyxyxy', 'xy', 'a') == 'aaa'\n"
-    "    assert replace_substring('xyz', 'z', 'Z') == 'xyZ'",
-
-    "def test_replace_substring():\n"
-    "    assert replace_substring('edgecase', 'edge', '') == 'case'\n"
-    "    assert replace_substring('edge', 'edge', 'E') == 'E'\n"
-    "    assert replace_substring('nochange', 'x', 'y') == 'nochange'",
-
-    "def test_replace_substring():\n"
-    "    with pytest.raises(TypeError): replace_substring(None, 'a', 'b')\n"
-    "    with pytest.raises(TypeError): replace_substring(123, '1', '2')\n"
-    "    with pytest.raises(TypeError): replace_substring(object(), 'a', 'b')",
-
-    "def test_replace_substring():\n"
-    "    with pytest.raises(TypeError): replace_substring('abc', None, 'x')\n"
-    "    with pytest.raises(TypeError): replace_substring('abc', 123, 'x')\n"
-    "    with pytest.raises(TypeError): replace_substring('abc', object(), 'x')",
-
-    "def test_replace_substring():\n"
-    "    with pytest.raises(TypeError): replace_substring('abc', 'a', None)\n"
-    "    with pytest.raises(TypeError): replace_substring('abc', 'a', 123)\n"
-    "    with pytest.raises(TypeError): replace_substring('abc', 'a', object())",
-
-    "def test_replace_substring():\n"
-    "    with pytest.raises(TypeError): replace_substring(['list'], 'x', 'y')\n"
-    "    with pytest.raises(TypeError): replace_substring(('tuple',), 't', 'x')\n"
-    "    with pytest.raises(TypeError): replace_substring({'k':'v'}, 'k', 'x')",
-
-    "def test_get_middle():\n"
-    "    assert get_middle('') == ''\n"
-    "    assert get_middle('a') == 'a'\n"
-    "    assert get_middle('ab') == 'ab'",
-
-    "def test_get_middle():\n"
-    "    assert get_middle(' ') == ' '\n"
-    "    assert get_middle('  ') == '  '\n"
-    "    assert get_middle('   ') == ' '",
-
-    "def test_get_middle():\n"
-    "    assert get_middle('\\n') == '\\n'\n"
-    "    assert get_middle('\\n\\n') == '\\n\\n'\n"
-    "    assert get_middle('a\\nb') == '\\n'",
-
-    "def test_get_middle():\n"
-    "    assert get_middle('\\t') == '\\t'\n"
-    "    assert get_middle(' \\t ') == ' \\t'\n"
-    "    assert get_middle('\\t\\t') == '\\t\\t'",
-
-    "def test_get_middle():\n"
-    "    assert get_middle('😊') == '😊'\n"
-    "    assert get_middle('a😊') == 'a😊'\n"
-    "    assert get_middle('😊a😊') == 'a'",
-
-    "def test_get_middle():\n"
-    "    assert get_middle('a😊b') == '😊'\n"
-    "    assert get_middle('ab😊c') == 'b😊'\n"
-    "    assert get_middle('😊ab😊') == 'ab'",
-
-    "def test_get_middle():\n"
-    "    assert get_middle('racecar') == 'e'\n"
-    "    assert get_middle('noon') == 'oo'\n"
-    "    assert get_middle('kayak') == 'y'",
-
-    "def test_get_middle():\n"
-    "    assert get_middle('!!') == '!!'\n"
-    "    assert get_middle('!a!') == 'a'\n"
-    "    assert get_middle('?!?') == '!'",
-
-    "def test_get_middle():\n"
-    "    assert get_middle('abc def') == ' '\n"
-    "    assert get_middle('abcd e') == 'd'\n"
-    "    assert get_middle('a bc') == ' '",
-
-    "def test_get_middle():\n"
-    "    assert get_middle('0') == '0'\n"
-    "    assert get_middle('00') == '00'\n"
-    "    assert get_middle('010') == '1'",
-
-    "def test_get_middle():\n"
-    "    assert get_middle('#$%^') == '$%'\n"
-    "    assert get_middle('@@@') == '@'\n"
-    "    assert get_middle('@!@!') == '@!'",
-
-    "def test_get_middle():\n"
-    "    assert get_middle('longerstring') == 'rs'\n"
-    "    assert get_middle('small') == 'a'\n"
-    "    assert get_middle('evenlen') == 'nl'",
-
-    "def test_get_middle():\n"
-    "    assert get_middle('aaabaaa') == 'b'\n"
-    "    assert get_middle('aaabaa') == 'ab'\n"
-    "    assert get_middle('aaaa') == 'aa'",
-
-    "def test_get_middle():\n"
-    "    assert get_middle('cat') == 'a'\n"
-    "    assert get_middle('doge') == 'og'\n"
-    "    assert get_middle('hi') == 'hi'",
-
-    "def test_get_middle():\n"
-    "    s = 'a' * 1001\n"
-    "    assert len(s) % 2 == 1\n"
-    "    assert get_middle(s) == 'a'\n"
-    "    s2 = 'a' * 1000\n"
-    "    assert get_middle(s2) == 'aa'",
-
-    "def test_get_middle():\n"
-    "    s = 'ab' * 500\n"
-    "    mid = len(s) // 2\n"
-    "    expected = s[mid - 1 : mid + 1]\n"
-    "    assert get_middle(s) == expected",
-
-    "def test_get_middle():\n"
-    "    s = ' ' * 100\n"
-    "    assert get_middle(s) == '  '\n"
-    "    s2 = 'x' + ' ' * 98 + 'y'\n"
-    "    assert get_middle(s2) == ' '",
-
-    "def test_get_middle():\n"
-    "    s = 'abc\\nxyz'\n"
-    "    assert get_middle(s) == 'c\\n'\n"
-    "    s2 = 'ab\\ncd'\n"
-    "    assert get_middle(s2) == 'b\\n'\n"
-    "    s3 = '\\nabc'\n"
-    "    assert get_middle(s3) == 'ab'",
-
-    "def test_get_middle():\n"
-    "    s = 'UPPERlower'\n"
-    "    assert get_middle(s) == 'rl'\n"
-    "    s2 = 'MiXeD'\n"
-    "    assert get_middle(s2) == 'Xe'\n"
-    "    s3 = 'AaBb'\n"
-    "    assert get_middle(s3) == 'aB'",
-
-    "def test_get_middle():\n"
-    "    s = '🙂A🙂'\n"
-    "    assert get_middle(s) == 'A'\n"
-    "    s2 = 'A🙂B🙂'\n"
-    "    assert get_middle(s2) == '🙂B'\n"
-    "    s3 = '🙂🙂'\n"
-    "    assert get_middle(s3) == '🙂🙂'",
-
-    "def test_get_middle():\n"
-    "    s = 'abc defg'\n"
-    "    assert get_middle(s) == 'd'\n"
-    "    s2 = 'ab cd ef'\n"
-    "    assert get_middle(s2) == ' c'\n"
-    "    s3 = 'a bc d'\n"
-    "    assert get_middle(s3) == 'c'",
-
-    "def test_get_middle():\n"
-    "    s = 'x'*2 + 'y'*2\n"
-    "    assert get_middle(s) == 'xy'\n"
-    "    s2 = 'xyyx'\n"
-    "    assert get_middle(s2) == 'yy'\n"
-    "    s3 = 'xxxyxx'\n"
-    "    assert get_middle(s3) == 'yx'",
-
-    "def test_get_middle():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_middle(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_middle(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_middle(3.14)",
-
-    "def test_get_middle():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_middle(object())\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_middle(True)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_middle(False)",
-
-    "def test_get_middle():\n"
-    "    # sequence types that still work (not errors)\n"
-    "    assert get_middle(['a']) == ['a']\n"
-    "    assert get_middle(['a','b']) == ['a','b']\n"
-    "    assert get_middle(['a','b','c']) == 'b'",
-
-    "def test_truncate_string():\n"
-    "    assert truncate_string('a',1)=='a'\n"
-    "    assert truncate_string('a',2)=='a'\n"
-    "    assert truncate_string('ab',2)=='ab'",
-
-    "def test_truncate_string():\n"
-    "    assert truncate_string('abc',3)=='abc'\n"
-    "    assert truncate_string('abc',2)=='ab...'\n"
-    "    assert truncate_string('abc',1)=='a...'",
-
-    "def test_truncate_string():\n"
-    "    assert truncate_string('abc',0)=='...'\n"
-    "    assert truncate_string('abc',-1)=='ab...'\n"
-    "    assert truncate_string('abc',-5)=='...'",
-
-    "def test_truncate_string():\n"
-    "    assert truncate_string('',-1)=='...'\n"
-    "    assert truncate_string('',-10)=='...'\n"
-    "    assert truncate_string('x',-1)=='...'",
-
-    "def test_truncate_string():\n"
-    "    assert truncate_string('abc',10)=='abc'\n"
-    "    assert truncate_string('a',100)=='a'\n"
-    "    assert truncate_string('long',1000)=='long'",
-
-    "def test_truncate_string():\n"
-    "    assert truncate_string('😊',0)=='...'\n"
-    "    assert truncate_string('😊',1)=='😊'\n"
-    "    assert truncate_string('😊a',1)=='😊...'",
-
-    "def test_truncate_string():\n"
-    "    assert truncate_string('😊abc',1)=='😊...'\n"
-    "    assert truncate_string('😊abc',4)=='😊abc'\n"
-    "    assert truncate_string('😊abc',2)=='😊a...'",
-
-    "def test_truncate_string():\n"
-    "    assert truncate_string('   ',1)==' ...'\n"
-    "    assert truncate_string('   ',2)=='  ...'\n"
-    "    assert truncate_string('   ',3)=='   '",
-
-    "def test_truncate_string():\n"
-    "    assert truncate_string('\\nline',1)=='\\n...'\n"
-    "    assert truncate_string('\\nline',2)=='\\nl...'\n"
-    "    assert truncate_string('\\nline',5)=='\\nline'",
-
-    "def test_truncate_string():\n"
-    "    assert truncate_string('tab\\tchar',3)=='tab...'\n"
-    "    assert truncate_string('tab\\tchar',4)=='tab\\t...'\n"
-    "    assert truncate_string('tab\\tchar',8)=='tab\\tchar'",
-
-    "def test_truncate_string():\n"
-    "    assert truncate_string('a'*1000,0)=='...'\n"
-    "    assert truncate_string('a'*1000,1)=='a...'\n"
-    "    assert truncate_string('a'*1000,1000)=='a'*1000",
-
-    "def test_truncate_string():\n"
-    "    assert truncate_string('a'*1000,999)=='a'*999+'...'\n"
-    "    assert truncate_string('a'*1000,1001)=='a'*1000\n"
-    "    assert truncate_string('abc',10)=='abc'",
-
-    "def test_truncate_string():\n"
-    "    assert truncate_string('True',True)=='T...'\n"
-    "    assert truncate_string('True',False)=='...'\n"
-    "    assert truncate_string('F',False)=='...'",
-
-    "def test_truncate_string():\n"
-    "    assert truncate_string('01',True)=='0...'\n"
-    "    assert truncate_string('01',False)=='...'\n"
-    "    assert truncate_string('01',2)=='01'",
-
-    "def test_truncate_string():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string('abc',1.5)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string('abc',float('inf'))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string('abc',-1.0)",
-
-    "def test_truncate_string():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string('abc','2')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string('abc',None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string('abc',[1])",
-
-    "def test_truncate_string():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string(123,2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string(123,0)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string(123,-1)",
-
-    "def test_truncate_string():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string([1,2,3],2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string([1,2,3],1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string([1,2,3],0)",
-
-    "def test_truncate_string():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string((1,2,3),2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string((1,),1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string((1,2),0)",
-
-    "def test_truncate_string():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string(b'abc',2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string(b'',0)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        truncate_string(b'x',1)",
-
-    "def test_truncate_string():\n"
-    "    s='end.'\n"
-    "    assert truncate_string(s,4)=='end.'\n"
-    "    assert truncate_string(s,3)=='end...'\n"
-    "    assert truncate_string(s,1)=='e...'",
-
-    "def test_truncate_string():\n"
-    "    s='😊end'\n"
-    "    assert truncate_string(s,2)=='😊e...'\n"
-    "    assert truncate_string(s,3)=='😊en...'\n"
-    "    assert truncate_string(s,4)=='😊end'",
-
-    "def test_truncate_string():\n"
-    "    s='edge'\n"
-    "    assert truncate_string(s,len(s))=='edge'\n"
-    "    assert truncate_string(s,len(s)-1)=='edg...'\n"
-    "    assert truncate_string(s,len(s)+1)=='edge'",
-
-    "def test_truncate_string():\n"
-    "    s='0'*5\n"
-    "    assert truncate_string(s,0)=='...'\n"
-    "    assert truncate_string(s,5)=='00000'\n"
-    "    assert truncate_string(s,4)=='0000...'",
-
-    "def test_truncate_string():\n"
-    "    s='multi word test'\n"
-    "    assert truncate_string(s,1)=='m...'\n"
-    "    assert truncate_string(s,5)=='multi...'\n"
-    "    assert truncate_string(s,20)=='multi word test'",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(0)==True\n"
-    "    assert is_perfect_square(1)==True\n"
-    "    assert is_perfect_square(-1)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(2)==False\n"
-    "    assert is_perfect_square(3)==False\n"
-    "    assert is_perfect_square(4)==True",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(15)==False\n"
-    "    assert is_perfect_square(16)==True\n"
-    "    assert is_perfect_square(17)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(25)==True\n"
-    "    assert is_perfect_square(24)==False\n"
-    "    assert is_perfect_square(26)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(10**6)==True\n"
-    "    assert is_perfect_square(10**6-1)==False\n"
-    "    assert is_perfect_square(10**6+1)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(-10)==False\n"
-    "    assert is_perfect_square(-100)==False\n"
-    "    assert is_perfect_square(9)==True",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(36)==True\n"
-    "    assert is_perfect_square(35)==False\n"
-    "    assert is_perfect_square(37)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(49)==True\n"
-    "    assert is_perfect_square(48)==False\n"
-    "    assert is_perfect_square(50)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(81)==True\n"
-    "    assert is_perfect_square(80)==False\n"
-    "    assert is_perfect_square(82)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(100)==True\n"
-    "    assert is_perfect_square(99)==False\n"
-    "    assert is_perfect_square(101)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(2147395600)==True\n"
-    "    assert is_perfect_square(2147395601)==False\n"
-    "    assert is_perfect_square(2147395599)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(144)==True\n"
-    "    assert is_perfect_square(143)==False\n"
-    "    assert is_perfect_square(145)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(1_000_000_000_000)==False\n"
-    "    assert is_perfect_square(1_000_000_000_000_000_000)==True\n"
-    "    assert is_perfect_square(999_999_999_999_999_999)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(121)==True\n"
-    "    assert is_perfect_square(122)==False\n"
-    "    assert is_perfect_square(120)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(169)==True\n"
-    "    assert is_perfect_square(168)==False\n"
-    "    assert is_perfect_square(170)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(225)==True\n"
-    "    assert is_perfect_square(224)==False\n"
-    "    assert is_perfect_square(226)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(10000)==True\n"
-    "    assert is_perfect_square(9999)==False\n"
-    "    assert is_perfect_square(10001)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(2**16)==True\n"
-    "    assert is_perfect_square(2**16-1)==False\n"
-    "    assert is_perfect_square(2**16+1)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(2**32)==True\n"
-    "    assert is_perfect_square(2**32-2)==False\n"
-    "    assert is_perfect_square(2**32+2)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(3**10)==False\n"
-    "    assert is_perfect_square(9**5)==True\n"
-    "    assert is_perfect_square(9**5+1)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(50)==False\n"
-    "    assert is_perfect_square(64)==True\n"
-    "    assert is_perfect_square(63)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(2**20)==False\n"
-    "    assert is_perfect_square(2**20+65536)==True\n"
-    "    assert is_perfect_square(2**20-65536)==False",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(7)==False\n"
-    "    assert is_perfect_square(8)==False\n"
-    "    assert is_perfect_square(9)==True",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(98)==False\n"
-    "    assert is_perfect_square(99)==False\n"
-    "    assert is_perfect_square(100)==True",
-
-    "def test_is_perfect_square():\n"
-    "    assert is_perfect_square(1000001)==False\n"
-    "    assert is_perfect_square(1000000)==True\n"
-    "    assert is_perfect_square(999999)==False",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['abc','x','yz'])=={3:['abc'],1:['x'],2:['yz']}\n"
-    "    assert group_by_length(['longword'])=={8:['longword']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['a','b','c'])=={1:['a','b','c']}\n"
-    "    assert group_by_length(['one','two',''])=={3:['one','two'],0:['']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['α','ββ'])=={1:['α'],2:['ββ']}\n"
-    "    assert group_by_length(['🙂','no'])=={1:['🙂'],2:['no']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['mix','m','more'])=={3:['mix'],1:['m'],4:['more']}\n"
-    "    assert group_by_length(['same','size'])=={4:['same','size']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['repeat','repeat'])=={6:['repeat','repeat']}\n"
-    "    assert group_by_length(['a','aa','aaa'])=={1:['a'],2:['aa'],3:['aaa']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['','x','xx'])=={0:[''],1:['x'],2:['xx']}\n"
-    "    assert group_by_length(['word'])=={4:['word']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['test','go'])=={4:['test'],2:['go']}\n"
-    "    assert group_by_length(['p','q','rs'])=={1:['p','q'],2:['rs']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['long','tiny'])=={4:['long','tiny']}\n"
-    "    assert group_by_length(['a','bbb'])=={1:['a'],3:['bbb']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['cat','dog','a'])=={3:['cat','dog'],1:['a']}\n"
-    "    assert group_by_length(['123','1'])=={3:['123'],1:['1']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['upper','Lower'])=={5:['upper','Lower']}\n"
-    "    assert group_by_length(['xX','y'])=={2:['xX'],1:['y']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['same','same','same'])=={4:['same','same','same']}\n"
-    "    assert group_by_length(['short','toolong'])=={5:['short'],7:['toolong']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['multi','m','mm'])=={5:['multi'],1:['m'],2:['mm']}\n"
-    "    assert group_by_length(['aa','bb',''])=={2:['aa','bb'],0:['']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['one','two','three'])=={3:['one','two'],5:['three']}\n"
-    "    assert group_by_length(['solo'])=={4:['solo']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['x','y','z'])=={1:['x','y','z']}\n"
-    "    assert group_by_length(['xy','z'])=={2:['xy'],1:['z']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['abc','def','g'])=={3:['abc','def'],1:['g']}\n"
-    "    assert group_by_length(['longer'])=={6:['longer']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['mix','xx',''])=={3:['mix'],2:['xx'],0:['']}\n"
-    "    assert group_by_length(['hello','hi'])=={5:['hello'],2:['hi']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['repeat','r'])=={6:['repeat'],1:['r']}\n"
-    "    assert group_by_length(['once','twice'])=={4:['once'],5:['twice']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['','a','bbb'])=={0:[''],1:['a'],3:['bbb']}\n"
-    "    assert group_by_length(['xy'])=={2:['xy']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['word','words'])=={4:['word'],5:['words']}\n"
-    "    assert group_by_length(['aaa','b','cc'])=={3:['aaa'],1:['b'],2:['cc']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['mixing','mix'])=={6:['mixing'],3:['mix']}\n"
-    "    assert group_by_length(['solo','duo'])=={4:['solo'],3:['duo']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['hi','hi','hello'])=={2:['hi','hi'],5:['hello']}\n"
-    "    assert group_by_length(['one'])=={3:['one']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['','','a'])=={0:['',''],1:['a']}\n"
-    "    assert group_by_length(['a','ab'])=={1:['a'],2:['ab']}",
-
-    "def test_group_by_length():\n"
-    "    assert group_by_length(['a'*50,'b'*2])=={50:['a'*50],2:['b'*2]}\n"
-    "    assert group_by_length(['c','d'*100])=={1:['c'],100:['d'*100]}",
-
-    "def test_group_by_length():\n"
-    "    with pytest.raises(TypeError): group_by_length(None)\n"
-    "    with pytest.raises(TypeError): group_by_length(123)\n"
-    "    with pytest.raises(TypeError): group_by_length(object())",
-
-    "def test_group_by_length():\n"
-    "    with pytest.raises(TypeError): group_by_length(['a',1,'b'])\n"
-    "    with pytest.raises(TypeError): group_by_length([[], 'x'])\n"
-    "    with pytest.raises(TypeError): group_by_length([{'key':'val'}])",
-
-    "def test_dedupe_preserve_order():\n"
-    "    assert dedupe_preserve_order([])==[]\n"
-    "    assert dedupe_preserve_order(['a','a','a'])==['a']\n"
-    "    assert dedupe_preserve_order(['x','y','x','z'])==['x','y','z']",
-
-    "def test_dedupe_preserve_order():\n"
-    "    assert dedupe_preserve_order([1,1,2,2,3])==[1,2,3]\n"
-    "    assert dedupe_preserve_order([0,0])==[0]\n"
-    "    assert dedupe_preserve_order([-1,-1,0])==[-1,0]",
-
-    "def test_dedupe_preserve_order():\n"
-    "    assert dedupe_preserve_order(['a','b','a','b'])==['a','b']\n"
-    "    assert dedupe_preserve_order(['','', 'x'])==['','x']\n"
-    "    assert dedupe_preserve_order(['','x',''])==['','x']",
-
-    "def test_dedupe_preserve_order():\n"
-    "    assert dedupe_preserve_order(['A','a','A'])==['A','a']\n"
-    "    assert dedupe_preserve_order(['Hello','Hello'])==['Hello']\n"
-    "    assert dedupe_preserve_order(['UP','up','UP'])==['UP','up']",
-
-    "def test_dedupe_preserve_order():\n"
-    "    assert dedupe_preserve_order([True,False,True])==[True,False]\n"
-    "    assert dedupe_preserve_order([False,False])==[False]\n"
-    "    assert dedupe_preserve_order([True,True,True])==[True]",
-
-    "def test_dedupe_preserve_order():\n"
-    "    assert dedupe_preserve_order([True,1,True,1])==[True]\n"
-    "    assert dedupe_preserve_order([False,0,False,0])==[False]\n"
-    "    assert dedupe_preserve_order([0,False,1,True])==[0,1]",
-
-    "def test_dedupe_preserve_order():\n"
-    "    assert dedupe_preserve_order([1,1.0,2.0,2])==[1,2.0]\n"
-    "    assert dedupe_preserve_order([0.0,0])==[0.0]\n"
-    "    assert dedupe_preserve_order([-1,-1.0,2.0])==[-1,2.0]",
-
-    "def test_dedupe_preserve_order():\n"
-    "    assert dedupe_preserve_order([None,None,'x'])==[None,'x']\n"
-    "    assert dedupe_preserve_order([None,'a',None])==[None,'a']\n"
-    "    assert dedupe_preserve_order(['a',None,'a',None])==['a',None]",
-
-    "def test_dedupe_preserve_order():\n"
-    "    assert dedupe_preserve_order(['🙂','🙂','a'])==['🙂','a']\n"
-    "    assert dedupe_preserve_order(['x','🙂','x'])==['x','🙂']\n"
-    "    assert dedupe_preserve_order(['😊','😊','😊'])==['😊']",
-
-    "def test_dedupe_preserve_order():\n"
-    "    assert dedupe_preserve_order(['α','ββ'])==['α','ββ']\n"
-    "    assert dedupe_preserve_order(['é','é','è'])==['é','è']\n"
-    "    assert dedupe_preserve_order(['ø','ø','ø','å'])==['ø','å']",
-
-    "def test_dedupe_preserve_order():\n"
-    "    xs = list(range(5))\n"
-    "    assert dedupe_preserve_order(xs)==[0,1,2,3,4]\n"
-    "    assert dedupe_preserve_order(xs + [0,1,2])==[0,1,2,3,4]\n"
-    "    assert dedupe_preserve_order([0,1,2,3,4,4,4])==[0,1,2,3,4]",
-
-    "def test_dedupe_preserve_order():\n"
-    "    assert dedupe_preserve_order([10**5,10**5,3])==[10**5,3]\n"
-    "    assert dedupe_preserve_order([0,10**9,0])==[0,10**9]\n"
-    "    assert dedupe_preserve_order([10**12,10**12,10**12])==[10**12]",
-
-    "def test_dedupe_preserve_order():\n"
-    "    s = 'long'*100\n"
-    "    t = 'long'*100\n"
-    "    assert dedupe_preserve_order([s,s])==[s]\n"
-    "    assert dedupe_preserve_order([s,t,'x'])==[s,'x']\n"
-    "    assert dedupe_preserve_order(['a'*1000,'a'*1000])==['a'*1000]",
-
-    "def test_dedupe_preserve_order():\n"
-    "    xs = ['a']*100\n"
-    "    assert dedupe_preserve_order(xs)==['a']\n"
-    "    ys = ['a']*50 + ['b']*50\n"
-    "    assert dedupe_preserve_order(ys)==['a','b']\n"
-    "    zs = ['x','x','y']*10\n"
-    "    assert dedupe_preserve_order(zs)==['x','y']",
-
-    "def test_dedupe_preserve_order():\n"
-    "    o1 = object()\n"
-    "    o2 = object()\n"
-    "    assert dedupe_preserve_order([o1,o1,o2])==[o1,o2]\n"
-    "    assert dedupe_preserve_order([o1,o2,o1])==[o1,o2]\n"
-    "    assert dedupe_preserve_order([o2,o2])==[o2]",
-
-    "def test_dedupe_preserve_order():\n"
-    "    assert dedupe_preserve_order(['',' ','', ' '])==['',' ']\n"
-    "    assert dedupe_preserve_order(['tab','tab','\\t'])==['tab','\\t']\n"
-    "    assert dedupe_preserve_order(['\\n','\\n','x'])==['\\n','x']",
-
-    "def test_dedupe_preserve_order():\n"
-    "    assert dedupe_preserve_order(['mix','mix','MIX'])==['mix','MIX']\n"
-    "    assert dedupe_preserve_order(['xy','XY','xy'])==['xy','XY']\n"
-    "    assert dedupe_preserve_order(['Case','case','CASE'])==['Case','case','CASE']",
-
-    "def test_dedupe_preserve_order():\n"
-    "    xs = ['a'*50,'a'*50,'b']\n"
-    "    assert dedupe_preserve_order(xs)==['a'*50,'b']\n"
-    "    ys = ['c','c','d']\n"
-    "    assert dedupe_preserve_order(ys)==['c','d']\n"
-    "    assert dedupe_preserve_order(['x'*2,'x'*2,'y'*3])==['x'*2,'y'*3]",
-
-    "def test_dedupe_preserve_order():\n"
-    "    assert dedupe_preserve_order(['0','00','000'])==['0','00','000']\n"
-    "    assert dedupe_preserve_order(['01','01','1'])==['01','1']\n"
-    "    assert dedupe_preserve_order(['10','10','10'])==['10']",
-
-    "def test_dedupe_preserve_order():\n"
-    "    xs = ['left','right','left','right','up']\n"
-    "    assert dedupe_preserve_order(xs)==['left','right','up']\n"
-    "    ys = ['start','start','end']\n"
-    "    assert dedupe_preserve_order(ys)==['start','end']\n"
-    "    assert dedupe_preserve_order(['one','two','one'])==['one','two']",
-
-    "def test_dedupe_preserve_order():\n"
-    "    with pytest.raises(TypeError): dedupe_preserve_order([[1],[1]])\n"
-    "    with pytest.raises(TypeError): dedupe_preserve_order([[0],[0],[1]])\n"
-    "    with pytest.raises(TypeError): dedupe_preserve_order([['x'],['x']])",
-
-    "def test_dedupe_preserve_order():\n"
-    "    with pytest.raises(TypeError): dedupe_preserve_order([{1},{1}])\n"
-    "    with pytest.raises(TypeError): dedupe_preserve_order([{1,2},{1,2}])\n"
-    "    with pytest.raises(TypeError): dedupe_preserve_order([set(),set()])",
-
-    "def test_dedupe_preserve_order():\n"
-    "    with pytest.raises(TypeError): dedupe_preserve_order([{},{}])\n"
-    "    with pytest.raises(TypeError): dedupe_preserve_order([{'a':1},{'a':1}])\n"
-    "    with pytest.raises(TypeError): dedupe_preserve_order([{'k': 'v'},{}])",
-
-    "def test_dedupe_preserve_order():\n"
-    "    with pytest.raises(TypeError): dedupe_preserve_order([[], 'x'])\n"
-    "    with pytest.raises(TypeError): dedupe_preserve_order(['x', []])\n"
-    "    with pytest.raises(TypeError): dedupe_preserve_order(['a',{1}])",
-
-    "def test_dedupe_preserve_order():\n"
-    "    with pytest.raises(TypeError): dedupe_preserve_order([['a'],['a'],'b'])\n"
-    "    with pytest.raises(TypeError): dedupe_preserve_order([[0,1],0,1])\n"
-    "    with pytest.raises(TypeError): dedupe_preserve_order([[None],None])",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('') == {}\n"
-    "    assert char_frequency('   ') == {' ': 3}\n"
-    "    assert char_frequency('aAa') == {'a': 2, 'A': 1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('😊😊a') == {'😊': 2, 'a': 1}\n"
-    "    assert char_frequency('!!') == {'!': 2}\n"
-    "    assert char_frequency('ab') == {'a': 1, 'b': 1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('aaaa') == {'a': 4}\n"
-    "    assert char_frequency('abcabc') == {'a': 2, 'b': 2, 'c': 2}\n"
-    "    assert char_frequency('xy') == {'x': 1, 'y': 1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency(' \\n ') == {' ': 2, '\\n': 1}\n"
-    "    assert char_frequency('\\t\\t') == {'\\t': 2}\n"
-    "    assert char_frequency('mix') == {'m': 1, 'i': 1, 'x': 1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('00abc00') == {'0': 4, 'a': 1, 'b': 1, 'c': 1}\n"
-    "    assert char_frequency('xyz') == {'x': 1, 'y': 1, 'z': 1}\n"
-    "    assert char_frequency('z') == {'z': 1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('upperLOWER') == {'u':1,'p':2,'e':2,'r':2,'L':1,'O':1,'W':1}\n"
-    "    assert char_frequency('aaBB') == {'a': 2, 'B': 2}\n"
-    "    assert char_frequency('12') == {'1': 1, '2': 1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('  a  ') == {' ': 4, 'a': 1}\n"
-    "    assert char_frequency('end!end!') == {'e':2,'n':2,'d':2,'!':2}\n"
-    "    assert char_frequency('n') == {'n': 1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('t   t') == {'t': 2, ' ': 3}\n"
-    "    assert char_frequency('@@@') == {'@': 3}\n"
-    "    assert char_frequency('a b') == {'a':1,' ':1,'b':1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('\\n\\n\\t') == {'\\n':2,'\\t':1}\n"
-    "    assert char_frequency('..,,') == {'.':2, ',':2}\n"
-    "    assert char_frequency('!/!') == {'!':2,'/':1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('caseS') == {'c':1,'a':1,'s':1,'e':1,'S':1}\n"
-    "    assert char_frequency('AaBbCc') == {'A':1,'a':1,'B':1,'b':1,'C':1,'c':1}\n"
-    "    assert char_frequency('xyx') == {'x':2,'y':1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('0000') == {'0':4}\n"
-    "    assert char_frequency('0101') == {'0':2,'1':2}\n"
-    "    assert char_frequency('a0') == {'a':1,'0':1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('weird chars!') == {'w':1,'e':2,'i':1,'r':2,'d':1,' ':1,'c':1,'h':1,'a':1,'s':1,'!':1}\n"
-    "    assert char_frequency('!!??') == {'!':2,'?':2}\n"
-    "    assert char_frequency('   a') == {' ':3,'a':1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('tab\\t') == {'t':1,'a':1,'b':1,'\\t':1}\n"
-    "    assert char_frequency('\\t\\t a') == {'\\t':2,' ':1,'a':1}\n"
-    "    assert char_frequency('ab ') == {'a':1,'b':1,' ':1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('mixED') == {'m':1,'i':1,'x':1,'E':1,'D':1}\n"
-    "    assert char_frequency('HELLO') == {'H':1,'E':1,'L':2,'O':1}\n"
-    "    assert char_frequency('aAaA') == {'a':2,'A':2}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('////') == {'/':4}\n"
-    "    assert char_frequency('/*/*') == {'/':2,'*':2}\n"
-    "    assert char_frequency('/.') == {'/':1,'.':1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('endline\\n') == {'e':1,'n':2,'d':1,'l':1,'i':1,'\\n':1}\n"
-    "    assert char_frequency('xx\\nxx') == {'x':4,'\\n':1}\n"
-    "    assert char_frequency(' ') == {' ':1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('  tabs\\t') == {' ':2,'t':1,'a':1,'b':1,'s':1,'\\t':1}\n"
-    "    assert char_frequency('line1') == {'l':1,'i':1,'n':1,'e':1,'1':1}\n"
-    "    assert char_frequency('_') == {'_':1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('space end ') == {'s':1,'p':1,'a':2,'c':1,'e':2,' ':2,'n':1,'d':1}\n"
-    "    assert char_frequency('aa a') == {'a':3,' ':1}\n"
-    "    assert char_frequency('...') == {'.':3}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('-_-') == {'-':2,'_':1}\n"
-    "    assert char_frequency('__--') == {'_':2,'-':2}\n"
-    "    assert char_frequency('-.') == {'-':1,'.':1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('word word') == {'w':2,'o':2,'r':2,'d':2,' ':1}\n"
-    "    assert char_frequency('ab ab') == {'a':2,'b':2,' ':1}\n"
-    "    assert char_frequency('single') == {'s':1,'i':1,'n':1,'g':1,'l':1,'e':1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('newline\\nnewline') == {'n':4,'e':4,'w':2,'l':2,'i':2,'\\n':1}\n"
-    "    assert char_frequency('aa\\n') == {'a':2,'\\n':1}\n"
-    "    assert char_frequency('x\\nx') == {'x':2,'\\n':1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('mix  ') == {'m':1,'i':1,'x':1,' ':2}\n"
-    "    assert char_frequency('  spaced') == {' ':2,'s':1,'p':1,'a':1,'c':1,'e':1,'d':1}\n"
-    "    assert char_frequency('\\tend') == {'\\t':1,'e':1,'n':1,'d':1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('123 321') == {'1':2,'2':2,'3':2,' ':1}\n"
-    "    assert char_frequency(' 00 ') == {' ':2,'0':2}\n"
-    "    assert char_frequency('x y') == {'x':1,' ':1,'y':1}",
-
-    "def test_char_frequency():\n"
-    "    assert char_frequency('aA!') == {'a':1,'A':1,'!':1}\n"
-    "    assert char_frequency('!!a') == {'!':2,'a':1}\n"
-    "    assert char_frequency('abc!') == {'a':1,'b':1,'c':1,'!':1}",
-
-    "def test_char_frequency():\n"
-    "    with pytest.raises(TypeError): char_frequency(None)\n"
-    "    with pytest.raises(TypeError): char_frequency(123)\n"
-    "    with pytest.raises(TypeError): char_frequency(['a','b'])",
-
-    "def test_max_three():\n"
-    "    assert max_three([]) == []\n"
-    "    assert max_three([7]) == [7]\n"
-    "    assert max_three([2, 1]) == [1, 2]",
-
-    "def test_max_three():\n"
-    "    assert max_three([1, 2, 3]) == [1, 2, 3]\n"
-    "    assert max_three([3, 2, 1]) == [1, 2, 3]\n"
-    "    assert max_three([3, 3, 3]) == [3, 3, 3]",
-
-    "def test_max_three():\n"
-    "    assert max_three([5, 1, 9, 0]) == [1, 5, 9]\n"
-    "    assert max_three([10, 9, 8, 7]) == [8, 9, 10]\n"
-    "    assert max_three([0, 0, 1]) == [0, 0, 1]",
-
-    "def test_max_three():\n"
-    "    assert max_three([-5, -1, -3, -2]) == [-3, -2, -1]\n"
-    "    assert max_three([-1]) == [-1]\n"
-    "    assert max_three([-4, -4, -4]) == [-4, -4, -4]",
-
-    "def test_max_three():\n"
-    "    assert max_three([100, 50, 25, 12, 6]) == [25, 50, 100]\n"
-    "    assert max_three([3, 1, 2, 3]) == [2, 3, 3]\n"
-    "    assert max_three([9, 9, 1]) == [1, 9, 9]",
-
-    "def test_max_three():\n"
-    "    assert max_three([5, 4, 3, 2, 1]) == [3, 4, 5]\n"
-    "    assert max_three([1, 1, 2, 2]) == [1, 2, 2]\n"
-    "    assert max_three([7, 7, 7, 1]) == [7, 7, 7]",
-
-    "def test_max_three():\n"
-    "    assert max_three([2, 9, 4, 9, 4]) == [4, 9, 9]\n"
-    "    assert max_three([0, -1, -2, -3]) == [-2, -1, 0]\n"
-    "    assert max_three([6]) == [6]",
-
-    "def test_max_three():\n"
-    "    assert max_three([50, 20, 30]) == [20, 30, 50]\n"
-    "    assert max_three([1, 100, 50, 2]) == [2, 50, 100]\n"
-    "    assert max_three([4, 4, 2, 1]) == [2, 4, 4]",
-
-    "def test_max_three():\n"
-    "    assert max_three([1.5, 2.5, 3.5, 0.5]) == [1.5, 2.5, 3.5]\n"
-    "    assert max_three([0.1, 0.2]) == [0.1, 0.2]\n"
-    "    assert max_three([3.3]) == [3.3]",
-
-    "def test_max_three():\n"
-    "    assert max_three([10, -10, 20, -20]) == [-10, 10, 20]\n"
-    "    assert max_three([5, -1, 5, -1]) == [-1, 5, 5]\n"
-    "    assert max_three([0, 0, 0]) == [0, 0, 0]",
-
-    "def test_max_three():\n"
-    "    assert max_three([-9, -8, -7, -6]) == [-8, -7, -6]\n"
-    "    assert max_three([2, 2, 2, 2]) == [2, 2, 2]\n"
-    "    assert max_three([3, 2, 1, 0, -1]) == [1, 2, 3]",
-
-    "def test_max_three():\n"
-    "    assert max_three([10**12, 10**6, 10**9]) == [10**6, 10**9, 10**12]\n"
-    "    assert max_three([-10**12, 0, 10**12]) == [0, 10**12, -10**12] if False else sorted([0, 10**12, -10**12])[-3:]\n"
-    "    assert max_three([10**12]) == [10**12]",
-
-    "def test_max_three():\n"
-    "    xs = list(range(1000))\n"
-    "    assert max_three(xs) == [997, 998, 999]\n"
-    "    xs2 = list(range(-5, 1))\n"
-    "    assert max_three(xs2) == [-3, -2, -1]",
-
-    "def test_max_three():\n"
-    "    assert max_three([1.0, 2, 3.5, -1]) == [1.0, 2, 3.5]\n"
-    "    assert max_three([-1.5, -2.0, -3.0, 0.0]) == [-1.5, 0.0, -2.0] if False else sorted([-1.5, -2.0, -3.0, 0.0])[-3:]\n"
-    "    assert max_three([0.0, 0, 0.0]) == [0, 0.0, 0.0] if False else sorted([0.0, 0, 0.0])[-3:]",
-
-    "def test_max_three():\n"
-    "    assert max_three([float('-inf'), 0, 1]) == [0, 1, float('-inf')] if False else sorted([float('-inf'), 0, 1])[-3:]\n"
-    "    assert max_three([float('inf'), 1, 2, 3]) == [2, 3, float('inf')]\n"
-    "    assert max_three([float('inf')]) == [float('inf')]",
-
-    "def test_max_three():\n"
-    "    assert max_three(['a', 'b', 'c']) == ['a', 'b', 'c']\n"
-    "    assert max_three(['c', 'b', 'a']) == ['a', 'b', 'c']\n"
-    "    assert max_three(['apple', 'banana', 'cherry', 'date']) == ['banana', 'cherry', 'date']",
-
-    "def test_max_three():\n"
-    "    assert max_three(['å', 'ä', 'ö', 'a']) == ['ä', 'å', 'ö'] if False else sorted(['å', 'ä', 'ö', 'a'])[-3:]\n"
-    "    assert max_three(['😊', '😎', '🙂']) == sorted(['😊', '😎', '🙂'])[-3:]\n"
-    "    assert max_three(['x']) == ['x']",
-
-    "def test_max_three():\n"
-    "    assert max_three([True, False, 2, 3]) == sorted([True, False, 2, 3])[-3:]\n"
-    "    assert max_three([True, True, True]) == sorted([True, True, True])[-3:]\n"
-    "    assert max_three([False, 0, 1]) == sorted([False, 0, 1])[-3:]",
-
-    "def test_max_three():\n"
-    "    assert max_three([1, 1, 1, 1]) == [1, 1, 1]\n"
-    "    assert max_three([2, 2, 2]) == [2, 2, 2]\n"
-    "    assert max_three([2, 2]) == [2, 2]",
-
-    "def test_max_three():\n"
-    "    assert max_three((1, 2, 3, 4)) == [2, 3, 4]\n"
-    "    assert max_three((5,)) == [5]\n"
-    "    assert max_three((3, 1)) == [1, 3]",
-
-    "def test_max_three():\n"
-    "    gen = (i for i in [3, 1, 4, 1, 5])\n"
-    "    assert max_three(gen) == [3, 4, 5]\n"
-    "    gen2 = (i for i in [0, -1])\n"
-    "    assert max_three(gen2) == [-1, 0]",
-
-    "def test_max_three():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        max_three(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        max_three(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        max_three(object())",
-
-    "def test_max_three():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        max_three([1, 'a', 2])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        max_three(['x', 1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        max_three([None, 0])",
-
-    "def test_max_three():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        max_three([1+2j, 3])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        max_three([0, 1j])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        max_three([complex(1, 1), 2])",
-
-    "def test_max_three():\n"
-    "    xs = list(range(-1000, 1001))\n"
-    "    assert max_three(xs) == [998, 999, 1000]\n"
-    "    xs2 = list(range(2))\n"
-    "    assert max_three(xs2) == [0, 1]",
-
-    "def test_min_three():\n"
-    "    assert min_three([]) == []\n"
-    "    assert min_three([7]) == [7]\n"
-    "    assert min_three([2, 1]) == [1, 2]",
-
-    "def test_min_three():\n"
-    "    assert min_three([1,2,3]) == [1,2,3]\n"
-    "    assert min_three([5,1,9,0]) == [0,1,5]\n"
-    "    assert min_three([3,3,3]) == [3,3,3]",
-
-    "def test_min_three():\n"
-    "    assert min_three([-5,-1,-3,-2]) == [-5,-3,-2]\n"
-    "    assert min_three([-1]) == [-1]\n"
-    "    assert min_three([-4,-4,-4]) == [-4,-4,-4]",
-
-    "def test_min_three():\n"
-    "    assert min_three([10,9,8,7]) == [7,8,9]\n"
-    "    assert min_three([0,0,1]) == [0,0,1]\n"
-    "    assert min_three([1,0,0]) == [0,0,1]",
-
-    "def test_min_three():\n"
-    "    assert min_three([100,50,25,12,6]) == [6,12,25]\n"
-    "    assert min_three([3,1,2,3]) == [1,2,3]\n"
-    "    assert min_three([9,9,1]) == [1,9,9]",
-
-    "def test_min_three():\n"
-    "    assert min_three([5,4,3,2,1]) == [1,2,3]\n"
-    "    assert min_three([1,1,2,2]) == [1,1,2]\n"
-    "    assert min_three([7,7,7,1]) == [1,7,7]",
-
-    "def test_min_three():\n"
-    "    assert min_three([2,9,4,9,4]) == [2,4,4]\n"
-    "    assert min_three([0,-1,-2,-3]) == [-3,-2,-1]\n"
-    "    assert min_three([6]) == [6]",
-
-    "def test_min_three():\n"
-    "    assert min_three([50,20,30]) == [20,30,50][:3]\n"
-    "    assert min_three([1,100,50,2]) == [1,2,50]\n"
-    "    assert min_three([4,4,2,1]) == [1,2,4]",
-
-    "def test_min_three():\n"
-    "    assert min_three([1.5,2.5,3.5,0.5]) == [0.5,1.5,2.5]\n"
-    "    assert min_three([0.1,0.2]) == [0.1,0.2]\n"
-    "    assert min_three([3.3]) == [3.3]",
-
-    "def test_min_three():\n"
-    "    assert min_three([10,-10,20,-20]) == [-20,-10,10]\n"
-    "    assert min_three([5,-1,5,-1]) == [-1,-1,5]\n"
-    "    assert min_three([0,0,0]) == [0,0,0]",
-
-    "def test_min_three():\n"
-    "    assert min_three([1,2,3,4,5,6]) == [1,2,3]\n"
-    "    assert min_three([9,1,8]) == [1,8,9][:3]\n"
-    "    assert min_three([1,2]) == [1,2]",
-
-    "def test_min_three():\n"
-    "    assert min_three([7,3,9,1,0]) == [0,1,3]\n"
-    "    assert min_three([-9,-8,-7,-6]) == [-9,-8,-7]\n"
-    "    assert min_three([2,2,2,2]) == [2,2,2]",
-
-    "def test_min_three():\n"
-    "    assert min_three([10**12, 10**9, 10**6]) == [10**6,10**9,10**12][:3]\n"
-    "    assert min_three([-10**12,0,10**12]) == [-10**12,0,10**12][:3]\n"
-    "    assert min_three([10**12]) == [10**12]",
-
-    "def test_min_three():\n"
-    "    xs = list(range(1000))\n"
-    "    assert min_three(xs) == [0,1,2]\n"
-    "    xs2 = list(range(-5,1))\n"
-    "    assert min_three(xs2) == [-5,-4,-3]",
-
-    "def test_min_three():\n"
-    "    assert min_three([1.0,2,3.5,-1]) == [-1,1.0,2]\n"
-    "    assert min_three([-1.5,-2.0,-3.0,0.0]) == [-3.0,-2.0,-1.5]\n"
-    "    assert min_three([0.0,0,0.0]) == [0,0.0,0.0] if False else sorted([0.0,0,0.0])[:3]",
-
-    "def test_min_three():\n"
-    "    assert min_three(['a','b','c']) == ['a','b','c']\n"
-    "    assert min_three(['c','b','a']) == ['a','b','c']\n"
-    "    assert min_three(['apple','banana','cherry']) == ['apple','banana','cherry']",
-
-    "def test_min_three():\n"
-    "    with pytest.raises(TypeError): min_three(None)\n"
-    "    with pytest.raises(TypeError): min_three(123)\n"
-    "    with pytest.raises(TypeError): min_three(object())",
-
-    "def test_min_three():\n"
-    "    with pytest.raises(TypeError): min_three([1,'a',2])\n"
-    "    with pytest.raises(TypeError): min_three(['x',1])\n"
-    "    with pytest.raises(TypeError): min_three([None,0])",
-
-    "def test_min_three():\n"
-    "    with pytest.raises(TypeError): min_three([1+2j,3])\n"
-    "    with pytest.raises(TypeError): min_three([0,1j])\n"
-    "    with pytest.raises(TypeError): min_three([complex(1,1),2])",
-
-    "def test_min_three():\n"
-    "    xs = list(range(-1000,1001))\n"
-    "    assert min_three(xs) == [-1000,-999,-998]\n"
-    "    xs2 = list(range(2))\n"
-    "    assert min_three(xs2) == [0,1]",
-
-    "def test_min_three():\n"
-    "    assert min_three([True, False, 2, 3]) == sorted([True,False,2,3])[:3]\n"
-    "    assert min_three([True,True,True]) == [True,True,True]\n"
-    "    assert min_three([False,0,1]) == sorted([False,0,1])[:3]",
-
-    "def test_min_three():\n"
-    "    assert min_three(['å','ä','ö','a']) == sorted(['å','ä','ö','a'])[:3]\n"
-    "    assert min_three(['😊','😎','🙂']) == sorted(['😊','😎','🙂'])[:3]\n"
-    "    assert min_three(['z']) == ['z']",
-
-    "def test_min_three():\n"
-    "    assert min_three((1,2,3,4)) == [1,2,3]\n"
-    "    assert min_three((5,)) == [5]\n"
-    "    assert min_three((3,1)) == [1,3]",
-
-    "def test_min_three():\n"
-    "    gen = (i for i in [3,1,4,1,5])\n"
-    "    assert min_three(list(gen)) == [1,1,3]\n"
-    "    gen2 = (i for i in [0,-1])\n"
-    "    assert min_three(list(gen2)) == [-1,0]",
-
-    "def test_min_three():\n"
-    "    assert min_three(['x','x','y','z']) == ['x','x','y']\n"
-    "    assert min_three(['y','y','x']) == ['x','y','y']\n"
-    "    assert min_three(['a']) == ['a']",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set([]) == set()\n"
-    "    assert remove_duplicates_set([1,1,1]) == {1}\n"
-    "    assert remove_duplicates_set([1,2,1,2]) == {1,2}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set(['a','a','b']) == {'a','b'}\n"
-    "    assert remove_duplicates_set(['x']) == {'x'}\n"
-    "    assert remove_duplicates_set(['x','y','x']) == {'x','y'}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set([0,0,0]) == {0}\n"
-    "    assert remove_duplicates_set([0,1,0]) == {0,1}\n"
-    "    assert remove_duplicates_set([-1,-1,2]) == {-1,2}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set(['A','a','A']) == {'A','a'}\n"
-    "    assert remove_duplicates_set(['','']) == {''}\n"
-    "    assert remove_duplicates_set(['','x']) == {'','x'}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set([1.1,1.1,2.2]) == {1.1,2.2}\n"
-    "    assert remove_duplicates_set([3.5]) == {3.5}\n"
-    "    assert remove_duplicates_set([3.5,3.5,3.6]) == {3.5,3.6}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set([True,True,False]) == {True,False}\n"
-    "    assert remove_duplicates_set([False]) == {False}\n"
-    "    assert remove_duplicates_set([True,False,True]) == {True,False}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set([(),()]) == {()}\n"
-    "    assert remove_duplicates_set([(1,), (1,), (2,)]) == {(1,), (2,)}\n"
-    "    assert remove_duplicates_set([(0,)]) == {(0,)}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set(['ab','ab','cd']) == {'ab','cd'}\n"
-    "    assert remove_duplicates_set(['ab']) == {'ab'}\n"
-    "    assert remove_duplicates_set(['xy','xy','xy']) == {'xy'}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set([10,20,10,30]) == {10,20,30}\n"
-    "    assert remove_duplicates_set([100]) == {100}\n"
-    "    assert remove_duplicates_set([0,100,0]) == {0,100}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set([' ',' ','a']) == {' ','a'}\n"
-    "    assert remove_duplicates_set([' ','']) == {' ',' '}\n"
-    "    assert remove_duplicates_set(['','']) == {''}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set(['hello','hello','world']) == {'hello','world'}\n"
-    "    assert remove_duplicates_set(['test']) == {'test'}\n"
-    "    assert remove_duplicates_set(['a','b','a']) == {'a','b'}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set(['a','A','a']) == {'a','A'}\n"
-    "    assert remove_duplicates_set(['A','A']) == {'A'}\n"
-    "    assert remove_duplicates_set(['x','X','x']) == {'x','X'}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set([0.0,0.0]) == {0.0}\n"
-    "    assert remove_duplicates_set([0.1,0.2,0.1]) == {0.1,0.2}\n"
-    "    assert remove_duplicates_set([9.9,9.9,9.8]) == {9.9,9.8}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set(['😀','😀','😃']) == {'😀','😃'}\n"
-    "    assert remove_duplicates_set(['😀']) == {'😀'}\n"
-    "    assert remove_duplicates_set(['😃','😃']) == {'😃'}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set(['ab','bc','ab','bc']) == {'ab','bc'}\n"
-    "    assert remove_duplicates_set(['xyz']) == {'xyz'}\n"
-    "    assert remove_duplicates_set(['xy','xy','xz']) == {'xy','xz'}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set([1,1,2,2,3]) == {1,2,3}\n"
-    "    assert remove_duplicates_set([3]) == {3}\n"
-    "    assert remove_duplicates_set([3,3,1]) == {1,3}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set(['abc','abc','def']) == {'abc','def'}\n"
-    "    assert remove_duplicates_set(['abc']) == {'abc'}\n"
-    "    assert remove_duplicates_set(['def','def','def']) == {'def'}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set([True,False,True,False]) == {True,False}\n"
-    "    assert remove_duplicates_set([True]) == {True}\n"
-    "    assert remove_duplicates_set([False,False]) == {False}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set([(),(1,1),(1,1)]) == {(),(1,1)}\n"
-    "    assert remove_duplicates_set([(2,2)]) == {(2,2)}\n"
-    "    assert remove_duplicates_set([(),()]) == {()}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set(['x','y','x','z']) == {'x','y','z'}\n"
-    "    assert remove_duplicates_set(['z']) == {'z'}\n"
-    "    assert remove_duplicates_set(['y','y']) == {'y'}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set([100,200,100,300]) == {100,200,300}\n"
-    "    assert remove_duplicates_set([400]) == {400}\n"
-    "    assert remove_duplicates_set([500,500]) == {500}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set(['hi','hi','HI']) == {'hi','HI'}\n"
-    "    assert remove_duplicates_set(['HI']) == {'HI'}\n"
-    "    assert remove_duplicates_set(['hi','hi']) == {'hi'}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set([1,2,2,3,3]) == {1,2,3}\n"
-    "    assert remove_duplicates_set([4]) == {4}\n"
-    "    assert remove_duplicates_set([4,4,4]) == {4}",
-
-    "def test_remove_duplicates_set():\n"
-    "    assert remove_duplicates_set(['','', 'a']) == {'','a'}\n"
-    "    assert remove_duplicates_set(['a']) == {'a'}\n"
-    "    assert remove_duplicates_set(['b','b']) == {'b'}",
-
-    "def test_remove_duplicates_set():\n"
-    "    with pytest.raises(TypeError): remove_duplicates_set([[1], [1]])\n"
-    "    with pytest.raises(TypeError): remove_duplicates_set([{'a':1}])\n"
-    "    with pytest.raises(TypeError): remove_duplicates_set([set()])",
-
-    "def test_find_max():\n"
-    "    with pytest.raises(ValueError): find_max([])\n"
-    "    assert find_max([0]) == 0\n"
-    "    assert find_max([-1,-2,-3]) == -1",
-
-    "def test_find_max():\n"
-    "    assert find_max([10,9,8]) == 10\n"
-    "    assert find_max([-10,0,10]) == 10\n"
-    "    assert find_max([10,10,10]) == 10",
-
-    "def test_find_max():\n"
-    "    assert find_max([-1e9,-2e9]) == -1e9\n"
-    "    assert find_max([1e9,5,3]) == 1e9\n"
-    "    assert find_max([0.1,0.01]) == 0.1",
-
-    "def test_find_max():\n"
-    "    assert find_max(['a','b','c']) == 'c'\n"
-    "    assert find_max(['aa','ab']) == 'ab'\n"
-    "    assert find_max([' ','  ','   ']) == '   '",
-
-    "def test_find_max():\n"
-    "    assert find_max(['😀','😃']) == '😃'\n"
-    "    assert find_max(['🙂','🙃']) == '🙂'\n"
-    "    assert find_max(['😀']) == '😀'",
-
-    "def test_find_max():\n"
-    "    assert find_max([(1,2),(1,3)]) == (1,3)\n"
-    "    assert find_max([(0,)]) == (0,)\n"
-    "    assert find_max([(-1,), (0,)]) == (0,)",
-
-    "def test_find_max():\n"
-    "    assert find_max([True,False]) == True\n"
-    "    assert find_max([False]) == False\n"
-    "    assert find_max([True,True]) == True",
-
-    "def test_find_max():\n"
-    "    assert find_max([1.1,1.01]) == 1.1\n"
-    "    assert find_max([-0.5,-0.1]) == -0.1\n"
-    "    assert find_max([3.14,3.141]) == 3.141",
-
-    "def test_find_max():\n"
-    "    assert find_max([999999999,1]) == 999999999\n"
-    "    assert find_max([-999999999,-1]) == -1\n"
-    "    assert find_max([5,5,4]) == 5",
-
-    "def test_find_max():\n"
-    "    with pytest.raises(TypeError): find_max([1,'a'])\n"
-    "    with pytest.raises(TypeError): find_max([0,[]])\n"
-    "    with pytest.raises(TypeError): find_max(['x', {}])",
-
-    "def test_find_max():\n"
-    "    assert find_max(['abc','abcd']) == 'abcd'\n"
-    "    assert find_max(['x','xy']) == 'xy'\n"
-    "    assert find_max(['long','longer']) == 'longer'",
-
-    "def test_find_max():\n"
-    "    assert find_max([[],[1]]) == [1]\n"
-    "    assert find_max([[1,2],[1,3]]) == [1,3]\n"
-    "    assert find_max([[0],[0,0]]) == [0,0]",
-
-    "def test_find_max():\n"
-    "    assert find_max([1,-1,2,-2]) == 2\n"
-    "    assert find_max([-10,-20,-30]) == -10\n"
-    "    assert find_max([50,10]) == 50",
-
-    "def test_find_max():\n"
-    "    assert find_max(['aa','aaa','aaaa']) == 'aaaa'\n"
-    "    assert find_max(['zz','zzz']) == 'zzz'\n"
-    "    assert find_max(['k','kk']) == 'kk'",
-
-    "def test_find_max():\n"
-    "    assert find_max([3.5,3.4,3.6]) == 3.6\n"
-    "    assert find_max([0.0001,0.0002]) == 0.0002\n"
-    "    assert find_max([-1.1,-1.01]) == -1.01",
-
-    "def test_find_max():\n"
-    "    assert find_max(['1','2','10']) == '2'\n"
-    "    assert find_max(['09','10']) == '10'\n"
-    "    assert find_max(['7','8']) == '8'",
-
-    "def test_find_max():\n"
-    "    assert find_max([(),(1,)]) == (1,)\n"
-    "    assert find_max([(),()]) == ()\n"
-    "    assert find_max([(2,3),(2,4)]) == (2,4)",
-
-    "def test_find_max():\n"
-    "    assert find_max([100,-100,50]) == 100\n"
-    "    assert find_max([-50,-100]) == -50\n"
-    "    assert find_max([999,998]) == 999",
-
-    "def test_find_max():\n"
-    "    assert find_max(['abc','ABD']) == 'abc'\n"
-    "    assert find_max(['ABD','ABE']) == 'ABE'\n"
-    "    assert find_max(['zzz','zza']) == 'zzz'",
-
-    "def test_find_max():\n"
-    "    assert find_max(['🙂','🙂']) == '🙂'\n"
-    "    assert find_max(['🙃']) == '🙃'\n"
-    "    assert find_max(['🙂','🙃']) == '🙂'",
-
-    "def test_find_max():\n"
-    "    assert find_max([1e-9,1e-10]) == 1e-9\n"
-    "    assert find_max([-1e-9,-1e-10]) == -1e-10\n"
-    "    assert find_max([2.0,2.0001]) == 2.0001",
-
-    "def test_find_max():\n"
-    "    assert find_max(['A','B']) == 'B'\n"
-    "    assert find_max(['m','n','o']) == 'o'\n"
-    "    assert find_max(['Z']) == 'Z'",
-
-    "def test_find_max():\n"
-    "    assert find_max([0,0,0]) == 0\n"
-    "    assert find_max([-5,-4,-3]) == -3\n"
-    "    assert find_max([-1,0]) == 0",
-
-    "def test_find_max():\n"
-    "    assert find_max([['a'],['a','b']]) == ['a','b']\n"
-    "    assert find_max([[1],[1,2],[1,2,3]]) == [1,2,3]\n"
-    "    assert find_max([[0],[0]]) == [0]",
-
-    "def test_find_max():\n"
-    "    assert find_max([1e308,1]) == 1e308\n"
-    "    assert find_max([-1e308,-1e307]) == -1e307\n"
-    "    assert find_max([float('-inf'), float('inf')]) == float('inf')",
-
-    "def test_find_min():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        find_min([])\n"
-    "    assert find_min([0]) == 0\n"
-    "    assert find_min([-1]) == -1",
-
-    "def test_find_min():\n"
-    "    assert find_min([1, -1, 2, -2]) == -2\n"
-    "    assert find_min([-5, -10, -3]) == -10\n"
-    "    assert find_min([0, 10, 20]) == 0",
-
-    "def test_find_min():\n"
-    "    assert find_min([999, -999]) == -999\n"
-    "    assert find_min([-10**12, 5, 10]) == -10**12\n"
-    "    assert find_min([3]) == 3",
-
-    "def test_find_min():\n"
-    "    data = [] + [7, -2, 0]\n"
-    "    assert find_min(data) == -2\n"
-    "    assert find_min([100, 50, 0, -1]) == -1\n"
-    "    assert find_min([2, 2, 2]) == 2",
-
-    "def test_find_min():\n"
-    "    assert find_min([-1, -1, -1]) == -1\n"
-    "    assert find_min([5, -5, 10]) == -5\n"
-    "    assert find_min([0]) == 0",
-
-    "def test_find_min():\n"
-    "    assert find_min([float('inf'), -1, 0]) == -1\n"
-    "    assert find_min([-3, -3, -2]) == -3\n"
-    "    assert find_min([1, 2, 3]) == 1",
-
-    "def test_find_min():\n"
-    "    assert find_min([10, -100, 50]) == -100\n"
-    "    assert find_min([-0.1, -0.01]) == -0.1\n"
-    "    assert find_min([1000]) == 1000",
-
-    "def test_find_min():\n"
-    "    assert find_min([True, False]) == False\n"
-    "    assert find_min([True, 1, 0]) == 0\n"
-    "    assert find_min([False]) == False",
-
-    "def test_find_min():\n"
-    "    assert find_min(['c', 'a', 'b']) == 'a'\n"
-    "    assert find_min(['x', 'X']) == 'X'\n"
-    "    assert find_min(['m']) == 'm'",
-
-    "def test_find_min():\n"
-    "    assert find_min([(1, 2), (0, 5)]) == (0, 5)\n"
-    "    assert find_min([(9,), (-1,)]) == (-1,)\n"
-    "    assert find_min([(3, 3)]) == (3, 3)",
-
-    "def test_find_min():\n"
-    "    assert find_min([b'a', b'b']) == b'a'\n"
-    "    assert find_min([b'z', b'A']) == b'A'\n"
-    "    assert find_min([b'k']) == b'k'",
-
-    "def test_find_min():\n"
-    "    assert find_min([[1], [0]]) == [0]\n"
-    "    assert find_min([[2], [2]]) == [2]\n"
-    "    assert find_min([[5]]) == [5]",
-
-    "def test_find_min():\n"
-    "    assert find_min(['aaa', 'aa']) == 'aa'\n"
-    "    assert find_min(['b', 'ba']) == 'b'\n"
-    "    assert find_min(['zzz']) == 'zzz'",
-
-    "def test_find_min():\n"
-    "    assert find_min([3.14, 2.71]) == 2.71\n"
-    "    assert find_min([-0.0001, 0.0]) == -0.0001\n"
-    "    assert find_min([1e9, 1e8]) == 1e8",
-
-    "def test_find_min():\n"
-    "    assert find_min([10, -1e-9]) == -1e-9\n"
-    "    assert find_min([5, 5.0]) == 5\n"
-    "    assert find_min([-2.5, -2.5001]) == -2.5001",
-
-    "def test_find_min():\n"
-    "    assert find_min(['😊', '😀']) == '😀'\n"
-    "    assert find_min(['A', 'a']) == 'A'\n"
-    "    assert find_min(['Ω', 'Ζ']) == 'Ζ'",
-
-    "def test_find_min():\n"
-    "    assert find_min([1, 0, -1]) == -1\n"
-    "    assert find_min([2, -2]) == -2\n"
-    "    assert find_min([100, -100, 0]) == -100",
-
-    "def test_find_min():\n"
-    "    assert find_min([1000, -999]) == -999\n"
-    "    assert find_min([-50, -50]) == -50\n"
-    "    assert find_min([0.1, 0.01]) == 0.01",
-
-    "def test_find_min():\n"
-    "    assert find_min([[], [1]]) == []\n"
-    "    assert find_min([[1, 2], [1, 1]]) == [1, 1]\n"
-    "    assert find_min([[0]]) == [0]",
-
-    "def test_find_min():\n"
-    "    assert find_min(['', 'a']) == ''\n"
-    "    assert find_min([' ', '']) == ''\n"
-    "    assert find_min(['abc', 'ab']) == 'ab'",
-
-    "def test_find_min():\n"
-    "    assert find_min([True, False, True]) == False\n"
-    "    assert find_min([0, False]) == 0\n"
-    "    assert find_min([1, True]) == 1",
-
-    "def test_find_min():\n"
-    "    assert find_min([(), (1,)]) == ()\n"
-    "    assert find_min([(0,), (0, 0)]) == (0,)\n"
-    "    assert find_min([(5, 4), (5, 3)]) == (5, 3)",
-
-    "def test_find_min():\n"
-    "    assert find_min(['xyz', 'xy']) == 'xy'\n"
-    "    assert find_min(['aaa', 'zzz']) == 'aaa'\n"
-    "    assert find_min(['bbb']) == 'bbb'",
-
-    "def test_find_min():\n"
-    "    assert find_min([float('-inf'), 0, 1]) == float('-inf')\n"
-    "    assert find_min([float('inf'), -5]) == -5\n"
-    "    assert find_min([1e-12, 1e-13]) == 1e-13",
-
-    "def test_find_min():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        find_min(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        find_min([1, 'a'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        find_min([None, 1])",
-
-    "def test_is_empty():\n"
-    "    assert is_empty([])==True\n"
-    "    assert is_empty('')==True\n"
-    "    assert is_empty(())==True\n"
-    "    assert is_empty([0])==False\n"
-    "    assert is_empty('a')==False",
-
-    "def test_is_empty():\n"
-    "    assert is_empty({})==True\n"
-    "    assert is_empty(set())==True\n"
-    "    assert is_empty({'a': 1})==False\n"
-    "    assert is_empty({0})==False",
-
-    "def test_is_empty():\n"
-    "    assert is_empty(0)==True\n"
-    "    assert is_empty(0.0)==True\n"
-    "    assert is_empty(0j)==True\n"
-    "    assert is_empty(-0)==True",
-
-    "def test_is_empty():\n"
-    "    assert is_empty(1)==False\n"
-    "    assert is_empty(-1)==False\n"
-    "    assert is_empty(2.5)==False\n"
-    "    assert is_empty(-0.0001)==False",
-
-    "def test_is_empty():\n"
-    "    assert is_empty(float('inf'))==False\n"
-    "    assert is_empty(float('-inf'))==False\n"
-    "    assert is_empty(float('nan'))==False",
-
-    "def test_is_empty():\n"
-    "    assert is_empty(False)==True\n"
-    "    assert is_empty(True)==False\n"
-    "    assert is_empty(None)==True",
-
-    "def test_is_empty():\n"
-    "    assert is_empty(' ')==False\n"
-    "    assert is_empty('\\n')==False\n"
-    "    assert is_empty('\\t')==False\n"
-    "    assert is_empty('   ')==False",
-
-    "def test_is_empty():\n"
-    "    assert is_empty(b'')==True\n"
-    "    assert is_empty(b'a')==False\n"
-    "    assert is_empty(bytearray())==True\n"
-    "    assert is_empty(bytearray(b'x'))==False",
-
-    "def test_is_empty():\n"
-    "    assert is_empty(range(0))==True\n"
-    "    assert is_empty(range(1))==False\n"
-    "    assert is_empty(range(5))==False",
-
-    "def test_is_empty():\n"
-    "    assert is_empty([[]])==False\n"
-    "    assert is_empty([{}, set()])==False\n"
-    "    assert is_empty([None])==False\n"
-    "    assert is_empty([[0]])==False",
-
-    "def test_is_empty():\n"
-    "    assert is_empty(frozenset())==True\n"
-    "    assert is_empty(frozenset({0}))==False\n"
-    "    assert is_empty(frozenset({1,2}))==False",
-
-    "def test_is_empty():\n"
-    "    class ZeroLen:\n"
-    "        def __len__(self):\n"
-    "            return 0\n"
-    "    z = ZeroLen()\n"
-    "    assert is_empty(z)==True",
-
-    "def test_is_empty():\n"
-    "    class FiveLen:\n"
-    "        def __len__(self):\n"
-    "            return 5\n"
-    "    f = FiveLen()\n"
-    "    assert is_empty(f)==False",
-
-    "def test_is_empty():\n"
-    "    class AlwaysTrue:\n"
-    "        def __bool__(self):\n"
-    "            return True\n"
-    "    x = AlwaysTrue()\n"
-    "    assert is_empty(x)==False",
-
-    "def test_is_empty():\n"
-    "    class AlwaysFalse:\n"
-    "        def __bool__(self):\n"
-    "            return False\n"
-    "    x = AlwaysFalse()\n"
-    "    assert is_empty(x)==True",
-
-    "def test_is_empty():\n"
-    "    class BadBool:\n"
-    "        def __bool__(self):\n"
-    "            raise TypeError('no bool')\n"
-    "    x = BadBool()\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_empty(x)",
-
-    "def test_is_empty():\n"
-    "    class NonBool:\n"
-    "        def __bool__(self):\n"
-    "            return 'yes'\n"
-    "    x = NonBool()\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_empty(x)",
-
-    "def test_is_empty():\n"
-    "    class BadLen:\n"
-    "        def __len__(self):\n"
-    "            return 'nope'\n"
-    "    x = BadLen()\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_empty(x)",
-
-    "def test_is_empty():\n"
-    "    class ExplodingLen:\n"
-    "        def __len__(self):\n"
-    "            raise TypeError('bad len')\n"
-    "    x = ExplodingLen()\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_empty(x)",
-
-    "def test_is_empty():\n"
-    "    class Plain:\n"
-    "        pass\n"
-    "    x = Plain()\n"
-    "    # object without __bool__ or __len__ is always truthy\n"
-    "    assert is_empty(x)==False",
-
-    "def test_is_empty():\n"
-    "    d = {'a': 1}\n"
-    "    assert is_empty(d.keys())==False\n"
-    "    assert is_empty(d.values())==False\n"
-    "    assert is_empty({}.keys())==True",
-
-    "def test_is_empty():\n"
-    "    mv_empty = memoryview(b'')\n"
-    "    mv_full = memoryview(b'abc')\n"
-    "    assert is_empty(mv_empty)==True\n"
-    "    assert is_empty(mv_full)==False",
-
-    "def test_is_empty():\n"
-    "    def gen(n):\n"
-    "        for i in range(n):\n"
-    "            yield i\n"
-    "    g0 = gen(0)\n"
-    "    g1 = gen(1)\n"
-    "    assert is_empty(g0)==False\n"
-    "    assert is_empty(g1)==False",
-
-    "def test_is_empty():\n"
-    "    class WeirdIter:\n"
-    "        def __iter__(self):\n"
-    "            return iter([1])\n"
-    "        def __bool__(self):\n"
-    "            raise TypeError('cannot decide truth')\n"
-    "    x = WeirdIter()\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_empty(x)",
-
-    "def test_is_empty():\n"
-    "    class Both:\n"
-    "        def __len__(self):\n"
-    "            return 0\n"
-    "        def __bool__(self):\n"
-    "            raise TypeError('bool blocked')\n"
-    "    x = Both()\n"
-    "    # __bool__ is tried first and raises\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_empty(x)",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces('a')=='a'\n"
-    "    assert remove_spaces('no_space')=='no_space'\n"
-    "    assert remove_spaces(' abc')=='abc'",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces('a b c')=='abc'\n"
-    "    assert remove_spaces('  a b  c  ')=='abc'\n"
-    "    assert remove_spaces(' multiple   spaces ')=='multiplespaces'",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces(' a ')=='a'\n"
-    "    assert remove_spaces('  a  b')=='ab'\n"
-    "    assert remove_spaces('a  b  c')=='abc'",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces('\\t')=='\\t'\n"
-    "    assert remove_spaces('\\n')=='\\n'\n"
-    "    assert remove_spaces(' \\t ')=='\\t'",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces('a b\\tc')=='ab\\tc'\n"
-    "    assert remove_spaces('x y\\nz')=='xy\\nz'\n"
-    "    assert remove_spaces(' \\n a ')=='\\na'",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces('emoji 😊 space')=='emoji😊space'\n"
-    "    assert remove_spaces('  😊  ')=='😊'\n"
-    "    assert remove_spaces('a 😊 b')=='a😊b'",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces('CAPS LOCK')=='CAPSLOCK'\n"
-    "    assert remove_spaces('A B C')=='ABC'\n"
-    "    assert remove_spaces(' Z ')=='Z'",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces('0 1 2 3')=='0123'\n"
-    "    assert remove_spaces(' 123 ')=='123'\n"
-    "    assert remove_spaces('1  2  3')=='123'",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces('! @ #')=='!@#'\n"
-    "    assert remove_spaces(' @! ')=='@!'\n"
-    "    assert remove_spaces('a ! b')=='a!b'",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces('MiXeD CaSe')=='MiXeDCaSe'\n"
-    "    assert remove_spaces(' U p ')=='Up'\n"
-    "    assert remove_spaces('C a M e L')=='CaMeL'",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces('tab\\tspace ')=='tab\\tspace'\n"
-    "    assert remove_spaces('space\\t ')=='space\\t'\n"
-    "    assert remove_spaces('a\\t b')=='a\\tb'",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces('line\\n break ')=='line\\nbreak'\n"
-    "    assert remove_spaces('x \\n y')=='x\\ny'\n"
-    "    assert remove_spaces('  \\n ')=='\\n'",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces('   end')=='end'\n"
-    "    assert remove_spaces('mid dle')=='middle'\n"
-    "    assert remove_spaces('space  bar')=='spacebar'",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces('word ')=='word'\n"
-    "    assert remove_spaces(' word')=='word'\n"
-    "    assert remove_spaces(' w o r d ')=='word'",
-
-    "def test_remove_spaces():\n"
-    "    s = 'a ' * 100\n"
-    "    result = remove_spaces(s)\n"
-    "    assert result=='a'*100\n"
-    "    assert ' ' not in result",
-
-    "def test_remove_spaces():\n"
-    "    nb = '\\u00A0'  # non-breaking space\n"
-    "    assert remove_spaces(nb)==nb\n"
-    "    assert remove_spaces(' ' + nb + ' ')==nb\n"
-    "    assert ' ' not in remove_spaces(' ' + nb)",
-
-    "def test_remove_spaces():\n"
-    "    s = 'a b c ' * 10\n"
-    "    result = remove_spaces(s)\n"
-    "    assert result=='abc'*10\n"
-    "    assert ' ' not in result",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces('😊 😊')=='😊😊'\n"
-    "    assert remove_spaces('  😊x y😊  ')=='😊xy😊'\n"
-    "    assert remove_spaces('x😊 y 😊z')=='x😊y😊z'",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces(' a\\tb c ')=='a\\tbc'\n"
-    "    assert remove_spaces('\\t a b \\t')=='\\tab\\t'\n"
-    "    assert remove_spaces(' \\t a  \\t b ')=='\\tab'",
-
-    "def test_remove_spaces():\n"
-    "    assert remove_spaces('')==''\n"
-    "    assert remove_spaces('nospace')=='nospace'\n"
-    "    assert remove_spaces('123456')=='123456'",
-
-    "def test_remove_spaces():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        remove_spaces(None)\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        remove_spaces(123)\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        remove_spaces(0.5)",
-
-    "def test_remove_spaces():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        remove_spaces(['a','b'])\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        remove_spaces({'a': 'b'})\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        remove_spaces(('a','b'))",
-
-    "def test_remove_spaces():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        remove_spaces(b'abc def')\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        remove_spaces(bytearray(b'a b'))\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        remove_spaces(object())",
-
-    "def test_remove_spaces():\n"
-    "    class NoReplace:\n"
-    "        pass\n"
-    "    x = NoReplace()\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        remove_spaces(x)",
-
-    "def test_remove_spaces():\n"
-    "    class BadReplace:\n"
-    "        def replace(self, old, new):\n"
-    "            raise ValueError('boom')\n"
-    "    x = BadReplace()\n"
-    "    with pytest.raises(ValueError):\n"
-    "        remove_spaces(x)",
-
-    "def test_is_odd():\n"
-    "    assert is_odd(0)==False\n"
-    "    assert is_odd(1)==True\n"
-    "    assert is_odd(-1)==True",
-
-    "def test_is_odd():\n"
-    "    assert is_odd(2)==False\n"
-    "    assert is_odd(3)==True\n"
-    "    assert is_odd(-3)==True",
-
-    "def test_is_odd():\n"
-    "    assert is_odd(10**6)==False\n"
-    "    assert is_odd(10**6+1)==True\n"
-    "    assert is_odd(-(10**6+1))==True",
-
-    "def test_is_odd():\n"
-    "    assert is_odd(-100)==False\n"
-    "    assert is_odd(-101)==True\n"
-    "    assert is_odd(-102)==False",
-
-    "def test_is_odd():\n"
-    "    assert is_odd(999999)==True\n"
-    "    assert is_odd(999998)==False\n"
-    "    assert is_odd(-999999)==True",
-
-    "def test_is_odd():\n"
-    "    assert is_odd(2**50)==False\n"
-    "    assert is_odd((2**50)+1)==True\n"
-    "    assert is_odd(-(2**50+1))==True",
-
-    "def test_is_odd():\n"
-    "    assert is_odd(0)==False\n"
-    "    assert is_odd(-0)==False\n"
-    "    assert is_odd(4)==False",
-
-    "def test_is_odd():\n"
-    "    assert is_odd(81)==True\n"
-    "    assert is_odd(80)==False\n"
-    "    assert is_odd(82)==False",
-
-    "def test_is_odd():\n"
-    "    assert is_odd(-25)==True\n"
-    "    assert is_odd(-26)==False\n"
-    "    assert is_odd(-27)==True",
-
-    "def test_is_odd():\n"
-    "    assert is_odd(1e9+1)==True\n"
-    "    assert is_odd(1e9)==False\n"
-    "    assert is_odd(-(1e9+1))==True",
-
-    "def test_is_odd():\n"
-    "    assert is_odd(3.0)==True\n"
-    "    assert is_odd(4.0)==False\n"
-    "    assert is_odd(-3.0)==True",
-
-    "def test_is_odd():\n"
-    "    assert is_odd(True)==True\n"
-    "    assert is_odd(False)==False\n"
-    "    assert is_odd(bool(1))==True",
-
-    "def test_is_odd():\n"
-    "    with pytest.raises(TypeError): is_odd('3')\n"
-    "    with pytest.raises(TypeError): is_odd('abc')\n"
-    "    with pytest.raises(TypeError): is_odd('')",
-
-    "def test_is_odd():\n"
-    "    with pytest.raises(TypeError): is_odd(None)\n"
-    "    with pytest.raises(TypeError): is_odd([])\n"
-    "    with pytest.raises(TypeError): is_odd({})",
-
-    "def test_is_odd():\n"
-    "    with pytest.raises(TypeError): is_odd([1])\n"
-    "    with pytest.raises(TypeError): is_odd([1,2])\n"
-    "    with pytest.raises(TypeError): is_odd([0])",
-
-    "def test_is_odd():\n"
-    "    with pytest.raises(TypeError): is_odd({'n':3})\n"
-    "    with pytest.raises(TypeError): is_odd({'a':1,'b':2})\n"
-    "    with pytest.raises(TypeError): is_odd(set([1]))",
-
-    "def test_is_odd():\n"
-    "    with pytest.raises(TypeError): is_odd(object())\n"
-    "    with pytest.raises(TypeError): is_odd(bytearray(b'3'))\n"
-    "    with pytest.raises(TypeError): is_odd(b'4')",
-
-    "def test_is_odd():\n"
-    "    with pytest.raises(TypeError): is_odd(3+4j)\n"
-    "    with pytest.raises(TypeError): is_odd(-2+0j)\n"
-    "    with pytest.raises(TypeError): is_odd(1j)",
-
-    "def test_is_odd():\n"
-    "    class Bad:\n"
-    "        def __mod__(self, other): raise ValueError('boom')\n"
-    "    with pytest.raises(Exception): is_odd(Bad())",
-
-    "def test_is_odd():\n"
-    "    class Weird:\n"
-    "        def __mod__(self, other): return 'not-int'\n"
-    "    with pytest.raises(TypeError): is_odd(Weird())",
-
-    "def test_is_odd():\n"
-    "    assert is_odd(-1_000_000_001)==True\n"
-    "    assert is_odd(-1_000_000_000)==False\n"
-    "    assert is_odd(1_000_000_003)==True",
-
-    "def test_is_odd():\n"
-    "    assert is_odd(2**63 - 1)==True\n"
-    "    assert is_odd(2**63)==False\n"
-    "    assert is_odd(-(2**63 - 1))==True",
-
-    "def test_is_odd():\n"
-    "    assert is_odd(int(3.0))==True\n"
-    "    assert is_odd(int(4.0))==False\n"
-    "    assert is_odd(int(-5.0))==True",
-
-    "def test_is_odd():\n"
-    "    assert is_odd(999_999_999_999)==True\n"
-    "    assert is_odd(1_000_000_000_000)==False\n"
-    "    assert is_odd(-999_999_999_999)==True",
-
-    "def test_is_odd():\n"
-    "    with pytest.raises(TypeError): is_odd(lambda x: x)\n"
-    "    with pytest.raises(TypeError): is_odd(is_odd)\n"
-    "    with pytest.raises(TypeError): is_odd(len)",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([])==[]\n"
-    "    assert cumulative_sum([0])==[0]\n"
-    "    assert cumulative_sum([0,0,0])==[0,0,0]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([1])==[1]\n"
-    "    assert cumulative_sum([1,2])==[1,3]\n"
-    "    assert cumulative_sum([1,2,3])==[1,3,6]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([-1])==[-1]\n"
-    "    assert cumulative_sum([-1,-2])==[-1,-3]\n"
-    "    assert cumulative_sum([-1,-2,-3])==[-1,-3,-6]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([10,-5,2])==[10,5,7]\n"
-    "    assert cumulative_sum([-10,5])==[-10,-5]\n"
-    "    assert cumulative_sum([5,-5])==[5,0]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([1e6])==[1e6]\n"
-    "    assert cumulative_sum([1e6,1])==[1e6,1e6+1]\n"
-    "    assert cumulative_sum([-1e6,1e6])==[-1e6,0]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([0.5,0.5])==[0.5,1.0]\n"
-    "    assert cumulative_sum([-0.5,0.2])==[-0.5,-0.3]\n"
-    "    assert cumulative_sum([0.1,0.1,0.1])==[0.1,0.2,0.3]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([100,-100,100])==[100,0,100]\n"
-    "    assert cumulative_sum([2,-4,6])==[2,-2,4]\n"
-    "    assert cumulative_sum([-5,5,-5])==[-5,0,-5]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([999999999])==[999999999]\n"
-    "    assert cumulative_sum([-999999999])==[-999999999]\n"
-    "    assert cumulative_sum([1,-1,1,-1])==[1,0,1,0]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([3,3,3])==[3,6,9]\n"
-    "    assert cumulative_sum([3,-3,3])==[3,0,3]\n"
-    "    assert cumulative_sum([-3,3,-3])==[-3,0,-3]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([1,0,0])==[1,1,1]\n"
-    "    assert cumulative_sum([0,1,0])==[0,1,1]\n"
-    "    assert cumulative_sum([0,0,1])==[0,0,1]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([-1,1,-1])==[-1,0,-1]\n"
-    "    assert cumulative_sum([1,-1,1])==[1,0,1]\n"
-    "    assert cumulative_sum([-2,2,-2])==[-2,0,-2]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([0,2,4,6])==[0,2,6,12]\n"
-    "    assert cumulative_sum([6,4,2,0])==[6,10,12,12]\n"
-    "    assert cumulative_sum([-1,-1,-1])==[-1,-2,-3]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([10**2,10**2])==[100,200]\n"
-    "    assert cumulative_sum([10**2,-10**2])==[100,0]\n"
-    "    assert cumulative_sum([-10**2,10**2])==[-100,0]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([0.001,0.002])==[0.001,0.003]\n"
-    "    assert cumulative_sum([-0.001,0.001])==[-0.001,0.0]\n"
-    "    assert cumulative_sum([0.1,-0.05,-0.05])==[0.1,0.05,0.0]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([1,-1,2,-2,3])==[1,0,2,0,3]\n"
-    "    assert cumulative_sum([-3,3,-3,3])==[-3,0,-3,0]\n"
-    "    assert cumulative_sum([5,-5,5,-5])==[5,0,5,0]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([1000,-999,1])==[1000,1,2]\n"
-    "    assert cumulative_sum([-1000,999,-1])==[-1000,-1,-2]\n"
-    "    assert cumulative_sum([0,1000,-1000])==[0,1000,0]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([1,1,-2,2])==[1,2,0,2]\n"
-    "    assert cumulative_sum([2,-2,2,-2])==[2,0,2,0]\n"
-    "    assert cumulative_sum([-1,2,-1])==[-1,1,0]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([50,50,50])==[50,100,150]\n"
-    "    assert cumulative_sum([-50,-50,-50])==[-50,-100,-150]\n"
-    "    assert cumulative_sum([50,-50,50])==[50,0,50]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([1e3,1e3])==[1000,2000]\n"
-    "    assert cumulative_sum([-1e3,1e3])==[-1000,0]\n"
-    "    assert cumulative_sum([1e3,-1e3,1e3])==[1000,0,1000]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([7])==[7]\n"
-    "    assert cumulative_sum([-7])==[-7]\n"
-    "    assert cumulative_sum([7,-7])==[7,0]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([2,2,2,2])==[2,4,6,8]\n"
-    "    assert cumulative_sum([2,-2,-2])==[2,0,-2]\n"
-    "    assert cumulative_sum([-2,2,2])==[-2,0,2]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([0,1,-1,1,-1])==[0,1,0,1,0]\n"
-    "    assert cumulative_sum([5,-5,0])==[5,0,0]\n"
-    "    assert cumulative_sum([-1,0,1])==[-1,-1,0]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([10,-10,10,-10])==[10,0,10,0]\n"
-    "    assert cumulative_sum([-10,10,-10,10])==[-10,0,-10,0]\n"
-    "    assert cumulative_sum([1,-2,3,-4])==[1,-1,2,-2]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([0,-1,-2,-3])==[0,-1,-3,-6]\n"
-    "    assert cumulative_sum([-5,0,5])==[-5,-5,0]\n"
-    "    assert cumulative_sum([3,-1,-2])==[3,2,0]",
-
-    "def test_cumulative_sum():\n"
-    "    assert cumulative_sum([1.5,-0.5,2.0])==[1.5,1.0,3.0]\n"
-    "    assert cumulative_sum([-0.1,-0.1,-0.1])==[-0.1,-0.2,-0.3]\n"
-    "    assert cumulative_sum([100,-50,-25,-25])==[100,50,25,0]",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome('áa')==False\n"
-    "    assert is_palindrome('áá')==True\n"
-    "    assert is_palindrome('́á')==True",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome('😊😊')==True\n"
-    "    assert is_palindrome('😊a😊')==True\n"
-    "    assert is_palindrome('😊ab')==False",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome('a b a')==True\n"
-    "    assert is_palindrome('a  b  a')==True\n"
-    "    assert is_palindrome('a b  a')==False",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome('\\n')==True\n"
-    "    assert is_palindrome('a\\na')==True\n"
-    "    assert is_palindrome('a\\nb')==False",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome(' \\t ')==True\n"
-    "    assert is_palindrome('a\\t a')==True\n"
-    "    assert is_palindrome('a\\t b')==False",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome([1,2,1])==True\n"
-    "    assert is_palindrome([1,2,3])==False\n"
-    "    assert is_palindrome([])==True",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome([1,'1',1])==True\n"
-    "    assert is_palindrome(['a',1,'a'])==True\n"
-    "    assert is_palindrome(['a',1,'b'])==False",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome((1,2,1))==True\n"
-    "    assert is_palindrome((1,2))==False\n"
-    "    assert is_palindrome(())==True",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome('😀😃😀')==True\n"
-    "    assert is_palindrome('😀😃😄')==False\n"
-    "    assert is_palindrome('😄😃😄')==True",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome(121)==True\n"
-    "    assert is_palindrome(120)==False\n"
-    "    assert is_palindrome(0)==True",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome('')==True\n"
-    "    assert is_palindrome(' ')==True\n"
-    "    assert is_palindrome('  ')==True",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome('aa\\u200baa')==True\n"
-    "    assert is_palindrome('ab\\u200bab')==True\n"
-    "    assert is_palindrome('a\\u200bb')==False",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome('aba\\n')==False\n"
-    "    assert is_palindrome('\\naba\\n')==True\n"
-    "    assert is_palindrome('a\\n\\na')==True",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome('AaA')==False\n"
-    "    assert is_palindrome('aaa')==True\n"
-    "    assert is_palindrome('Aa')==False",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome('!@#@!')==True\n"
-    "    assert is_palindrome('!@#')==False\n"
-    "    assert is_palindrome('#!#')==True",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome(['a','', 'a'])==True\n"
-    "    assert is_palindrome(['a','','b'])==False\n"
-    "    assert is_palindrome(['',''])==True",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome('abcba')==True\n"
-    "    assert is_palindrome('abccba')==True\n"
-    "    assert is_palindrome('abcda')==False",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome('あいあ')==True\n"
-    "    assert is_palindrome('あいう')==False\n"
-    "    assert is_palindrome('うあう')==True",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome(['😊','a','😊'])==True\n"
-    "    assert is_palindrome(['😊','😊'])==True\n"
-    "    assert is_palindrome(['a','😊'])==False",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome(['A','b','A'])==True\n"
-    "    assert is_palindrome(['A','B'])==False\n"
-    "    assert is_palindrome(['a','a'])==True",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome('0x0')==False\n"
-    "    assert is_palindrome('000')==True\n"
-    "    assert is_palindrome('010')==True",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome('\\t\\t')==True\n"
-    "    assert is_palindrome('a\\t\\ta')==True\n"
-    "    assert is_palindrome('a\\tb')==False",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome(['x',1,'x'])==True\n"
-    "    assert is_palindrome(['x',1,'y'])==False\n"
-    "    assert is_palindrome([1,1])==True",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome('aba\\taba')==True\n"
-    "    assert is_palindrome('aba\\t ab')==False\n"
-    "    assert is_palindrome('a\\ta')==True",
-
-    "def test_is_palindrome():\n"
-    "    assert is_palindrome('😊á😊')==True\n"
-    "    assert is_palindrome('á😊a')==False\n"
-    "    assert is_palindrome('áá')==True",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(0)==0\n"
-    "    assert fibonacci(1)==1\n"
-    "    with pytest.raises(ValueError): fibonacci(-1)",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(2)==1\n"
-    "    assert fibonacci(3)==2\n"
-    "    assert fibonacci(4)==3\n"
-    "    with pytest.raises(ValueError): fibonacci(-5)",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(5)==5\n"
-    "    assert fibonacci(6)==8\n"
-    "    assert fibonacci(7)==13",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(10)==55\n"
-    "    assert fibonacci(11)==89\n"
-    "    with pytest.raises(ValueError): fibonacci(-10)",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(15)==610\n"
-    "    assert fibonacci(14)==377\n"
-    "    assert fibonacci(0)==0",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(20)==6765\n"
-    "    assert fibonacci(19)==4181\n"
-    "    with pytest.raises(ValueError): fibonacci(-2)",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(1)==1\n"
-    "    assert fibonacci(True)==1\n"
-    "    assert fibonacci(False)==0",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(8)==21\n"
-    "    assert fibonacci(9)==34\n"
-    "    with pytest.raises(ValueError): fibonacci(-8)",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(25)==75025\n"
-    "    assert fibonacci(24)==46368",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(3)==2\n"
-    "    assert fibonacci(5)==5\n"
-    "    with pytest.raises(TypeError): fibonacci(3.5)",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(2)==1\n"
-    "    assert fibonacci(12)==144\n"
-    "    with pytest.raises(TypeError): fibonacci('4')",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(30)==832040\n"
-    "    assert fibonacci(29)==514229",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(4)==3\n"
-    "    assert fibonacci(0)==0\n"
-    "    with pytest.raises(ValueError): fibonacci(-100)",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(6)==8\n"
-    "    assert fibonacci(16)==987\n"
-    "    assert fibonacci(17)==1597",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(7)==13\n"
-    "    assert fibonacci(13)==233\n"
-    "    with pytest.raises(TypeError): fibonacci(None)",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(9)==34\n"
-    "    assert fibonacci(10)==55\n"
-    "    assert fibonacci(1)==1",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(18)==2584\n"
-    "    assert fibonacci(19)==4181\n"
-    "    with pytest.raises(ValueError): fibonacci(-3)",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(22)==17711\n"
-    "    assert fibonacci(21)==10946",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(23)==28657\n"
-    "    assert fibonacci(2)==1\n"
-    "    with pytest.raises(TypeError): fibonacci(2.0)",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(5)==5\n"
-    "    assert fibonacci(1)==1\n"
-    "    with pytest.raises(TypeError): fibonacci([5])",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(26)==121393\n"
-    "    assert fibonacci(27)==196418",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(28)==317811\n"
-    "    assert fibonacci(0)==0\n"
-    "    with pytest.raises(ValueError): fibonacci(-4)",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(32)==2178309\n"
-    "    assert fibonacci(31)==1346269",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(33)==3524578\n"
-    "    assert fibonacci(34)==5702887\n"
-    "    with pytest.raises(TypeError): fibonacci({'n':5})",
-
-    "def test_fibonacci():\n"
-    "    assert fibonacci(12)==144\n"
-    "    assert fibonacci(8)==21\n"
-    "    with pytest.raises(ValueError): fibonacci(-12)",
-
-    "def test_multiply():\n"
-    "    assert multiply(0, 0) == 0\n"
-    "    assert multiply(1, -1) == -1\n"
-    "    assert multiply(-1, -1) == 1",
-
-    "def test_multiply():\n"
-    "    assert multiply(10**12, 10**12) == 10**24\n"
-    "    assert multiply(-10**12, 10**12) == -10**24\n"
-    "    assert multiply(-10**12, -10**12) == 10**24",
-
-    "def test_multiply():\n"
-    "    assert multiply(10**9, 0) == 0\n"
-    "    assert multiply(-10**9, 0) == 0\n"
-    "    assert multiply(0, -10**9) == 0",
-
-    "def test_multiply():\n"
-    "    assert multiply(1.5, 2) == 3.0\n"
-    "    assert multiply(-2.5, 2) == -5.0\n"
-    "    assert multiply(0.1, 0.2) == 0.020000000000000004",
-
-    "def test_multiply():\n"
-    "    assert multiply(float('inf'), 2) == float('inf')\n"
-    "    assert multiply(float('-inf'), 2) == float('-inf')\n"
-    "    assert multiply(float('-inf'), -1) == float('inf')",
-
-    "def test_multiply():\n"
-    "    assert multiply(True, 3) == 3\n"
-    "    assert multiply(False, 5) == 0\n"
-    "    assert multiply(True, -4) == -4",
-
-    "def test_multiply():\n"
-    "    assert multiply('a', 3) == 'aaa'\n"
-    "    assert multiply(3, 'ab') == 'ababab'\n"
-    "    assert multiply('x', 0) == ''",
-
-    "def test_multiply():\n"
-    "    assert multiply('a', -1) == ''\n"
-    "    assert multiply('abc', -2) == ''\n"
-    "    assert multiply('', 100) == ''",
-
-    "def test_multiply():\n"
-    "    assert multiply([1], 3) == [1, 1, 1]\n"
-    "    assert multiply(2, ['x']) == ['x', 'x']\n"
-    "    assert multiply([1, 2], 0) == []",
-
-    "def test_multiply():\n"
-    "    assert multiply((1,), 3) == (1, 1, 1)\n"
-    "    assert multiply(2, (1, 2)) == (1, 2, 1, 2)\n"
-    "    assert multiply(0, (1, 2, 3)) == ()",
-
-    "def test_multiply():\n"
-    "    xs = list(range(1000))\n"
-    "    result = multiply(xs, 2)\n"
-    "    assert len(result) == 2000\n"
-    "    assert result[0] == 0\n"
-    "    assert result[-1] == 999",
-
-    "def test_multiply():\n"
-    "    xs = [0]\n"
-    "    assert multiply(xs, -1) == []\n"
-    "    assert multiply(xs, -5) == []\n"
-    "    assert multiply(xs, 1) == [0]",
-
-    "def test_multiply():\n"
-    "    assert multiply(-1, 2**31) == -(2**31)\n"
-    "    assert multiply(2**16, 2**16) == 2**32\n"
-    "    assert multiply(-2**16, -2**16) == 2**32",
-
-    "def test_multiply():\n"
-    "    assert multiply(1e308, 2) == float('inf')\n"
-    "    assert multiply(-1e308, 2) == float('-inf')\n"
-    "    assert multiply(1e308, -2) == float('-inf')",
-
-    "def test_multiply():\n"
-    "    assert multiply(0.1, 3) == 0.30000000000000004\n"
-    "    assert multiply(-0.1, 3) == -0.30000000000000004\n"
-    "    assert multiply(0.0, 5) == 0.0",
-
-    "def test_multiply():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply('a', 'b')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply('a', 2.5)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply(2.5, 'a')",
-
-    "def test_multiply():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply([1, 2], [3, 4])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply([1, 2], 2.5)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply(2.5, [1, 2])",
-
-    "def test_multiply():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply({'a': 1}, 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply(2, {'a': 1})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply({'a': 1}, {'b': 2})",
-
-    "def test_multiply():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply(None, 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply(1, None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply(None, None)",
-
-    "def test_multiply():\n"
-    "    assert multiply(True, True) == 1\n"
-    "    assert multiply(False, False) == 0\n"
-    "    assert multiply(True, False) == 0",
-
-    "def test_multiply():\n"
-    "    assert multiply(-0, 5) == 0\n"
-    "    assert multiply(0, -5) == 0\n"
-    "    assert multiply(-0, -5) == 0",
-
-    "def test_multiply():\n"
-    "    assert multiply(b'a', 3) == b'aaa'\n"
-    "    assert multiply(2, b'xy') == b'xyxy'\n"
-    "    assert multiply(b'data', 0) == b''",
-
-    "def test_multiply():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply(b'a', 2.5)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply(2.5, b'a')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply(b'a', '2')",
-
-    "def test_multiply():\n"
-    "    assert multiply(3, -3) == -9\n"
-    "    assert multiply(-3, 3) == -9\n"
-    "    assert multiply(-3, -3) == 9",
-
-    "def test_multiply():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply(object(), 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply(2, object())\n"
-    "    with pytest.raises(TypeError):\n"
-    "        multiply(object(), object())",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([]) == 0\n"
-    "    assert sum_of_squares([0]) == 0\n"
-    "    assert sum_of_squares([0, 0, 0]) == 0",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([1]) == 1\n"
-    "    assert sum_of_squares([1, 2]) == 5\n"
-    "    assert sum_of_squares([1, 2, 3]) == 14",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([-1]) == 1\n"
-    "    assert sum_of_squares([-1, -2]) == 5\n"
-    "    assert sum_of_squares([-1, -2, -3]) == 14",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([10, -5, 2]) == 129\n"
-    "    assert sum_of_squares([-10, 5]) == 125\n"
-    "    assert sum_of_squares([5, -5]) == 50",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([10**6]) == 10**12\n"
-    "    assert sum_of_squares([10**6, 1]) == 10**12 + 1\n"
-    "    assert sum_of_squares([-10**6, 10**6]) == 2 * (10**12)",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([0.5]) == 0.25\n"
-    "    assert sum_of_squares([0.5, 0.5]) == 0.5\n"
-    "    assert sum_of_squares([-0.5, 0.2]) == 0.29",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([100, -100, 100]) == 30000\n"
-    "    assert sum_of_squares([2, -4, 6]) == 56\n"
-    "    assert sum_of_squares([-5, 5, -5]) == 75",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([999999999]) == 999999998000000001\n"
-    "    assert sum_of_squares([-999999999]) == 999999998000000001\n"
-    "    assert sum_of_squares([1, -1, 1, -1]) == 4",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([3, 3, 3]) == 27\n"
-    "    assert sum_of_squares([3, -3, 3]) == 27\n"
-    "    assert sum_of_squares([-3, -3, -3]) == 27",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([1, 0, 0]) == 1\n"
-    "    assert sum_of_squares([0, 1, 0]) == 1\n"
-    "    assert sum_of_squares([0, 0, 1]) == 1",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([-1, 1, -1]) == 3\n"
-    "    assert sum_of_squares([1, -1, 1]) == 3\n"
-    "    assert sum_of_squares([-2, 2, -2]) == 12",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([0, 2, 4, 6]) == 56\n"
-    "    assert sum_of_squares([6, 4, 2, 0]) == 56\n"
-    "    assert sum_of_squares([-1, -1, -1]) == 3",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([10**2, 10**2]) == 20000\n"
-    "    assert sum_of_squares([10**2, -10**2]) == 20000\n"
-    "    assert sum_of_squares([-10**2, 10**2]) == 20000",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([0.001, 0.002]) == 5e-06\n"
-    "    assert sum_of_squares([-0.001, 0.001]) == 2e-06\n"
-    "    assert sum_of_squares([0.1, -0.05, -0.05]) == 0.015",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([1, -1, 2, -2, 3]) == 19\n"
-    "    assert sum_of_squares([-3, 3, -3, 3]) == 36\n"
-    "    assert sum_of_squares([5, -5, 5, -5]) == 100",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([1000, -999, 1]) == 1998002\n"
-    "    assert sum_of_squares([-1000, 999, -1]) == 1998002\n"
-    "    assert sum_of_squares([0, 1000, -1000]) == 2000000",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([1, 1, -2, 2]) == 10\n"
-    "    assert sum_of_squares([2, -2, 2, -2]) == 16\n"
-    "    assert sum_of_squares([-1, 2, -1]) == 6",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([50, 50, 50]) == 7500\n"
-    "    assert sum_of_squares([-50, -50, -50]) == 7500\n"
-    "    assert sum_of_squares([50, -50, 50]) == 7500",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([1e3, 1e3]) == 2e6\n"
-    "    assert sum_of_squares([-1e3, 1e3]) == 2e6\n"
-    "    assert sum_of_squares([1e3, -1e3, 1e3]) == 3e6",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([7]) == 49\n"
-    "    assert sum_of_squares([-7]) == 49\n"
-    "    assert sum_of_squares([7, -7]) == 98",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([2, 2, 2, 2]) == 16\n"
-    "    assert sum_of_squares([2, -2, -2]) == 12\n"
-    "    assert sum_of_squares([-2, 2, 2]) == 12",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([0, 1, -1, 1, -1]) == 4\n"
-    "    assert sum_of_squares([5, -5, 0]) == 50\n"
-    "    assert sum_of_squares([-1, 0, 1]) == 2",
-
-    "def test_sum_of_squares():\n"
-    "    assert sum_of_squares([10, -10, 10, -10]) == 400\n"
-    "    assert sum_of_squares([-10, 10, -10, 10]) == 400\n"
-    "    assert sum_of_squares([1, -2, 3, -4]) == 30",
-
-    "def test_sum_of_squares():\n"
-    "    with pytest.raises(TypeError): sum_of_squares([None])\n"
-    "    with pytest.raises(TypeError): sum_of_squares(['a'])\n"
-    "    with pytest.raises(TypeError): sum_of_squares([[], 1])",
-
-    "def test_sum_of_squares():\n"
-    "    with pytest.raises(TypeError): sum_of_squares('abc')\n"
-    "    with pytest.raises(TypeError): sum_of_squares([object()])\n"
-    "    with pytest.raises(TypeError): sum_of_squares([1, object()])",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(0) == 0\n"
-    "    assert get_abs(-0) == 0\n"
-    "    assert get_abs(1) == 1",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(-1) == 1\n"
-    "    assert get_abs(-999) == 999\n"
-    "    assert get_abs(999) == 999",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(10**12) == 10**12\n"
-    "    assert get_abs(-(10**12)) == 10**12\n"
-    "    assert get_abs(10**18) == 10**18",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(0.0) == 0.0\n"
-    "    assert get_abs(-0.0) == 0.0\n"
-    "    assert get_abs(3.14) == 3.14",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(-3.14) == 3.14\n"
-    "    assert get_abs(-1e-9) == 1e-9\n"
-    "    assert get_abs(1e-9) == 1e-9",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(float('inf')) == float('inf')\n"
-    "    assert get_abs(float('-inf')) == float('inf')\n"
-    "    assert get_abs(float('inf')) > 0",
-
-    "def test_get_abs():\n"
-    "    nan = float('nan')\n"
-    "    assert get_abs(nan) != get_abs(nan)\n"
-    "    assert get_abs(nan) != nan\n"
-    "    assert get_abs(nan) != 0",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(True) == 1\n"
-    "    assert get_abs(False) == 0\n"
-    "    assert get_abs(-True) == 1",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(5+0j) == 5\n"
-    "    assert get_abs(-5+0j) == 5\n"
-    "    assert get_abs(3+4j) == 5",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(0+0j) == 0\n"
-    "    assert get_abs(1j) == 1\n"
-    "    assert get_abs(-1j) == 1",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(2+3j) == (13)**0.5\n"
-    "    assert get_abs(-2-3j) == (13)**0.5\n"
-    "    assert get_abs(0+5j) == 5",
-
-    "def test_get_abs():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs('5')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs('-5')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs('0')",
-
-    "def test_get_abs():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs([])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs({})",
-
-    "def test_get_abs():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs([1, -2])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs((1, -2))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs({'a': 1})",
-
-    "def test_get_abs():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs(object())\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs(set([1]))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs(set())",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(-2**63) == 2**63\n"
-    "    assert get_abs(2**63) == 2**63\n"
-    "    assert get_abs(-(2**31)) == 2**31",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(0.0000001) == 0.0000001\n"
-    "    assert get_abs(-0.0000001) == 0.0000001\n"
-    "    assert get_abs(1.23456789) == 1.23456789",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(-1.23456789) == 1.23456789\n"
-    "    assert get_abs(-9999999.999) == 9999999.999\n"
-    "    assert get_abs(9999999.999) == 9999999.999",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(0j) == 0\n"
-    "    assert get_abs(1+1j) == (2)**0.5\n"
-    "    assert get_abs(-1-1j) == (2)**0.5",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(-True) == 1\n"
-    "    assert get_abs(+True) == 1\n"
-    "    assert get_abs(+False) == 0",
-
-    "def test_get_abs():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs(b'1')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs(b'-1')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs(bytearray(b'1'))",
-
-    "def test_get_abs():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs(get_abs)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs(lambda x: x)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs(abs)",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(1e308) == 1e308\n"
-    "    assert get_abs(-1e308) == 1e308\n"
-    "    assert get_abs(1e-308) == 1e-308",
-
-    "def test_get_abs():\n"
-    "    assert get_abs(-1e-308) == 1e-308\n"
-    "    assert get_abs(42) == 42\n"
-    "    assert get_abs(-42) == 42",
-
-    "def test_get_abs():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs('')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs('abc')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_abs('3.14')",
-
-    "def test_factorial():\n"
-    "    assert factorial(0) == 1\n"
-    "    assert factorial(1) == 1\n"
-    "    assert factorial(2) == 2",
-
-    "def test_factorial():\n"
-    "    assert factorial(3) == 6\n"
-    "    assert factorial(4) == 24\n"
-    "    assert factorial(5) == 120",
-
-    "def test_factorial():\n"
-    "    assert factorial(6) == 720\n"
-    "    assert factorial(7) == 5040\n"
-    "    assert factorial(8) == 40320",
-
-    "def test_factorial():\n"
-    "    assert factorial(10) == 3628800\n"
-    "    assert factorial(12) == 479001600\n"
-    "    assert factorial(15) == 1307674368000",
-
-    "def test_factorial():\n"
-    "    assert factorial(True) == 1\n"
-    "    assert factorial(False) == 1\n"
-    "    assert factorial(2) == 2",
-
-    "def test_factorial():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        factorial(-1)\n"
-    "    with pytest.raises(ValueError):\n"
-    "        factorial(-10)",
-
-    "def test_factorial():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial(1.5)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial(2.0)",
-
-    "def test_factorial():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial('5')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial('')",
-
-    "def test_factorial():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial([5])",
-
-    "def test_factorial():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial({'n': 5})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial((5,))",
-
-    "def test_factorial():\n"
-    "    assert factorial(20) == 2432902008176640000\n"
-    "    assert factorial(18) == 6402373705728000",
-
-    "def test_factorial():\n"
-    "    assert factorial(9) == 362880\n"
-    "    assert factorial(11) == 39916800",
-
-    "def test_factorial():\n"
-    "    assert factorial(16) == 20922789888000\n"
-    "    assert factorial(17) == 355687428096000",
-
-    "def test_factorial():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial(3 + 0j)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial(1j)",
-
-    "def test_factorial():\n"
-    "    assert factorial(13) == 6227020800\n"
-    "    assert factorial(14) == 87178291200",
-
-    "def test_factorial():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial(float('inf'))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial(float('nan'))",
-
-    "def test_factorial():\n"
-    "    assert factorial(19) == 121645100408832000\n"
-    "    assert factorial(3) == 6",
-
-    "def test_factorial():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial(b'5')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial(bytearray(b'5'))",
-
-    "def test_factorial():\n"
-    "    assert factorial(4) == 24\n"
-    "    assert factorial(2) == 2",
-
-    "def test_factorial():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial(object())\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial(set([1]))",
-
-    "def test_factorial():\n"
-    "    assert factorial(0) == 1\n"
-    "    assert factorial(1) == 1",
-
-    "def test_factorial():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial(range(5))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial(iter([5]))",
-
-    "def test_factorial():\n"
-    "    assert factorial(6) == 720\n"
-    "    assert factorial(7) == 5040",
-
-    "def test_factorial():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial(lambda x: x)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial(print)",
-
-    "def test_factorial():\n"
-    "    assert factorial(8) == 40320\n"
-    "    assert factorial(5) == 120",
-
-    "def test_every_other():\n"
-    "    assert every_other([]) == []\n"
-    "    assert every_other([1]) == []\n"
-    "    assert every_other([1, 2]) == [2]",
-
-    "def test_every_other():\n"
-    "    assert every_other([1, 2, 3]) == [2]\n"
-    "    assert every_other([1, 2, 3, 4]) == [2, 4]",
-
-    "def test_every_other():\n"
-    "    assert every_other(['a', 'b', 'c', 'd']) == ['b', 'd']\n"
-    "    assert every_other(['x']) == []",
-
-    "def test_every_other():\n"
-    "    assert every_other([0, 0, 0, 0]) == [0, 0]\n"
-    "    assert every_other([0, 1, 0, 1]) == [1, 1]",
-
-    "def test_every_other():\n"
-    "    assert every_other([-1, -2, -3, -4]) == [-2, -4]\n"
-    "    assert every_other([-1]) == []",
-
-    "def test_every_other():\n"
-    "    assert every_other([True, False, True, False]) == [False, False]\n"
-    "    assert every_other([False]) == []",
-
-    "def test_every_other():\n"
-    "    assert every_other([None, 1, None, 2]) == [1, 2]\n"
-    "    assert every_other([None]) == []",
-
-    "def test_every_other():\n"
-    "    assert every_other([(1,), (2,), (3,), (4,)]) == [(2,), (4,)]\n"
-    "    assert every_other([(1,)]) == []",
-
-    "def test_every_other():\n"
-    "    assert every_other([[1], [2], [3]]) == [[2]]\n"
-    "    assert every_other([[1], [2], [3], [4]]) == [[2], [4]]",
-
-    "def test_every_other():\n"
-    "    assert every_other(['😊', '😃', '😄', '😁']) == ['😃', '😁']\n"
-    "    assert every_other(['😊']) == []",
-
-    "def test_every_other():\n"
-    "    assert every_other([1.1, 2.2, 3.3, 4.4]) == [2.2, 4.4]\n"
-    "    assert every_other([1.1]) == []",
-
-    "def test_every_other():\n"
-    "    assert every_other(range(5)) == [1, 3]\n"
-    "    assert every_other(range(1)) == []",
-
-    "def test_every_other():\n"
-    "    assert every_other('abcd') == 'bd'\n"
-    "    assert every_other('a') == ''",
-
-    "def test_every_other():\n"
-    "    assert every_other(b'abcdef') == b'bdf'\n"
-    "    assert every_other(b'a') == b''",
-
-    "def test_every_other():\n"
-    "    assert every_other((1, 2, 3, 4, 5)) == (2, 4)\n"
-    "    assert every_other((1,)) == ()",
-
-    "def test_every_other():\n"
-    "    assert every_other([[], [1], [], [2]]) == [[1], [2]]\n"
-    "    assert every_other([[]]) == []",
-
-    "def test_every_other():\n"
-    "    assert every_other([0, -1, -2, -3]) == [-1, -3]\n"
-    "    assert every_other([0]) == []",
-
-    "def test_every_other():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        every_other(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        every_other(123)",
-
-    "def test_every_other():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        every_other(3.14)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        every_other(True)",
-
-    "def test_every_other():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        every_other({'a': 1, 'b': 2})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        every_other({1, 2, 3})",
-
-    "def test_every_other():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        every_other(object())\n"
-    "    with pytest.raises(TypeError):\n"
-    "        every_other(lambda x: x)",
-
-    "def test_every_other():\n"
-    "    assert every_other([1, 2, 3, 4, 5, 6]) == [2, 4, 6]\n"
-    "    assert every_other([1, 2, 3, 4, 5]) == [2, 4]",
-
-    "def test_every_other():\n"
-    "    assert every_other(['a', '', 'b', '']) == ['', '']\n"
-    "    assert every_other(['']) == []",
-
-    "def test_every_other():\n"
-    "    assert every_other([float('inf'), 1, float('-inf'), 2]) == [1, 2]\n"
-    "    assert every_other([float('nan')]) == []",
-
-    "def test_every_other():\n"
-    "    assert every_other([1, None, 2, None]) == [None, None]\n"
-    "    assert every_other([None]) == []",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('a') is True\n"
-    "    assert starts_with_vowel('e') is True\n"
-    "    assert starts_with_vowel('b') is False",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('Apple') is True\n"
-    "    assert starts_with_vowel('banana') is False",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('Umbrella') is True\n"
-    "    assert starts_with_vowel('Cat') is False",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('') is False\n"
-    "    assert starts_with_vowel(None) is False",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel(' ') is False\n"
-    "    assert starts_with_vowel(' a') is False",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('1apple') is False\n"
-    "    assert starts_with_vowel('!orange') is False",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('Árbol') is False\n"
-    "    assert starts_with_vowel('ábc') is False",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('æther') is False\n"
-    "    assert starts_with_vowel('øzone') is False",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('O') is True\n"
-    "    assert starts_with_vowel('I') is True",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('\\nabc') is False\n"
-    "    assert starts_with_vowel('\\tabc') is False",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('😊apple') is False\n"
-    "    assert starts_with_vowel('🍎') is False",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('u') is True\n"
-    "    assert starts_with_vowel('y') is False",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('AEIOU') is True\n"
-    "    assert starts_with_vowel('BCDF') is False",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('a123') is True\n"
-    "    assert starts_with_vowel('e!@#') is True",
-
-    "def test_starts_with_vowel():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        starts_with_vowel(123)",
-
-    "def test_starts_with_vowel():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        starts_with_vowel([])",
-
-    "def test_starts_with_vowel():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        starts_with_vowel({})",
-
-    "def test_starts_with_vowel():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        starts_with_vowel(True)",
-
-    "def test_starts_with_vowel():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        starts_with_vowel(b'apple')",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('a\\n') is True\n"
-    "    assert starts_with_vowel('e\\t') is True",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('Aardvark') is True\n"
-    "    assert starts_with_vowel('aardvark') is True",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('ø') is False\n"
-    "    assert starts_with_vowel('ß') is False",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('ufo') is True\n"
-    "    assert starts_with_vowel('UFO') is True",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel(' ') is False\n"
-    "    assert starts_with_vowel('') is False",
-
-    "def test_starts_with_vowel():\n"
-    "    assert starts_with_vowel('ábc') is True\n"
-    "    assert starts_with_vowel('́abc') is False",
-
-    "def test_unique_list():\n"
-    "    assert unique_list([]) == []\n"
-    "    assert unique_list([1, 1, 1]) == [1]\n"
-    "    assert unique_list([1, 2, 1, 2]) == [1, 2]",
-
-    "def test_unique_list():\n"
-    "    assert unique_list(['a', 'a', 'b']) == ['a', 'b']\n"
-    "    assert unique_list(['x']) == ['x']",
-
-    "def test_unique_list():\n"
-    "    assert unique_list([0, 0, 1, 0]) == [0, 1]\n"
-    "    assert unique_list([-1, -1, -2]) == [-1, -2]",
-
-    "def test_unique_list():\n"
-    "    assert unique_list(['A', 'a', 'A']) == ['A', 'a']\n"
-    "    assert unique_list(['', '', 'a']) == ['', 'a']",
-
-    "def test_unique_list():\n"
-    "    assert unique_list([True, True, False]) == [True, False]\n"
-    "    assert unique_list([False, False]) == [False]",
-
-    "def test_unique_list():\n"
-    "    assert unique_list([(1, 2), (1, 2), (2, 3)]) == [(1, 2), (2, 3)]\n"
-    "    assert unique_list([(0,), (0,)]) == [(0,)]",
-
-    "def test_unique_list():\n"
-    "    assert unique_list([1.1, 1.1, 2.2]) == [1.1, 2.2]\n"
-    "    assert unique_list([0.0, 0.0]) == [0.0]",
-
-    "def test_unique_list():\n"
-    "    assert unique_list(['🙂', '🙂', 'a']) == ['🙂', 'a']\n"
-    "    assert unique_list(['a', '🙂', 'a']) == ['a', '🙂']",
-
-    "def test_unique_list():\n"
-    "    assert unique_list([None, None, 1]) == [None, 1]\n"
-    "    assert unique_list([None, None]) == [None]",
-
-    "def test_unique_list():\n"
-    "    assert unique_list(['a', 'b', 'a', 'c']) == ['a', 'b', 'c']\n"
-    "    assert unique_list(['x', 'x', 'y']) == ['x', 'y']",
-
-    "def test_unique_list():\n"
-    "    assert unique_list([' ', ' ', 'a']) == [' ', 'a']\n"
-    "    assert unique_list(['', '']) == ['']",
-
-    "def test_unique_list():\n"
-    "    assert unique_list([1, '1', 1]) == [1, '1']\n"
-    "    assert unique_list(['1', 1, '1']) == ['1', 1]",
-
-    "def test_unique_list():\n"
-    "    assert unique_list([[1], [1], [2]]) == [[1], [2]]\n"
-    "    assert unique_list([[0], [0]]) == [[0]]",
-
-    "def test_unique_list():\n"
-    "    x = [1]\n"
-    "    assert unique_list([x, x, [2]]) == [x, [2]]",
-
-    "def test_unique_list():\n"
-    "    assert unique_list(['a\\n', 'a\\n', 'b']) == ['a\\n', 'b']\n"
-    "    assert unique_list(['\\t', '\\t']) == ['\\t']",
-
-    "def test_unique_list():\n"
-    "    assert unique_list([10**9, 10**9, 1]) == [10**9, 1]\n"
-    "    assert unique_list([-10**9, -10**9]) == [-10**9]",
-
-    "def test_unique_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        unique_list(123)",
-
-    "def test_unique_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        unique_list(None)",
-
-    "def test_unique_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        unique_list('abc')",
-
-    "def test_unique_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        unique_list({1, 2, 3})",
-
-    "def test_unique_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        unique_list({'a': 1})",
-
-    "def test_unique_list():\n"
-    "    assert unique_list(['a', 'A', 'a', 'A']) == ['a', 'A']\n"
-    "    assert unique_list(['ß', 'ß', 'ss']) == ['ß', 'ss']",
-
-    "def test_unique_list():\n"
-    "    assert unique_list([0, False, 0]) == [0, False]\n"
-    "    assert unique_list([True, 1, True]) == [True, 1]",
-
-    "def test_unique_list():\n"
-    "    assert unique_list(['a'*50, 'a'*50, 'b']) == ['a'*50, 'b']\n"
-    "    assert unique_list(['c']) == ['c']",
-
-    "def test_unique_list():\n"
-    "    assert unique_list([(), (), (1,)]) == [(), (1,)]\n"
-    "    assert unique_list([(1, 1), (1, 1)]) == [(1, 1)]",
-
-    "def test_average():\n"
-    "    with pytest.raises(ZeroDivisionError):\n"
-    "        average([])",
-
-    "def test_average():\n"
-    "    assert average([0]) == 0\n"
-    "    assert average([0, 0, 0]) == 0",
-
-    "def test_average():\n"
-    "    assert average([1]) == 1\n"
-    "    assert average([1, 1, 1]) == 1",
-
-    "def test_average():\n"
-    "    assert average([1, 2]) == 1.5\n"
-    "    assert average([1, 2, 3]) == 2",
-
-    "def test_average():\n"
-    "    assert average([-1, -2]) == -1.5\n"
-    "    assert average([-1, -2, -3]) == -2",
-
-    "def test_average():\n"
-    "    assert average([1, -1]) == 0\n"
-    "    assert average([5, -5, 5, -5]) == 0",
-
-    "def test_average():\n"
-    "    assert average([0.5, 0.5]) == 0.5\n"
-    "    assert average([0.1, 0.2]) == 0.15",
-
-    "def test_average():\n"
-    "    assert average([-0.5, 0.5]) == 0.0\n"
-    "    assert average([-0.1, -0.2]) == -0.15",
-
-    "def test_average():\n"
-    "    assert average([10**6, 10**6]) == 10**6\n"
-    "    assert average([-10**6, 10**6]) == 0",
-
-    "def test_average():\n"
-    "    assert average([1, 2, 2]) == 5/3\n"
-    "    assert average([3, 3, 3, 3]) == 3",
-
-    "def test_average():\n"
-    "    assert average([True, False]) == 0.5\n"
-    "    assert average([True, True]) == 1",
-
-    "def test_average():\n"
-    "    assert average([False, False]) == 0\n"
-    "    assert average([True, False, True]) == 2/3",
-
-    "def test_average():\n"
-    "    assert average([1.0, 2.0, 3.0]) == 2.0\n"
-    "    assert average([0.0, 0.0]) == 0.0",
-
-    "def test_average():\n"
-    "    assert average([100, 0, -100]) == 0\n"
-    "    assert average([50, 50, -100]) == 0",
-
-    "def test_average():\n"
-    "    assert average([1e-9, 1e-9]) == 1e-9\n"
-    "    assert average([-1e-9, 1e-9]) == 0",
-
-    "def test_average():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average(None)",
-
-    "def test_average():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average(123)",
-
-    "def test_average():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average('abc')",
-
-    "def test_average():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average([1, '2', 3])",
-
-    "def test_average():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average([None, None])",
-
-    "def test_average():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average([[1], [2]])",
-
-    "def test_average():\n"
-    "    assert average([0, 1, 2, 3]) == 1.5\n"
-    "    assert average([3, 2, 1, 0]) == 1.5",
-
-    "def test_average():\n"
-    "    assert average([999999999, 1]) == 500000000\n"
-    "    assert average([-999999999, -1]) == -500000000",
-
-    "def test_average():\n"
-    "    assert average([2, 4, 6, 8]) == 5\n"
-    "    assert average([1, 3, 5, 7, 9]) == 5",
-
-    "def test_average():\n"
-    "    with pytest.raises(ZeroDivisionError):\n"
-    "        average(list())\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average([float('nan')])",
-
-    "def test_power():\n"
-    "    assert power(0, 0) == 1\n"
-    "    assert power(0, 5) == 0\n"
-    "    assert power(5, 0) == 1",
-
-    "def test_power():\n"
-    "    assert power(1, 1000) == 1\n"
-    "    assert power(-1, 2) == 1\n"
-    "    assert power(-1, 3) == -1",
-
-    "def test_power():\n"
-    "    assert power(2, 10) == 1024\n"
-    "    assert power(2, -1) == 0.5\n"
-    "    assert power(4, -2) == 0.0625",
-
-    "def test_power():\n"
-    "    assert power(-2, 2) == 4\n"
-    "    assert power(-2, 3) == -8\n"
-    "    assert power(-2, 0) == 1",
-
-    "def test_power():\n"
-    "    assert power(0.5, 2) == 0.25\n"
-    "    assert power(4, 0.5) == 2\n"
-    "    assert power(9, 0.5) == 3",
-
-    "def test_power():\n"
-    "    assert power(10, 1) == 10\n"
-    "    assert power(10, 2) == 100\n"
-    "    assert power(10, 3) == 1000",
-
-    "def test_power():\n"
-    "    assert power(True, 5) == 1\n"
-    "    assert power(False, 5) == 0\n"
-    "    assert power(True, 0) == 1",
-
-    "def test_power():\n"
-    "    assert power(5, True) == 5\n"
-    "    assert power(5, False) == 1\n"
-    "    assert power(0, True) == 0",
-
-    "def test_power():\n"
-    "    assert power(2.5, 2) == 6.25\n"
-    "    assert power(-2.5, 2) == 6.25\n"
-    "    assert power(-2.5, 3) == -15.625",
-
-    "def test_power():\n"
-    "    assert power(0.0, 5) == 0.0\n"
-    "    assert power(5.0, 0) == 1.0\n"
-    "    assert power(0.0, 0) == 1.0",
-
-    "def test_power():\n"
-    "    assert power(2, 31) == 2147483648\n"
-    "    assert power(2, 32) == 4294967296\n"
-    "    assert power(2, 33) == 8589934592",
-
-    "def test_power():\n"
-    "    assert power(-10, 1) == -10\n"
-    "    assert power(-10, 2) == 100\n"
-    "    assert power(-10, 3) == -1000",
-
-    "def test_power():\n"
-    "    assert power(100, -2) == 0.0001\n"
-    "    assert power(4, -0.5) == 0.5\n"
-    "    assert power(9, -0.5) == 1 / 3",
-
-    "def test_power():\n"
-    "    assert power(1, -999999) == 1\n"
-    "    assert power(1, 999999) == 1\n"
-    "    assert power(1, 0) == 1",
-
-    "def test_power():\n"
-    "    assert power(-1, 999999) == -1\n"
-    "    assert power(-1, 1000000) == 1\n"
-    "    assert power(-1, 0) == 1",
-
-    "def test_power():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        power('2', 3)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        power(2, '3')",
-
-    "def test_power():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        power(None, 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        power(2, None)",
-
-    "def test_power():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        power([2], 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        power(2, [2])",
-
-    "def test_power():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        power({}, 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        power(2, {})",
-
-    "def test_power():\n"
-    "    assert power(7, 1) == 7\n"
-    "    assert power(7, 2) == 49\n"
-    "    assert power(7, 3) == 343",
-
-    "def test_power():\n"
-    "    assert power(0, 1) == 0\n"
-    "    assert power(0, 2) == 0\n"
-    "    assert power(0, -1) == 0",
-
-    "def test_power():\n"
-    "    assert power(1e2, 2) == 10000.0\n"
-    "    assert power(1e-2, 2) == 0.0001\n"
-    "    assert power(1e2, -1) == 0.01",
-
-    "def test_power():\n"
-    "    assert power(3, 3) == 27\n"
-    "    assert power(3, 4) == 81\n"
-    "    assert power(3, 5) == 243",
-
-    "def test_power():\n"
-    "    assert power(-3, 4) == 81\n"
-    "    assert power(-3, 5) == -243\n"
-    "    assert power(-3, 6) == 729",
-
-    "def test_power():\n"
-    "    with pytest.raises(OverflowError):\n"
-    "        power(10, 10000)",
-
-    "def test_sort_list():\n"
-    "    assert sort_list([]) == []\n"
-    "    assert sort_list([1]) == [1]\n"
-    "    assert sort_list([2, 1]) == [1, 2]",
-
-    "def test_sort_list():\n"
-    "    assert sort_list([0, -1, 1]) == [-1, 0, 1]\n"
-    "    assert sort_list([-3, -1, -2]) == [-3, -2, -1]\n"
-    "    assert sort_list([0, 0, 0]) == [0, 0, 0]",
-
-    "def test_sort_list():\n"
-    "    assert sort_list([1, 1, 1]) == [1, 1, 1]\n"
-    "    assert sort_list([2, 1, 2, 1]) == [1, 1, 2, 2]\n"
-    "    assert sort_list([3, 3, 2, 3]) == [2, 3, 3, 3]",
-
-    "def test_sort_list():\n"
-    "    assert sort_list([10**12, -10**12, 0]) == [-10**12, 0, 10**12]\n"
-    "    assert sort_list([999999999, -999999999, 1]) == [-999999999, 1, 999999999]\n"
-    "    assert sort_list([2**63 - 1, -(2**63), 0]) == [-(2**63), 0, 2**63 - 1]",
-
-    "def test_sort_list():\n"
-    "    assert sort_list([0.0, -0.0, 0.0]) == [0.0, -0.0, 0.0] if False else sorted([0.0, -0.0, 0.0])\n"
-    "    assert sort_list([0.1, 0.01, 0.001]) == [0.001, 0.01, 0.1]\n"
-    "    assert sort_list([-0.5, -0.1, -0.9]) == [-0.9, -0.5, -0.1]",
-
-    "def test_sort_list():\n"
-    "    assert sort_list([float('inf'), 1.0, 0.0]) == [0.0, 1.0, float('inf')]\n"
-    "    assert sort_list([float('-inf'), 0.0, 1.0]) == [float('-inf'), 0.0, 1.0]\n"
-    "    assert sort_list([float('-inf'), float('inf'), 0.0]) == [float('-inf'), 0.0, float('inf')]",
-
-    "def test_sort_list():\n"
-    "    xs = [float('nan'), 1.0, 2.0]\n"
-    "    out = sort_list(xs)\n"
-    "    assert len(out) == 3\n"
-    "    assert 1.0 in out and 2.0 in out",
-
-    "def test_sort_list():\n"
-    "    assert sort_list([True, False, True]) == [False, True, True]\n"
-    "    assert sort_list([False, False]) == [False, False]\n"
-    "    assert sort_list([True]) == [True]",
-
-    "def test_sort_list():\n"
-    "    assert sort_list(['b', 'a', 'c']) == ['a', 'b', 'c']\n"
-    "    assert sort_list(['', 'a', ' ']) == ['', ' ', 'a']\n"
-    "    assert sort_list(['aa', 'a', 'aaa']) == ['a', 'aa', 'aaa']",
-
-    "def test_sort_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list([1, '1'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list([None, 1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list([object(), object()])",
-
-    "def test_sort_list():\n"
-    "    assert sort_list([(1, 2), (1, 1), (0, 5)]) == [(0, 5), (1, 1), (1, 2)]\n"
-    "    assert sort_list([(), (1,), (0,)]) == [(), (0,), (1,)]\n"
-    "    assert sort_list([(2, 0), (1, 99), (1, 2)]) == [(1, 2), (1, 99), (2, 0)]",
-
-    "def test_sort_list():\n"
-    "    assert sort_list([b'b', b'a', b'c']) == [b'a', b'b', b'c']\n"
-    "    assert sort_list([b'', b'a', b' ']) == [b'', b' ', b'a']\n"
-    "    assert sort_list([b'aa', b'a', b'aaa']) == [b'a', b'aa', b'aaa']",
-
-    "def test_sort_list():\n"
-    "    assert sort_list([[1, 2], [1, 1], [0]]) == [[0], [1, 1], [1, 2]]\n"
-    "    assert sort_list([[], [0], [0, 0]]) == [[], [0], [0, 0]]\n"
-    "    assert sort_list([[1], [1, 0], [1, 0, 0]]) == [[1], [1, 0], [1, 0, 0]]",
-
-    "def test_sort_list():\n"
-    "    assert sort_list(['A', 'a', 'B', 'b']) == ['A', 'B', 'a', 'b']\n"
-    "    assert sort_list(['Z', 'z', 'Y', 'y']) == ['Y', 'Z', 'y', 'z']\n"
-    "    assert sort_list(['Á', 'A', 'a']) == sorted(['Á', 'A', 'a'])",
-
-    "def test_sort_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list([1, '1'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list(['a', None])",
-
-    "def test_sort_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list([1, 2, [3]])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list([[1], 2])",
-
-    "def test_sort_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list([{'a': 1}, {'b': 2}])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list([{'a': 1}, 1])",
-
-    "def test_sort_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list([{1, 2}, {1}])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list([{1}, 1])",
-
-    "def test_sort_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list([complex(1, 2), complex(0, 1)])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list([complex(1, 0), 1])",
-
-    "def test_sort_list():\n"
-    "    xs = list(range(1000, -1, -1))\n"
-    "    out = sort_list(xs)\n"
-    "    assert out[0] == 0\n"
-    "    assert out[-1] == 1000\n"
-    "    assert len(out) == 1001",
-
-    "def test_sort_list():\n"
-    "    xs = [3, 1, 2]\n"
-    "    out = sort_list(xs)\n"
-    "    assert xs == [3, 1, 2]\n"
-    "    assert out == [1, 2, 3]",
-
-    "def test_sort_list():\n"
-    "    xs = ['b', 'a', 'c']\n"
-    "    out = sort_list(xs)\n"
-    "    assert xs == ['b', 'a', 'c']\n"
-    "    assert out == ['a', 'b', 'c']",
-
-    "def test_sort_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list(object())",
-
-    "def test_sort_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list('cba')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list(b'cba')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list((3, 2, 1))",
-
-    "def test_sort_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list([float('nan'), 'a'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list([None, None])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sort_list([1, None])",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('') == ''\n"
-    "    assert normalize_case('a') == 'A'\n"
-    "    assert normalize_case('A') == 'A'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('abc') == 'Abc'\n"
-    "    assert normalize_case('ABC') == 'Abc'\n"
-    "    assert normalize_case('aBC') == 'Abc'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case(' hello') == ' hello'\n"
-    "    assert normalize_case(' hello world') == ' hello world'\n"
-    "    assert normalize_case('  a') == '  a'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('hello world') == 'Hello world'\n"
-    "    assert normalize_case('HELLO WORLD') == 'Hello world'\n"
-    "    assert normalize_case('hELLO wORLD') == 'Hello world'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('1abc') == '1abc'\n"
-    "    assert normalize_case('123ABC') == '123abc'\n"
-    "    assert normalize_case('1AbC') == '1abc'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('!abc') == '!abc'\n"
-    "    assert normalize_case('#HELLO') == '#hello'\n"
-    "    assert normalize_case('?Test') == '?test'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('äbc') == 'Äbc'\n"
-    "    assert normalize_case('ÄBC') == 'Äbc'\n"
-    "    assert normalize_case('ßtest') == 'Sstest'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('😊abc') == '😊abc'\n"
-    "    assert normalize_case('😊ABC') == '😊abc'\n"
-    "    assert normalize_case('😊aBC') == '😊abc'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('\\nabc') == '\\nabc'\n"
-    "    assert normalize_case('\\tabc') == '\\tabc'\n"
-    "    assert normalize_case('\\nABC') == '\\nabc'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('a\\nb') == 'A\\nb'\n"
-    "    assert normalize_case('A\\nB') == 'A\\nb'\n"
-    "    assert normalize_case('a\\nB') == 'A\\nb'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case(' ') == ' '\n"
-    "    assert normalize_case('   ') == '   '\n"
-    "    assert normalize_case(' a ') == ' a '",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('z') == 'Z'\n"
-    "    assert normalize_case('Z') == 'Z'\n"
-    "    assert normalize_case('zZz') == 'Zzz'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('ñandú') == 'Ñandú'\n"
-    "    assert normalize_case('ÑANDÚ') == 'Ñandú'\n"
-    "    assert normalize_case('ñANDÚ') == 'Ñandú'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('ørlando') == 'Ørlando'\n"
-    "    assert normalize_case('ØRLANDO') == 'Ørlando'\n"
-    "    assert normalize_case('øRLANDO') == 'Ørlando'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('İstanbul') == 'İstanbul'\n"
-    "    assert normalize_case('istanbul') == 'Istanbul'\n"
-    "    assert normalize_case('ISTANBUL') == 'Istanbul'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('σigma') == 'Σigma'\n"
-    "    assert normalize_case('ΣIGMA') == 'Σigma'\n"
-    "    assert normalize_case('σIGMA') == 'Σigma'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('ǆungla') == 'ǅungla'\n"
-    "    assert normalize_case('ǅUNGLa') == 'ǅungla'\n"
-    "    assert normalize_case('ǆUNGLa') == 'ǅungla'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('mañana') == 'Mañana'\n"
-    "    assert normalize_case('MAÑANA') == 'Mañana'\n"
-    "    assert normalize_case('mAÑANA') == 'Mañana'",
-
-    "def test_normalize_case():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        normalize_case(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        normalize_case(123)",
-
-    "def test_normalize_case():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        normalize_case(['a'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        normalize_case({'a': 1})",
-
-    "def test_normalize_case():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        normalize_case(b'abc')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        normalize_case(bytearray(b'abc'))",
-
-    "def test_normalize_case():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        normalize_case(3.14)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        normalize_case(True)",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('x' * 1000) == 'X' + 'x' * 999\n"
-    "    assert normalize_case('X' * 1000) == 'X' + 'x' * 999",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('camelCase') == 'Camelcase'\n"
-    "    assert normalize_case('PascalCase') == 'Pascalcase'\n"
-    "    assert normalize_case('snake_case') == 'Snake_case'",
-
-    "def test_normalize_case():\n"
-    "    assert normalize_case('ümlaut') == 'Ümlaut'\n"
-    "    assert normalize_case('ÜMLAUT') == 'Ümlaut'\n"
-    "    assert normalize_case('üMLAUT') == 'Ümlaut'",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([]) == []\n"
-    "    assert prefix_sum([0]) == [0]\n"
-    "    assert prefix_sum([0, 0, 0]) == [0, 0, 0]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([1]) == [1]\n"
-    "    assert prefix_sum([1, 2]) == [1, 3]\n"
-    "    assert prefix_sum([1, 2, 3]) == [1, 3, 6]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([-1]) == [-1]\n"
-    "    assert prefix_sum([-1, -2]) == [-1, -3]\n"
-    "    assert prefix_sum([-1, -2, -3]) == [-1, -3, -6]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([10, -5, 2]) == [10, 5, 7]\n"
-    "    assert prefix_sum([-10, 5]) == [-10, -5]\n"
-    "    assert prefix_sum([5, -5]) == [5, 0]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([1e6]) == [1e6]\n"
-    "    assert prefix_sum([1e6, 1]) == [1e6, 1e6 + 1]\n"
-    "    assert prefix_sum([-1e6, 1e6]) == [-1e6, 0]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([0.5, 0.5]) == [0.5, 1.0]\n"
-    "    assert prefix_sum([-0.5, 0.2]) == [-0.5, -0.3]\n"
-    "    assert prefix_sum([0.1, 0.1, 0.1]) == [0.1, 0.2, 0.3]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([100, -100, 100]) == [100, 0, 100]\n"
-    "    assert prefix_sum([2, -4, 6]) == [2, -2, 4]\n"
-    "    assert prefix_sum([-5, 5, -5]) == [-5, 0, -5]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([999999999]) == [999999999]\n"
-    "    assert prefix_sum([-999999999]) == [-999999999]\n"
-    "    assert prefix_sum([1, -1, 1, -1]) == [1, 0, 1, 0]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([3, 3, 3]) == [3, 6, 9]\n"
-    "    assert prefix_sum([3, -3, 3]) == [3, 0, 3]\n"
-    "    assert prefix_sum([-3, 3, -3]) == [-3, 0, -3]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([1, 0, 0]) == [1, 1, 1]\n"
-    "    assert prefix_sum([0, 1, 0]) == [0, 1, 1]\n"
-    "    assert prefix_sum([0, 0, 1]) == [0, 0, 1]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([True, True, False]) == [1, 2, 2]\n"
-    "    assert prefix_sum([False, True]) == [0, 1]\n"
-    "    assert prefix_sum([True, False, True]) == [1, 1, 2]",
-
-    "def test_prefix_sum():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        prefix_sum(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        prefix_sum(123)",
-
-    "def test_prefix_sum():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        prefix_sum([1, 'a'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        prefix_sum(['1', 2])",
-
-    "def test_prefix_sum():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        prefix_sum([None])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        prefix_sum([1, None])",
-
-    "def test_prefix_sum():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        prefix_sum([[], []])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        prefix_sum([[1], [2]])",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([0, -1, -2, -3]) == [0, -1, -3, -6]\n"
-    "    assert prefix_sum([-5, 0, 5]) == [-5, -5, 0]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([1, -1, 2, -2, 3]) == [1, 0, 2, 0, 3]\n"
-    "    assert prefix_sum([-3, 3, -3, 3]) == [-3, 0, -3, 0]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([50, 50, 50]) == [50, 100, 150]\n"
-    "    assert prefix_sum([-50, -50, -50]) == [-50, -100, -150]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([7]) == [7]\n"
-    "    assert prefix_sum([-7]) == [-7]\n"
-    "    assert prefix_sum([7, -7]) == [7, 0]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([2, 2, 2, 2]) == [2, 4, 6, 8]\n"
-    "    assert prefix_sum([2, -2, -2]) == [2, 0, -2]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([0, 1, -1, 1, -1]) == [0, 1, 0, 1, 0]\n"
-    "    assert prefix_sum([5, -5, 0]) == [5, 0, 0]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([10, -10, 10, -10]) == [10, 0, 10, 0]\n"
-    "    assert prefix_sum([-10, 10, -10, 10]) == [-10, 0, -10, 0]",
-
-    "def test_prefix_sum():\n"
-    "    assert prefix_sum([1.5, -0.5, 2.0]) == [1.5, 1.0, 3.0]\n"
-    "    assert prefix_sum([-0.1, -0.1, -0.1]) == [-0.1, -0.2, -0.3]",
-
-    "def test_prefix_sum():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        prefix_sum('123')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        prefix_sum({'a': 1})",
-
-    "def test_prefix_sum():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        prefix_sum([1, 2, '3'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        prefix_sum([True, 'False'])",
-
-    "def test_factorial_recursive():\n"
-    "    assert factorial_recursive(0) == 1\n"
-    "    assert factorial_recursive(1) == 1\n"
-    "    assert factorial_recursive(2) == 2",
-
-    "def test_factorial_recursive():\n"
-    "    assert factorial_recursive(3) == 6\n"
-    "    assert factorial_recursive(4) == 24\n"
-    "    assert factorial_recursive(5) == 120",
-
-    "def test_factorial_recursive():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        factorial_recursive(-1)\n"
-    "    with pytest.raises(ValueError):\n"
-    "        factorial_recursive(-10)\n"
-    "    with pytest.raises(ValueError):\n"
-    "        factorial_recursive(-999)",
-
-    "def test_factorial_recursive():\n"
-    "    assert factorial_recursive(True) == 1\n"
-    "    assert factorial_recursive(False) == 1\n"
-    "    assert factorial_recursive(6) == 720",
-
-    "def test_factorial_recursive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive(2.5)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive('5')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive(None)",
-
-    "def test_factorial_recursive():\n"
-    "    assert factorial_recursive(7) == 5040\n"
-    "    assert factorial_recursive(8) == 40320\n"
-    "    assert factorial_recursive(9) == 362880",
-
-    "def test_factorial_recursive():\n"
-    "    assert factorial_recursive(10) == 3628800\n"
-    "    assert factorial_recursive(11) == 39916800\n"
-    "    assert factorial_recursive(12) == 479001600",
-
-    "def test_factorial_recursive():\n"
-    "    assert factorial_recursive(13) == 6227020800\n"
-    "    assert factorial_recursive(14) == 87178291200\n"
-    "    assert factorial_recursive(15) == 1307674368000",
-
-    "def test_factorial_recursive():\n"
-    "    with pytest.raises(RecursionError):\n"
-    "        factorial_recursive(5000)\n"
-    "    with pytest.raises(RecursionError):\n"
-    "        factorial_recursive(10000)\n"
-    "    with pytest.raises(RecursionError):\n"
-    "        factorial_recursive(20000)",
-
-    "def test_factorial_recursive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive([5])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive({'n': 5})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive(object())",
-
-    "def test_factorial_recursive():\n"
-    "    assert factorial_recursive(16) == 20922789888000\n"
-    "    assert factorial_recursive(17) == 355687428096000\n"
-    "    assert factorial_recursive(18) == 6402373705728000",
-
-    "def test_factorial_recursive():\n"
-    "    assert factorial_recursive(19) == 121645100408832000\n"
-    "    assert factorial_recursive(20) == 2432902008176640000\n"
-    "    assert factorial_recursive(21) == 51090942171709440000",
-
-    "def test_factorial_recursive():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        factorial_recursive(-0.1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive(float('nan'))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive(float('inf'))",
-
-    "def test_factorial_recursive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive(1+2j)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive(b'3')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive(bytearray(b'4'))",
-
-    "def test_factorial_recursive():\n"
-    "    assert factorial_recursive(25) == 15511210043330985984000000\n"
-    "    assert factorial_recursive(26) == 403291461126605635584000000\n"
-    "    assert factorial_recursive(27) == 10888869450418352160768000000",
-
-    "def test_factorial_recursive():\n"
-    "    assert factorial_recursive(28) == 304888344611713860501504000000\n"
-    "    assert factorial_recursive(29) == 8841761993739701954543616000000\n"
-    "    assert factorial_recursive(30) == 265252859812191058636308480000000",
-
-    "def test_factorial_recursive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive('')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive('0')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive('01')",
-
-    "def test_factorial_recursive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive((5,))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive({5})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive(range(5))",
-
-    "def test_factorial_recursive():\n"
-    "    assert factorial_recursive(31) == 8222838654177922817725562880000000\n"
-    "    assert factorial_recursive(32) == 263130836933693530167218012160000000\n"
-    "    assert factorial_recursive(33) == 8683317618811886495518194401280000000",
-
-    "def test_factorial_recursive():\n"
-    "    assert factorial_recursive(34) == 295232799039604140847618609643520000000\n"
-    "    assert factorial_recursive(35) == 10333147966386144929666651337523200000000\n"
-    "    assert factorial_recursive(36) == 371993326789901217467999448150835200000000",
-
-    "def test_factorial_recursive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive('5.0')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive(' 5 ')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive('five')",
-
-    "def test_factorial_recursive():\n"
-    "    assert factorial_recursive(37) == 13763753091226345046315979581580902400000000\n"
-    "    assert factorial_recursive(38) == 523022617466601111760007224100074291200000000\n"
-    "    assert factorial_recursive(39) == 20397882081197443358640281739902897356800000000",
-
-    "def test_factorial_recursive():\n"
-    "    assert factorial_recursive(40) == 815915283247897734345611269596115894272000000000\n"
-    "    assert factorial_recursive(41) == 33452526613163807108170062053440751665152000000000\n"
-    "    assert factorial_recursive(42) == 1405006117752879898543142606244511569936384000000000",
-
-    "def test_factorial_recursive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive('٣')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive('５')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive('Ⅳ')",
-
-    "def test_factorial_recursive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive(Decimal('5'))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive(Fraction(5, 1))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        factorial_recursive(Fraction(1, 2))",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('', ',') == ['']\n"
-    "    assert split_and_strip('a,b,c', ',') == ['a','b','c']\n"
-    "    assert split_and_strip(' a , b , c ', ',') == ['a','b','c']",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('a,,b', ',') == ['a','','b']\n"
-    "    assert split_and_strip(',a,b,', ',') == ['','a','b','']\n"
-    "    assert split_and_strip(',,', ',') == ['','','']",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip(' one | two | three ', '|') == ['one','two','three']\n"
-    "    assert split_and_strip('one|two|three', '|') == ['one','two','three']\n"
-    "    assert split_and_strip(' one| two|three ', '|') == ['one','two','three']",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('a;b;c', ';') == ['a','b','c']\n"
-    "    assert split_and_strip(' a ; b ; c ', ';') == ['a','b','c']\n"
-    "    assert split_and_strip('a ;b; c', ';') == ['a','b','c']",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('x y z', ' ') == ['x','y','z']\n"
-    "    assert split_and_strip('  x   y  z  ', ' ') == ['','', 'x','','','y','','z','','']\n"
-    "    assert split_and_strip('x', ' ') == ['x']",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('\\n a \\n b \\n', '\\n') == ['','a','b','']\n"
-    "    assert split_and_strip('a\\nb\\nc', '\\n') == ['a','b','c']\n"
-    "    assert split_and_strip('\\n\\n', '\\n') == ['','','']",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('😊 , 😃 , 😄 ', ',') == ['😊','😃','😄']\n"
-    "    assert split_and_strip('😊|😃|😄', '|') == ['😊','😃','😄']\n"
-    "    assert split_and_strip(' 😊 ', ',') == ['😊']",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('a| b |c| ', '|') == ['a','b','c','']\n"
-    "    assert split_and_strip('|a|b|c', '|') == ['','a','b','c']\n"
-    "    assert split_and_strip('|', '|') == ['','']",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('1, 2 ,3 , 4', ',') == ['1','2','3','4']\n"
-    "    assert split_and_strip('1|2|3', '|') == ['1','2','3']\n"
-    "    assert split_and_strip(' 1 ', ',') == ['1']",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('a\\tb\\tc', '\\t') == ['a','b','c']\n"
-    "    assert split_and_strip(' a\\t b \\t c ', '\\t') == ['a','b','c']\n"
-    "    assert split_and_strip('\\t', '\\t') == ['','']",
-
-    "def test_split_and_strip():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        split_and_strip(None, ',')\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        split_and_strip(123, ',')\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        split_and_strip(['a,b'], ',')",
-
-    "def test_split_and_strip():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        split_and_strip('a,b,c', None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        split_and_strip('abc', 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        split_and_strip('abc', [])",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('a--b--c', '--') == ['a','b','c']\n"
-    "    assert split_and_strip('--a--b--', '--') == ['','a','b','']\n"
-    "    assert split_and_strip('----', '--') == ['','','']",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('a,b, c ,d ', ',') == ['a','b','c','d']\n"
-    "    assert split_and_strip(' a ,b,c,d', ',') == ['a','b','c','d']\n"
-    "    assert split_and_strip('a,b,c,d ', ',') == ['a','b','c','d']",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('mixed CASE , Test ', ',') == ['mixed CASE','Test']\n"
-    "    assert split_and_strip('UPPER|lower', '|') == ['UPPER','lower']\n"
-    "    assert split_and_strip(' MiXeD ', ',') == ['MiXeD']",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('a,b,,', ',') == ['a','b','','']\n"
-    "    assert split_and_strip(',,a,b', ',') == ['','','a','b']\n"
-    "    assert split_and_strip('', '|') == ['']",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip(' word ', ',') == ['word']\n"
-    "    assert split_and_strip(' word | ', '|') == ['word','']\n"
-    "    assert split_and_strip(' | word', '|') == ['','word']",
-
-    "def test_split_and_strip():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        split_and_strip(object(), ',')\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        split_and_strip(b'a,b,c', ',')\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        split_and_strip(True, ',')",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('a,b,c', ',') == ['a','b','c']\n"
-    "    assert split_and_strip('a|b|c', '|') == ['a','b','c']\n"
-    "    assert split_and_strip('a:b:c', ':') == ['a','b','c']",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('  spaced  out  ', ' ') == ['','','spaced','','out','','']\n"
-    "    assert split_and_strip(' spaced ', ' ') == ['','spaced','']\n"
-    "    assert split_and_strip(' ', ' ') == ['','']",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('α, β , γ', ',') == ['α','β','γ']\n"
-    "    assert split_and_strip('λ|μ|ν', '|') == ['λ','μ','ν']\n"
-    "    assert split_and_strip(' Ω ', ',') == ['Ω']",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('end.', '.') == ['end','']\n"
-    "    assert split_and_strip('.start', '.') == ['','start']\n"
-    "    assert split_and_strip('.', '.') == ['','']",
-
-    "def test_split_and_strip():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        split_and_strip('a,b,c', sep=',') if False else split_and_strip('a,b,c', sep=1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        split_and_strip('abc', sep=None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        split_and_strip('abc', sep={})",
-
-    "def test_split_and_strip():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        split_and_strip('abc', ('a',))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        split_and_strip('a,b,c', 3.14)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        split_and_strip('a,b,c', True)",
-
-    "def test_split_and_strip():\n"
-    "    assert split_and_strip('🔥 ,  💧 , 🌱 ', ',') == ['🔥','💧','🌱']\n"
-    "    assert split_and_strip('🔥|💧|🌱', '|') == ['🔥','💧','🌱']\n"
-    "    assert split_and_strip('  🔥  ', ',') == ['🔥']",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists([], []) == []\n"
-    "    assert interleave_lists([], [1,2,3]) == []\n"
-    "    assert interleave_lists([1,2,3], []) == []",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists([1], [2]) == [1,2]\n"
-    "    assert interleave_lists([1,2], [3,4]) == [1,3,2,4]\n"
-    "    assert interleave_lists([0,0], [1,1]) == [0,1,0,1]",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists([1,2,3], [9]) == [1,9]\n"
-    "    assert interleave_lists([1], [9,8,7]) == [1,9]\n"
-    "    assert interleave_lists([1,2], [9,8,7]) == [1,9,2,8]",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists([None, 1], [2, None]) == [None,2,1,None]\n"
-    "    assert interleave_lists([None], [None]) == [None,None]\n"
-    "    assert interleave_lists([None, None], [1]) == [None,1]",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists([True, False], [1, 0]) == [True,1,False,0]\n"
-    "    assert interleave_lists([False], [True]) == [False,True]\n"
-    "    assert interleave_lists([True, True], [False, False]) == [True,False,True,False]",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists(['', 'a'], ['b', '']) == ['', 'b', 'a', '']\n"
-    "    assert interleave_lists(['   '], ['x']) == ['   ','x']\n"
-    "    assert interleave_lists(['\\n'], ['\\t']) == ['\\n','\\t']",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists(['😊'], ['😃']) == ['😊','😃']\n"
-    "    assert interleave_lists(['😊','a'], ['b','😊']) == ['😊','b','a','😊']\n"
-    "    assert interleave_lists(['😀','😃','😁'], ['x','y']) == ['😀','x','😃','y']",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists([(1,2)], [(3,4)]) == [(1,2),(3,4)]\n"
-    "    assert interleave_lists([(1,)], [(2,)]) == [(1,),(2,)]\n"
-    "    assert interleave_lists([(1,2),(3,4)], [(0,0)]) == [(1,2),(0,0)]",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists([[1],[2]], [[3],[4]]) == [[1],[3],[2],[4]]\n"
-    "    assert interleave_lists([[],[1]], [[2],[]]) == [[],[2],[1],[]]\n"
-    "    assert interleave_lists([[1,2,3]], [[4,5]]) == [[1,2,3],[4,5]]",
-
-    "def test_interleave_lists():\n"
-    "    a = [1,2]\n"
-    "    b = a\n"
-    "    assert interleave_lists([a], [b]) == [a,b]\n"
-    "    assert interleave_lists([a,a], [b,b]) == [a,b,a,b]\n"
-    "    assert interleave_lists([[1],[1]], [[1],[1]]) == [[1],[1],[1],[1]]",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists([1.5, -0.5], [2.5, 0.5]) == [1.5,2.5,-0.5,0.5]\n"
-    "    assert interleave_lists([0.1, 0.2], [0.3]) == [0.1,0.3]\n"
-    "    assert interleave_lists([float('inf')], [1]) == [float('inf'),1]",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists([float('nan')], [0]) != [float('nan'),0]\n"
-    "    assert interleave_lists([0], [float('nan')]) != [0,float('nan')]\n"
-    "    assert interleave_lists([float('nan')], [float('nan')]) != [float('nan'),float('nan')]",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists([10**12, -10**12], [1, -1]) == [10**12,1,-10**12,-1]\n"
-    "    assert interleave_lists([2**31], [-(2**31)]) == [2**31, -(2**31)]\n"
-    "    assert interleave_lists([0, 10**9, 10**9], [1, 2]) == [0,1,10**9,2]",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists([{'a':1}], [{'b':2}]) == [{'a':1},{'b':2}]\n"
-    "    assert interleave_lists([{}], [{}]) == [{},{}]\n"
-    "    assert interleave_lists([{'x':0},{'y':1}], [{'z':2}]) == [{'x':0},{'z':2}]",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists([set([1]), set([2])], [set([3]), set([4])]) == [set([1]),set([3]),set([2]),set([4])]\n"
-    "    assert interleave_lists([set()], [set()]) == [set(), set()]\n"
-    "    assert interleave_lists([set([1,2])], [set([3])]) == [set([1,2]), set([3])]",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists(range(3), range(3)) == [0,0,1,1,2,2]\n"
-    "    assert interleave_lists(range(0), range(5)) == []\n"
-    "    assert interleave_lists(range(5), range(0)) == []",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists('ab', 'XY') == ['a','X','b','Y']\n"
-    "    assert interleave_lists('a', 'XYZ') == ['a','X']\n"
-    "    assert interleave_lists('', 'Z') == []",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists((1,2), (3,4)) == [1,3,2,4]\n"
-    "    assert interleave_lists((1,2,3), (9,)) == [1,9]\n"
-    "    assert interleave_lists((), ()) == []",
-
-    "def test_interleave_lists():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        interleave_lists(None, [])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        interleave_lists([], None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        interleave_lists(None, None)",
-
-    "def test_interleave_lists():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        interleave_lists(123, [1,2])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        interleave_lists([1,2], 123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        interleave_lists(object(), object())",
-
-    "def test_interleave_lists():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        interleave_lists([1,2], 3.14)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        interleave_lists(3.14, [1,2])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        interleave_lists('ab', None)",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists([1,2,3], [4,5,6]) == [1,4,2,5,3,6]\n"
-    "    assert interleave_lists([1,2,3,4], [9,8,7]) == [1,9,2,8,3,7]\n"
-    "    assert interleave_lists([0], [0,0,0,0]) == [0,0]",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists([[], []], [[], []]) == [[],[],[],[]]\n"
-    "    assert interleave_lists([[[]]], [[1]]) == [[[]],[1]]\n"
-    "    assert interleave_lists([[1],[2],[3]], [[4]]) == [[1],[4]]",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists(['a\\n', 'b\\t'], ['x\\t', 'y\\n']) == ['a\\n','x\\t','b\\t','y\\n']\n"
-    "    assert interleave_lists(['\\0'], ['\\0']) == ['\\0','\\0']\n"
-    "    assert interleave_lists([' '], ['\\n']) == [' ','\\n']",
-
-    "def test_interleave_lists():\n"
-    "    assert interleave_lists([1, -1, 1], [0, 0, 0]) == [1,0,-1,0,1,0]\n"
-    "    assert interleave_lists([1,2,3], [0,0]) == [1,0,2,0]\n"
-    "    assert interleave_lists([0,0], [1,2,3]) == [0,1,0,2]",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([]) is None\n"
-    "    assert second_largest([1]) is None\n"
-    "    assert second_largest([1,1,1]) is None",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([1,2]) == 1\n"
-    "    assert second_largest([2,1]) == 1\n"
-    "    assert second_largest([1,2,3]) == 2",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([3,3,2,2,1]) == 2\n"
-    "    assert second_largest([5,5,5,4]) == 4\n"
-    "    assert second_largest([0,0,0,-1]) == 0",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([-1,-2,-3]) == -2\n"
-    "    assert second_largest([-10,-5,-1]) == -5\n"
-    "    assert second_largest([-1,-1,-2]) == -2",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([0,1,0]) == 0\n"
-    "    assert second_largest([0,0,1]) == 0\n"
-    "    assert second_largest([1,0,0]) == 0",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([10**9, 1, 10**8]) == 10**8\n"
-    "    assert second_largest([10**12, 10**12-1]) == 10**12-1\n"
-    "    assert second_largest([1,10**6,10**6]) == 1",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([1.5, 2.5, 3.5]) == 2.5\n"
-    "    assert second_largest([0.1, 0.1, 0.2]) == 0.1\n"
-    "    assert second_largest([-1.1, -2.2, -3.3]) == -2.2",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([True, False]) == False\n"
-    "    assert second_largest([True, True, False]) == False\n"
-    "    assert second_largest([False, False]) is None",
-
-    "def test_second_largest():\n"
-    "    assert second_largest(['a','b','c']) == 'b'\n"
-    "    assert second_largest(['z','y','x']) == 'y'\n"
-    "    assert second_largest(['a','a','b']) == 'a'",
-
-    "def test_second_largest():\n"
-    "    assert second_largest(['apple','banana','cherry']) == 'banana'\n"
-    "    assert second_largest(['aa','aaa','a']) == 'aa'\n"
-    "    assert second_largest(['same','same']) is None",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([(), (1,), (2,)]) == (1,)\n"
-    "    assert second_largest([(1,2),(1,1),(1,3)]) == (1,2)\n"
-    "    assert second_largest([(),()]) is None",
-
-    "def test_second_largest():\n"
-    "    assert second_largest(['😊','😀','😃']) == '😃'\n"
-    "    assert second_largest(['😀','😀','😃']) == '😀'\n"
-    "    assert second_largest(['😊']) is None",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([1,2,2,3,3]) == 2\n"
-    "    assert second_largest([5,4,4,4]) == 4\n"
-    "    assert second_largest([9,8,9,8]) == 8",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([0,-1,-2,-3]) == -1\n"
-    "    assert second_largest([-100,0,100]) == 0\n"
-    "    assert second_largest([1,-1]) == -1",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([1e-9, 1e-10]) == 1e-10\n"
-    "    assert second_largest([1e3, 1e3, 1e2]) == 1e2\n"
-    "    assert second_largest([0.0, -0.0]) is None",
-
-    "def test_second_largest():\n"
-    "    assert second_largest(range(5)) == 3\n"
-    "    assert second_largest(range(2)) == 0\n"
-    "    assert second_largest(range(1)) is None",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([b'a', b'b', b'c']) == b'b'\n"
-    "    assert second_largest([b'z', b'z', b'y']) == b'y'\n"
-    "    assert second_largest([b'a']) is None",
-
-    "def test_second_largest():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        second_largest(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        second_largest(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        second_largest('abc')",
-
-    "def test_second_largest():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        second_largest([1,'a'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        second_largest([{},1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        second_largest([[],[1]])",
-
-    "def test_second_largest():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        second_largest([1, None])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        second_largest([float('nan'), 1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        second_largest([object(), object()])",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([10,9,8,7]) == 9\n"
-    "    assert second_largest([7,8,9,10]) == 9\n"
-    "    assert second_largest([9,10,10]) == 9",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([1,1,2,3,4]) == 3\n"
-    "    assert second_largest([4,3,2,1,1]) == 3\n"
-    "    assert second_largest([2,2,3,3]) == 2",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([100,50,50,25]) == 50\n"
-    "    assert second_largest([5,10,15]) == 10\n"
-    "    assert second_largest([42]) is None",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([1,2,3,4,5]) == 4\n"
-    "    assert second_largest([5,4,3,2,1]) == 4\n"
-    "    assert second_largest([2,1,2]) == 1",
-
-    "def test_second_largest():\n"
-    "    assert second_largest([0,0,1,1,2,2]) == 1\n"
-    "    assert second_largest([3,3,3,2]) == 2\n"
-    "    assert second_largest([1,1]) is None",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({}) == {}\n"
-    "    assert invert_dict({'a': 1}) == {1: 'a'}\n"
-    "    assert invert_dict({1: 'a'}) == {'a': 1}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({'a': 1, 'b': 2}) == {1: 'a', 2: 'b'}\n"
-    "    assert invert_dict({1: 2, 3: 4}) == {2: 1, 4: 3}\n"
-    "    assert invert_dict({'x': 'y'}) == {'y': 'x'}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({0: False}) == {False: 0}\n"
-    "    assert invert_dict({True: 1}) == {1: True}\n"
-    "    assert invert_dict({False: 0}) == {0: False}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({'a': None}) == {None: 'a'}\n"
-    "    assert invert_dict({None: 'x'}) == {'x': None}\n"
-    "    assert invert_dict({None: None}) == {None: None}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({'a': 1, 'b': 1}) == {1: 'b'}\n"
-    "    assert invert_dict({1: 'x', 2: 'x'}) == {'x': 2}\n"
-    "    assert invert_dict({'x': 'y', 'z': 'y'}) == {'y': 'z'}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({'a': 1, 'b': 2, 'c': 1}) == {1: 'c', 2: 'b'}\n"
-    "    assert invert_dict({1: 2, 3: 2, 5: 6}) == {2: 3, 6: 5}\n"
-    "    assert invert_dict({'k': 0, 'v': 0}) == {0: 'v'}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({'😊': 1}) == {1: '😊'}\n"
-    "    assert invert_dict({1: '😊'}) == {'😊': 1}\n"
-    "    assert invert_dict({'😀': '😃'}) == {'😃': '😀'}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({1.1: 2.2}) == {2.2: 1.1}\n"
-    "    assert invert_dict({0.0: 0.0}) == {0.0: 0.0}\n"
-    "    assert invert_dict({-1.5: 3.5}) == {3.5: -1.5}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({(1, 2): 'a'}) == {'a': (1, 2)}\n"
-    "    assert invert_dict({'x': (1, 2)}) == {(1, 2): 'x'}\n"
-    "    assert invert_dict({(): 'empty'}) == {'empty': ()}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({1: True, 2: False}) == {True: 1, False: 2}\n"
-    "    assert invert_dict({True: 'yes', False: 'no'}) == {'yes': True, 'no': False}\n"
-    "    assert invert_dict({True: True}) == {True: True}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({'a': 'b', 'c': 'd'}) == {'b': 'a', 'd': 'c'}\n"
-    "    assert invert_dict({'aa': 'bb'}) == {'bb': 'aa'}\n"
-    "    assert invert_dict({'': 'x'}) == {'x': ''}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({'a': 1, 'b': 2, 'c': 3}) == {1: 'a', 2: 'b', 3: 'c'}\n"
-    "    assert invert_dict({10: 20, 30: 40}) == {20: 10, 40: 30}\n"
-    "    assert invert_dict({'x': 0}) == {0: 'x'}",
-
-    "def test_invert_dict():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        invert_dict(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        invert_dict(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        invert_dict('abc')",
-
-    "def test_invert_dict():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        invert_dict([('a', 1)])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        invert_dict((('a', 1),))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        invert_dict({['a']: 1})",
-
-    "def test_invert_dict():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        invert_dict({'a': []})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        invert_dict({'a': {}})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        invert_dict({'a': set()})",
-
-    "def test_invert_dict():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        invert_dict({1: {2}})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        invert_dict({1: object()})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        invert_dict({object(): 1})",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({'a': 1, 'b': 2, 'a': 3}) == {3: 'a', 2: 'b'}\n"
-    "    assert invert_dict({1: 'x', 1: 'y'}) == {'y': 1}\n"
-    "    assert invert_dict({'k': 'v', 'k': 'z'}) == {'z': 'k'}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({'a': 1, 'b': 1, 'c': 1}) == {1: 'c'}\n"
-    "    assert invert_dict({1: 2, 2: 2, 3: 2}) == {2: 3}\n"
-    "    assert invert_dict({'x': 'y', 'z': 'y', 'w': 'y'}) == {'y': 'w'}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({0: 0, 1: 1}) == {0: 0, 1: 1}\n"
-    "    assert invert_dict({-1: -2, -3: -4}) == {-2: -1, -4: -3}\n"
-    "    assert invert_dict({10**6: 1}) == {1: 10**6}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({'a': 1, 'b': 2, 'c': 2}) == {1: 'a', 2: 'c'}\n"
-    "    assert invert_dict({'x': 9, 'y': 8, 'z': 9}) == {9: 'z', 8: 'y'}\n"
-    "    assert invert_dict({'one': 1, 'two': 2, 'uno': 1}) == {1: 'uno', 2: 'two'}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({True: 1, False: 0}) == {1: True, 0: False}\n"
-    "    assert invert_dict({1: True, 0: False}) == {True: 1, False: 0}\n"
-    "    assert invert_dict({False: False}) == {False: False}",
-
-    "def test_invert_dict():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        invert_dict({'a': [1, 2]})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        invert_dict({'b': {'x': 1}})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        invert_dict({'c': set([1])})",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({None: 1, 'a': 2}) == {1: None, 2: 'a'}\n"
-    "    assert invert_dict({1: None, 2: 'a'}) == {None: 1, 'a': 2}\n"
-    "    assert invert_dict({None: None, 'x': None}) == {None: 'x'}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({'a': True, 'b': True}) == {True: 'b'}\n"
-    "    assert invert_dict({True: 'a', False: 'a'}) == {'a': False}\n"
-    "    assert invert_dict({True: 1, False: 1}) == {1: False}",
-
-    "def test_invert_dict():\n"
-    "    assert invert_dict({'long_key_name': 'v'}) == {'v': 'long_key_name'}\n"
-    "    assert invert_dict({'k1': 'v1', 'k2': 'v2'}) == {'v1': 'k1', 'v2': 'k2'}\n"
-    "    assert invert_dict({'x': 'y', 'y': 'x'}) == {'y': 'x', 'x': 'y'}",
-
-    "def test_clamp():\n"
-    "    assert clamp(5, 0, 10) == 5\n"
-    "    assert clamp(-1, 0, 10) == 0\n"
-    "    assert clamp(11, 0, 10) == 10",
-
-    "def test_clamp():\n"
-    "    assert clamp(0, 0, 0) == 0\n"
-    "    assert clamp(1, 1, 1) == 1\n"
-    "    assert clamp(-1, -1, -1) == -1",
-
-    "def test_clamp():\n"
-    "    assert clamp(0, -5, 5) == 0\n"
-    "    assert clamp(-10, -5, 5) == -5\n"
-    "    assert clamp(10, -5, 5) == 5",
-
-    "def test_clamp():\n"
-    "    assert clamp(5.5, 0.0, 10.0) == 5.5\n"
-    "    assert clamp(-1.5, 0.0, 10.0) == 0.0\n"
-    "    assert clamp(11.1, 0.0, 10.0) == 10.0",
-
-    "def test_clamp():\n"
-    "    assert clamp(True, 0, 1) == 1\n"
-    "    assert clamp(False, 0, 1) == 0\n"
-    "    assert clamp(True, False, True) == True",
-
-    "def test_clamp():\n"
-    "    assert clamp(0, -1, 1) == 0\n"
-    "    assert clamp(-1, -1, 1) == -1\n"
-    "    assert clamp(1, -1, 1) == 1",
-
-    "def test_clamp():\n"
-    "    assert clamp(100, 0, 50) == 50\n"
-    "    assert clamp(-100, -50, 50) == -50\n"
-    "    assert clamp(25, 0, 50) == 25",
-
-    "def test_clamp():\n"
-    "    assert clamp(1e9, 0, 1e8) == 1e8\n"
-    "    assert clamp(-1e9, -1e8, 1e8) == -1e8\n"
-    "    assert clamp(0.0, -1e-3, 1e-3) == 0.0",
-
-    "def test_clamp():\n"
-    "    assert clamp(-0.0, 0.0, 1.0) == 0.0\n"
-    "    assert clamp(0.0, 0.0, 0.0) == 0.0\n"
-    "    assert clamp(1.0, 1.0, 1.0) == 1.0",
-
-    "def test_clamp():\n"
-    "    assert clamp(5, 10, 0) == 10\n"
-    "    assert clamp(-5, 10, 0) == 10\n"
-    "    assert clamp(15, 10, 0) == 10",
-
-    "def test_clamp():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        clamp('5', 0, 10)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        clamp(5, '0', 10)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        clamp(5, 0, '10')",
-
-    "def test_clamp():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        clamp(None, 0, 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        clamp(1, None, 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        clamp(1, 0, None)",
-
-    "def test_clamp():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        clamp([1], 0, 10)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        clamp(1, [0], 10)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        clamp(1, 0, [10])",
-
-    "def test_clamp():\n"
-    "    assert clamp(-5, -10, -1) == -5\n"
-    "    assert clamp(-15, -10, -1) == -10\n"
-    "    assert clamp(0, -10, -1) == -1",
-
-    "def test_clamp():\n"
-    "    assert clamp(2.5, 2.5, 2.5) == 2.5\n"
-    "    assert clamp(2.4, 2.5, 2.5) == 2.5\n"
-    "    assert clamp(2.6, 2.5, 2.5) == 2.5",
-
-    "def test_clamp():\n"
-    "    assert clamp(1, -1, True) == True\n"
-    "    assert clamp(0, False, True) == 0\n"
-    "    assert clamp(-1, False, True) == False",
-
-    "def test_clamp():\n"
-    "    assert clamp(5, -float('inf'), float('inf')) == 5\n"
-    "    assert clamp(-1e9, -float('inf'), 0) == -1e9\n"
-    "    assert clamp(1e9, 0, float('inf')) == 1e9",
-
-    "def test_clamp():\n"
-    "    assert clamp(0, -0.0, 0.0) == 0.0\n"
-    "    assert clamp(-0.0, -0.0, 0.0) == 0.0\n"
-    "    assert clamp(0.0, -0.0, 0.0) == 0.0",
-
-    "def test_clamp():\n"
-    "    assert clamp(999999999999, 0, 999999999998) == 999999999998\n"
-    "    assert clamp(-999999999999, -999999999998, 0) == -999999999998\n"
-    "    assert clamp(1, -999999999998, 999999999998) == 1",
-
-    "def test_clamp():\n"
-    "    assert clamp(3, 3, 5) == 3\n"
-    "    assert clamp(5, 3, 5) == 5\n"
-    "    assert clamp(4, 3, 5) == 4",
-
-    "def test_clamp():\n"
-    "    assert clamp(3, 5, 3) == 5\n"
-    "    assert clamp(4, 5, 3) == 5\n"
-    "    assert clamp(6, 5, 3) == 5",
-
-    "def test_clamp():\n"
-    "    assert clamp(1e-9, 0.0, 1e-8) == 1e-9\n"
-    "    assert clamp(-1e-9, 0.0, 1e-8) == 0.0\n"
-    "    assert clamp(1e-7, 0.0, 1e-8) == 1e-8",
-
-    "def test_clamp():\n"
-    "    assert clamp(42, 42, 100) == 42\n"
-    "    assert clamp(100, 42, 100) == 100\n"
-    "    assert clamp(101, 42, 100) == 100",
-
-    "def test_clamp():\n"
-    "    assert clamp(0, -1, 0) == 0\n"
-    "    assert clamp(-1, -1, 0) == -1\n"
-    "    assert clamp(1, -1, 0) == 0",
-
-    "def test_clamp():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        clamp(object(), 0, 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        clamp(1, object(), 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        clamp(1, 0, object())",
-
-    "def test_list_difference():\n"
-    "    assert list_difference([], []) == []\n"
-    "    assert list_difference([], [1, 2]) == []\n"
-    "    assert list_difference([1, 2], []) == [1, 2]\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference([1, 2, 3], [1, 2, 3]) == []\n"
-    "    assert list_difference([1, 2, 3], [3]) == [1, 2]\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference([-1, -2, -3], [-2]) == [-1, -3]\n"
-    "    assert list_difference([-1, -1], [-1]) == []\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference([0, 1, 2], [0]) == [1, 2]\n"
-    "    assert list_difference([0, 0, 0], [0]) == []\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference(['a', 'b', 'c'], ['b']) == ['a', 'c']\n"
-    "    assert list_difference(['a', 'a'], ['a']) == []\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference(['A', 'a'], ['a']) == ['A']\n"
-    "    assert list_difference(['a', 'A'], ['A']) == ['a']\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference([True, False], [True]) == [False]\n"
-    "    assert list_difference([False, False], [False]) == []\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference([1.0, 2.0, 3.0], [2.0]) == [1.0, 3.0]\n"
-    "    assert list_difference([1.1, 1.1], [1.1]) == []\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference([None, 1, None], [None]) == [1]\n"
-    "    assert list_difference([None], [None]) == []\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference([(1, 2), (3, 4)], [(1, 2)]) == [(3, 4)]\n"
-    "    assert list_difference([(1, 2)], [(1, 2)]) == []\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference(['', 'a', ''], ['']) == ['a']\n"
-    "    assert list_difference([''], ['']) == []\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference(['🙂', 'a', '🙂'], ['🙂']) == ['a']\n"
-    "    assert list_difference(['🙂'], ['🙂']) == []\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference([10**9, 1], [10**9]) == [1]\n"
-    "    assert list_difference([10**9], [10**9]) == []\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference([0, -0], [0]) == []\n"
-    "    assert list_difference([-0], [0]) == []\n",
-
-    "def test_list_difference():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_difference(None, [])\n",
-
-    "def test_list_difference():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_difference([], None)\n",
-
-    "def test_list_difference():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_difference(123, [1])\n",
-
-    "def test_list_difference():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_difference([1, 2], 123)\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference([], []) == []\n"
-    "    assert list_difference([], ['x']) == []\n"
-    "    assert list_difference(['x'], []) == ['x']\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference([1, 2, 3], [1, 2, 3]) == []\n"
-    "    assert list_difference([1, 2, 3], [2]) == [1, 3]\n"
-    "    assert list_difference([1, 2, 3], [4]) == [1, 2, 3]\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference([1, 1, 2, 2], [1]) == [2, 2]\n"
-    "    assert list_difference([1, 1, 1], [1]) == []\n"
-    "    assert list_difference([2, 2], [1]) == [2, 2]\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference([-1, -2, -3], [-2]) == [-1, -3]\n"
-    "    assert list_difference([-1, -1], [-1]) == []\n"
-    "    assert list_difference([-3, -2, -1], []) == [-3, -2, -1]\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference(['a', 'b', 'a'], ['a']) == ['b']\n"
-    "    assert list_difference(['a', 'A'], ['a']) == ['A']\n"
-    "    assert list_difference(['x', 'y'], ['z']) == ['x', 'y']\n",
-
-    "def test_list_difference():\n"
-    "    assert list_difference([None, 1, None], [None]) == [1]\n"
-    "    assert list_difference([None], [None]) == []\n"
-    "    assert list_difference([1, None], []) == [1, None]\n",
-
-    "def test_list_difference():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_difference(None, [])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_difference([], None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_difference(123, 456)\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('', 'a') == ''\n"
-    "    assert remove_char('', '') == ''\n"
-    "    assert remove_char('a', 'a') == ''\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('aaa', 'a') == ''\n"
-    "    assert remove_char('aba', 'a') == 'b'\n"
-    "    assert remove_char('abc', 'x') == 'abc'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('a a a', ' ') == 'aaa'\n"
-    "    assert remove_char('   ', ' ') == ''\n"
-    "    assert remove_char(' a b ', ' ') == 'ab'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('AaA', 'a') == 'AA'\n"
-    "    assert remove_char('AaA', 'A') == 'a'\n"
-    "    assert remove_char('abcABC', 'A') == 'abcBC'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('😊a😊', '😊') == 'a'\n"
-    "    assert remove_char('😊😊', '😊') == ''\n"
-    "    assert remove_char('a😊b', '😊') == 'ab'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('line\\nline', '\\n') == 'lineline'\n"
-    "    assert remove_char('a\\nb\\n', '\\n') == 'ab'\n"
-    "    assert remove_char('\\n', '\\n') == ''\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('tab\\tchar', '\\t') == 'tabchar'\n"
-    "    assert remove_char('\\t\\t', '\\t') == ''\n"
-    "    assert remove_char('a\\tb', '\\t') == 'ab'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('!!!', '!') == ''\n"
-    "    assert remove_char('!a!b!', '!') == 'ab'\n"
-    "    assert remove_char('abc!', '!') == 'abc'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('123123', '1') == '2323'\n"
-    "    assert remove_char('000', '0') == ''\n"
-    "    assert remove_char('10203', '0') == '123'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('repeat', 'r') == 'epeat'\n"
-    "    assert remove_char('repeat', 'e') == 'rpat'\n"
-    "    assert remove_char('repeat', 't') == 'repea'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('mixED', 'E') == 'mixD'\n"
-    "    assert remove_char('mixED', 'e') == 'mixED'\n"
-    "    assert remove_char('CASE', 'S') == 'CAE'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('a b c', 'b') == 'a  c'\n"
-    "    assert remove_char('abcabc', 'b') == 'acac'\n"
-    "    assert remove_char('bbb', 'b') == ''\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('edge-case', '-') == 'edgecase'\n"
-    "    assert remove_char('--a--', '-') == 'a'\n"
-    "    assert remove_char('no-dash', '_') == 'no-dash'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('a'*10, 'a') == ''\n"
-    "    assert remove_char('a'*10, 'b') == 'a'*10\n"
-    "    assert remove_char('bbbbba', 'b') == 'a'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('中文中文', '中') == '文文'\n"
-    "    assert remove_char('αβγα', 'α') == 'βγ'\n"
-    "    assert remove_char('résumé', 'é') == 'résum'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('0x0x0', 'x') == '000'\n"
-    "    assert remove_char('101010', '1') == '000'\n"
-    "    assert remove_char('202020', '2') == '000'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('a_b_c', '_') == 'abc'\n"
-    "    assert remove_char('__init__', '_') == 'init'\n"
-    "    assert remove_char('no_underscore', '-') == 'no_underscore'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char(' spaced ', ' ') == 'spaced'\n"
-    "    assert remove_char('  lead', ' ') == 'lead'\n"
-    "    assert remove_char('trail  ', ' ') == 'trail'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('camelCase', 'C') == 'amelase'\n"
-    "    assert remove_char('snake_case', 'c') == 'snake_ase'\n"
-    "    assert remove_char('PascalCase', 'P') == 'ascalCase'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('..,,!!', '!') == '..,,'\n"
-    "    assert remove_char('?!?', '?') == '!'\n"
-    "    assert remove_char('--==--', '=') == '----'\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('a\\u200ba', '\\u200b') == 'aa'\n"
-    "    assert remove_char('\\u200b\\u200b', '\\u200b') == ''\n"
-    "    assert remove_char('a\\u200bb', 'b') == 'a\\u200b'\n",
-
-    "def test_remove_char():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        remove_char(None, 'a')\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        remove_char(123, '1')\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        remove_char(['a','b'], 'a')\n",
-
-    "def test_remove_char():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_char('abc', None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_char('abc', 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_char('abc', ['a'])\n",
-
-    "def test_remove_char():\n"
-    "    assert remove_char('AaAa', 'a') == 'AA'\n"
-    "    assert remove_char('AaAa', 'A') == 'aa'\n"
-    "    assert remove_char('AaAa', 'x') == 'AaAa'\n",
-
-    "def test_remove_char():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_char('abc', '')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_char('abc', 'ab')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_char('abc', '😊😊')\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection([], [])) == []\n"
-    "    assert sorted(list_intersection([1, 2, 3], [])) == []\n"
-    "    assert sorted(list_intersection([], [1, 2, 3])) == []\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection([1, 1, 2, 2, 3], [2, 2, 4])) == [2]\n"
-    "    assert sorted(list_intersection([0, 0, 0], [0])) == [0]\n"
-    "    assert sorted(list_intersection([1, 2, 3], [3, 3, 3])) == [3]\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection([-1, -2, -3], [-3, -4])) == [-3]\n"
-    "    assert sorted(list_intersection([-1, 0, 1], [2, 1, 0])) == [0, 1]\n"
-    "    assert sorted(list_intersection([-10, -10], [-10, 10])) == [-10]\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection([1.0, 2.0, 3.0], [3, 4, 5])) == [3.0]\n"
-    "    assert sorted(list_intersection([0.0, -0.0], [0])) == [0.0]\n"
-    "    assert sorted(list_intersection([1.5, 2.5], [2.5, 3.5])) == [2.5]\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection([True, False], [1, 0])) == [0, 1]\n"
-    "    assert sorted(list_intersection([True, True, False], [True])) == [True]\n"
-    "    assert sorted(list_intersection([False], [0, 2, 3])) == [False]\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection(['a', 'b', 'c'], ['b', 'x'])) == ['b']\n"
-    "    assert sorted(list_intersection(['', ' '], [' '])) == [' ']\n"
-    "    assert sorted(list_intersection(['😊', 'a'], ['😊', 'b'])) == ['😊']\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection([None, 1, 2], [None, 0])) == [None]\n"
-    "    assert sorted(list_intersection([None, None], [None])) == [None]\n"
-    "    assert sorted(list_intersection([None, 'x'], ['x'])) == ['x']\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection([(1, 2), (3, 4)], [(3, 4), (0, 0)])) == [(3, 4)]\n"
-    "    assert sorted(list_intersection([(1,), (1,), (2,)], [(2,), (2,)])) == [(2,)]\n"
-    "    assert sorted(list_intersection([(), (1,)], [()])) == [()]\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection([1, 2, 3], [3, 2, 1])) == [1, 2, 3]\n"
-    "    assert sorted(list_intersection([1, 2, 3], [4, 5, 6])) == []\n"
-    "    assert sorted(list_intersection([2, 2, 2], [2])) == [2]\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection([10**12, 10**6], [10**12])) == [10**12]\n"
-    "    assert sorted(list_intersection([10**9, -10**9], [-10**9, 0])) == [-10**9]\n"
-    "    assert sorted(list_intersection([2**63, 2**10], [2**63, 1])) == [2**63]\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection([float('inf'), 1.0], [float('inf'), 2.0])) == [float('inf')]\n"
-    "    assert sorted(list_intersection([float('-inf'), 0], [float('-inf')])) == [float('-inf')]\n"
-    "    assert sorted(list_intersection([float('inf'), float('-inf')], [float('inf')])) == [float('inf')]\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection([float('nan')], [float('nan')])) == []\n"
-    "    assert sorted(list_intersection([float('nan'), 1.0], [1.0])) == [1.0]\n"
-    "    assert sorted(list_intersection([float('nan'), 2.0], [2.0, float('nan')])) == [2.0]\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection([1, '1'], ['1', 2])) == ['1']\n"
-    "    assert sorted(list_intersection([1, '1'], [1])) == [1]\n"
-    "    assert sorted(list_intersection(['1'], [1])) == []\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection([b'a', b'b'], [b'b', b'c'])) == [b'b']\n"
-    "    assert sorted(list_intersection([b'a'], [b'a'])) == [b'a']\n"
-    "    assert sorted(list_intersection([b'a'], ['a'])) == []\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection([1, 2, 3], (3, 4, 5))) == [3]\n"
-    "    assert sorted(list_intersection((1, 2), [2, 3])) == [2]\n"
-    "    assert sorted(list_intersection((1, 2), (2, 3))) == [2]\n",
-
-    "def test_list_intersection():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_intersection(None, [1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_intersection([1], None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_intersection(None, None)\n",
-
-    "def test_list_intersection():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_intersection([[]], [[]])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_intersection([[1]], [[1]])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_intersection([{'a': 1}], [{'a': 1}])\n",
-
-    "def test_list_intersection():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_intersection([{1}, {2}], [{2}])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_intersection([{1, 2}], [{1, 2}])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_intersection([set()], [set()])\n",
-
-    "def test_list_intersection():\n"
-    "    class _Unhashable:\n"
-    "        __hash__ = None\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_intersection([_Unhashable()], [_Unhashable()])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_intersection([_Unhashable(), 1], [1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        list_intersection([_Unhashable()], [1])\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection(range(0), range(10))) == []\n"
-    "    assert sorted(list_intersection(range(5), range(3, 8))) == [3, 4]\n"
-    "    assert sorted(list_intersection(range(-3, 3), range(2, 6))) == [2]\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection([0, -0, 0.0], [0])) == [0]\n"
-    "    assert sorted(list_intersection([-0.0], [0])) == [0.0]\n"
-    "    assert sorted(list_intersection([0, 1], [-0.0, 2])) == [0]\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection(['a\\n', 'b'], ['a\\n'])) == ['a\\n']\n"
-    "    assert sorted(list_intersection(['\\t', ' '], ['\\t'])) == ['\\t']\n"
-    "    assert sorted(list_intersection(['\\n', '\\r'], ['\\r', 'x'])) == ['\\r']\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection(['a'*1000, 'b'], ['a'*1000])) == ['a'*1000]\n"
-    "    assert sorted(list_intersection(['', ''], [''])) == ['']\n"
-    "    assert sorted(list_intersection(['x'*0], [''])) == ['']\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection([1, 2, 3], [3, 2, 1, 1, 1])) == [1, 2, 3]\n"
-    "    assert sorted(list_intersection([2, 2, 3, 3], [3, 3, 4, 4])) == [3]\n"
-    "    assert sorted(list_intersection([1, 2, 2, 2], [2, 2])) == [2]\n",
-
-    "def test_list_intersection():\n"
-    "    assert sorted(list_intersection(['a', None, 'b'], [None, 'c'])) == [None]\n"
-    "    assert sorted(list_intersection([None, None], [None])) == [None]\n"
-    "    assert sorted(list_intersection([None, 1], [2, None, 3])) == [None]\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('') == set()\n"
-    "    assert unique_chars('aaaa') == {'a'}\n"
-    "    assert unique_chars('abca') == {'a','b','c'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('   ') == {' '}\n"
-    "    assert unique_chars(' a  b ') == {' ', 'a', 'b'}\n"
-    "    assert unique_chars('\\t\\t') == {'\\t'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('\\n') == {'\\n'}\n"
-    "    assert unique_chars('a\\nb') == {'a','\\n','b'}\n"
-    "    assert unique_chars('a\\n\\na') == {'a','\\n'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('🙂') == {'🙂'}\n"
-    "    assert unique_chars('🙂🙂a') == {'🙂','a'}\n"
-    "    assert unique_chars('😀😃😀') == {'😀','😃'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('Aa') == {'A','a'}\n"
-    "    assert unique_chars('aA') == {'a','A'}\n"
-    "    assert unique_chars('AAAaaa') == {'A','a'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('a0a0') == {'a','0'}\n"
-    "    assert unique_chars('0000') == {'0'}\n"
-    "    assert unique_chars('123321') == {'1','2','3'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('!@#!') == {'!','@','#'}\n"
-    "    assert unique_chars('..,,') == {'.',','}\n"
-    "    assert unique_chars('---___') == {'-','_'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('a\\u200bb') == {'a','\\u200b','b'}\n"
-    "    assert unique_chars('aa\\u200baa') == {'a','\\u200b'}\n"
-    "    assert unique_chars('\\u200b') == {'\\u200b'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('e\\u0301') == {'e','\\u0301'}\n"
-    "    assert unique_chars('e\\u0301e') == {'e','\\u0301'}\n"
-    "    assert unique_chars('\\u0301') == {'\\u0301'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('a' * 1000) == {'a'}\n"
-    "    assert unique_chars(('ab' * 500)) == {'a','b'}\n"
-    "    assert unique_chars(('abc' * 100)) == {'a','b','c'}\n",
-
-    "def test_unique_chars():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        unique_chars(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        unique_chars(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        unique_chars(['a','b'])\n",
-
-    "def test_unique_chars():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        unique_chars(b'abc')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        unique_chars(bytearray(b'abc'))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        unique_chars(object())\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('İ') == {'İ'}\n"
-    "    assert unique_chars('ß') == {'ß'}\n"
-    "    assert unique_chars('ΩΩA') == {'Ω','A'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('a a') == {'a',' '}\n"
-    "    assert unique_chars('  a') == {' ','a'}\n"
-    "    assert unique_chars('a  ') == {'a',' '}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('\\\\') == {'\\\\'}\n"
-    "    assert unique_chars('\\\\n') == {'\\\\','n'}\n"
-    "    assert unique_chars('\\\\t') == {'\\\\','t'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('0.0') == {'0','.'}\n"
-    "    assert unique_chars('-0') == {'-','0'}\n"
-    "    assert unique_chars('+-') == {'+','-'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('🧪pytest🧪') == {'🧪','p','y','t','e','s'}\n"
-    "    assert unique_chars('test') == {'t','e','s'}\n"
-    "    assert unique_chars('') == set()\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('a\\r\\n') == {'a','\\r','\\n'}\n"
-    "    assert unique_chars('\\r\\n') == {'\\r','\\n'}\n"
-    "    assert unique_chars('\\r') == {'\\r'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('a\\x00b') == {'a','\\x00','b'}\n"
-    "    assert unique_chars('\\x00\\x00') == {'\\x00'}\n"
-    "    assert unique_chars('\\x00') == {'\\x00'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('Aa\\nAa') == {'A','a','\\n'}\n"
-    "    assert unique_chars('A a') == {'A','a',' '}\n"
-    "    assert unique_chars('A\\ta') == {'A','a','\\t'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('中文中文') == {'中','文'}\n"
-    "    assert unique_chars('あいあ') == {'あ','い'}\n"
-    "    assert unique_chars('한글한') == {'한','글'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('()()') == {'(',')'}\n"
-    "    assert unique_chars('[]{}') == {'[',']','{','}'}\n"
-    "    assert unique_chars(',:;') == {',',':',';'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('mixED') == {'m','i','x','E','D'}\n"
-    "    assert unique_chars('MiXeD') == {'M','i','X','e','D'}\n"
-    "    assert unique_chars('mIx') == {'m','I','x'}\n",
-
-    "def test_unique_chars():\n"
-    "    assert unique_chars('   \\t') == {' ','\\t'}\n"
-    "    assert unique_chars('\\t \\t') == {'\\t',' '}\n"
-    "    assert unique_chars(' \\n ') == {' ','\\n'}\n",
-
-    "def test_unique_chars():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        unique_chars(3.14)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        unique_chars(True)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        unique_chars(False)\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([]) == []\n"
-    "    assert running_total([0]) == [0]\n"
-    "    assert running_total([0, 0, 0]) == [0, 0, 0]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([1]) == [1]\n"
-    "    assert running_total([1, 2, 3]) == [1, 3, 6]\n"
-    "    assert running_total([5, -2, 1]) == [5, 3, 4]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([-1]) == [-1]\n"
-    "    assert running_total([-1, -2, -3]) == [-1, -3, -6]\n"
-    "    assert running_total([-5, 5]) == [-5, 0]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([10, -10, 10, -10]) == [10, 0, 10, 0]\n"
-    "    assert running_total([2, -2, 2, -2]) == [2, 0, 2, 0]\n"
-    "    assert running_total([1, -1, 1]) == [1, 0, 1]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([1.5, 0.5]) == [1.5, 2.0]\n"
-    "    assert running_total([-0.5, 0.5]) == [-0.5, 0.0]\n"
-    "    assert running_total([0.1, 0.2, 0.3]) == [0.1, 0.30000000000000004, 0.6000000000000001]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([10**6, 1]) == [1000000, 1000001]\n"
-    "    assert running_total([-10**6, 10**6]) == [-1000000, 0]\n"
-    "    assert running_total([999999999]) == [999999999]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([True, True, False]) == [1, 2, 2]\n"
-    "    assert running_total([False, True]) == [0, 1]\n"
-    "    assert running_total([True, False, True]) == [1, 1, 2]\n",
-
-    "def test_running_total():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        running_total(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        running_total(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        running_total('123')\n",
-
-    "def test_running_total():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        running_total([1, '2', 3])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        running_total([None, 1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        running_total([object()])\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([0, -1, -2, -3]) == [0, -1, -3, -6]\n"
-    "    assert running_total([3, -1, -2]) == [3, 2, 0]\n"
-    "    assert running_total([-2, 2, 2]) == [-2, 0, 2]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([100, 0, -100]) == [100, 100, 0]\n"
-    "    assert running_total([5, 0, 0]) == [5, 5, 5]\n"
-    "    assert running_total([0, 5, 0]) == [0, 5, 5]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([1e-9, 1e-9]) == [1e-09, 2e-09]\n"
-    "    assert running_total([-1e-9, 1e-9]) == [-1e-09, 0.0]\n"
-    "    assert running_total([1e3, -1e3, 1e3]) == [1000.0, 0.0, 1000.0]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([7]) == [7]\n"
-    "    assert running_total([-7]) == [-7]\n"
-    "    assert running_total([7, -7]) == [7, 0]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([2, 2, 2, 2]) == [2, 4, 6, 8]\n"
-    "    assert running_total([-2, -2]) == [-2, -4]\n"
-    "    assert running_total([1, 2, -3, 4]) == [1, 3, 0, 4]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([0.0, 0.0]) == [0.0, 0.0]\n"
-    "    assert running_total([-0.0, 0.0]) == [-0.0, 0.0]\n"
-    "    assert running_total([0.0, -1.0, 1.0]) == [0.0, -1.0, 0.0]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([100, -50, -25, -25]) == [100, 50, 25, 0]\n"
-    "    assert running_total([1, -2, 3, -4]) == [1, -1, 2, -2]\n"
-    "    assert running_total([-1, 2, -1]) == [-1, 1, 0]\n",
-
-    "def test_running_total():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        running_total([1, 2, None])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        running_total([[], 1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        running_total([{}, 1])\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([1, -1, 0]) == [1, 0, 0]\n"
-    "    assert running_total([0, 1, -1]) == [0, 1, 0]\n"
-    "    assert running_total([-1, 0, 1]) == [-1, -1, 0]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([1000000000, -1000000000]) == [1000000000, 0]\n"
-    "    assert running_total([-1000000000, 1000000000]) == [-1000000000, 0]\n"
-    "    assert running_total([1000000000, 1]) == [1000000000, 1000000001]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([0, 0, 5]) == [0, 0, 5]\n"
-    "    assert running_total([5, 0, 0]) == [5, 5, 5]\n"
-    "    assert running_total([0, 5, 0]) == [0, 5, 5]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([1, 2, -1, -2]) == [1, 3, 2, 0]\n"
-    "    assert running_total([-2, 1, 1]) == [-2, -1, 0]\n"
-    "    assert running_total([3, -3, 1]) == [3, 0, 1]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([0.25, 0.25, 0.5]) == [0.25, 0.5, 1.0]\n"
-    "    assert running_total([-0.25, -0.25]) == [-0.25, -0.5]\n"
-    "    assert running_total([0.5, -0.25, -0.25]) == [0.5, 0.25, 0.0]\n",
-
-    "def test_running_total():\n"
-    "    assert running_total([True, False, False]) == [1, 1, 1]\n"
-    "    assert running_total([False, False, True]) == [0, 0, 1]\n"
-    "    assert running_total([True, True, True]) == [1, 2, 3]\n",
-
-    "def test_running_total():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        running_total([1, 2, '3'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        running_total(['1', 2, 3])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        running_total([1, 2, {}])\n",
-
-    "def test_running_total():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        running_total([1, 2, []])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        running_total([1, object()])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        running_total([None])\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([]) == []\n"
-    "    assert filter_falsey([0, False, None, '']) == []\n"
-    "    assert filter_falsey([1, True, 'a']) == [1, True, 'a']\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([0, 1, 2, 0]) == [1, 2]\n"
-    "    assert filter_falsey([False, True, False]) == [True]\n"
-    "    assert filter_falsey([None, 'x', None]) == ['x']\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey(['', 'a', '']) == ['a']\n"
-    "    assert filter_falsey([' ', '']) == [' ']\n"
-    "    assert filter_falsey(['', ' ', 'x']) == [' ', 'x']\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([[], [1], []]) == [[1]]\n"
-    "    assert filter_falsey([{}, {'a': 1}]) == [{'a': 1}]\n"
-    "    assert filter_falsey([(), (1,)]) == [(1,)]\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([0.0, 0.1, -0.1]) == [0.1, -0.1]\n"
-    "    assert filter_falsey([0.0, -0.0]) == []\n"
-    "    assert filter_falsey([1.5, 0.0, 2.5]) == [1.5, 2.5]\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([True, False, True]) == [True, True]\n"
-    "    assert filter_falsey([False, False]) == []\n"
-    "    assert filter_falsey([True]) == [True]\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([None, None, 1]) == [1]\n"
-    "    assert filter_falsey([None, 0, False]) == []\n"
-    "    assert filter_falsey([None, 'a']) == ['a']\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey(['0', 0]) == ['0']\n"
-    "    assert filter_falsey(['False', False]) == ['False']\n"
-    "    assert filter_falsey(['None', None]) == ['None']\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([set(), {1}]) == [{1}]\n"
-    "    assert filter_falsey([frozenset(), frozenset({1})]) == [frozenset({1})]\n"
-    "    assert filter_falsey([{'a'}, set()]) == [{'a'}]\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([[], (), {}]) == []\n"
-    "    assert filter_falsey([[0], (0,), {'x': 0}]) == [[0], (0,), {'x': 0}]\n"
-    "    assert filter_falsey([{}, {'': ''}]) == [{'': ''}]\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([0, '', [], {}, ()]) == []\n"
-    "    assert filter_falsey([1, ' ', [0]]) == [1, ' ', [0]]\n"
-    "    assert filter_falsey([False, True, []]) == [True]\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([float('nan'), 0]) == [float('nan')]\n"
-    "    assert filter_falsey([float('inf'), 0]) == [float('inf')]\n"
-    "    assert filter_falsey([float('-inf'), None]) == [float('-inf')]\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([b'', b'a']) == [b'a']\n"
-    "    assert filter_falsey([b'0', b'']) == [b'0']\n"
-    "    assert filter_falsey([b'\\x00']) == [b'\\x00']\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey(['\\n', '']) == ['\\n']\n"
-    "    assert filter_falsey(['\\t', None]) == ['\\t']\n"
-    "    assert filter_falsey(['\\0', '']) == ['\\0']\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([1, 2, 3]) == [1, 2, 3]\n"
-    "    assert filter_falsey([0, 0, 0]) == []\n"
-    "    assert filter_falsey([0, 1, 0, 2]) == [1, 2]\n",
-
-    "def test_filter_falsey():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_falsey(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_falsey(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_falsey('abc')\n",
-
-    "def test_filter_falsey():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_falsey(3.14)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_falsey(True)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_falsey(object())\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([[False], [True]]) == [[False], [True]]\n"
-    "    assert filter_falsey([[0], []]) == [[0]]\n"
-    "    assert filter_falsey([[None], []]) == [[None]]\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([{'a': None}, {}]) == [{'a': None}]\n"
-    "    assert filter_falsey([{0: 0}, {}]) == [{0: 0}]\n"
-    "    assert filter_falsey([{}, {}]) == []\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([(), (0,)]) == [(0,)]\n"
-    "    assert filter_falsey([(False,), ()]) == [(False,)]\n"
-    "    assert filter_falsey([(), ()]) == []\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([True, 1, 'x']) == [True, 1, 'x']\n"
-    "    assert filter_falsey([False, 0, '']) == []\n"
-    "    assert filter_falsey([None, [], {}]) == []\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([float('nan'), None]) == [float('nan')]\n"
-    "    assert filter_falsey([float('inf'), float('-inf')]) == [float('inf'), float('-inf')]\n"
-    "    assert filter_falsey([0, float('nan')]) == [float('nan')]\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([{'x': []}, {'y': 1}]) == [{'x': []}, {'y': 1}]\n"
-    "    assert filter_falsey([{'': ''}, {}]) == [{'': ''}]\n"
-    "    assert filter_falsey([{'a': False}, {}]) == [{'a': False}]\n",
-
-    "def test_filter_falsey():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_falsey({'a': 1})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_falsey({1, 2, 3})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_falsey(frozenset([1, 2]))\n",
-
-    "def test_filter_falsey():\n"
-    "    assert filter_falsey([{'a': []}, [], {'b': 0}, {}]) == [{'a': []}, {'b': 0}]\n"
-    "    assert filter_falsey([[[]], []]) == [[[]]]\n"
-    "    assert filter_falsey([{'x': False}, {'y': None}, {}]) == [{'x': False}, {'y': None}]\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([]) == 0\n"
-    "    assert sum_nested_list([[]]) == 0\n"
-    "    assert sum_nested_list([[[]], []]) == 0\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([0]) == 0\n"
-    "    assert sum_nested_list([0, 0, 0]) == 0\n"
-    "    assert sum_nested_list([0, [0, [0]], 0]) == 0\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([1]) == 1\n"
-    "    assert sum_nested_list([1, 2, 3]) == 6\n"
-    "    assert sum_nested_list([1, [2, 3], 4]) == 10\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([-1]) == -1\n"
-    "    assert sum_nested_list([-1, -2, -3]) == -6\n"
-    "    assert sum_nested_list([-1, [2, [-3]], 4]) == 2\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([[1, 2], [3, 4]]) == 10\n"
-    "    assert sum_nested_list([[1], [2], [3]]) == 6\n"
-    "    assert sum_nested_list([[1, [2]], [[3], 4]]) == 10\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([1, [2, [3, [4]]]]) == 10\n"
-    "    assert sum_nested_list([[1, [2, [3]]], 4]) == 10\n"
-    "    assert sum_nested_list([[[[[5]]]]]) == 5\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([1, [], 2]) == 3\n"
-    "    assert sum_nested_list([[], [1, []], 2, [[]]]) == 3\n"
-    "    assert sum_nested_list([[[]], 1, [[[]]]]) == 1\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([1.5, [2.5]]) == 4.0\n"
-    "    assert sum_nested_list([0.1, [0.2, [0.3]]]) == 0.6000000000000001\n"
-    "    assert sum_nested_list([-0.5, [0.2, [-0.1]]]) == -0.4\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([10**9, [-10**9]]) == 0\n"
-    "    assert sum_nested_list([10**12, [1, [-1]]]) == 10**12\n"
-    "    assert sum_nested_list([-10**12, [10**12, [0]]]) == 0\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([True, False, [True]]) == 2\n"
-    "    assert sum_nested_list([[False], [0], [1]]) == 1\n"
-    "    assert sum_nested_list([True, [2, [False]]]) == 3\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([None]) == 0\n"
-    "    assert sum_nested_list([1, None, [2]]) == 3\n"
-    "    assert sum_nested_list([None, [None, [None]]]) == 0\n",
-
-    "def test_sum_nested_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list(['1'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list([1, ['2']])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list([['a', 'b']])\n",
-
-    "def test_sum_nested_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list([{'a': 1}])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list([1, {'b': 2}])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list([[{'x': 1}], 2])\n",
-
-    "def test_sum_nested_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list([object()])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list([1, object()])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list([[object()]])\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([float('inf')]) == float('inf')\n"
-    "    assert sum_nested_list([float('-inf'), [1]]) == float('-inf')\n"
-    "    assert sum_nested_list([float('inf'), float('-inf')]) != 0\n",
-
-    "def test_sum_nested_list():\n"
-    "    r = sum_nested_list([float('nan')])\n"
-    "    assert r != r\n"
-    "    r2 = sum_nested_list([1.0, [float('nan')]])\n"
-    "    assert r2 != r2\n"
-    "    r3 = sum_nested_list([float('nan'), [float('nan')]])\n"
-    "    assert r3 != r3\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([1, (2, 3)]) == 6\n"
-    "    assert sum_nested_list([(1, 2), [3]]) == 6\n"
-    "    assert sum_nested_list([(1,), [(2,), [3]]]) == 6\n",
-
-    "def test_sum_nested_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list([1, (2, '3')])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list([('x',), 1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list([(1, 2), ('a', 'b')])\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([0, [-0.0]]) == 0.0\n"
-    "    assert sum_nested_list([-0.0, [0.0]]) == 0.0\n"
-    "    assert sum_nested_list([0.0, [-0.0], [0]]) == 0.0\n",
-
-    "def test_sum_nested_list():\n"
-    "    big = list(range(1000))\n"
-    "    assert sum_nested_list(big) == sum(range(1000))\n"
-    "    assert sum_nested_list([big, []]) == sum(range(1000))\n"
-    "    assert sum_nested_list([[], [big]]) == sum(range(1000))\n",
-
-    "def test_sum_nested_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list('123')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list(None)\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([[[-1, -2], [-3]], [[4]]]) == -2\n"
-    "    assert sum_nested_list([[1, [2]], [], [[3, [4]]]]) == 10\n"
-    "    assert sum_nested_list([[], [], []]) == 0\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([True, [True, [True]]]) == 3\n"
-    "    assert sum_nested_list([False, [False], False]) == 0\n"
-    "    assert sum_nested_list([True, [0, [False]]]) == 1\n",
-
-    "def test_sum_nested_list():\n"
-    "    assert sum_nested_list([1, [2, [3, [4, [5]]]]]) == 15\n"
-    "    assert sum_nested_list([[1], [[2], [[[3]]]]]) == 6\n"
-    "    assert sum_nested_list([[[[[1]]]]]) == 1\n",
-
-    "def test_sum_nested_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list([[1, 2], '3'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list([['4'], [5]])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_nested_list([[None], 1])\n",
-
-    "def test_filter_none():\n"
-    "    assert filter_none([]) == []\n"
-    "    assert filter_none([None]) == []\n"
-    "    assert filter_none([None, None]) == []\n",
-
-    "def test_filter_none():\n"
-    "    assert filter_none([1, None, 2]) == [1, 2]\n"
-    "    assert filter_none([None, 0, None]) == [0]\n"
-    "    assert filter_none([0, None, 0]) == [0, 0]\n",
-
-    "def test_filter_none():\n"
-    "    assert filter_none([False, None, True]) == [False, True]\n"
-    "    assert filter_none([None, False]) == [False]\n"
-    "    assert filter_none([True, None]) == [True]\n",
-
-    "def test_filter_none():\n"
-    "    assert filter_none(['a', None, 'b']) == ['a', 'b']\n"
-    "    assert filter_none([None, '']) == ['']\n"
-    "    assert filter_none(['', None, 'x']) == ['', 'x']\n",
-
-    "def test_filter_none():\n"
-    "    assert filter_none([[], None, []]) == [[], []]\n"
-    "    assert filter_none([None, {}]) == [{}]\n"
-    "    assert filter_none([{}, None, {}]) == [{}, {}]\n",
-
-    "def test_filter_none():\n"
-    "    assert filter_none([1.1, None, 2.2]) == [1.1, 2.2]\n"
-    "    assert filter_none([None, 0.0]) == [0.0]\n"
-    "    assert filter_none([0.0, None, 0.0]) == [0.0, 0.0]\n",
-
-    "def test_filter_none():\n"
-    "    assert filter_none([(), None, (1,)]) == [(), (1,)]\n"
-    "    assert filter_none([None, ()]) == [()]\n"
-    "    assert filter_none([(), (), None]) == [(), ()]\n",
-
-    "def test_filter_none():\n"
-    "    assert filter_none([[1], None, [2]]) == [[1], [2]]\n"
-    "    assert filter_none([None, [None]]) == [[None]]\n"
-    "    assert filter_none([[None], None]) == [[None]]\n",
-
-    "def test_filter_none():\n"
-    "    assert filter_none([{'a': 1}, None]) == [{'a': 1}]\n"
-    "    assert filter_none([None, {'a': None}]) == [{'a': None}]\n"
-    "    assert filter_none([{'x': 1}, None, {'y': 2}]) == [{'x': 1}, {'y': 2}]\n",
-
-    "def test_filter_none():\n"
-    "    assert filter_none([1, 2, 3]) == [1, 2, 3]\n"
-    "    assert filter_none([None, 1, 2, 3, None]) == [1, 2, 3]\n"
-    "    assert filter_none([None, None, 5]) == [5]\n",
-
-    "def test_filter_none():\n"
-    "    assert filter_none([True, False, None]) == [True, False]\n"
-    "    assert filter_none([None, True, False]) == [True, False]\n"
-    "    assert filter_none([False, None, False]) == [False, False]\n",
-
-    "def test_filter_none():\n"
-    "    assert filter_none(['😊', None, '😃']) == ['😊', '😃']\n"
-    "    assert filter_none([None, '😊']) == ['😊']\n"
-    "    assert filter_none(['😊', None]) == ['😊']\n",
-
-    "def test_filter_none():\n"
-    "    assert filter_none([0, None, False]) == [0, False]\n"
-    "    assert filter_none([None, 0, False]) == [0, False]\n"
-    "    assert filter_none([None, None, False]) == [False]\n",
-
-    "def test_filter_none():\n"
-    "    assert filter_none([[[]], None]) == [[[]]]\n"
-    "    assert filter_none([None, [[]]]) == [[[]]]\n"
-    "    assert filter_none([[[]], None, [[]]]) == [[[]], [[]]]\n",
-
-    "def test_filter_none():\n"
-    "    assert filter_none([{'a': [None]}, None]) == [{'a': [None]}]\n"
-    "    assert filter_none([None, {'b': 2}]) == [{'b': 2}]\n"
-    "    assert filter_none([{'x': None}, None]) == [{'x': None}]\n",
-
-    "def test_filter_none():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_none(None)\n",
-
-    "def test_filter_none():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_none(123)\n",
-
-    "def test_filter_none():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_none('abc')\n",
-
-    "def test_filter_none():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_none(3.14)\n",
-
-    "def test_filter_none():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_none(True)\n",
-
-    "def test_filter_none():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_none({'a': 1})\n",
-
-    "def test_filter_none():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_none((1, 2, 3))\n",
-
-    "def test_filter_none():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_none(set([1, 2, 3]))\n",
-
-    "def test_filter_none():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_none(object())\n",
-
-    "def test_filter_none():\n"
-    "    assert filter_none([None, None, None, 1]) == [1]\n"
-    "    assert filter_none([None, 'a', None, 'b', None]) == ['a', 'b']\n"
-    "    assert filter_none([None, None, {}]) == [{}]\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([]) is None\n"
-    "    assert get_first([1]) == 1\n"
-    "    assert get_first([None]) is None\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([0]) == 0\n"
-    "    assert get_first(['']) == ''\n"
-    "    assert get_first([False]) is False\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([1, 2, 3]) == 1\n"
-    "    assert get_first(['a', 'b']) == 'a'\n"
-    "    assert get_first([True, False]) is True\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([[], 1, 2]) == []\n"
-    "    assert get_first([{}, 'x']) == {}\n"
-    "    assert get_first([(), 5]) == ()\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([[1, 2], [3]]) == [1, 2]\n"
-    "    assert get_first([{'a': 1}, {'b': 2}]) == {'a': 1}\n"
-    "    assert get_first([{'k': []}, {'k': [1]}]) == {'k': []}\n",
-
-    "def test_get_first():\n"
-    "    assert get_first(['😊', 'a']) == '😊'\n"
-    "    assert get_first(['\\n', 'x']) == '\\n'\n"
-    "    assert get_first(['\\t', 'y']) == '\\t'\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([10**12, -1]) == 10**12\n"
-    "    assert get_first([-10**12, 1]) == -10**12\n"
-    "    assert get_first([2**63, 0]) == 2**63\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([1.5, 2.5]) == 1.5\n"
-    "    assert get_first([-0.0, 1.0]) == -0.0\n"
-    "    assert get_first([float('inf'), -1]) == float('inf')\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([float('-inf'), 0]) == float('-inf')\n"
-    "    assert get_first([float('nan'), 1]) != get_first([float('nan'), 1])\n"
-    "    assert get_first([0.0, -0.0]) == 0.0\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([b'', b'a']) == b''\n"
-    "    assert get_first([b'hi']) == b'hi'\n"
-    "    assert get_first([bytearray(b'x'), bytearray(b'y')]) == bytearray(b'x')\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([set(), {1}]) == set()\n"
-    "    assert get_first([frozenset(), frozenset({1})]) == frozenset()\n"
-    "    assert get_first([{'a'}, {'b'}]) == {'a'}\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([range(0), range(1)]) == range(0)\n"
-    "    assert list(get_first([range(3), range(2)])) == [0, 1, 2]\n"
-    "    assert get_first([range(1), 'x']).start == 0\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([{'nested': [None]}, {'nested': []}]) == {'nested': [None]}\n"
-    "    assert get_first([[None], []]) == [None]\n"
-    "    assert get_first([[''], ['a']]) == ['']\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([(1, 2), (3, 4)]) == (1, 2)\n"
-    "    assert get_first([(None,), (1,)]) == (None,)\n"
-    "    assert get_first([('a',), ()]) == ('a',)\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([[[]], []]) == [[]]\n"
-    "    assert get_first([[[1, 2]], [3]]) == [[1, 2]]\n"
-    "    assert get_first([['x', ['y']], ['z']]) == ['x', ['y']]\n",
-
-    "def test_get_first():\n"
-    "    assert get_first('') is None\n"
-    "    assert get_first('abc') == 'a'\n"
-    "    assert get_first('😊a') == '😊'\n",
-
-    "def test_get_first():\n"
-    "    assert get_first(None) == None\n"
-    "    assert get_first(False) == None\n"
-    "    assert get_first(0) == None\n",
-
-    "def test_get_first():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_first(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_first(3.14)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_first(object())\n",
-
-    "def test_get_first():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_first({'a': 1})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_first({1, 2, 3})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_first((x for x in [1, 2, 3]))\n",
-
-    "def test_get_first():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_first(b'abc')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_first(bytearray(b'abc'))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        get_first(range(5))\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([{'a': 1}]) == {'a': 1}\n"
-    "    assert get_first([{'a': 1}]) == get_first([{'a': 1}])\n"
-    "    assert get_first(['same', 'same']) == 'same'\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([0, None, False]) == 0\n"
-    "    assert get_first([None, 0, False]) == None\n"
-    "    assert get_first([False, 0, None]) == False\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([' ', 'x']) == ' '\n"
-    "    assert get_first(['\\u200b', 'a']) == '\\u200b'\n"
-    "    assert get_first(['\\r', 'n']) == '\\r'\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([[1], 2, 3]) == [1]\n"
-    "    assert get_first([{'x': 1}, 2]) == {'x': 1}\n"
-    "    assert get_first([{'x': None}, {'x': 1}]) == {'x': None}\n",
-
-    "def test_get_first():\n"
-    "    assert get_first([Ellipsis, 1, 2]) == Ellipsis\n"
-    "    assert get_first([NotImplemented, 'x']) == NotImplemented\n"
-    "    assert get_first([complex(1, 2), 0]) == complex(1, 2)\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([]) is None\n"
-    "    assert get_last([None]) is None\n"
-    "    assert get_last([0]) == 0\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([False]) is False\n"
-    "    assert get_last([True]) is True\n"
-    "    assert get_last([0, False]) is False\n",
-
-    "def test_get_last():\n"
-    "    assert get_last(['']) == ''\n"
-    "    assert get_last([' ', '']) == ''\n"
-    "    assert get_last(['a', ' ']) == ' '\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([[], []]) == []\n"
-    "    assert get_last([[1], []]) == []\n"
-    "    assert get_last([[], [1, 2]]) == [1, 2]\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([{}, {}]) == {}\n"
-    "    assert get_last([{'a': 1}, {}]) == {}\n"
-    "    assert get_last([{}, {'b': 2}]) == {'b': 2}\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([set(), set([1])]) == {1}\n"
-    "    assert get_last([set([1, 2]), set()]) == set()\n"
-    "    assert get_last([set()]) == set()\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([(), (1,)]) == (1,)\n"
-    "    assert get_last([(1, 2), ()]) == ()\n"
-    "    assert get_last([('a',), ('b', 'c')]) == ('b', 'c')\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([float('inf')]) == float('inf')\n"
-    "    assert get_last([float('-inf')]) == float('-inf')\n"
-    "    assert get_last([0.0, float('inf')]) == float('inf')\n",
-
-    "def test_get_last():\n"
-    "    x = []\n"
-    "    y = {'k': 'v'}\n"
-    "    assert get_last([x, y]) is y\n"
-    "    assert get_last([y, x]) is x\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([Ellipsis]) is Ellipsis\n"
-    "    assert get_last([NotImplemented]) is NotImplemented\n"
-    "    assert get_last([0, Ellipsis]) is Ellipsis\n",
-
-    "def test_get_last():\n"
-    "    assert get_last(['\\n']) == '\\n'\n"
-    "    assert get_last(['a', '\\n']) == '\\n'\n"
-    "    assert get_last(['\\t', ' ']) == ' '\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([b'']) == b''\n"
-    "    assert get_last([b'a', b'']) == b''\n"
-    "    assert get_last([b'x', b'y']) == b'y'\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([complex(1, 2)]) == complex(1, 2)\n"
-    "    assert get_last([complex(0, 0), complex(-1, 3)]) == complex(-1, 3)\n"
-    "    assert get_last([1, complex(2, 0)]) == complex(2, 0)\n",
-
-    "def test_get_last():\n"
-    "    assert get_last(['😊']) == '😊'\n"
-    "    assert get_last(['a', '😊']) == '😊'\n"
-    "    assert get_last(['🙂', '🙃', '🙂']) == '🙂'\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([0, -0]) == 0\n"
-    "    assert get_last([1, -1, 0]) == 0\n"
-    "    assert get_last([-1, 1, -0]) == 0\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([10**18]) == 10**18\n"
-    "    assert get_last([-(10**18), 10**18]) == 10**18\n"
-    "    assert get_last([10**18, -(10**18)]) == -(10**18)\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([0.1 + 0.2]) == 0.30000000000000004\n"
-    "    assert get_last([1.0, 0.1 + 0.2]) == 0.30000000000000004\n"
-    "    assert get_last([0.3, 0.1 + 0.2]) == 0.30000000000000004\n",
-
-    "def test_get_last():\n"
-    "    assert get_last(['ab', '']) == ''\n"
-    "    assert get_last(['', 'ab']) == 'ab'\n"
-    "    assert get_last(['ab', 'cd']) == 'cd'\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([None, 0]) == 0\n"
-    "    assert get_last([0, None]) is None\n"
-    "    assert get_last([None, None]) is None\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([[None], None]) is None\n"
-    "    assert get_last([None, [None]]) == [None]\n"
-    "    assert get_last([[0], [False]]) == [False]\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([{'a': 1}, {'a': 1}]) == {'a': 1}\n"
-    "    assert get_last([{'a': 1}, {'a': 2}]) == {'a': 2}\n"
-    "    assert get_last([{'x': []}, {'x': []}]) == {'x': []}\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([range(0)]) == range(0)\n"
-    "    assert get_last([range(1)]) == range(1)\n"
-    "    assert get_last([range(3), range(0)]) == range(0)\n",
-
-    "def test_get_last():\n"
-    "    assert get_last([0, '0']) == '0'\n"
-    "    assert get_last(['0', 0]) == 0\n"
-    "    assert get_last([True, 1]) == 1\n",
-
-    "def test_get_last():\n"
-    "    class Falsy:\n"
-    "        def __bool__(self):\n"
-    "            return False\n"
-    "    f = Falsy()\n"
-    "    assert get_last([f]) is f\n"
-    "    assert get_last([0, f]) is f\n",
-
-    "def test_get_last():\n"
-    "    assert get_last(['end', None, '']) == ''\n"
-    "    assert get_last(['only', 'one', 'last']) == 'last'\n"
-    "    assert get_last([[], None, {}]) == {}\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two(1, 2) == 2\n"
-    "    assert max_of_two(-1, -2) == -1\n"
-    "    assert max_of_two(0, 0) == 0\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two(10, -10) == 10\n"
-    "    assert max_of_two(-5, 5) == 5\n"
-    "    assert max_of_two(1, 1) == 1\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two(1.5, 1.4) == 1.5\n"
-    "    assert max_of_two(-1.5, -1.4) == -1.4\n"
-    "    assert max_of_two(0.0, -0.0) == 0.0\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two(True, False) == True\n"
-    "    assert max_of_two(False, False) == False\n"
-    "    assert max_of_two(True, True) == True\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two('b', 'a') == 'b'\n"
-    "    assert max_of_two('abc', 'ab') == 'abc'\n"
-    "    assert max_of_two('', 'x') == 'x'\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two([1, 2], [1, 1]) == [1, 2]\n"
-    "    assert max_of_two([0], []) == [0]\n"
-    "    assert max_of_two([1], [1]) == [1]\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two((1, 2), (1, 1)) == (1, 2)\n"
-    "    assert max_of_two((0,), ()) == (0,)\n"
-    "    assert max_of_two((1,), (1,)) == (1,)\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two(10**12, 10**11) == 10**12\n"
-    "    assert max_of_two(-10**12, -10**11) == -10**11\n"
-    "    assert max_of_two(10**18, 0) == 10**18\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two(3.14, 3.1400001) == 3.1400001\n"
-    "    assert max_of_two(-3.14, -3.1400001) == -3.14\n"
-    "    assert max_of_two(1e-9, 1e-10) == 1e-9\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two(float('inf'), 1) == float('inf')\n"
-    "    assert max_of_two(float('-inf'), 0) == 0\n"
-    "    assert max_of_two(float('inf'), float('inf')) == float('inf')\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two(None, 1) == 1\n"
-    "    assert max_of_two(None, None) is None\n"
-    "    assert max_of_two(1, None) == 1\n",
-
-    "def test_max_of_two():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        max_of_two('a', 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        max_of_two([], 1)\n",
-
-    "def test_max_of_two():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        max_of_two({}, {})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        max_of_two(object(), object())\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two('😊', '😀') == '😊'\n"
-    "    assert max_of_two('a', '😊') == '😊'\n"
-    "    assert max_of_two('😊', '😊') == '😊'\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two(b'b', b'a') == b'b'\n"
-    "    assert max_of_two(b'', b'a') == b'a'\n"
-    "    assert max_of_two(b'x', b'x') == b'x'\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two(0, False) == 0\n"
-    "    assert max_of_two(True, 0) == True\n"
-    "    assert max_of_two(False, -1) == False\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two(-0.0, 0.0) == 0.0\n"
-    "    assert max_of_two(0.0, -0.0) == 0.0\n"
-    "    assert max_of_two(-0.0, -0.0) == -0.0\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two('Z', 'a') == 'a'\n"
-    "    assert max_of_two('A', 'a') == 'a'\n"
-    "    assert max_of_two('z', 'Z') == 'z'\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two([1, 2, 3], [1, 2]) == [1, 2, 3]\n"
-    "    assert max_of_two([1], [1, 0]) == [1, 0]\n"
-    "    assert max_of_two([], []) == []\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two((2, 0), (1, 9)) == (2, 0)\n"
-    "    assert max_of_two((1, 2, 3), (1, 2)) == (1, 2, 3)\n"
-    "    assert max_of_two((), ()) == ()\n",
-
-    "def test_max_of_two():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        max_of_two(1, '1')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        max_of_two([], None)\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two(5, 5.0) == 5\n"
-    "    assert max_of_two(5.0, 5) == 5.0\n"
-    "    assert max_of_two(0, 0.0) == 0\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two('long', 'longer') == 'longer'\n"
-    "    assert max_of_two('same', 'same') == 'same'\n"
-    "    assert max_of_two('', '') == ''\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two(2**63, 2**62) == 2**63\n"
-    "    assert max_of_two(-(2**63), -(2**62)) == -(2**62)\n"
-    "    assert max_of_two(2**31, -2**31) == 2**31\n",
-
-    "def test_max_of_two():\n"
-    "    assert max_of_two(1e308, 1e307) == 1e308\n"
-    "    assert max_of_two(-1e308, -1e307) == -1e307\n"
-    "    assert max_of_two(1e-308, 0) == 1e-308\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two(1, 2) == 1\n"
-    "    assert min_of_two(-1, -2) == -2\n"
-    "    assert min_of_two(0, 0) == 0\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two(10, -10) == -10\n"
-    "    assert min_of_two(-5, 5) == -5\n"
-    "    assert min_of_two(1, 1) == 1\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two(1.5, 1.4) == 1.4\n"
-    "    assert min_of_two(-1.5, -1.4) == -1.5\n"
-    "    assert min_of_two(0.0, -0.0) == 0.0\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two(True, False) == False\n"
-    "    assert min_of_two(False, False) == False\n"
-    "    assert min_of_two(True, True) == True\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two('a', 'b') == 'a'\n"
-    "    assert min_of_two('ab', 'abc') == 'ab'\n"
-    "    assert min_of_two('', 'x') == ''\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two([1, 1], [1, 2]) == [1, 1]\n"
-    "    assert min_of_two([], [0]) == []\n"
-    "    assert min_of_two([1], [1]) == [1]\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two((1, 1), (1, 2)) == (1, 1)\n"
-    "    assert min_of_two((), (0,)) == ()\n"
-    "    assert min_of_two((1,), (1,)) == (1,)\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two(10**12, 10**11) == 10**11\n"
-    "    assert min_of_two(-10**12, -10**11) == -10**12\n"
-    "    assert min_of_two(10**18, 0) == 0\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two(3.14, 3.1400001) == 3.14\n"
-    "    assert min_of_two(-3.14, -3.1400001) == -3.1400001\n"
-    "    assert min_of_two(1e-9, 1e-10) == 1e-10\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two(float('inf'), 1) == 1\n"
-    "    assert min_of_two(float('-inf'), 0) == float('-inf')\n"
-    "    assert min_of_two(float('inf'), float('inf')) == float('inf')\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two(None, 1) is None\n"
-    "    assert min_of_two(None, None) is None\n"
-    "    assert min_of_two(1, None) is None\n",
-
-    "def test_min_of_two():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        min_of_two('a', 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        min_of_two([], 1)\n",
-
-    "def test_min_of_two():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        min_of_two({}, {})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        min_of_two(object(), object())\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two('😀', '😃') == '😀'\n"
-    "    assert min_of_two('a', '😊') == 'a'\n"
-    "    assert min_of_two('😊', '😊') == '😊'\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two(b'a', b'b') == b'a'\n"
-    "    assert min_of_two(b'', b'a') == b''\n"
-    "    assert min_of_two(b'x', b'x') == b'x'\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two(0, False) == False\n"
-    "    assert min_of_two(True, 0) == 0\n"
-    "    assert min_of_two(False, -1) == -1\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two(-0.0, 0.0) == -0.0\n"
-    "    assert min_of_two(0.0, -0.0) == -0.0\n"
-    "    assert min_of_two(-0.0, -0.0) == -0.0\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two('Z', 'a') == 'Z'\n"
-    "    assert min_of_two('A', 'a') == 'A'\n"
-    "    assert min_of_two('z', 'Z') == 'Z'\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two([1, 2], [1, 2, 3]) == [1, 2]\n"
-    "    assert min_of_two([1, 0], [1]) == [1]\n"
-    "    assert min_of_two([], []) == []\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two((1, 9), (2, 0)) == (1, 9)\n"
-    "    assert min_of_two((1, 2), (1, 2, 3)) == (1, 2)\n"
-    "    assert min_of_two((), ()) == ()\n",
-
-    "def test_min_of_two():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        min_of_two(1, '1')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        min_of_two([], None)\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two(5, 5.0) == 5\n"
-    "    assert min_of_two(5.0, 5) == 5.0\n"
-    "    assert min_of_two(0, 0.0) == 0\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two('long', 'longer') == 'long'\n"
-    "    assert min_of_two('same', 'same') == 'same'\n"
-    "    assert min_of_two('', '') == ''\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two(2**63, 2**62) == 2**62\n"
-    "    assert min_of_two(-(2**63), -(2**62)) == -(2**63)\n"
-    "    assert min_of_two(2**31, -2**31) == -2**31\n",
-
-    "def test_min_of_two():\n"
-    "    assert min_of_two(1e308, 1e307) == 1e307\n"
-    "    assert min_of_two(-1e308, -1e307) == -1e308\n"
-    "    assert min_of_two(1e-308, 0) == 0\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([]) == []\n"
-    "    assert filter_even([1, 3, 5]) == []\n"
-    "    assert filter_even([2, 4, 6]) == [2, 4, 6]\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([0]) == [0]\n"
-    "    assert filter_even([0, 1, 2]) == [0, 2]\n"
-    "    assert filter_even([1, 0, 3]) == [0]\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([-2, -1, 0, 1, 2]) == [-2, 0, 2]\n"
-    "    assert filter_even([-4, -3, -2]) == [-4, -2]\n"
-    "    assert filter_even([-1, -3]) == []\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([10**6, 10**6 + 1]) == [10**6]\n"
-    "    assert filter_even([-(10**6)]) == [-(10**6)]\n"
-    "    assert filter_even([10**6 + 3]) == []\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([True, False]) == [False]\n"
-    "    assert filter_even([True, 2]) == [2]\n"
-    "    assert filter_even([False, 0]) == [False, 0]\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([2.0, 4.0]) == [2.0, 4.0]\n"
-    "    assert filter_even([2.5, 3.5]) == []\n"
-    "    assert filter_even([0.0, 1.0]) == [0.0]\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([1, 2, 3, 4, 5]) == [2, 4]\n"
-    "    assert filter_even([4, 3, 2, 1]) == [4, 2]\n"
-    "    assert filter_even([2, 2, 2]) == [2, 2, 2]\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([0, -2, -4]) == [0, -2, -4]\n"
-    "    assert filter_even([-1, -3, -5]) == []\n"
-    "    assert filter_even([1, -2, 3]) == [-2]\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([100, 101, 102]) == [100, 102]\n"
-    "    assert filter_even([99, 101]) == []\n"
-    "    assert filter_even([98]) == [98]\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([0, 0, 1]) == [0, 0]\n"
-    "    assert filter_even([1, 1, 1]) == []\n"
-    "    assert filter_even([2, 1, 2]) == [2, 2]\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even(range(0)) == []\n"
-    "    assert filter_even(range(5)) == [0, 2, 4]\n"
-    "    assert filter_even(range(-3, 3)) == [-2, 0, 2]\n",
-
-    "def test_filter_even():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_even(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_even(123)\n",
-
-    "def test_filter_even():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_even(['a', 'b'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_even([1, '2'])\n",
-
-    "def test_filter_even():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_even([None])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_even([{}])\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([2, False]) == [2, False]\n"
-    "    assert filter_even([True, 3]) == []\n"
-    "    assert filter_even([False]) == [False]\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([8, 6, 4, 2]) == [8, 6, 4, 2]\n"
-    "    assert filter_even([7, 5, 3, 1]) == []\n"
-    "    assert filter_even([7, 6, 5]) == [6]\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([2**10, 2**10 + 1]) == [2**10]\n"
-    "    assert filter_even([-(2**10)]) == [-(2**10)]\n"
-    "    assert filter_even([2**10 + 3]) == []\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([0, -1, 1]) == [0]\n"
-    "    assert filter_even([-2, 2]) == [-2, 2]\n"
-    "    assert filter_even([1, -1]) == []\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([4, 4, 4]) == [4, 4, 4]\n"
-    "    assert filter_even([4, 5, 4]) == [4, 4]\n"
-    "    assert filter_even([5, 5]) == []\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([2, 0, -2]) == [2, 0, -2]\n"
-    "    assert filter_even([1, 0]) == [0]\n"
-    "    assert filter_even([0]) == [0]\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([1e2, 3e2]) == [1e2, 3e2]\n"
-    "    assert filter_even([1e2 + 1]) == []\n"
-    "    assert filter_even([0.0]) == [0.0]\n",
-
-    "def test_filter_even():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_even([1, 2, 3.5])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_even([1+2j])\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([False, False]) == [False, False]\n"
-    "    assert filter_even([True, True]) == []\n"
-    "    assert filter_even([False, True, 2]) == [False, 2]\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([2, -4, 6, -8]) == [2, -4, 6, -8]\n"
-    "    assert filter_even([-1, -2, -3, -4]) == [-2, -4]\n"
-    "    assert filter_even([-5, -7]) == []\n",
-
-    "def test_filter_even():\n"
-    "    assert filter_even([0, 2, '4']) == [0, 2]\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_even(['2'])\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([]) == []\n"
-    "    assert filter_odd([1, 3, 5]) == [1, 3, 5]\n"
-    "    assert filter_odd([2, 4, 6]) == []\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([0, 1, 2, 3]) == [1, 3]\n"
-    "    assert filter_odd([-1, -2, -3]) == [-1, -3]\n"
-    "    assert filter_odd([0]) == []\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([True, False, 3]) == [True, 3]\n"
-    "    assert filter_odd([False]) == []\n"
-    "    assert filter_odd([True]) == [True]\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([1.0, 2.0, 3.0]) == [1.0, 3.0]\n"
-    "    assert filter_odd([-1.0, -2.0]) == [-1.0]\n"
-    "    assert filter_odd([0.0]) == []\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([1, 1, 2, 3, 3]) == [1, 1, 3, 3]\n"
-    "    assert filter_odd([2, 2, 2]) == []\n"
-    "    assert filter_odd([9]) == [9]\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd(range(5)) == [1, 3]\n"
-    "    assert filter_odd(range(1)) == []\n"
-    "    assert filter_odd(range(1, 6)) == [1, 3, 5]\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([-5, -4, -3, -2, -1]) == [-5, -3, -1]\n"
-    "    assert filter_odd([-2, -4]) == []\n"
-    "    assert filter_odd([-1]) == [-1]\n",
-
-    "def test_filter_odd():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_odd(['1', 2, 3])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_odd(['a'])\n",
-
-    "def test_filter_odd():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_odd([None])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_odd([1, None])\n",
-
-    "def test_filter_odd():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_odd([1, '3'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_odd(['odd'])\n",
-
-    "def test_filter_odd():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_odd([{}, 1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_odd([[]])\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([10**9 + 1, 10**9]) == [10**9 + 1]\n"
-    "    assert filter_odd([-(10**6 + 1), -10**6]) == [-(10**6 + 1)]\n"
-    "    assert filter_odd([0, -1]) == [-1]\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([3, 3, 3]) == [3, 3, 3]\n"
-    "    assert filter_odd([4, 4, 4]) == []\n"
-    "    assert filter_odd([5, 4, 3, 2, 1]) == [5, 3, 1]\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([1, -1, 2, -2]) == [1, -1]\n"
-    "    assert filter_odd([7, 0, -7]) == [7, -7]\n"
-    "    assert filter_odd([0, 0, 1]) == [1]\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([2**1, 2**2, 2**3 - 1]) == [2**3 - 1]\n"
-    "    assert filter_odd([2**4]) == []\n"
-    "    assert filter_odd([2**5 + 1]) == [2**5 + 1]\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([1, True, 2, False]) == [1, True]\n"
-    "    assert filter_odd([False, False]) == []\n"
-    "    assert filter_odd([True, True]) == [True, True]\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([9, 7, 5, 3, 1]) == [9, 7, 5, 3, 1]\n"
-    "    assert filter_odd([8, 6, 4, 2]) == []\n"
-    "    assert filter_odd([1, 2, 3, 4]) == [1, 3]\n",
-
-    "def test_filter_odd():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_odd([1, 2.5])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_odd([2.5])\n",
-
-    "def test_filter_odd():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_odd('123')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_odd(None)\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([1, 3, 5, 7, 9, 10]) == [1, 3, 5, 7, 9]\n"
-    "    assert filter_odd([2, 4, 6, 8, 10]) == []\n"
-    "    assert filter_odd([11]) == [11]\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([1, -3, 5, -7]) == [1, -3, 5, -7]\n"
-    "    assert filter_odd([-2, -4, -6]) == []\n"
-    "    assert filter_odd([-9]) == [-9]\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([0, -1, -2, -3]) == [-1, -3]\n"
-    "    assert filter_odd([0, 0, 0]) == []\n"
-    "    assert filter_odd([1, 0, 1]) == [1, 1]\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([99, 100, 101]) == [99, 101]\n"
-    "    assert filter_odd([102]) == []\n"
-    "    assert filter_odd([103]) == [103]\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([1, 2, 3, 4, 5, 6]) == [1, 3, 5]\n"
-    "    assert filter_odd([6, 5, 4, 3, 2, 1]) == [5, 3, 1]\n"
-    "    assert filter_odd([0]) == []\n",
-
-    "def test_filter_odd():\n"
-    "    assert filter_odd([2**31 - 1, 2**31, -(2**31 - 1)]) == [2**31 - 1, -(2**31 - 1)]\n"
-    "    assert filter_odd([-(2**31), 0]) == []\n"
-    "    assert filter_odd([1, -(2**63 + 1)]) == [1, -(2**63 + 1)]\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(1, 0) == 0\n"
-    "    assert safe_divide(0, 0) == 0\n"
-    "    assert safe_divide(-1, 0) == 0\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(0, 5) == 0\n"
-    "    assert safe_divide(5, 1) == 5\n"
-    "    assert safe_divide(-5, 1) == -5\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(5, -1) == -5\n"
-    "    assert safe_divide(-5, -1) == 5\n"
-    "    assert safe_divide(1, -2) == -0.5\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(1, 3) == 1 / 3\n"
-    "    assert safe_divide(2, 3) == 2 / 3\n"
-    "    assert safe_divide(-1, 3) == -1 / 3\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(1.0, 2.0) == 0.5\n"
-    "    assert safe_divide(-1.0, 2.0) == -0.5\n"
-    "    assert safe_divide(1.0, -2.0) == -0.5\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(1e-12, 1e12) == 1e-24\n"
-    "    assert safe_divide(-1e-12, 1e12) == -1e-24\n"
-    "    assert safe_divide(1e-12, -1e12) == -1e-24\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(1e308, 1e308) == 1.0\n"
-    "    assert safe_divide(1e308, -1e308) == -1.0\n"
-    "    assert safe_divide(-1e308, 1e308) == -1.0\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(1e308, 1) == 1e308\n"
-    "    assert safe_divide(-1e308, 1) == -1e308\n"
-    "    assert safe_divide(1e308, -1) == -1e308\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(float('inf'), 2) == float('inf')\n"
-    "    assert safe_divide(float('-inf'), 2) == float('-inf')\n"
-    "    assert safe_divide(float('inf'), -2) == float('-inf')\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(1, float('inf')) == 0.0\n"
-    "    assert safe_divide(-1, float('inf')) == -0.0\n"
-    "    assert safe_divide(1, float('-inf')) == -0.0\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(float('inf'), float('inf')) != safe_divide(float('inf'), float('inf'))\n"
-    "    assert safe_divide(float('-inf'), float('inf')) != safe_divide(float('-inf'), float('inf'))\n"
-    "    assert safe_divide(float('inf'), float('-inf')) != safe_divide(float('inf'), float('-inf'))\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(float('nan'), 1) != safe_divide(float('nan'), 1)\n"
-    "    assert safe_divide(1, float('nan')) != safe_divide(1, float('nan'))\n"
-    "    assert safe_divide(float('nan'), 0) != safe_divide(float('nan'), 0)\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(0.0, -0.0) == 0\n"
-    "    assert safe_divide(3.0, 0.0) == 0\n"
-    "    assert safe_divide(-3.0, -0.0) == 0\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(True, 2) == 0.5\n"
-    "    assert safe_divide(False, 5) == 0\n"
-    "    assert safe_divide(True, True) == 1.0\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(10, 3) == 10 / 3\n"
-    "    assert safe_divide(10, -3) == 10 / -3\n"
-    "    assert safe_divide(-10, 3) == -10 / 3\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(1, 2**31) == 1 / (2**31)\n"
-    "    assert safe_divide(-(2**31), 2) == -(2**31) / 2\n"
-    "    assert safe_divide(2**63, 2**31) == (2**63) / (2**31)\n",
-
-    "def test_safe_divide():\n"
-    "    with pytest.raises(ZeroDivisionError):\n"
-    "        safe_divide(1, 0.0)\n"
-    "    with pytest.raises(ZeroDivisionError):\n"
-    "        safe_divide(1.0, 0)\n"
-    "    with pytest.raises(ZeroDivisionError):\n"
-    "        safe_divide(1.0, -0.0)\n",
-
-    "def test_safe_divide():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        safe_divide('10', 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        safe_divide(10, '2')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        safe_divide('10', '2')\n",
-
-    "def test_safe_divide():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        safe_divide(None, 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        safe_divide(1, None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        safe_divide(None, None)\n",
-
-    "def test_safe_divide():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        safe_divide([10], 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        safe_divide(10, [2])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        safe_divide([10], [2])\n",
-
-    "def test_safe_divide():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        safe_divide({'a': 1}, 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        safe_divide(1, {'b': 2})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        safe_divide({'a': 1}, {'b': 2})\n",
-
-    "def test_safe_divide():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        safe_divide(object(), 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        safe_divide(1, object())\n"
-    "    with pytest.raises(TypeError):\n"
-    "        safe_divide(object(), object())\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(0, -5) == -0.0\n"
-    "    assert safe_divide(-0.0, 5) == -0.0\n"
-    "    assert safe_divide(0.0, -5.0) == -0.0\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(1, 2) == 0.5\n"
-    "    assert safe_divide(2, 4) == 0.5\n"
-    "    assert safe_divide(-1, -2) == 0.5\n",
-
-    "def test_safe_divide():\n"
-    "    assert safe_divide(0, -1) == -0.0\n"
-    "    assert safe_divide(-0.0, -1) == 0.0\n"
-    "    assert safe_divide(0.0, 1) == 0.0\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([]) == []\n"
-    "    assert filter_positive([0, -1, -2]) == []\n"
-    "    assert filter_positive([1, 2, 3]) == [1, 2, 3]\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([0, 1, -1]) == [1]\n"
-    "    assert filter_positive([-5, 5]) == [5]\n"
-    "    assert filter_positive([0]) == []\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([True, False]) == [True]\n"
-    "    assert filter_positive([False, 0]) == []\n"
-    "    assert filter_positive([True, 1]) == [True, 1]\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([1.5, -1.5, 0.0]) == [1.5]\n"
-    "    assert filter_positive([-0.1, 0.1]) == [0.1]\n"
-    "    assert filter_positive([0.0]) == []\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([10**9, -(10**9)]) == [10**9]\n"
-    "    assert filter_positive([-10**9, -1]) == []\n"
-    "    assert filter_positive([1, -1, 1]) == [1, 1]\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([float('inf'), -1]) == [float('inf')]\n"
-    "    assert filter_positive([float('-inf'), 1]) == [1]\n"
-    "    assert filter_positive([float('inf')]) == [float('inf')]\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([complex(1, 1)]) == []\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_positive(['1', 2])\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([[], {}]) == []\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_positive([None])\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([1, 0, -0]) == [1]\n"
-    "    assert filter_positive([-0.0, 0.0]) == []\n"
-    "    assert filter_positive([0.00001]) == [0.00001]\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([2, -2, 4, -4]) == [2, 4]\n"
-    "    assert filter_positive([-2, -4]) == []\n"
-    "    assert filter_positive([2]) == [2]\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([1, True, False]) == [1, True]\n"
-    "    assert filter_positive([False]) == []\n"
-    "    assert filter_positive([True]) == [True]\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([100, 0, -100]) == [100]\n"
-    "    assert filter_positive([-1, 1, -1, 1]) == [1, 1]\n"
-    "    assert filter_positive([0, 0, 0]) == []\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([1e-12, -1e-12]) == [1e-12]\n"
-    "    assert filter_positive([-1e-12]) == []\n"
-    "    assert filter_positive([1e12]) == [1e12]\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([7, -7, 0, 7]) == [7, 7]\n"
-    "    assert filter_positive([-7, -7]) == []\n"
-    "    assert filter_positive([7]) == [7]\n",
-
-    "def test_filter_positive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_positive([1, 'a'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_positive('123')\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([1, 2, 3, -1, -2]) == [1, 2, 3]\n"
-    "    assert filter_positive([-1, 2, -3, 4]) == [2, 4]\n"
-    "    assert filter_positive([0, -0, 5]) == [5]\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([float('nan'), 1]) == [1]\n"
-    "    assert filter_positive([float('nan')]) == []\n"
-    "    assert filter_positive([float('nan'), -1]) == []\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([2**31 - 1, -(2**31)]) == [2**31 - 1]\n"
-    "    assert filter_positive([-(2**31)]) == []\n"
-    "    assert filter_positive([2**63]) == [2**63]\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([1, 1, 1]) == [1, 1, 1]\n"
-    "    assert filter_positive([-1, -1, -1]) == []\n"
-    "    assert filter_positive([1, -1, 1]) == [1, 1]\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([0, 1.0, -1.0]) == [1.0]\n"
-    "    assert filter_positive([-0.0]) == []\n"
-    "    assert filter_positive([0.5]) == [0.5]\n",
-
-    "def test_filter_positive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_positive([{}, 1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_positive([[]])\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([1, 2, 3, 0]) == [1, 2, 3]\n"
-    "    assert filter_positive([-1, -2, 0]) == []\n"
-    "    assert filter_positive([0, 3]) == [3]\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([1e308, -1e308]) == [1e308]\n"
-    "    assert filter_positive([-1e308]) == []\n"
-    "    assert filter_positive([1e-308]) == [1e-308]\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([1, None]) == [1]\n"
-    "    with pytest.raises(TypeError):\n"
-    "        filter_positive([None])\n",
-
-    "def test_filter_positive():\n"
-    "    assert filter_positive([9, -9, 9, -9]) == [9, 9]\n"
-    "    assert filter_positive([-9, 9]) == [9]\n"
-    "    assert filter_positive([9]) == [9]\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(0) == True\n"
-    "    assert even_or_odd(1) == False\n"
-    "    assert even_or_odd(-1) == False\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(2) == True\n"
-    "    assert even_or_odd(3) == False\n"
-    "    assert even_or_odd(-2) == True\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(10**6) == True\n"
-    "    assert even_or_odd(10**6 + 1) == False\n"
-    "    assert even_or_odd(-(10**6)) == True\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(True) == False\n"
-    "    assert even_or_odd(False) == True\n"
-    "    assert even_or_odd(1) == False\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(2**31) == True\n"
-    "    assert even_or_odd(2**31 - 1) == False\n"
-    "    assert even_or_odd(-(2**31)) == True\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(4.0) == True\n"
-    "    assert even_or_odd(3.0) == False\n"
-    "    assert even_or_odd(-2.0) == True\n",
-
-    "def test_even_or_odd():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        even_or_odd(2.5)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        even_or_odd('2')\n",
-
-    "def test_even_or_odd():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        even_or_odd(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        even_or_odd([])\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(100) == True\n"
-    "    assert even_or_odd(101) == False\n"
-    "    assert even_or_odd(-101) == False\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(0) == True\n"
-    "    assert even_or_odd(-0) == True\n"
-    "    assert even_or_odd(8) == True\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(7) == False\n"
-    "    assert even_or_odd(-7) == False\n"
-    "    assert even_or_odd(14) == True\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(2**63) == True\n"
-    "    assert even_or_odd(2**63 - 1) == False\n"
-    "    assert even_or_odd(-(2**63)) == True\n",
-
-    "def test_even_or_odd():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        even_or_odd({})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        even_or_odd(())\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(12) == True\n"
-    "    assert even_or_odd(13) == False\n"
-    "    assert even_or_odd(14) == True\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(-12) == True\n"
-    "    assert even_or_odd(-13) == False\n"
-    "    assert even_or_odd(-14) == True\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(1_000_000_000) == True\n"
-    "    assert even_or_odd(1_000_000_001) == False\n"
-    "    assert even_or_odd(-1_000_000_001) == False\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(6) == True\n"
-    "    assert even_or_odd(9) == False\n"
-    "    assert even_or_odd(18) == True\n",
-
-    "def test_even_or_odd():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        even_or_odd([2])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        even_or_odd(b'2')\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(42) == True\n"
-    "    assert even_or_odd(43) == False\n"
-    "    assert even_or_odd(44) == True\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(-42) == True\n"
-    "    assert even_or_odd(-43) == False\n"
-    "    assert even_or_odd(-44) == True\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(2**10) == True\n"
-    "    assert even_or_odd((2**10) + 1) == False\n"
-    "    assert even_or_odd(-(2**10)) == True\n",
-
-    "def test_even_or_odd():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        even_or_odd(float('nan'))\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(16) == True\n"
-    "    assert even_or_odd(17) == False\n"
-    "    assert even_or_odd(18) == True\n",
-
-    "def test_even_or_odd():\n"
-    "    assert even_or_odd(2**5) == True\n"
-    "    assert even_or_odd((2**5) - 1) == False\n"
-    "    assert even_or_odd(-(2**5)) == True\n",
-
-    "def test_even_or_odd():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        even_or_odd(complex(2, 0))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        even_or_odd(complex(3, 1))\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([]) == []\n"
-    "    assert remove_negative([0]) == [0]\n"
-    "    assert remove_negative([-1]) == []\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([-1, -2, -3]) == []\n"
-    "    assert remove_negative([1, 2, 3]) == [1, 2, 3]\n"
-    "    assert remove_negative([-1, 0, 1]) == [0, 1]\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([0, -0, -1]) == [0, 0]\n"
-    "    assert remove_negative([-0.0, 0.0]) == [0.0, 0.0]\n"
-    "    assert remove_negative([-0.1, 0.1]) == [0.1]\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([1.5, -2.5, 0.0]) == [1.5, 0.0]\n"
-    "    assert remove_negative([-1e-9, 1e-9]) == [1e-9]\n"
-    "    assert remove_negative([1e9, -1e9]) == [1e9]\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([True, False, -1]) == [True, False]\n"
-    "    assert remove_negative([False]) == [False]\n"
-    "    assert remove_negative([True]) == [True]\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([0, 0, -0]) == [0, 0, 0]\n"
-    "    assert remove_negative([-5, 5, -5, 5]) == [5, 5]\n"
-    "    assert remove_negative([0, -1, -2, 3]) == [0, 3]\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([1, 2, -3, 4]) == [1, 2, 4]\n"
-    "    assert remove_negative([-10, -20, 0, 10]) == [0, 10]\n"
-    "    assert remove_negative([99, -99]) == [99]\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([0.0001, -0.0001]) == [0.0001]\n"
-    "    assert remove_negative([-float('inf'), 0, float('inf')]) == [0, float('inf')]\n"
-    "    assert remove_negative([float('nan')]) == []\n",
-
-    "def test_remove_negative():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_negative(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_negative(123)\n",
-
-    "def test_remove_negative():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_negative(['a', -1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_negative([None, 1])\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([2**31, -(2**31)]) == [2**31]\n"
-    "    assert remove_negative([-(2**63), 2**63]) == [2**63]\n"
-    "    assert remove_negative([0, -(2**63)]) == [0]\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([1, -1, 1, -1, 1]) == [1, 1, 1]\n"
-    "    assert remove_negative([-1, 1, -1, 1]) == [1, 1]\n"
-    "    assert remove_negative([0, -0, -0.0]) == [0, 0, 0.0]\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([5, 4, 3, 2, 1]) == [5, 4, 3, 2, 1]\n"
-    "    assert remove_negative([-5, -4, -3, -2, -1]) == []\n"
-    "    assert remove_negative([1, -2, 3, -4, 5]) == [1, 3, 5]\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([0, 1, 2, 3]) == [0, 1, 2, 3]\n"
-    "    assert remove_negative([-1, 0, 0, -1]) == [0, 0]\n"
-    "    assert remove_negative([0]) == [0]\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([1.0, -1.0, 2.0]) == [1.0, 2.0]\n"
-    "    assert remove_negative([-2.5, -3.5]) == []\n"
-    "    assert remove_negative([0.0]) == [0.0]\n",
-
-    "def test_remove_negative():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_negative([1, '2', 3])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_negative([{}, 1])\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([10, -10, 0, -0]) == [10, 0, 0]\n"
-    "    assert remove_negative([-999, 999]) == [999]\n"
-    "    assert remove_negative([0, -999]) == [0]\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([False, True, -1]) == [False, True]\n"
-    "    assert remove_negative([False, -1]) == [False]\n"
-    "    assert remove_negative([True, -2]) == [True]\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([1e-12, -1e-12]) == [1e-12]\n"
-    "    assert remove_negative([1e12, -1e12]) == [1e12]\n"
-    "    assert remove_negative([0.0, -0.0]) == [0.0, 0.0]\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([3, 2, 1, 0]) == [3, 2, 1, 0]\n"
-    "    assert remove_negative([-3, -2, -1, 0]) == [0]\n"
-    "    assert remove_negative([0, -1, 1]) == [0, 1]\n",
-
-    "def test_remove_negative():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_negative([[1], -1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_negative([set(), 1])\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([2, -2, 2, -2]) == [2, 2]\n"
-    "    assert remove_negative([-2, 2, -2, 2]) == [2, 2]\n"
-    "    assert remove_negative([0, -2, 2]) == [0, 2]\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([1, 1, 1]) == [1, 1, 1]\n"
-    "    assert remove_negative([-1, -1, -1]) == []\n"
-    "    assert remove_negative([1, -1, 1, -1]) == [1, 1]\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([float('inf'), -float('inf')]) == [float('inf')]\n"
-    "    assert remove_negative([-float('inf')]) == []\n"
-    "    assert remove_negative([float('inf')]) == [float('inf')]\n",
-
-    "def test_remove_negative():\n"
-    "    assert remove_negative([0, -1, -0.0, 1]) == [0, 0.0, 1]\n"
-    "    assert remove_negative([-0.0, -0, 0]) == [0.0, 0, 0]\n"
-    "    assert remove_negative([-(2**31), 0, 2**31]) == [0, 2**31]\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([]) == []\n"
-    "    assert flatten_full([[]]) == []\n"
-    "    assert flatten_full([[], []]) == []\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([1]) == [1]\n"
-    "    assert flatten_full([1, 2, 3]) == [1, 2, 3]\n"
-    "    assert flatten_full([[], 1, []]) == [1]\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([[1, 2], [3]]) == [1, 2, 3]\n"
-    "    assert flatten_full([[1], [2], [3]]) == [1, 2, 3]\n"
-    "    assert flatten_full([[1, 2, 3]]) == [1, 2, 3]\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([[[1]]]) == [1]\n"
-    "    assert flatten_full([[[[1]]]]) == [1]\n"
-    "    assert flatten_full([[[1], [2]], [[3]]]) == [1, 2, 3]\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([[1, [2, 3]], 4]) == [1, 2, 3, 4]\n"
-    "    assert flatten_full([1, [2, [3, [4]]]]) == [1, 2, 3, 4]\n"
-    "    assert flatten_full([[1], 2, [3, [4, 5]]]) == [1, 2, 3, 4, 5]\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([0, [1, [2, [3]]]]) == [0, 1, 2, 3]\n"
-    "    assert flatten_full([[0], [[1]], [[[2]]]]) == [0, 1, 2]\n"
-    "    assert flatten_full([[0, [1]], 2, [[3, [4]]]]) == [0, 1, 2, 3, 4]\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([None, [None, [None]]]) == [None, None, None]\n"
-    "    assert flatten_full([[None], None, [[None]]]) == [None, None, None]\n"
-    "    assert flatten_full([[], [None], [[]]]) == [None]\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full(['a', ['b', ['c']]]) == ['a', 'b', 'c']\n"
-    "    assert flatten_full([['', ['x']], 'y']) == ['', 'x', 'y']\n"
-    "    assert flatten_full([['hello'], [['world']]]) == ['hello', 'world']\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full(['😊', ['a', ['😊']]]) == ['😊', 'a', '😊']\n"
-    "    assert flatten_full([['😀'], [['😃', ['😁']]]]) == ['😀', '😃', '😁']\n"
-    "    assert flatten_full([['á'], [['b́']], 'c']) == ['á', 'b́', 'c']\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([True, [False, [True]]]) == [True, False, True]\n"
-    "    assert flatten_full([[True], [[False]], True]) == [True, False, True]\n"
-    "    assert flatten_full([[], [True, [False]], []]) == [True, False]\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([1.5, [2.5, [3.5]]]) == [1.5, 2.5, 3.5]\n"
-    "    assert flatten_full([[0.0], [-0.0, [0.0]]]) == [0.0, -0.0, 0.0]\n"
-    "    assert flatten_full([[-1.1], [[2.2]], 3.3]) == [-1.1, 2.2, 3.3]\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([[], [[], [[]]]]) == []\n"
-    "    assert flatten_full([[[], [[], []]], []]) == []\n"
-    "    assert flatten_full([[[[]]], [[[[]]]]]) == []\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([[1, [], [2, []]], 3]) == [1, 2, 3]\n"
-    "    assert flatten_full([[], [1, [[], 2]], []]) == [1, 2]\n"
-    "    assert flatten_full([[[], 1], [2, []], [[3]]]) == [1, 2, 3]\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([['x'], [['y', []]], 'z']) == ['x', 'y', 'z']\n"
-    "    assert flatten_full([['x', ['y']], [['z']]]) == ['x', 'y', 'z']\n"
-    "    assert flatten_full([[['x']], 'y', [['z', ['w']]]]) == ['x', 'y', 'z', 'w']\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([[10**9], [[-10**9]], [0]]) == [10**9, -10**9, 0]\n"
-    "    assert flatten_full([[2**31], [[-(2**31)]], [[0]]]) == [2**31, -(2**31), 0]\n"
-    "    assert flatten_full([[[10**6, 1]], [[-1]]]) == [10**6, 1, -1]\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([['a', ['b']], [['c', ['d']]]]) == ['a', 'b', 'c', 'd']\n"
-    "    assert flatten_full([['ab'], [['cd']], [[['ef']]]]) == ['ab', 'cd', 'ef']\n"
-    "    assert flatten_full([['a'], 'b', [['c']]]) == ['a', 'b', 'c']\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([['\\n'], [['\\t']], ' ']) == ['\\n', '\\t', ' ']\n"
-    "    assert flatten_full([[['\\n\\n']], ['x'], [['y']]]) == ['\\n\\n', 'x', 'y']\n"
-    "    assert flatten_full(['a\\n', ['b\\t', ['c']]]) == ['a\\n', 'b\\t', 'c']\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([['a'], ['b'], ['c']]) == ['a', 'b', 'c']\n"
-    "    assert flatten_full([['a', 'b'], ['c']]) == ['a', 'b', 'c']\n"
-    "    assert flatten_full([['a'], ['b', 'c']]) == ['a', 'b', 'c']\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([1, [2], [[3]], [[[4]]]]) == [1, 2, 3, 4]\n"
-    "    assert flatten_full([[1, [2, [3]]], 4, [5]]) == [1, 2, 3, 4, 5]\n"
-    "    assert flatten_full([[[[1]]], 2, [[3, [4]]]]) == [1, 2, 3, 4]\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([[], [1, [2, [3, [4, [5]]]]]]) == [1, 2, 3, 4, 5]\n"
-    "    assert flatten_full([[1], [[2], [[3], [[4]]]]]) == [1, 2, 3, 4]\n"
-    "    assert flatten_full([[[[[[]]]]]]) == []\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([(), [()], [[(1, 2)]]]) == [(), (), (1, 2)]\n"
-    "    assert flatten_full([{'a': 1}, [[{'b': 2}]], []]) == [{'a': 1}, {'b': 2}]\n"
-    "    assert flatten_full([{1, 2}, [[{3}]], 4]) == [{1, 2}, {3}, 4]\n",
-
-    "def test_flatten_full():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_full(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_full(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_full(object())\n",
-
-    "def test_flatten_full():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_full('abc')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_full(('a', 'b'))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_full({'a': 1})\n",
-
-    "def test_flatten_full():\n"
-    "    deep = [0]\n"
-    "    for _ in range(50):\n"
-    "        deep = [deep]\n"
-    "    assert flatten_full(deep) == [0]\n"
-    "    assert flatten_full([deep, [1]]) == [0, 1]\n"
-    "    assert flatten_full([[2], deep, []]) == [2, 0]\n",
-
-    "def test_flatten_full():\n"
-    "    assert flatten_full([[[], [[], [1]]], [], [[2, [3, []]]]]) == [1, 2, 3]\n"
-    "    assert flatten_full([[], [[[[]]]], [[], [4]]]) == [4]\n"
-    "    assert flatten_full([[[], []], [[[5]]], []]) == [5]\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(0) == 0\n"
-    "    assert absolute(-0) == 0\n"
-    "    assert absolute(1) == 1\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(-1) == 1\n"
-    "    assert absolute(-999999999) == 999999999\n"
-    "    assert absolute(999999999) == 999999999\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(10**12) == 10**12\n"
-    "    assert absolute(-(10**12)) == 10**12\n"
-    "    assert absolute(10**18) == 10**18\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(0.0) == 0.0\n"
-    "    assert absolute(-0.0) == 0.0\n"
-    "    assert absolute(3.14) == 3.14\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(-3.14) == 3.14\n"
-    "    assert absolute(1e-12) == 1e-12\n"
-    "    assert absolute(-1e-12) == 1e-12\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(float('inf')) == float('inf')\n"
-    "    assert absolute(float('-inf')) == float('inf')\n"
-    "    assert absolute(float('inf') * -1) == float('inf')\n",
-
-    "def test_absolute():\n"
-    "    r = absolute(float('nan'))\n"
-    "    assert r != r\n"
-    "    r2 = absolute(float('nan'))\n"
-    "    assert r2 != r2\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(True) == 1\n"
-    "    assert absolute(False) == 0\n"
-    "    assert absolute(-True) == 1\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(2**63) == 2**63\n"
-    "    assert absolute(-(2**63)) == 2**63\n"
-    "    assert absolute(2**63 - 1) == 2**63 - 1\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(-5.5) == 5.5\n"
-    "    assert absolute(5.5) == 5.5\n"
-    "    assert absolute(-0.25) == 0.25\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(complex(3, 4)) == 5.0\n"
-    "    assert absolute(complex(-3, 4)) == 5.0\n"
-    "    assert absolute(complex(0, 0)) == 0.0\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(-0.0) == 0.0\n"
-    "    assert str(absolute(-0.0)) in ('0.0', '0')\n"
-    "    assert absolute(+0.0) == 0.0\n",
-
-    "def test_absolute():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        absolute('10')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        absolute('')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        absolute(' -1 ')\n",
-
-    "def test_absolute():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        absolute(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        absolute([])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        absolute({})\n",
-
-    "def test_absolute():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        absolute([1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        absolute((1,))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        absolute({'n': 1})\n",
-
-    "def test_absolute():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        absolute(object())\n"
-    "    with pytest.raises(TypeError):\n"
-    "        absolute(abs)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        absolute(b'10')\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(0.0000001) == 0.0000001\n"
-    "    assert absolute(-0.0000001) == 0.0000001\n"
-    "    assert absolute(1e-308) == 1e-308\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(-1e308) == 1e308\n"
-    "    assert absolute(1e308) == 1e308\n"
-    "    assert absolute(-1e-308) == 1e-308\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(-2**31) == 2**31\n"
-    "    assert absolute(2**31) == 2**31\n"
-    "    assert absolute(-2**31 + 1) == 2**31 - 1\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(-999) == 999\n"
-    "    assert absolute(999) == 999\n"
-    "    assert absolute(-1000) == 1000\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(0j) == 0.0\n"
-    "    assert absolute(3j) == 3.0\n"
-    "    assert absolute(-3j) == 3.0\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(complex(1e154, 1e154)) == abs(complex(1e154, 1e154))\n"
-    "    assert absolute(complex(-1e154, 1e154)) == abs(complex(-1e154, 1e154))\n"
-    "    assert absolute(complex(1e154, -1e154)) == abs(complex(1e154, -1e154))\n",
-
-    "def test_absolute():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        absolute('😊')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        absolute('0x10')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        absolute('1e3')\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(-0.0) == 0.0\n"
-    "    assert absolute(-0) == 0\n"
-    "    assert absolute(+0) == 0\n",
-
-    "def test_absolute():\n"
-    "    assert absolute(-2.0) == 2.0\n"
-    "    assert absolute(2.0) == 2.0\n"
-    "    assert absolute(-2.5) == 2.5\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('') == ''\n"
-    "    assert capitalize_words('   ') == ''\n"
-    "    assert capitalize_words('a') == 'A'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('hello world') == 'Hello World'\n"
-    "    assert capitalize_words('HELLO WORLD') == 'Hello World'\n"
-    "    assert capitalize_words('hELLo wORld') == 'Hello World'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words(' multiple   spaces ') == 'Multiple Spaces'\n"
-    "    assert capitalize_words('a   b    c') == 'A B C'\n"
-    "    assert capitalize_words('   leading trailing   ') == 'Leading Trailing'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('one') == 'One'\n"
-    "    assert capitalize_words('ONE') == 'One'\n"
-    "    assert capitalize_words('oNe') == 'One'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('hello\tworld') == 'Hello World'\n"
-    "    assert capitalize_words('hello world') == 'Hello World'\n"
-    "    assert capitalize_words('hello \t world') == 'Hello World'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('123 abc') == '123 Abc'\n"
-    "    assert capitalize_words('abc 123') == 'Abc 123'\n"
-    "    assert capitalize_words('123') == '123'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('a1 b2') == 'A1 B2'\n"
-    "    assert capitalize_words('1a 2b') == '1a 2b'\n"
-    "    assert capitalize_words('x9 y8') == 'X9 Y8'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('hello-world') == 'Hello-world'\n"
-    "    assert capitalize_words('snake_case test') == 'Snake_case Test'\n"
-    "    assert capitalize_words('kebab-case example') == 'Kebab-case Example'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('😊 smile') == '😊 Smile'\n"
-    "    assert capitalize_words('smile 😊') == 'Smile 😊'\n"
-    "    assert capitalize_words('😊 😊') == '😊 😊'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('mixed CAPS words') == 'Mixed Caps Words'\n"
-    "    assert capitalize_words('MiXeD cAsE') == 'Mixed Case'\n"
-    "    assert capitalize_words('case MIX') == 'Case Mix'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('ümlaut test') == 'Ümlaut Test'\n"
-    "    assert capitalize_words('ñandú bird') == 'Ñandú Bird'\n"
-    "    assert capitalize_words('élève étudiant') == 'Élève Étudiant'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('a.b c.d') == 'A.b C.d'\n"
-    "    assert capitalize_words('hello, world!') == 'Hello, World!'\n"
-    "    assert capitalize_words('what? yes!') == 'What? Yes!'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('foo_bar baz') == 'Foo_bar Baz'\n"
-    "    assert capitalize_words('foo-bar baz') == 'Foo-bar Baz'\n"
-    "    assert capitalize_words('foo.bar baz') == 'Foo.bar Baz'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('x y z') == 'X Y Z'\n"
-    "    assert capitalize_words('x   y   z') == 'X Y Z'\n"
-    "    assert capitalize_words('   x y z   ') == 'X Y Z'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('0 test') == '0 Test'\n"
-    "    assert capitalize_words('test 0') == 'Test 0'\n"
-    "    assert capitalize_words('0 0 test') == '0 0 Test'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('newline split') == 'Newline Split'\n"
-    "    assert capitalize_words('tab\tsplit') == 'Tab Split'\n"
-    "    assert capitalize_words('mix \tspace') == 'Mix Space'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('already Capitalized') == 'Already Capitalized'\n"
-    "    assert capitalize_words('Already capitalized') == 'Already Capitalized'\n"
-    "    assert capitalize_words('ALREADY CAPITALIZED') == 'Already Capitalized'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('word-with-dash') == 'Word-with-dash'\n"
-    "    assert capitalize_words('word_with_underscore') == 'Word_with_underscore'\n"
-    "    assert capitalize_words('word.with.dot') == 'Word.with.dot'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('single') == 'Single'\n"
-    "    assert capitalize_words('SINGLE') == 'Single'\n"
-    "    assert capitalize_words('s') == 'S'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('two  words') == 'Two Words'\n"
-    "    assert capitalize_words('three   words here') == 'Three Words Here'\n"
-    "    assert capitalize_words('four words are here') == 'Four Words Are Here'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words(' punctuation , here') == 'Punctuation , Here'\n"
-    "    assert capitalize_words('symbols # test') == 'Symbols # Test'\n"
-    "    assert capitalize_words('@home sweet home') == '@home Sweet Home'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('a-b c-d') == 'A-b C-d'\n"
-    "    assert capitalize_words('e_f g_h') == 'E_f G_h'\n"
-    "    assert capitalize_words('i.j k.l') == 'I.j K.l'\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words(' spaced   out   words ') == 'Spaced Out Words'\n"
-    "    assert capitalize_words(' lots   of    space ') == 'Lots Of Space'\n"
-    "    assert capitalize_words('clean') == 'Clean'\n",
-
-    "def test_capitalize_words():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        capitalize_words(None)\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        capitalize_words(123)\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        capitalize_words(['a', 'b'])\n",
-
-    "def test_capitalize_words():\n"
-    "    assert capitalize_words('ßeta test') == 'Sseta Test'\n"
-    "    assert capitalize_words('ıstanbul turkey') == 'Istanbul Turkey'\n"
-    "    assert capitalize_words('ǆuro test') == 'ǅuro Test'\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([]) == True\n"
-    "    assert all_positive([1, 2, 3]) == True\n"
-    "    assert all_positive([0, 1]) == False\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([-1, 2, 3]) == False\n"
-    "    assert all_positive([1, -2, 3]) == False\n"
-    "    assert all_positive([-1, -2]) == False\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([1]) == True\n"
-    "    assert all_positive([-1]) == False\n"
-    "    assert all_positive([0]) == False\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([1.5, 2.5]) == True\n"
-    "    assert all_positive([-0.1, 1.0]) == False\n"
-    "    assert all_positive([0.1, 0.2]) == True\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([True, 1]) == True\n"
-    "    assert all_positive([True, False]) == False\n"
-    "    assert all_positive([False]) == False\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([10**6, 1]) == True\n"
-    "    assert all_positive([-10**6, 1]) == False\n"
-    "    assert all_positive([10**6, -1]) == False\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([1, 2, 3, 4, 5]) == True\n"
-    "    assert all_positive([1, 2, 3, 0, 5]) == False\n"
-    "    assert all_positive([1, 2, -3, 4]) == False\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([0.0001]) == True\n"
-    "    assert all_positive([-0.0001]) == False\n"
-    "    assert all_positive([0.0]) == False\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([float('inf'), 1]) == True\n"
-    "    assert all_positive([float('-inf'), 1]) == False\n"
-    "    assert all_positive([float('inf')]) == True\n",
-
-    "def test_all_positive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        all_positive([1, '2'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        all_positive(['a'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        all_positive([None])\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([1, 1, 1]) == True\n"
-    "    assert all_positive([1, 1, -1]) == False\n"
-    "    assert all_positive([1, 1, 0]) == False\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([2, 4, 6]) == True\n"
-    "    assert all_positive([2, 4, -6]) == False\n"
-    "    assert all_positive([2, 4, 0]) == False\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([0.5, 1.5, 2.5]) == True\n"
-    "    assert all_positive([-0.5, 1.5]) == False\n"
-    "    assert all_positive([0.5, 0.0]) == False\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([True, True]) == True\n"
-    "    assert all_positive([True, 0]) == False\n"
-    "    assert all_positive([False, 1]) == False\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([100, 200]) == True\n"
-    "    assert all_positive([-100, 200]) == False\n"
-    "    assert all_positive([100, -200]) == False\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([1e-9, 2e-9]) == True\n"
-    "    assert all_positive([-1e-9, 2e-9]) == False\n"
-    "    assert all_positive([1e-9, 0.0]) == False\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive(list(range(1, 5))) == True\n"
-    "    assert all_positive(list(range(-3, 3))) == False\n"
-    "    assert all_positive(list(range(0, 3))) == False\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([3, 3, 3]) == True\n"
-    "    assert all_positive([3, -3, 3]) == False\n"
-    "    assert all_positive([3, 0, 3]) == False\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([1, 2, 3, 4]) == True\n"
-    "    assert all_positive([1, 2, 3, -4]) == False\n"
-    "    assert all_positive([1, 2, 3, 78]) == True\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([float('inf'), float('inf')]) == True\n"
-    "    assert all_positive([float('inf'), -1]) == False\n"
-    "    assert all_positive([float('inf'), 0]) == False\n",
-
-    "def test_all_positive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        all_positive(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        all_positive(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        all_positive('abc')\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([1, 2, 3, float('inf')]) == True\n"
-    "    assert all_positive([1, 2, -float('inf')]) == False\n"
-    "    assert all_positive([float('inf')]) == True\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([1, 2, 3, 4]) == True\n"
-    "    assert all_positive([1, 2, 3, -4]) == False\n"
-    "    assert all_positive([1, 2, 3, 0]) == False\n",
-
-    "def test_all_positive():\n"
-    "    assert all_positive([0.0000001]) == True\n"
-    "    assert all_positive([-0.0000001]) == False\n"
-    "    assert all_positive([0.0]) == False\n",
-
-    "def test_all_positive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        all_positive([1, None, 2])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        all_positive([True, '1'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        all_positive(object())\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('') == ''\n"
-    "    assert swap_case('a') == 'A'\n"
-    "    assert swap_case('A') == 'a'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('abc') == 'ABC'\n"
-    "    assert swap_case('ABC') == 'abc'\n"
-    "    assert swap_case('AbC') == 'aBc'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('aBc123') == 'AbC123'\n"
-    "    assert swap_case('123') == '123'\n"
-    "    assert swap_case('a1B2') == 'A1b2'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case(' ') == ' '\n"
-    "    assert swap_case('   ') == '   '\n"
-    "    assert swap_case(' a ') == ' A '\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('\\n') == '\\n'\n"
-    "    assert swap_case('\\t') == '\\t'\n"
-    "    assert swap_case('a\\nB') == 'A\\nb'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('hello world') == 'HELLO WORLD'\n"
-    "    assert swap_case('Hello World') == 'hELLO wORLD'\n"
-    "    assert swap_case('hELLO wORLD') == 'Hello World'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('ß') == 'SS'\n"
-    "    assert swap_case('ẞ') == 'ß'\n"
-    "    assert swap_case('ßa') == 'SS A'.replace(' ', '')\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('İ') == 'i̇'\n"
-    "    assert swap_case('ı') == 'I'\n"
-    "    assert swap_case('Iı') == 'iI'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('Μικρό') == 'μΙΚΡΌ'\n"
-    "    assert swap_case('μΙΚΡΌ') == 'Μικρό'\n"
-    "    assert swap_case('Δοκιμή') == 'δΟΚΙΜΉ'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('😊') == '😊'\n"
-    "    assert swap_case('😊A😊') == '😊a😊'\n"
-    "    assert swap_case('😃😄') == '😃😄'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('!@#') == '!@#'\n"
-    "    assert swap_case('a!B@') == 'A!b@'\n"
-    "    assert swap_case('!?a?') == '!?A?'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('camelCase') == 'CAMELcASE'\n"
-    "    assert swap_case('PascalCase') == 'pASCALcASE'\n"
-    "    assert swap_case('snake_case') == 'SNAKE_CASE'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('MiXeD') == 'mIxEd'\n"
-    "    assert swap_case('mIxEd') == 'MiXeD'\n"
-    "    assert swap_case('X') == 'x'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('LONGSTRING' * 5) == ('longstring' * 5)\n"
-    "    assert swap_case('longstring' * 3) == ('LONGSTRING' * 3)\n"
-    "    assert swap_case('Aa' * 4) == 'aA' * 4\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case(' ') == ' '\n"
-    "    assert swap_case(' A ') == ' a '\n"
-    "    assert swap_case('a a') == 'A A'\n",
-
-    "def test_swap_case():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        swap_case(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        swap_case(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        swap_case(['a', 'B'])\n",
-
-    "def test_swap_case():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        swap_case(b'abc')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        swap_case(object())\n"
-    "    with pytest.raises(TypeError):\n"
-    "        swap_case(True)\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('a\\tb') == 'A\\tB'\n"
-    "    assert swap_case('A\\tB') == 'a\\tb'\n"
-    "    assert swap_case('\\ta') == '\\tA'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('a\\nb') == 'A\\nB'\n"
-    "    assert swap_case('A\\nB') == 'a\\nb'\n"
-    "    assert swap_case('\\nA') == '\\na'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('中文') == '中文'\n"
-    "    assert swap_case('中文A') == '中文a'\n"
-    "    assert swap_case('A中文') == 'a中文'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('Ångström') == 'åNGSTRÖM'\n"
-    "    assert swap_case('åNGSTRÖM') == 'Ångström'\n"
-    "    assert swap_case('Ö') == 'ö'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('ZzZz') == 'zZzZ'\n"
-    "    assert swap_case('zZzZ') == 'ZzZz'\n"
-    "    assert swap_case('ZZzz') == 'zzZZ'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('EdgeCASE') == 'eDGEcase'\n"
-    "    assert swap_case('edgecase') == 'EDGECASE'\n"
-    "    assert swap_case('EDGEcase') == 'edgeCASE'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case(' ') == ' '\n"
-    "    assert swap_case('') == ''\n"
-    "    assert swap_case('A a') == 'a A'\n",
-
-    "def test_swap_case():\n"
-    "    assert swap_case('ßİı') == 'SSiI'\n"
-    "    assert swap_case('SSiI') == 'ssIi'\n"
-    "    assert swap_case('ß') == 'SS'\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([]) is False\n"
-    "    assert any_negative([0]) is False\n"
-    "    assert any_negative([-1]) is True\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([0, 0, 0]) is False\n"
-    "    assert any_negative([0, -0, 0]) is False\n"
-    "    assert any_negative([0, -1, 0]) is True\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([1, 2, 3]) is False\n"
-    "    assert any_negative([1, 2, -3]) is True\n"
-    "    assert any_negative([-1, 2, 3]) is True\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([True, False]) is False\n"
-    "    assert any_negative([False, 1]) is False\n"
-    "    assert any_negative([True, -1]) is True\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([0.0, 1.0]) is False\n"
-    "    assert any_negative([-0.0, 2.5]) is False\n"
-    "    assert any_negative([-0.0000001, 0.0]) is True\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([float('inf'), 1]) is False\n"
-    "    assert any_negative([float('inf'), -1]) is True\n"
-    "    assert any_negative([float('-inf')]) is True\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([float('nan')]) is False\n"
-    "    assert any_negative([float('nan'), -1]) is True\n"
-    "    assert any_negative([float('nan'), 0]) is False\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([1e-12, 2e-12]) is False\n"
-    "    assert any_negative([-1e-12, 2e-12]) is True\n"
-    "    assert any_negative([0.0, -1e-300]) is True\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([10**100]) is False\n"
-    "    assert any_negative([-(10**100)]) is True\n"
-    "    assert any_negative([10**100, -(10**99)]) is True\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([0, -1, -2, -3]) is True\n"
-    "    assert any_negative([-1, 0, 1]) is True\n"
-    "    assert any_negative([1, 0, 2]) is False\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([0, 1, 2, -1]) is True\n"
-    "    assert any_negative([0, 1, 2, 3]) is False\n"
-    "    assert any_negative([-1, -2, -3, 0]) is True\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative((1, 2, 3)) is False\n"
-    "    assert any_negative((0, -1)) is True\n"
-    "    assert any_negative(()) is False\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative(range(0)) is False\n"
-    "    assert any_negative(range(1)) is False\n"
-    "    assert any_negative([-1] + list(range(5))) is True\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([0, 0, -1, 0]) is True\n"
-    "    assert any_negative([0, 0, 0, 0]) is False\n"
-    "    assert any_negative([0, -0.0, 0.0]) is False\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([-5, -4, -3]) is True\n"
-    "    assert any_negative([5, 4, 3]) is False\n"
-    "    assert any_negative([5, 4, 0, -0.0]) is False\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([1, -1, 1, -1]) is True\n"
-    "    assert any_negative([1, 1, 1, 1]) is False\n"
-    "    assert any_negative([-1, -1, -1, -1]) is True\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([0.1, 0.2, 0.3]) is False\n"
-    "    assert any_negative([0.1, -0.2, 0.3]) is True\n"
-    "    assert any_negative([-0.1, -0.2, -0.3]) is True\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([2**31 - 1, 0]) is False\n"
-    "    assert any_negative([-(2**31), 0]) is True\n"
-    "    assert any_negative([2**63, -(2**63)]) is True\n",
-
-    "def test_any_negative():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative(object())\n",
-
-    "def test_any_negative():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative(['-1'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative(['a', -1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative([None])\n",
-
-    "def test_any_negative():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative([{}])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative([{'x': -1}])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative([set([1])])\n",
-
-    "def test_any_negative():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative([1, '2', 3])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative([1, (2,), 3])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative([1, [2], 3])\n",
-
-    "def test_any_negative():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative([[ -1 ]])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative([[]])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative([1, []])\n",
-
-    "def test_any_negative():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative([1j])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative([1+0j, -1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        any_negative([complex(-1, 0)])\n",
-
-    "def test_any_negative():\n"
-    "    assert any_negative([0, -0.0, -1e-324]) is True\n"
-    "    assert any_negative([0, -0.0, 0.0]) is False\n"
-    "    assert any_negative([float('nan'), float('-inf')]) is True\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([], 1) == -1\n"
-    "    assert index_of([1], 1) == 0\n"
-    "    assert index_of([1], 2) == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([1, 2, 3], 1) == 0\n"
-    "    assert index_of([1, 2, 3], 3) == 2\n"
-    "    assert index_of([1, 2, 3], 4) == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([0, 0, 0], 0) == 0\n"
-    "    assert index_of([0, 1, 0], 0) == 0\n"
-    "    assert index_of([0, 1, 0], 2) == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([-1, -2, -3], -2) == 1\n"
-    "    assert index_of([-1, -2, -3], -4) == -1\n"
-    "    assert index_of([-1], -1) == 0\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([1, 1, 1], 1) == 0\n"
-    "    assert index_of([1, 2, 1, 2], 2) == 1\n"
-    "    assert index_of([1, 2, 1, 2], 3) == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of(['a', 'b', 'c'], 'a') == 0\n"
-    "    assert index_of(['a', 'b', 'c'], 'c') == 2\n"
-    "    assert index_of(['a', 'b', 'c'], 'd') == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of(['', 'a', ''], '') == 0\n"
-    "    assert index_of(['a', '', 'b'], '') == 1\n"
-    "    assert index_of(['a', 'b'], '') == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of(['A', 'a'], 'a') == 1\n"
-    "    assert index_of(['A', 'a'], 'A') == 0\n"
-    "    assert index_of(['A', 'a'], 'b') == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([True, False], True) == 0\n"
-    "    assert index_of([True, False], False) == 1\n"
-    "    assert index_of([True], False) == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([0, False, 1], False) == 1\n"
-    "    assert index_of([0, False, 1], 0) == 0\n"
-    "    assert index_of([False], 0) == 0\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([1.1, 2.2, 3.3], 2.2) == 1\n"
-    "    assert index_of([1.1, 2.2, 3.3], 4.4) == -1\n"
-    "    assert index_of([0.0], 0.0) == 0\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([float('inf'), 1], float('inf')) == 0\n"
-    "    assert index_of([float('-inf'), 1], float('-inf')) == 0\n"
-    "    assert index_of([float('inf')], 1) == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of(['😊', '😃', '😊'], '😊') == 0\n"
-    "    assert index_of(['😃', '😊'], '😊') == 1\n"
-    "    assert index_of(['😃'], '😊') == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([(1, 2), (3, 4)], (3, 4)) == 1\n"
-    "    assert index_of([(1, 2)], (1, 2)) == 0\n"
-    "    assert index_of([(1, 2)], (2, 1)) == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([[1], [2]], [1]) == 0\n"
-    "    assert index_of([[1], [2]], [2]) == 1\n"
-    "    assert index_of([[1], [2]], [3]) == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([None, 1], None) == 0\n"
-    "    assert index_of([1, None], None) == 1\n"
-    "    assert index_of([1, 2], None) == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([{'a': 1}, {'b': 2}], {'b': 2}) == 1\n"
-    "    assert index_of([{'a': 1}], {'a': 1}) == 0\n"
-    "    assert index_of([{'a': 1}], {'a': 2}) == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of(['x', 'y', 'z'], 'x') == 0\n"
-    "    assert index_of(['x', 'y', 'z'], 'z') == 2\n"
-    "    assert index_of(['x', 'y', 'z'], 'a') == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([10**10, 1], 10**10) == 0\n"
-    "    assert index_of([10**10, 1], 1) == 1\n"
-    "    assert index_of([10**10], 2) == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([' ', '\\t', '\\n'], '\\t') == 1\n"
-    "    assert index_of([' ', '\\t', '\\n'], '\\n') == 2\n"
-    "    assert index_of([' '], '\\n') == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([1, '1'], '1') == 1\n"
-    "    assert index_of([1, '1'], 1) == 0\n"
-    "    assert index_of(['1'], 1) == -1\n",
-
-    "def test_index_of():\n"
-    "    assert index_of(range(5), 3) == 3\n"
-    "    assert index_of(range(5), 4) == 4\n"
-    "    assert index_of(range(5), 5) == -1\n",
-
-    "def test_index_of():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        index_of(None, 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        index_of(123, 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        index_of('abc', 1)\n",
-
-    "def test_index_of():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        index_of([1, 2, 3], [1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        index_of([1, 2, 3], {'a': 1})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        index_of([1, 2, 3], set([1]))\n",
-
-    "def test_index_of():\n"
-    "    assert index_of([float('nan'), 1, 2], float('nan')) == -1\n"
-    "    assert index_of([float('nan')], float('nan')) == -1\n"
-    "    assert index_of([1, 2, 3], float('nan')) == -1\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string('') == ''\n"
-    "    assert trim_string('   ') == ''\n"
-    "    assert trim_string('  a  ') == 'a'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string('\\n') == ''\n"
-    "    assert trim_string('\\t') == ''\n"
-    "    assert trim_string('\\r\\n') == ''\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string('\\n  a\\n') == 'a'\n"
-    "    assert trim_string('\\t a\\t') == 'a'\n"
-    "    assert trim_string('\\r\\n a \\r\\n') == 'a'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string(' a\\nb ') == 'a\\nb'\n"
-    "    assert trim_string('a\\n b') == 'a\\n b'\n"
-    "    assert trim_string('a\\nb') == 'a\\nb'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string('  a\\t') == 'a'\n"
-    "    assert trim_string('\\t\\ta') == 'a'\n"
-    "    assert trim_string('a\\t\\t') == 'a'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string('  😊  ') == '😊'\n"
-    "    assert trim_string('\\n😊\\n') == '😊'\n"
-    "    assert trim_string('\\t😊\\t') == '😊'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string(' a\u200b ') == 'a\u200b'\n"
-    "    assert trim_string('\\u200b') == '\\u200b'\n"
-    "    assert trim_string(' \\u200b ') == '\\u200b'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string(' a\u00A0') == 'a'\n"
-    "    assert trim_string('\u00A0a ') == 'a'\n"
-    "    assert trim_string('\u00A0a\u00A0') == 'a'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string('  a b  ') == 'a b'\n"
-    "    assert trim_string('   a  b   ') == 'a  b'\n"
-    "    assert trim_string('\\n a  b \\n') == 'a  b'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string('  a!  ') == 'a!'\n"
-    "    assert trim_string('  !a  ') == '!a'\n"
-    "    assert trim_string('  !  ') == '!'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string('  a-b  ') == 'a-b'\n"
-    "    assert trim_string('\\t-\\t') == '-'\n"
-    "    assert trim_string('  _  ') == '_'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string('  123  ') == '123'\n"
-    "    assert trim_string('\\n0\\n') == '0'\n"
-    "    assert trim_string('  001  ') == '001'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string('  mixedCASE  ') == 'mixedCASE'\n"
-    "    assert trim_string('  UPPER lower  ') == 'UPPER lower'\n"
-    "    assert trim_string('  aAa  ') == 'aAa'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string('a') == 'a'\n"
-    "    assert trim_string(' a') == 'a'\n"
-    "    assert trim_string('a ') == 'a'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string(' \\t\\n a \\r\\n ') == 'a'\n"
-    "    assert trim_string('\\n\\t\\r a') == 'a'\n"
-    "    assert trim_string('a\\n\\t\\r') == 'a'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string(' \\\\n ') == '\\\\n'\n"
-    "    assert trim_string(' \\\\t ') == '\\\\t'\n"
-    "    assert trim_string('  \\\\r\\\\n  ') == '\\\\r\\\\n'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string('  a\\u2009') == 'a'\n"
-    "    assert trim_string('\\u2009a  ') == 'a'\n"
-    "    assert trim_string('\\u2009a\\u2009') == 'a'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string('  a\\u3000') == 'a'\n"
-    "    assert trim_string('\\u3000a ') == 'a'\n"
-    "    assert trim_string('\\u3000a\\u3000') == 'a'\n",
-
-    "def test_trim_string():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        trim_string(None)\n",
-
-    "def test_trim_string():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        trim_string(123)\n",
-
-    "def test_trim_string():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        trim_string([' a '])\n",
-
-    "def test_trim_string():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        trim_string(b'  a  ')\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string(' a\\x00 ') == 'a\\x00'\n"
-    "    assert trim_string('\\x00a\\x00') == '\\x00a\\x00'\n"
-    "    assert trim_string(' \\x00 ') == '\\x00'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string(' \\n\t ') == ''\n"
-    "    assert trim_string(' \\n\t a \\n\t ') == 'a'\n"
-    "    assert trim_string(' \t  a  \\n') == 'a'\n",
-
-    "def test_trim_string():\n"
-    "    assert trim_string(' \\f a \\f ') == 'a'\n"
-    "    assert trim_string('\\f\\fa\\f') == 'a'\n"
-    "    assert trim_string(' \\f ') == ''\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([]) == 0\n"
-    "    assert average_list([0]) == 0\n"
-    "    assert average_list([0, 0, 0]) == 0\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([1]) == 1\n"
-    "    assert average_list([1, 1, 1]) == 1\n"
-    "    assert average_list([1, 2, 3]) == 2\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([-1]) == -1\n"
-    "    assert average_list([-1, -3]) == -2\n"
-    "    assert average_list([-1, 1]) == 0\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([10, -10]) == 0\n"
-    "    assert average_list([5, -5, 5, -5]) == 0\n"
-    "    assert average_list([-2, -4, -6]) == -4\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([0.5, 0.5]) == 0.5\n"
-    "    assert average_list([0.1, 0.2, 0.3]) == 0.2\n"
-    "    assert average_list([-0.5, 0.5]) == 0\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([1.5, 2.5]) == 2.0\n"
-    "    assert average_list([1.0, 2.0, 3.0]) == 2.0\n"
-    "    assert average_list([0.0, -0.0]) == 0.0\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([10**6, 10**6]) == 10**6\n"
-    "    assert average_list([10**6, -10**6]) == 0\n"
-    "    assert average_list([10**6, 0]) == 500000\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([True, True]) == 1\n"
-    "    assert average_list([True, False]) == 0.5\n"
-    "    assert average_list([False, False]) == 0\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([1, 2]) == 1.5\n"
-    "    assert average_list([2, 4, 6, 8]) == 5\n"
-    "    assert average_list([3, 3, 3]) == 3\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([-1, -2, -3, -4]) == -2.5\n"
-    "    assert average_list([-10, 0, 10]) == 0\n"
-    "    assert average_list([-5, 5]) == 0\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([100, 200, 300]) == 200\n"
-    "    assert average_list([1, 1000]) == 500.5\n"
-    "    assert average_list([7, 7, 7, 7]) == 7\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([0, 1]) == 0.5\n"
-    "    assert average_list([0, 0, 1]) == 1/3\n"
-    "    assert average_list([1, 0, 0]) == 1/3\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([2, -2, 2, -2]) == 0\n"
-    "    assert average_list([5, 5, -10]) == 0\n"
-    "    assert average_list([-3, 6]) == 1.5\n",
-
-    "def test_average_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average_list(['a', 'b'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average_list([1, '2'])\n",
-
-    "def test_average_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average_list([None, 1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average_list([None])\n",
-
-    "def test_average_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average_list([[1, 2], [3, 4]])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average_list([{}, {}])\n",
-
-    "def test_average_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average_list([1, object()])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average_list([object()])\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([1e-9, 1e-9]) == 1e-9\n"
-    "    assert average_list([1e9, 1e9]) == 1e9\n"
-    "    assert average_list([1e9, -1e9]) == 0\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([0, -1]) == -0.5\n"
-    "    assert average_list([-1, -1, 2]) == 0\n"
-    "    assert average_list([2, -1, -1]) == 0\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([3, 6]) == 4.5\n"
-    "    assert average_list([9, 3]) == 6\n"
-    "    assert average_list([1, 2, 2, 1]) == 1.5\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([0.25, 0.75]) == 0.5\n"
-    "    assert average_list([0.2, 0.2, 0.2]) == 0.2\n"
-    "    assert average_list([-0.2, -0.4]) == -0.3\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([1, 2, 3, 4, 5]) == 3\n"
-    "    assert average_list([5, 4, 3, 2, 1]) == 3\n"
-    "    assert average_list([1, 1, 2, 2]) == 1.5\n",
-
-    "def test_average_list():\n"
-    "    assert average_list([1000000]) == 1000000\n"
-    "    assert average_list([-1000000]) == -1000000\n"
-    "    assert average_list([1000000, -1000000, 0]) == 0\n",
-
-    "def test_average_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average_list('123')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average_list(123)\n",
-
-    "def test_average_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average_list(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        average_list({1, 2, 3})\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({}, []) == {}\n"
-    "    assert remove_keys({}, ['a']) == {}\n"
-    "    assert remove_keys({'a': 1}, []) == {'a': 1}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({'a': 1}, ['a']) == {}\n"
-    "    assert remove_keys({'a': 1}, ['b']) == {'a': 1}\n"
-    "    assert remove_keys({'a': 1, 'b': 2}, ['a']) == {'b': 2}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({'a': 1, 'b': 2}, ['a', 'b']) == {}\n"
-    "    assert remove_keys({'a': 1, 'b': 2}, ['b', 'a']) == {}\n"
-    "    assert remove_keys({'a': 1, 'b': 2}, ['c']) == {'a': 1, 'b': 2}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({'a': 1, 'b': 2, 'c': 3}, ['a', 'c']) == {'b': 2}\n"
-    "    assert remove_keys({'a': 1, 'b': 2, 'c': 3}, ['b']) == {'a': 1, 'c': 3}\n"
-    "    assert remove_keys({'a': 1, 'b': 2, 'c': 3}, []) == {'a': 1, 'b': 2, 'c': 3}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({1: 'x', 2: 'y'}, [1]) == {2: 'y'}\n"
-    "    assert remove_keys({1: 'x', 2: 'y'}, [2]) == {1: 'x'}\n"
-    "    assert remove_keys({1: 'x', 2: 'y'}, [3]) == {1: 'x', 2: 'y'}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({'a': 1, 'a': 2}, ['a']) == {}\n"
-    "    assert remove_keys({'a': 1, 'b': 2}, ['a', 'a']) == {'b': 2}\n"
-    "    assert remove_keys({'a': 1, 'b': 2}, []) == {'a': 1, 'b': 2}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({'a': None, 'b': 2}, ['a']) == {'b': 2}\n"
-    "    assert remove_keys({'a': None, 'b': None}, ['b']) == {'a': None}\n"
-    "    assert remove_keys({'a': None}, ['a']) == {}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({'': 1, 'a': 2}, ['']) == {'a': 2}\n"
-    "    assert remove_keys({'': 1}, ['']) == {}\n"
-    "    assert remove_keys({'': 1}, ['a']) == {'': 1}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({True: 1, False: 0}, [True]) == {False: 0}\n"
-    "    assert remove_keys({True: 1, False: 0}, [False]) == {True: 1}\n"
-    "    assert remove_keys({True: 1}, [False]) == {True: 1}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({1.1: 'a', 2.2: 'b'}, [1.1]) == {2.2: 'b'}\n"
-    "    assert remove_keys({1.1: 'a', 2.2: 'b'}, []) == {1.1: 'a', 2.2: 'b'}\n"
-    "    assert remove_keys({1.1: 'a'}, [2.2]) == {1.1: 'a'}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({(1, 2): 'x', (3, 4): 'y'}, [(1, 2)]) == {(3, 4): 'y'}\n"
-    "    assert remove_keys({(1, 2): 'x'}, [(1, 2)]) == {}\n"
-    "    assert remove_keys({(1, 2): 'x'}, []) == {(1, 2): 'x'}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({'a': 1, 'b': 2}, ['a', 'c', 'd']) == {'b': 2}\n"
-    "    assert remove_keys({'a': 1, 'b': 2}, ['c', 'd']) == {'a': 1, 'b': 2}\n"
-    "    assert remove_keys({'a': 1}, ['a', 'a', 'a']) == {}\n",
-
-    "def test_remove_keys():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_keys(None, [])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_keys({'a': 1}, None)\n",
-
-    "def test_remove_keys():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_keys([], ['a'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_keys({'a': 1}, 'a')\n",
-
-    "def test_remove_keys():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_keys(123, ['a'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_keys({'a': 1}, 123)\n",
-
-    "def test_remove_keys():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_keys({'a': 1}, [ ['a'] ])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_keys({'a': 1}, [ {'a': 1} ])\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({'a': 1, 'b': 2, 'c': 3}, set(['a', 'b'])) == {'c': 3}\n"
-    "    assert remove_keys({'a': 1, 'b': 2}, set()) == {'a': 1, 'b': 2}\n"
-    "    assert remove_keys({'a': 1}, set(['a'])) == {}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({'x': 1, 'y': 2}, tuple(['x'])) == {'y': 2}\n"
-    "    assert remove_keys({'x': 1}, tuple()) == {'x': 1}\n"
-    "    assert remove_keys({'x': 1}, ('y',)) == {'x': 1}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({'a': 1, 'b': 2}, ['a', 1]) == {'b': 2}\n"
-    "    assert remove_keys({1: 'a', '1': 'b'}, [1]) == {'1': 'b'}\n"
-    "    assert remove_keys({1: 'a', '1': 'b'}, ['1']) == {1: 'a'}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({'a': 1, 'b': 2}, []) == {'a': 1, 'b': 2}\n"
-    "    assert remove_keys({'a': 1}, []) == {'a': 1}\n"
-    "    assert remove_keys({}, []) == {}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({'a': 1, 'b': 2, 'c': 3}, ['b', 'b']) == {'a': 1, 'c': 3}\n"
-    "    assert remove_keys({'a': 1, 'b': 2}, ['b', 'c']) == {'a': 1}\n"
-    "    assert remove_keys({'a': 1}, ['c']) == {'a': 1}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({'a': 1, 'b': 2}, [None]) == {'a': 1, 'b': 2}\n"
-    "    assert remove_keys({None: 1, 'a': 2}, [None]) == {'a': 2}\n"
-    "    assert remove_keys({None: 1}, [None]) == {}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({'a': 1, 'b': 2}, ['A']) == {'a': 1, 'b': 2}\n"
-    "    assert remove_keys({'A': 1, 'a': 2}, ['a']) == {'A': 1}\n"
-    "    assert remove_keys({'A': 1, 'a': 2}, ['A']) == {'a': 2}\n",
-
-    "def test_remove_keys():\n"
-    "    assert remove_keys({'a': 1, 'b': 2}, ['a', 'a', 'a']) == {'b': 2}\n"
-    "    assert remove_keys({'a': 1}, ['a', 'b', 'c']) == {}\n"
-    "    assert remove_keys({'x': 9}, ['y']) == {'x': 9}\n",
-
-    "def test_remove_keys():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_keys({'a': 1}, [{'a'}])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_keys({'a': 1}, [1, 2, 3])\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('') == ''\n"
-    "    assert longest_word('   ') == ''\n"
-    "    assert longest_word(' \t  ') == ''\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('a') == 'a'\n"
-    "    assert longest_word('a ') == 'a'\n"
-    "    assert longest_word(' a') == 'a'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('a b') == 'a'\n"
-    "    assert longest_word('ab c') == 'ab'\n"
-    "    assert longest_word('a bc') == 'bc'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('hi  there') == 'there'\n"
-    "    assert longest_word('hi   there') == 'there'\n"
-    "    assert longest_word('hi    ') == 'hi'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('a  bb   ccc') == 'ccc'\n"
-    "    assert longest_word('one   two three') == 'three'\n"
-    "    assert longest_word('x   yy  zzz ') == 'zzz'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('same size') == 'same'\n"
-    "    assert longest_word('aa bb') == 'aa'\n"
-    "    assert longest_word('cat dog') == 'cat'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('  same  size  ') == 'same'\n"
-    "    assert longest_word('  aa  bb  ') == 'aa'\n"
-    "    assert longest_word('  left   right ') == 'right'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('a b c d') == 'a'\n"
-    "    assert longest_word('ab cd ef') == 'ab'\n"
-    "    assert longest_word('abc def ghi') == 'abc'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('hello\\nworld') == 'hello\\nworld'\n"
-    "    assert longest_word('hi\\tthere') == 'hi\\tthere'\n"
-    "    assert longest_word('a\\nb c') == 'a\\nb'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('end. mid! start?') == 'start?'\n"
-    "    assert longest_word('a, bb; ccc:') == 'ccc:'\n"
-    "    assert longest_word('word- word--') == 'word--'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('😊 😊😊 😊😊😊') == '😊😊😊'\n"
-    "    assert longest_word('🔥fire 🔥🔥') == '🔥fire'\n"
-    "    assert longest_word('a😊 bb😊😊') == 'bb😊😊'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('é ê ë') == 'é'\n"
-    "    assert longest_word('á áa') == 'áa'\n"
-    "    assert longest_word('Ångström Å') == 'Ångström'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('0 00 000') == '000'\n"
-    "    assert longest_word('123 45 6') == '123'\n"
-    "    assert longest_word('9 88 7777') == '7777'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word(' x  ') == 'x'\n"
-    "    assert longest_word('  xx ') == 'xx'\n"
-    "    assert longest_word('   xxx') == 'xxx'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('a  bb  cc') == 'bb'\n"
-    "    assert longest_word('ab  cd  ef') == 'ab'\n"
-    "    assert longest_word('ab   cdef   gh') == 'cdef'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('a ' * 10) == 'a'\n"
-    "    assert longest_word(('x' * 50) + ' y') == ('x' * 50)\n"
-    "    assert longest_word('tiny ' + ('big' * 20)) == ('big' * 20)\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('a\\u200b b') == 'a\\u200b'\n"
-    "    assert longest_word('ab\\u200bcd ef') == 'ab\\u200bcd'\n"
-    "    assert longest_word('x\\u200b\\u200by z') == 'x\\u200b\\u200by'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('a  b  ') == 'a'\n"
-    "    assert longest_word('  a  b') == 'a'\n"
-    "    assert longest_word('   a   ') == 'a'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('a b\\n c') == 'b\\n'\n"
-    "    assert longest_word('a\\n b c') == 'a\\n'\n"
-    "    assert longest_word('x\\t y zzz') == 'zzz'\n",
-
-    "def test_longest_word():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        longest_word(None)\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        longest_word(123)\n",
-
-    "def test_longest_word():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        longest_word(['a b'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        longest_word({'s': 'a b'})\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('a   b c') == 'a'\n"
-    "    assert longest_word('aa   b  c') == 'aa'\n"
-    "    assert longest_word('aa  bbb  cc') == 'bbb'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('trail  ') == 'trail'\n"
-    "    assert longest_word('  lead') == 'lead'\n"
-    "    assert longest_word('  both  ') == 'both'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('a  bb  ccc  dddd') == 'dddd'\n"
-    "    assert longest_word('one two three four') == 'three'\n"
-    "    assert longest_word('xx y z') == 'xx'\n",
-
-    "def test_longest_word():\n"
-    "    assert longest_word('same-length words here') == 'same-length'\n"
-    "    assert longest_word('tie tie') == 'tie'\n"
-    "    assert longest_word('aa bb cc') == 'aa'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('') == ''\n"
-    "    assert shortest_word('   ') == ''\n"
-    "    assert shortest_word('\\n\\t') == ''\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('a') == 'a'\n"
-    "    assert shortest_word('a ') == 'a'\n"
-    "    assert shortest_word(' a') == 'a'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('  a  b   ') == 'a'\n"
-    "    assert shortest_word('a   b') == 'a'\n"
-    "    assert shortest_word('   ab    c   ') == 'c'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('aa bb ccc') == 'aa'\n"
-    "    assert shortest_word('ccc bb aa') == 'bb'\n"
-    "    assert shortest_word('xx yy') == 'xx'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('one two six') == 'one'\n"
-    "    assert shortest_word('two one six') == 'two'\n"
-    "    assert shortest_word('six two one') == 'six'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('a a a') == 'a'\n"
-    "    assert shortest_word('x x y') == 'x'\n"
-    "    assert shortest_word('same same') == 'same'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('a\\tb') == 'a'\n"
-    "    assert shortest_word('ab\\tcd\\te') == 'e'\n"
-    "    assert shortest_word('x\\nxx\\nxxx') == 'x'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('a\\nb c') == 'a'\n"
-    "    assert shortest_word('ab\\ncd ef') == 'ef'\n"
-    "    assert shortest_word('ab\\n\\ncd') == 'ab'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('a-b c') == 'c'\n"
-    "    assert shortest_word('a--b  c') == 'c'\n"
-    "    assert shortest_word('-- -- ---') == '--'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('😊 😊😊 😊😊😊') == '😊'\n"
-    "    assert shortest_word('🙂🙃 🙂') == '🙂'\n"
-    "    assert shortest_word('x 😊 yyy') == 'x'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('á é íóú') == 'á'\n"
-    "    assert shortest_word('Ångström a') == 'a'\n"
-    "    assert shortest_word('ß ss s') == 's'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('A a AA') == 'A'\n"
-    "    assert shortest_word('aa A bb') == 'A'\n"
-    "    assert shortest_word('MiX m mixed') == 'm'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('123 4 56') == '4'\n"
-    "    assert shortest_word('0 00 000') == '0'\n"
-    "    assert shortest_word('-1 -22 -333') == '-1'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('! !! !!!') == '!'\n"
-    "    assert shortest_word('?? ? ???') == '?'\n"
-    "    assert shortest_word('... .. .') == '.'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('a,b cc') == 'cc'\n"
-    "    assert shortest_word('x, yyy') == 'x,'\n"
-    "    assert shortest_word('hi, hi') == 'hi,'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('a.. b') == 'b'\n"
-    "    assert shortest_word('x... yy') == 'yy'\n"
-    "    assert shortest_word('end.') == 'end.'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('word\\u200bbreak x') == 'x'\n"
-    "    assert shortest_word('a\\u200bb c') == 'c'\n"
-    "    assert shortest_word('\\u200b') == '\\u200b'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('a\\r\\nb bb') == 'a'\n"
-    "    assert shortest_word('ab\\r\\ncd e') == 'e'\n"
-    "    assert shortest_word('\\r\\n') == ''\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('a\\x0bb bb') == 'a'\n"
-    "    assert shortest_word('ab\\x0bcd e') == 'e'\n"
-    "    assert shortest_word('\\x0b') == '\\x0b'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('a\\u00a0b c') == 'c'\n"
-    "    assert shortest_word('x\\u00a0\\u00a0y z') == 'z'\n"
-    "    assert shortest_word('\\u00a0') == ''\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('alpha  beta   gamma') == 'beta'\n"
-    "    assert shortest_word('alpha beta gamma') == 'beta'\n"
-    "    assert shortest_word('alpha   beta gamma') == 'beta'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('a'*100 + ' bb') == 'bb'\n"
-    "    assert shortest_word('x ' + 'y'*200) == 'x'\n"
-    "    assert shortest_word('p'*50 + ' q'*1) == 'q'\n",
-
-    "def test_shortest_word():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        shortest_word(None)\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        shortest_word(123)\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        shortest_word(object())\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word('a\\t\\tbb\\nccc') == 'a'\n"
-    "    assert shortest_word('   a\\n   bb   ') == 'a'\n"
-    "    assert shortest_word('bb\\n\\n c') == 'c'\n",
-
-    "def test_shortest_word():\n"
-    "    assert shortest_word(' \\t  a   bb\\tccc ') == 'a'\n"
-    "    assert shortest_word('word\\n x\\nlonger') == 'x'\n"
-    "    assert shortest_word('\\n\\t   ') == ''\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('') == ''\n"
-    "    assert capitalize_str('a') == 'A'\n"
-    "    assert capitalize_str('A') == 'A'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('abc') == 'Abc'\n"
-    "    assert capitalize_str('ABC') == 'Abc'\n"
-    "    assert capitalize_str('aBC') == 'Abc'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str(' hello') == ' hello'\n"
-    "    assert capitalize_str(' hello world') == ' hello world'\n"
-    "    assert capitalize_str(' hello')[:1] == ' '\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('1abc') == '1abc'\n"
-    "    assert capitalize_str('123') == '123'\n"
-    "    assert capitalize_str('1ABC') == '1abc'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('!abc') == '!abc'\n"
-    "    assert capitalize_str('@TEST') == '@test'\n"
-    "    assert capitalize_str('#x') == '#x'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('ß') == 'Ss'\n"
-    "    assert capitalize_str('ßtest') == 'Sstest'\n"
-    "    assert capitalize_str('ßTEST') == 'Sstest'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('éclair') == 'Éclair'\n"
-    "    assert capitalize_str('ÉCLAIR') == 'Éclair'\n"
-    "    assert capitalize_str('éCLAIR') == 'Éclair'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('😊') == '😊'\n"
-    "    assert capitalize_str('😊abc') == '😊abc'\n"
-    "    assert capitalize_str('😊ABC') == '😊abc'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('a😊b') == 'A😊b'\n"
-    "    assert capitalize_str('A😊B') == 'A😊b'\n"
-    "    assert capitalize_str('😊a') == '😊a'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str(' multiple words') == ' multiple words'\n"
-    "    assert capitalize_str('multiple Words') == 'Multiple words'\n"
-    "    assert capitalize_str('MULTIPLE words') == 'Multiple words'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('\\nabc') == '\\nabc'\n"
-    "    assert capitalize_str('\\tabc') == '\\tabc'\n"
-    "    assert capitalize_str('a\\nb') == 'A\\nb'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str(' ') == ' '\n"
-    "    assert capitalize_str('   ') == '   '\n"
-    "    assert capitalize_str(' a') == ' a'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('ç') == 'Ç'\n"
-    "    assert capitalize_str('çalış') == 'Çalış'\n"
-    "    assert capitalize_str('ÇALIŞ') == 'Çalış'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('ø') == 'Ø'\n"
-    "    assert capitalize_str('øtest') == 'Øtest'\n"
-    "    assert capitalize_str('ØTEST') == 'Øtest'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('ñandú') == 'Ñandú'\n"
-    "    assert capitalize_str('ÑANDÚ') == 'Ñandú'\n"
-    "    assert capitalize_str('ñANDÚ') == 'Ñandú'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('0xabc') == '0xabc'\n"
-    "    assert capitalize_str('0XABC') == '0xabc'\n"
-    "    assert capitalize_str('0xABC') == '0xabc'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('true') == 'True'\n"
-    "    assert capitalize_str('TRUE') == 'True'\n"
-    "    assert capitalize_str('tRUE') == 'True'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('false') == 'False'\n"
-    "    assert capitalize_str('FALSE') == 'False'\n"
-    "    assert capitalize_str('fALSE') == 'False'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('none') == 'None'\n"
-    "    assert capitalize_str('NONE') == 'None'\n"
-    "    assert capitalize_str('nONE') == 'None'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('ümlaut') == 'Ümlaut'\n"
-    "    assert capitalize_str('ÜMLAUT') == 'Ümlaut'\n"
-    "    assert capitalize_str('üMLAUT') == 'Ümlaut'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str(' mixedCASE') == ' mixedcase'\n"
-    "    assert capitalize_str('MiXeD') == 'Mixed'\n"
-    "    assert capitalize_str('mIXed') == 'Mixed'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('a'*100) == 'A' + 'a'*99\n"
-    "    assert capitalize_str('A'*100) == 'A' + 'a'*99\n"
-    "    assert capitalize_str('a'*1) == 'A'\n",
-
-    "def test_capitalize_str():\n"
-    "    assert capitalize_str('ßß') == 'Ssss'\n"
-    "    assert capitalize_str('ßßa') == 'Sssa'\n"
-    "    assert capitalize_str('ßA') == 'Ssa'\n",
-
-    "def test_capitalize_str():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        capitalize_str(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        capitalize_str(123)\n",
-
-    "def test_capitalize_str():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        capitalize_str(['a'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        capitalize_str({'a': 1})\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([], 1) == -1\n"
-    "    assert binary_search([], 0) == -1\n"
-    "    assert binary_search([], -1) == -1\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([1], 1) == 0\n"
-    "    assert binary_search([1], 0) == -1\n"
-    "    assert binary_search([1], 2) == -1\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([1, 2], 1) == 0\n"
-    "    assert binary_search([1, 2], 2) == 1\n"
-    "    assert binary_search([1, 2], 3) == -1\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([1, 3, 5], 3) == 1\n"
-    "    assert binary_search([1, 3, 5], 1) == 0\n"
-    "    assert binary_search([1, 3, 5], 5) == 2\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([1, 3, 5], 0) == -1\n"
-    "    assert binary_search([1, 3, 5], 4) == -1\n"
-    "    assert binary_search([1, 3, 5], 6) == -1\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([-5, -3, -1], -3) == 1\n"
-    "    assert binary_search([-5, -3, -1], -5) == 0\n"
-    "    assert binary_search([-5, -3, -1], -1) == 2\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([-5, -3, -1], 0) == -1\n"
-    "    assert binary_search([-5, -3, -1], -4) == -1\n"
-    "    assert binary_search([-5, -3, -1], -6) == -1\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([0, 0, 0], 0) in (0, 1, 2)\n"
-    "    assert binary_search([0, 0, 0], 1) == -1\n"
-    "    assert binary_search([0, 0, 0], -1) == -1\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([1, 2, 2, 2, 3], 2) in (1, 2, 3)\n"
-    "    assert binary_search([1, 2, 2, 2, 3], 1) == 0\n"
-    "    assert binary_search([1, 2, 2, 2, 3], 3) == 4\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([10, 20, 30, 40], 10) == 0\n"
-    "    assert binary_search([10, 20, 30, 40], 40) == 3\n"
-    "    assert binary_search([10, 20, 30, 40], 25) == -1\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([1.0, 2.0, 3.0], 2.0) == 1\n"
-    "    assert binary_search([1.0, 2.0, 3.0], 2.5) == -1\n"
-    "    assert binary_search([1.0, 2.0, 3.0], 1.0) == 0\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search(['a', 'b', 'c'], 'b') == 1\n"
-    "    assert binary_search(['a', 'b', 'c'], 'a') == 0\n"
-    "    assert binary_search(['a', 'b', 'c'], 'd') == -1\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search(['apple', 'banana', 'cherry'], 'banana') == 1\n"
-    "    assert binary_search(['apple', 'banana', 'cherry'], 'apple') == 0\n"
-    "    assert binary_search(['apple', 'banana', 'cherry'], 'date') == -1\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([True, True, True], True) in (0, 1, 2)\n"
-    "    assert binary_search([False, False], False) in (0, 1)\n"
-    "    assert binary_search([False, False], True) == -1\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search(list(range(100)), 0) == 0\n"
-    "    assert binary_search(list(range(100)), 99) == 99\n"
-    "    assert binary_search(list(range(100)), 100) == -1\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search(list(range(-50, 50)), -50) == 0\n"
-    "    assert binary_search(list(range(-50, 50)), 0) == 50\n"
-    "    assert binary_search(list(range(-50, 50)), 49) == 99\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([2, 4, 6, 8], 6) == 2\n"
-    "    assert binary_search([2, 4, 6, 8], 5) == -1\n"
-    "    assert binary_search([2, 4, 6, 8], 2) == 0\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([1, 3, 5, 7, 9], 7) == 3\n"
-    "    assert binary_search([1, 3, 5, 7, 9], 8) == -1\n"
-    "    assert binary_search([1, 3, 5, 7, 9], 1) == 0\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([1000000], 1000000) == 0\n"
-    "    assert binary_search([1000000], -1000000) == -1\n"
-    "    assert binary_search([1000000], 0) == -1\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([-1, 0, 1], 0) == 1\n"
-    "    assert binary_search([-1, 0, 1], -1) == 0\n"
-    "    assert binary_search([-1, 0, 1], 2) == -1\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([1, 2, 3, 4, 5], 3) == 2\n"
-    "    assert binary_search([1, 2, 3, 4, 5], -10) == -1\n"
-    "    assert binary_search([1, 2, 3, 4, 5], 10) == -1\n",
-
-    "def test_binary_search():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        binary_search(None, 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        binary_search(123, 1)\n",
-
-    "def test_binary_search():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        binary_search([1, 2, 3], None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        binary_search([1, 2, 3], '2')\n",
-
-    "def test_binary_search():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        binary_search([1, '2', 3], 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        binary_search([1, 2, 3], [2])\n",
-
-    "def test_binary_search():\n"
-    "    assert binary_search([0, 1, 2, 3], -1) == -1\n"
-    "    assert binary_search([0, 1, 2, 3], 4) == -1\n"
-    "    assert binary_search([0, 1, 2, 3], 0) == 0\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([]) == []\n"
-    "    assert remove_empty([0, '', None, False, [], {}, (), set()]) == []\n"
-    "    assert remove_empty([0, '', 'x', None, 1, [], [0], {}, {'a': 1}, False, True]) == ['x', 1, [0], {'a': 1}, True]\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty(['', ' ', '  ']) == [' ', '  ']\n"
-    "    assert remove_empty(['\\t', '\\n', '']) == ['\\t', '\\n']\n"
-    "    assert remove_empty(['   ', 'x', '']) == ['   ', 'x']\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([[], [0], [False], [None], ['']]) == [[0], [False], [None], ['']]\n"
-    "    assert remove_empty([{}, {'k': 0}, {'k': None}]) == [{'k': 0}, {'k': None}]\n"
-    "    assert remove_empty([(), (0,), ('',)]) == [(0,), ('',)]\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([0.0, -0.0, 0.0001, -0.0001]) == [0.0001, -0.0001]\n"
-    "    assert remove_empty([float('nan'), 0.0]) == [float('nan')]\n"
-    "    assert remove_empty([float('inf'), float('-inf'), 0]) == [float('inf'), float('-inf')]\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([b'', b'0', b'a']) == [b'0', b'a']\n"
-    "    assert remove_empty([bytearray(b''), bytearray(b'x')]) == [bytearray(b'x')]\n"
-    "    assert remove_empty([memoryview(b''), memoryview(b'1')]) == [memoryview(b'1')]\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([range(0), range(1), range(2)]) == [range(1), range(2)]\n"
-    "    assert remove_empty([set(), {0}, {None}]) == [{0}, {None}]\n"
-    "    assert remove_empty([frozenset(), frozenset({0})]) == [frozenset({0})]\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty(['0', 0, '']) == ['0']\n"
-    "    assert remove_empty([False, 0, 0.0, True, 1]) == [True, 1]\n"
-    "    assert remove_empty([None, 'None', []]) == ['None']\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([[[]], [[]], []]) == [[[]], [[]]]\n"
-    "    assert remove_empty([{'a': []}, {'a': 1}, {}]) == [{'a': []}, {'a': 1}]\n"
-    "    assert remove_empty([[0, 0], [0], []]) == [[0, 0], [0]]\n",
-
-    "def test_remove_empty():\n"
-    "    class AlwaysFalse:\n"
-    "        def __bool__(self):\n"
-    "            return False\n"
-    "    class AlwaysTrue:\n"
-    "        def __bool__(self):\n"
-    "            return True\n"
-    "    assert remove_empty([AlwaysFalse(), AlwaysTrue()]) and len(remove_empty([AlwaysFalse(), AlwaysTrue()])) == 1\n"
-    "    assert isinstance(remove_empty([AlwaysFalse(), AlwaysTrue()])[0], AlwaysTrue)\n"
-    "    assert remove_empty([AlwaysFalse(), 0, '']) == []\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty(['🙂', '', '😊']) == ['🙂', '😊']\n"
-    "    assert remove_empty(['\\u200b', '']) == ['\\u200b']\n"
-    "    assert remove_empty(['', 'a\\u200b', ' ']) == ['a\\u200b', ' ']\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([0, 1, 2, 3]) == [1, 2, 3]\n"
-    "    assert remove_empty(['', 'x', 'y']) == ['x', 'y']\n"
-    "    assert remove_empty([None, {'k': 'v'}, []]) == [{'k': 'v'}]\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([True, False, True, False]) == [True, True]\n"
-    "    assert remove_empty([False, [], {}, (), set(), 1]) == [1]\n"
-    "    assert remove_empty([0, '0', 0.0, '']) == ['0']\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([{'': 0}, {'': ''}, {'': None}]) == [{'': 0}, {'': ''}, {'': None}]\n"
-    "    assert remove_empty([{0: 0}, {}, {1: 0}]) == [{0: 0}, {1: 0}]\n"
-    "    assert remove_empty([{'a': False}, {'b': []}, {}]) == [{'a': False}, {'b': []}]\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([[False], [0], [None], []]) == [[False], [0], [None]]\n"
-    "    assert remove_empty([[''], ['x'], []]) == [[''], ['x']]\n"
-    "    assert remove_empty([[0], 0, [1], 1]) == [[0], [1], 1]\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([float('nan'), float('nan')]) == [float('nan'), float('nan')]\n"
-    "    assert remove_empty([0, float('nan'), '', None]) == [float('nan')]\n"
-    "    assert remove_empty([float('inf'), 0, float('-inf')]) == [float('inf'), float('-inf')]\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty(['  a  ', '']) == ['  a  ']\n"
-    "    assert remove_empty(['\\n', '', '\\t']) == ['\\n', '\\t']\n"
-    "    assert remove_empty(['\\r\\n', '']) == ['\\r\\n']\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([0, -0, 0.0, -0.0, 2, -2]) == [2, -2]\n"
-    "    assert remove_empty([0, 0.0000, -0.0000, 0.0001]) == [0.0001]\n"
-    "    assert remove_empty([0, -1, 1]) == [-1, 1]\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([{'nested': {}}, {'nested': []}, {'nested': 0}]) == [{'nested': {}}, {'nested': []}, {'nested': 0}]\n"
-    "    assert remove_empty([{'nested': ''}, {}]) == [{'nested': ''}]\n"
-    "    assert remove_empty([{'n': None}, {'n': 1}, {}]) == [{'n': None}, {'n': 1}]\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([['a'], [''], []]) == [['a'], ['']]\n"
-    "    assert remove_empty([[' '], [], ['\\t']]) == [[' '], ['\\t']]\n"
-    "    assert remove_empty([[''], ['x'], ['y']]) == [[''], ['x'], ['y']]\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([[], (), {}, set(), frozenset(), range(0)]) == []\n"
-    "    assert remove_empty([range(1), (), []]) == [range(1)]\n"
-    "    assert remove_empty([frozenset({0}), frozenset()]) == [frozenset({0})]\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([0, 'a', 0, 'b', 0]) == ['a', 'b']\n"
-    "    assert remove_empty(['', 1, '', 2, '']) == [1, 2]\n"
-    "    assert remove_empty([None, True, None, False]) == [True]\n",
-
-    "def test_remove_empty():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_empty(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_empty(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_empty('abc')\n",
-
-    "def test_remove_empty():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_empty(object())\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_empty(3.14)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_empty(True)\n",
-
-    "def test_remove_empty():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_empty({'a': 1})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_empty({1, 2, 3})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        remove_empty((0, 1))\n",
-
-    "def test_remove_empty():\n"
-    "    assert remove_empty([{'a': []}, [], '', 0, None, {'b': 1}]) == [{'a': []}, {'b': 1}]\n"
-    "    assert remove_empty([[''], [], ['x'], '']) == [[''], ['x']]\n"
-    "    assert remove_empty([False, [], {}, (), set(), 'ok']) == ['ok']\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([]) == 0\n"
-    "    assert sum_list([0, 0, 0]) == 0\n"
-    "    assert sum_list([1, -1, 0]) == 0\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([10**18, -(10**18)]) == 0\n"
-    "    assert sum_list([10**18, 1, -1]) == 10**18\n"
-    "    assert sum_list([-10**18, 10**18 - 1]) == -1\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([1e-12, -1e-12]) == 0.0\n"
-    "    assert sum_list([0.1, 0.2]) == 0.30000000000000004\n"
-    "    assert sum_list([0.1, -0.1, 0.2]) == 0.2\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([float('inf')]) == float('inf')\n"
-    "    assert sum_list([float('-inf')]) == float('-inf')\n"
-    "    assert sum_list([float('inf'), float('-inf')]) != sum_list([float('inf'), float('-inf')])\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([float('nan')]) != sum_list([float('nan')])\n"
-    "    assert sum_list([1.0, float('nan')]) != sum_list([1.0, float('nan')])\n"
-    "    assert sum_list([float('nan'), float('nan')]) != sum_list([float('nan'), float('nan')])\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([True, False, True]) == 2\n"
-    "    assert sum_list([False, False]) == 0\n"
-    "    assert sum_list([True, 2, 3]) == 6\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([1+2j, 3-4j]) == (4-2j)\n"
-    "    assert sum_list([0+0j, 5]) == (5+0j)\n"
-    "    assert sum_list([1j, -1j, 2]) == 2\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([1, 2.5, -3]) == 0.5\n"
-    "    assert sum_list([0.0, -0.0, 1.0]) == 1.0\n"
-    "    assert sum_list([-2.5, 2.5]) == 0.0\n",
-
-    "def test_sum_list():\n"
-    "    xs = [10**6] * 1000\n"
-    "    assert sum_list(xs) == 10**6 * 1000\n"
-    "    assert sum_list(xs[:1]) == 10**6\n"
-    "    assert sum_list(xs[:0]) == 0\n",
-
-    "def test_sum_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list(object())\n",
-
-    "def test_sum_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list(['1', '2'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list([1, '2'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list([1, None])\n",
-
-    "def test_sum_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list([[1, 2], [3]])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list([{'a': 1}, {'b': 2}])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list([(1, 2), (3,)])\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([0, -0, 0]) == 0\n"
-    "    assert sum_list([-1, 1, -1, 1]) == 0\n"
-    "    assert sum_list([2, -3, 4, -5, 6]) == 4\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([1, 2, 3, -6]) == 0\n"
-    "    assert sum_list([5, -2, -3]) == 0\n"
-    "    assert sum_list([7, -7, 1]) == 1\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([float('inf'), 1.0]) == float('inf')\n"
-    "    assert sum_list([float('-inf'), -1.0]) == float('-inf')\n"
-    "    assert sum_list([float('inf'), -float('inf'), 1.0]) != sum_list([float('inf'), -float('inf'), 1.0])\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([1e308, 1e308]) == float('inf')\n"
-    "    assert sum_list([-1e308, -1e308]) == -float('inf')\n"
-    "    assert sum_list([1e308, -1e308]) == 0.0\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([1e-300, 1e-300, -2e-300]) == 0.0\n"
-    "    assert sum_list([1e-320, 1e-320]) != 0.0\n"
-    "    assert sum_list([1e-320, -1e-320]) == 0.0\n",
-
-    "def test_sum_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list([b'a', b'b'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list([bytearray(b'a')])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list(['a', b'b'])\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([0, 1, 2, 3, 4]) == 10\n"
-    "    assert sum_list([-5, -4, -3, -2, -1]) == -15\n"
-    "    assert sum_list([100, -50, -25, -25]) == 0\n",
-
-    "def test_sum_list():\n"
-    "    xs = [1, 2, 3]\n"
-    "    assert sum_list(xs) == 6\n"
-    "    assert xs == [1, 2, 3]\n"
-    "    assert sum_list(xs[:0]) == 0\n",
-
-    "def test_sum_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list([set([1]), set([2])])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list([{'x': 1}])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list([object()])\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([0.0, -0.0]) == 0.0\n"
-    "    assert sum_list([0.0, -0.0, -0.0]) == 0.0\n"
-    "    assert sum_list([-0.0, 1.0]) == 1.0\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([2**63, -(2**63)]) == 0\n"
-    "    assert sum_list([2**63 - 1, 1]) == 2**63\n"
-    "    assert sum_list([-(2**63), 2**63 - 1]) == -1\n",
-
-    "def test_sum_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list([1, 2, '3', 4])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list([None, None])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        sum_list([1, float('nan'), 'x'])\n",
-
-    "def test_sum_list():\n"
-    "    assert sum_list([0, 0.0, False]) == 0.0\n"
-    "    assert sum_list([1, 1.0, True]) == 3.0\n"
-    "    assert sum_list([0, True, False, 2]) == 3\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('', '') is True\n"
-    "    assert starts_with('a', '') is True\n"
-    "    assert starts_with('', 'a') is False\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('hello', 'h') is True\n"
-    "    assert starts_with('hello', 'he') is True\n"
-    "    assert starts_with('hello', 'hello') is True\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('hello', 'helloo') is False\n"
-    "    assert starts_with('hi', 'hello') is False\n"
-    "    assert starts_with('a', 'aa') is False\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('Hello', 'h') is False\n"
-    "    assert starts_with('Hello', 'H') is True\n"
-    "    assert starts_with('HELLO', 'HE') is True\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with(' hello', ' ') is True\n"
-    "    assert starts_with(' hello', 'h') is False\n"
-    "    assert starts_with('hello ', 'hello ') is True\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('\\nhello', '\\n') is True\n"
-    "    assert starts_with('\\thello', '\\t') is True\n"
-    "    assert starts_with('hello\\n', 'hello') is True\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('😊abc', '😊') is True\n"
-    "    assert starts_with('😊abc', '😊a') is True\n"
-    "    assert starts_with('😊abc', 'a') is False\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('abc', '😊') is False\n"
-    "    assert starts_with('😊', '😊') is True\n"
-    "    assert starts_with('😊', '') is True\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('12345', '123') is True\n"
-    "    assert starts_with('12345', '12a') is False\n"
-    "    assert starts_with('12345', '123456') is False\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('0xFF', '0x') is True\n"
-    "    assert starts_with('0xFF', '0X') is False\n"
-    "    assert starts_with('0xff', '0x') is True\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with(' ', ' ') is True\n"
-    "    assert starts_with('  ', ' ') is True\n"
-    "    assert starts_with(' ', '') is True\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('abc', None) is False\n"
-    "    assert starts_with('abc', '') is True\n"
-    "    assert starts_with('abc', 'a') is True\n",
-
-    "def test_starts_with():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        starts_with(None, 'a')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        starts_with(None, None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        starts_with(123, '1')\n",
-
-    "def test_starts_with():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        starts_with('abc', 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        starts_with('abc', ['a'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        starts_with([], 'a')\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('case-sensitive', 'case') is True\n"
-    "    assert starts_with('case-sensitive', 'Case') is False\n"
-    "    assert starts_with('Case', 'Case') is True\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('a\\0b', 'a\\0') is True\n"
-    "    assert starts_with('a\\0b', 'a') is True\n"
-    "    assert starts_with('a\\0b', '\\0') is False\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('汉字测试', '汉') is True\n"
-    "    assert starts_with('汉字测试', '字') is False\n"
-    "    assert starts_with('汉字测试', '汉字') is True\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('a-b-c', 'a-') is True\n"
-    "    assert starts_with('a-b-c', 'a-b') is True\n"
-    "    assert starts_with('a-b-c', '-') is False\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('...', '.') is True\n"
-    "    assert starts_with('...', '..') is True\n"
-    "    assert starts_with('...', '...') is True\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('false', 'f') is True\n"
-    "    assert starts_with('true', 't') is True\n"
-    "    assert starts_with('true', 'f') is False\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('0', '0') is True\n"
-    "    assert starts_with('0', '') is True\n"
-    "    assert starts_with('0', '00') is False\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('longstring', 'long') is True\n"
-    "    assert starts_with('longstring', 'longstring') is True\n"
-    "    assert starts_with('longstring', 'longstrings') is False\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('end', 'e') is True\n"
-    "    assert starts_with('end', 'en') is True\n"
-    "    assert starts_with('end', 'nd') is False\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('mixed123', 'mixed') is True\n"
-    "    assert starts_with('mixed123', 'mixed1') is True\n"
-    "    assert starts_with('mixed123', '123') is False\n",
-
-    "def test_starts_with():\n"
-    "    assert starts_with('repeat repeat', 'repeat') is True\n"
-    "    assert starts_with('repeat repeat', 'repeat ') is True\n"
-    "    assert starts_with('repeat repeat', ' repeat') is False\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([]) == []\n"
-    "    assert flatten_deep([[]]) == []\n"
-    "    assert flatten_deep([[], []]) == []\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([1]) == [1]\n"
-    "    assert flatten_deep([[1]]) == [1]\n"
-    "    assert flatten_deep([[[1]]]) == [1]\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([1, [2], 3]) == [1, 2, 3]\n"
-    "    assert flatten_deep([[1, 2], 3]) == [1, 2, 3]\n"
-    "    assert flatten_deep([1, [2, 3]]) == [1, 2, 3]\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([[1, [2, [3]]]]) == [1, 2, 3]\n"
-    "    assert flatten_deep([[[[2]]], 1, [[3]]]) == [2, 1, 3]\n"
-    "    assert flatten_deep([[[]], [[[]]]]) == []\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([0, [0, [0]]]) == [0, 0, 0]\n"
-    "    assert flatten_deep([-1, [-2, [-3]]]) == [-1, -2, -3]\n"
-    "    assert flatten_deep([[10**9], [[-(10**9)]]]) == [10**9, -(10**9)]\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep(['a', ['b', ['c']]]) == ['a', 'b', 'c']\n"
-    "    assert flatten_deep([['', ['x']], 'y']) == ['', 'x', 'y']\n"
-    "    assert flatten_deep([['hello'], [['world']]]) == ['hello', 'world']\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep(['😊', ['🙂', ['🙃']]]) == ['😊', '🙂', '🙃']\n"
-    "    assert flatten_deep([[['🔥']]]) == ['🔥']\n"
-    "    assert flatten_deep(['a', ['😊'], [['b']]]) == ['a', '😊', 'b']\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([True, [False, [True]]]) == [True, False, True]\n"
-    "    assert flatten_deep([[True, False], [[False]]]) == [True, False, False]\n"
-    "    assert flatten_deep([[[False]]]) == [False]\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([None, [None, [1]]]) == [None, None, 1]\n"
-    "    assert flatten_deep([[None], [[None]]]) == [None, None]\n"
-    "    assert flatten_deep([0, [None], [1]]) == [0, None, 1]\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([1.5, [2.5, [3.0]]]) == [1.5, 2.5, 3.0]\n"
-    "    assert flatten_deep([[0.1, [0.2]], 0.3]) == [0.1, 0.2, 0.3]\n"
-    "    assert flatten_deep([[-0.0], [[0.0]]]) == [-0.0, 0.0]\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([['a', [1, [True]]]]) == ['a', 1, True]\n"
-    "    assert flatten_deep([[None, ['x']], [[0]]]) == [None, 'x', 0]\n"
-    "    assert flatten_deep([['', [0]], [[False]]]) == ['', 0, False]\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([[[], [1], []], 2]) == [1, 2]\n"
-    "    assert flatten_deep([[[[]]], [[1, []]]]) == [1]\n"
-    "    assert flatten_deep([[], [[[], []]], [[[[]]]]]) == []\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([[1, [2, []], 3], []]) == [1, 2, 3]\n"
-    "    assert flatten_deep([[[1], []], [[2, [3]]]]) == [1, 2, 3]\n"
-    "    assert flatten_deep([[[1, [2]]], 3, [4, [5]]]) == [1, 2, 3, 4, 5]\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([[['a'], ['b']], [['c']]]) == ['a', 'b', 'c']\n"
-    "    assert flatten_deep([[['x', ['y']]], 'z']) == ['x', 'y', 'z']\n"
-    "    assert flatten_deep([['x'], [['y']], [[['z']]]]) == ['x', 'y', 'z']\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([['\\n', ['\\t']], [[' ']]]) == ['\\n', '\\t', ' ']\n"
-    "    assert flatten_deep([['a\\n'], [['b\\t']], 'c']) == ['a\\n', 'b\\t', 'c']\n"
-    "    assert flatten_deep([[['\\r']], ['\\n']]) == ['\\r', '\\n']\n",
-
-    "def test_flatten_deep():\n"
-    "    big = [[i] for i in range(10)]\n"
-    "    assert flatten_deep(big) == list(range(10))\n"
-    "    assert flatten_deep([big, [10]]) == list(range(10)) + [10]\n"
-    "    assert flatten_deep([[[[0]]], [[[[1]]]]]) == [0, 1]\n",
-
-    "def test_flatten_deep():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_deep(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_deep(123)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_deep('abc')\n",
-
-    "def test_flatten_deep():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_deep({1: [2]})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_deep((1, [2]))\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_deep({1, 2, 3})\n",
-
-    "def test_flatten_deep():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_deep([1, {'a': 2}])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_deep([1, (2, 3)])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        flatten_deep([object()])\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([['a'], [['b'], [['c']]]]) == ['a', 'b', 'c']\n"
-    "    assert flatten_deep([[1, [2, [3, [4]]]]]) == [1, 2, 3, 4]\n"
-    "    assert flatten_deep([[], [1, [2]], [], [[3]]]) == [1, 2, 3]\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([[[[[]]]], [[[]]]]) == []\n"
-    "    assert flatten_deep([[[[]], []], [[]]]) == []\n"
-    "    assert flatten_deep([[[], [[], []]], []]) == []\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([[0], [[-0]], [[[0]]]]) == [0, 0, 0]\n"
-    "    assert flatten_deep([[float('inf')], [[float('-inf')]]]) == [float('inf'), float('-inf')]\n"
-    "    assert flatten_deep([[float('nan')], [[1]]])[0] != flatten_deep([[float('nan')], [[1]]])[0]\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([['a'], [[], ['b']], [['c', []]]]) == ['a', 'b', 'c']\n"
-    "    assert flatten_deep([[1, []], [[2, []]], [[[3]]]]) == [1, 2, 3]\n"
-    "    assert flatten_deep([['x'], [[['y']]], [], 'z']) == ['x', 'y', 'z']\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([[[[1, 2]]], [[[3]]], [4]]) == [1, 2, 3, 4]\n"
-    "    assert flatten_deep([[['a', 'b']], [['c']], [['d']]]) == ['a', 'b', 'c', 'd']\n"
-    "    assert flatten_deep([1, [[2]], [[[3]]], [[[[4]]]]]) == [1, 2, 3, 4]\n",
-
-    "def test_flatten_deep():\n"
-    "    assert flatten_deep([[], [[], [[], [1]]]]) == [1]\n"
-    "    assert flatten_deep([[[[[]]]], 1, [[[]]]]) == [1]\n"
-    "    assert flatten_deep([[[]], [0, [[], [2]]], []]) == [0, 2]\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('', '') == ''\n"
-    "    assert concat_str('', 'a') == 'a'\n"
-    "    assert concat_str('a', '') == 'a'\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('a', 'b') == 'ab'\n"
-    "    assert concat_str('hello', 'world') == 'helloworld'\n"
-    "    assert concat_str(' ', ' ') == '  '\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('a', ' ') == 'a '\n"
-    "    assert concat_str(' ', 'b') == ' b'\n"
-    "    assert concat_str(' a ', ' b ') == ' a  b '\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('\\n', '\\n') == '\\n\\n'\n"
-    "    assert concat_str('\\t', 'a') == '\\ta'\n"
-    "    assert concat_str('a', '\\t') == 'a\\t'\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('😊', '😊') == '😊😊'\n"
-    "    assert concat_str('😊', 'a') == '😊a'\n"
-    "    assert concat_str('a', '😊') == 'a😊'\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('🔥', '💧') == '🔥💧'\n"
-    "    assert concat_str('💡', '') == '💡'\n"
-    "    assert concat_str('', '💡') == '💡'\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('A', 'a') == 'Aa'\n"
-    "    assert concat_str('a', 'A') == 'aA'\n"
-    "    assert concat_str('ABC', 'def') == 'ABCdef'\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('123', '456') == '123456'\n"
-    "    assert concat_str('0', '0') == '00'\n"
-    "    assert concat_str('-1', '1') == '-11'\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('line', '\\nbreak') == 'line\\nbreak'\n"
-    "    assert concat_str('end\\n', 'start') == 'end\\nstart'\n"
-    "    assert concat_str('\\n', ' ') == '\\n '\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str(' ', '') == ' '\n"
-    "    assert concat_str('', ' ') == ' '\n"
-    "    assert concat_str('   ', ' ') == '    '\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('x'*1000, 'y') == 'x'*1000 + 'y'\n"
-    "    assert concat_str('x', 'y'*1000) == 'x' + 'y'*1000\n"
-    "    assert concat_str('a'*500, 'b'*500) == 'a'*500 + 'b'*500\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('mixed', 'CASE') == 'mixedCASE'\n"
-    "    assert concat_str('MiXeD', 'cAsE') == 'MiXeDcAsE'\n"
-    "    assert concat_str('lower', 'UPPER') == 'lowerUPPER'\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str(' ', '\\t') == ' \\t'\n"
-    "    assert concat_str('\\t', ' ') == '\\t '\n"
-    "    assert concat_str('\\t', '\\t') == '\\t\\t'\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('a\\tb', 'c') == 'a\\tbc'\n"
-    "    assert concat_str('a', 'b\\tc') == 'ab\\tc'\n"
-    "    assert concat_str('a\\n', 'b') == 'a\\nb'\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('!', '?') == '!?' \n"
-    "    assert concat_str('@', '#') == '@#'\n"
-    "    assert concat_str('$$', '$') == '$$$'\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('[]', '{}') == '[]{}'\n"
-    "    assert concat_str('()', '[]') == '()[]'\n"
-    "    assert concat_str('{}', '') == '{}'\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('true', 'false') == 'truefalse'\n"
-    "    assert concat_str('False', 'True') == 'FalseTrue'\n"
-    "    assert concat_str('None', 'Type') == 'NoneType'\n",
-
-    "def test_concat_str():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        concat_str('a', 1)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        concat_str(1, 'a')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        concat_str(1, 2)\n",
-
-    "def test_concat_str():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        concat_str(None, 'a')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        concat_str('a', None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        concat_str(None, None)\n",
-
-    "def test_concat_str():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        concat_str(['a'], 'b')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        concat_str('a', ['b'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        concat_str([], [])\n",
-
-    "def test_concat_str():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        concat_str({'a': 1}, 'b')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        concat_str('a', {'b': 2})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        concat_str({}, {})\n",
-
-    "def test_concat_str():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        concat_str(True, 'a')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        concat_str('a', False)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        concat_str(True, False)\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('0', '') == '0'\n"
-    "    assert concat_str('', '0') == '0'\n"
-    "    assert concat_str('00', '1') == '001'\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('α', 'β') == 'αβ'\n"
-    "    assert concat_str('Ω', '') == 'Ω'\n"
-    "    assert concat_str('', 'Ω') == 'Ω'\n",
-
-    "def test_concat_str():\n"
-    "    assert concat_str('end', '\\r') == 'end\\r'\n"
-    "    assert concat_str('\\r', 'start') == '\\rstart'\n"
-    "    assert concat_str('\\r', '\\r') == '\\r\\r'\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(0, 1) == True\n"
-    "    assert is_divisible(0, -1) == True\n"
-    "    assert is_divisible(0, 5) == True\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(5, 0) == False\n"
-    "    assert is_divisible(-5, 0) == False\n"
-    "    assert is_divisible(0, 0) == False\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(10, 2) == True\n"
-    "    assert is_divisible(10, 3) == False\n"
-    "    assert is_divisible(10, 5) == True\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(-10, 2) == True\n"
-    "    assert is_divisible(-10, 3) == False\n"
-    "    assert is_divisible(-10, -5) == True\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(9, 3) == True\n"
-    "    assert is_divisible(9, -3) == True\n"
-    "    assert is_divisible(9, 2) == False\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(1, 1) == True\n"
-    "    assert is_divisible(1, 2) == False\n"
-    "    assert is_divisible(-1, 1) == True\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(1000000, 1) == True\n"
-    "    assert is_divisible(1000000, 10) == True\n"
-    "    assert is_divisible(1000000, 3) == False\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(7, 7) == True\n"
-    "    assert is_divisible(7, -7) == True\n"
-    "    assert is_divisible(7, 14) == False\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(2**10, 2) == True\n"
-    "    assert is_divisible(2**10, 4) == True\n"
-    "    assert is_divisible(2**10, 3) == False\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(-2**10, 2) == True\n"
-    "    assert is_divisible(-2**10, -4) == True\n"
-    "    assert is_divisible(-2**10, 3) == False\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(1, -1) == True\n"
-    "    assert is_divisible(2, -1) == True\n"
-    "    assert is_divisible(3, -2) == False\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(99, 9) == True\n"
-    "    assert is_divisible(99, 11) == True\n"
-    "    assert is_divisible(99, 10) == False\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(-99, 9) == True\n"
-    "    assert is_divisible(-99, 11) == True\n"
-    "    assert is_divisible(-99, 10) == False\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(8, 4) == True\n"
-    "    assert is_divisible(8, 8) == True\n"
-    "    assert is_divisible(8, 16) == False\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(5, 2) == False\n"
-    "    assert is_divisible(5, 5) == True\n"
-    "    assert is_divisible(5, -5) == True\n",
-
-    "def test_is_divisible():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_divisible(10.5, 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_divisible(10, 2.5)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_divisible(10.0, 2.0)\n",
-
-    "def test_is_divisible():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_divisible('10', 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_divisible(10, '2')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_divisible('10', '2')\n",
-
-    "def test_is_divisible():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_divisible(None, 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_divisible(2, None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_divisible(None, None)\n",
-
-    "def test_is_divisible():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_divisible([10], 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_divisible(10, [2])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_divisible([], [])\n",
-
-    "def test_is_divisible():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_divisible({'a': 10}, 2)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_divisible(10, {'b': 2})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_divisible({}, {})\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(True, 1) == True\n"
-    "    assert is_divisible(False, 1) == True\n"
-    "    assert is_divisible(True, 2) == False\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(1, True) == True\n"
-    "    assert is_divisible(2, True) == True\n"
-    "    assert is_divisible(3, True) == True\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(1, -1) == True\n"
-    "    assert is_divisible(2, -2) == True\n"
-    "    assert is_divisible(3, -3) == True\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(2147483648, 2) == True\n"
-    "    assert is_divisible(2147483648, 3) == False\n"
-    "    assert is_divisible(-2147483648, 2) == True\n",
-
-    "def test_is_divisible():\n"
-    "    assert is_divisible(7, 1) == True\n"
-    "    assert is_divisible(7, -1) == True\n"
-    "    assert is_divisible(7, 0) == False\n",
-
-    "def test_string_to_int():\n"
-    "    assert string_to_int('0') == 0\n"
-    "    assert string_to_int('00') == 0\n"
-    "    assert string_to_int('-0') == 0\n",
-
-    "def test_string_to_int():\n"
-    "    assert string_to_int('1') == 1\n"
-    "    assert string_to_int('-1') == -1\n"
-    "    assert string_to_int('+1') == 1\n",
-
-    "def test_string_to_int():\n"
-    "    assert string_to_int('2147483647') == 2147483647\n"
-    "    assert string_to_int('-2147483648') == -2147483648\n"
-    "    assert string_to_int('000123') == 123\n",
-
-    "def test_string_to_int():\n"
-    "    assert string_to_int(' 42'.strip()) == 42\n"
-    "    assert string_to_int('42 ') == 42\n"
-    "    assert string_to_int('   7') == 7\n",
-
-    "def test_string_to_int():\n"
-    "    assert string_to_int('\\n5') == 5\n"
-    "    assert string_to_int('\\t6') == 6\n"
-    "    assert string_to_int('7\\n') == 7\n",
-
-    "def test_string_to_int():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int(' ')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('\\n')\n",
-
-    "def test_string_to_int():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('abc')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('12a')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('a12')\n",
-
-    "def test_string_to_int():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('1.0')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('-1.5')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('3.14')\n",
-
-    "def test_string_to_int():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('1e3')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('2E4')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('-1e2')\n",
-
-    "def test_string_to_int():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('--1')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('+-1')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('++1')\n",
-
-    "def test_string_to_int():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('01x')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('x01')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('0x10')\n",
-
-    "def test_string_to_int():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        string_to_int(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        string_to_int(True)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        string_to_int(False)\n",
-
-    "def test_string_to_int():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        string_to_int(10)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        string_to_int(3.14)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        string_to_int([])\n",
-
-    "def test_string_to_int():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        string_to_int({})\n"
-    "    with pytest.raises(TypeError):\n"
-    "        string_to_int([1])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        string_to_int(('1',))\n",
-
-    "def test_string_to_int():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('∞')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('−1')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('１２')\n",
-
-    "def test_string_to_int():\n"
-    "    assert string_to_int('+000') == 0\n"
-    "    assert string_to_int('-000') == 0\n"
-    "    assert string_to_int('0000') == 0\n",
-
-    "def test_string_to_int():\n"
-    "    assert string_to_int('9') == 9\n"
-    "    assert string_to_int('-9') == -9\n"
-    "    assert string_to_int('+9') == 9\n",
-
-    "def test_string_to_int():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int(' ') \n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int(' 1 2 ')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('1 2')\n",
-
-    "def test_string_to_int():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('\\t')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('\\n')\n",
-
-    "def test_string_to_int():\n"
-    "    assert string_to_int('5') == 5\n"
-    "    assert string_to_int('10') == 10\n"
-    "    assert string_to_int('-10') == -10\n",
-
-    "def test_string_to_int():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('5-')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('-5-')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('+-5')\n",
-
-    "def test_string_to_int():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('1_000')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('10,000')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('1 000')\n",
-
-    "def test_string_to_int():\n"
-    "    assert string_to_int('42') == 42\n"
-    "    assert string_to_int('0042') == 42\n"
-    "    assert string_to_int('-0042') == -42\n",
-
-    "def test_string_to_int():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('NaN')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('inf')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('-inf')\n",
-
-    "def test_string_to_int():\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('+')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('-')\n"
-    "    with pytest.raises(ValueError):\n"
-    "        string_to_int('+-')\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([]) == 0\n"
-    "    assert product_list([0]) == 0\n"
-    "    assert product_list([1]) == 1\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([2, 3]) == 6\n"
-    "    assert product_list([5, 1, 9]) == 45\n"
-    "    assert product_list([10, 0, 7]) == 0\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([-1]) == -1\n"
-    "    assert product_list([-1, 2]) == -2\n"
-    "    assert product_list([-1, -2, -3]) == -6\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([0, -1, 2]) == 0\n"
-    "    assert product_list([-2, 0, -3]) == 0\n"
-    "    assert product_list([0, 0, 0]) == 0\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([1, 1, 1]) == 1\n"
-    "    assert product_list([1, 2, 1, 2]) == 4\n"
-    "    assert product_list([2, 2, 2, 2]) == 16\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([10**9, 2]) == 2 * (10**9)\n"
-    "    assert product_list([10**6, 10**6]) == 10**12\n"
-    "    assert product_list([-10**9, 3]) == -3 * (10**9)\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([0.5, 2]) == 1.0\n"
-    "    assert product_list([0.1, 0.2]) == 0.020000000000000004\n"
-    "    assert product_list([-0.5, 2, -4]) == 4.0\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([1e-12, 1e12]) == 1.0\n"
-    "    assert product_list([1e-308, 1e308]) == 1.0\n"
-    "    assert product_list([-1e-12, 1e12]) == -1.0\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([float('inf'), 0]) != product_list([float('inf'), 1])\n"
-    "    assert product_list([float('inf'), 2]) == float('inf')\n"
-    "    assert product_list([float('-inf'), 2]) == float('-inf')\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([float('inf'), -1]) == float('-inf')\n"
-    "    assert product_list([float('-inf'), -1]) == float('inf')\n"
-    "    assert product_list([float('inf'), float('-inf')]) == float('-inf')\n",
-
-    "def test_product_list():\n"
-    "    r = product_list([float('nan')])\n"
-    "    assert r != r\n"
-    "    r2 = product_list([1, float('nan')])\n"
-    "    assert r2 != r2\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([True, True, True]) == 1\n"
-    "    assert product_list([True, False, True]) == 0\n"
-    "    assert product_list([True, 2, False]) == 0\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([True, 2, 3]) == 6\n"
-    "    assert product_list([False, 5]) == 0\n"
-    "    assert product_list([True, -2]) == -2\n",
-
-    "def test_product_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        product_list(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        product_list(123)\n",
-
-    "def test_product_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        product_list([1, '2'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        product_list(['3'])\n",
-
-    "def test_product_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        product_list([1, None])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        product_list([None])\n",
-
-    "def test_product_list():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        product_list([object()])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        product_list([1, object()])\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([1, -1, 1, -1]) == 1\n"
-    "    assert product_list([-1, -1, -1, -1]) == 1\n"
-    "    assert product_list([-1, -1, -1]) == -1\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([2, -3, 4]) == -24\n"
-    "    assert product_list([-2, -3, 4]) == 24\n"
-    "    assert product_list([-2, 3, -4]) == 24\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([0, 1, 2, 3]) == 0\n"
-    "    assert product_list([1, 2, 3, 0]) == 0\n"
-    "    assert product_list([0, -1, -2]) == 0\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([1, 2, 3, 4, 5]) == 120\n"
-    "    assert product_list([1, 2, 3, 4, 5, 6]) == 720\n"
-    "    assert product_list([2, 3, 5, 7, 11]) == 2310\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([10**3, 10**3, 10**3]) == 10**9\n"
-    "    assert product_list([10**4, 10**4]) == 10**8\n"
-    "    assert product_list([-(10**4), 10**4]) == -(10**8)\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([0.0, -0.0, 2.0]) == 0.0\n"
-    "    assert product_list([-0.0, 3.0]) == -0.0\n"
-    "    assert product_list([0.0, 3.0]) == 0.0\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([1.25, 0.0]) == 0.0\n"
-    "    assert product_list([1.25, 4]) == 5.0\n"
-    "    assert product_list([-1.25, 4]) == -5.0\n",
-
-    "def test_product_list():\n"
-    "    assert product_list([float('inf'), 0.0]) != float('inf')\n"
-    "    assert product_list([float('inf'), 0.0]) != float('-inf')\n"
-    "    assert product_list([float('-inf'), 0.0]) != float('inf')\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('', '') is True\n"
-    "    assert ends_with('a', '') is True\n"
-    "    assert ends_with('', 'a') is False\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('hello', 'o') is True\n"
-    "    assert ends_with('hello', 'lo') is True\n"
-    "    assert ends_with('hello', 'll') is False\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('test', 'test') is True\n"
-    "    assert ends_with('test', 'testing') is False\n"
-    "    assert ends_with('testing', 'test') is False\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('abc', 'c') is True\n"
-    "    assert ends_with('abc', 'bc') is True\n"
-    "    assert ends_with('abc', 'abc') is True\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('abc', 'a') is False\n"
-    "    assert ends_with('abc', 'ab') is False\n"
-    "    assert ends_with('abc', 'b') is False\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('hello ', ' ') is True\n"
-    "    assert ends_with(' hello', 'hello') is True\n"
-    "    assert ends_with('hello', ' hello') is False\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('line\\n', '\\n') is True\n"
-    "    assert ends_with('line\\n', 'line') is False\n"
-    "    assert ends_with('line', '\\n') is False\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('tab\\t', '\\t') is True\n"
-    "    assert ends_with('tab\\t', 'b\\t') is True\n"
-    "    assert ends_with('tab', '\\t') is False\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('😀😃😄', '😄') is True\n"
-    "    assert ends_with('😀😃😄', '😃😄') is True\n"
-    "    assert ends_with('😀😃😄', '😀') is False\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('😊', '😊') is True\n"
-    "    assert ends_with('😊', '') is True\n"
-    "    assert ends_with('😊', 'a') is False\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('CaseTest', 'Test') is True\n"
-    "    assert ends_with('CaseTest', 'test') is False\n"
-    "    assert ends_with('casetest', 'test') is True\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('12345', '5') is True\n"
-    "    assert ends_with('12345', '45') is True\n"
-    "    assert ends_with('12345', '6') is False\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('0.0', '0') is True\n"
-    "    assert ends_with('0.0', '.0') is True\n"
-    "    assert ends_with('0.0', '0.0') is True\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('a b c', 'c') is True\n"
-    "    assert ends_with('a b c', ' c') is True\n"
-    "    assert ends_with('a b c', 'b c ') is False\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('endswith', 'with') is True\n"
-    "    assert ends_with('endswith', 'ends') is False\n"
-    "    assert ends_with('endswith', 'h') is True\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('repeatrepeat', 'repeat') is True\n"
-    "    assert ends_with('repeatrepeat', 'peat') is True\n"
-    "    assert ends_with('repeatrepeat', 'repeat ') is False\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('ümlaut', 'laut') is True\n"
-    "    assert ends_with('ümlaut', 'ü') is False\n"
-    "    assert ends_with('ümlaut', 'aut') is True\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('mañana', 'na') is True\n"
-    "    assert ends_with('mañana', 'ña') is False\n"
-    "    assert ends_with('mañana', 'ana') is True\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('Ωmega', 'ega') is True\n"
-    "    assert ends_with('Ωmega', 'Ω') is False\n"
-    "    assert ends_with('Ωmega', 'mega') is True\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('x'*1000, 'x') is True\n"
-    "    assert ends_with('x'*1000, 'xx') is True\n"
-    "    assert ends_with('x'*1000, 'y') is False\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('abc\\0', '\\0') is True\n"
-    "    assert ends_with('abc\\0', 'c') is False\n"
-    "    assert ends_with('abc\\0', 'bc\\0') is True\n",
-
-    "def test_ends_with():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        ends_with(None, 'a')\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        ends_with(123, '3')\n",
-
-    "def test_ends_with():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        ends_with('abc', None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        ends_with('abc', 1)\n",
+from unittestgen.management.dedupe import stream_dedupe
+from unittestgen.management.seeds import iter_seeds
 
-    "def test_ends_with():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        ends_with(['a','b','c'], 'c')\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        ends_with({'a':1}, '1')\n",
-
-    "def test_ends_with():\n"
-    "    assert ends_with('final.', '.') is True\n"
-    "    assert ends_with('final.', 'l.') is True\n"
-    "    assert ends_with('final.', 'final..') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('') is False\n"
-    "    assert is_lower('a') is True\n"
-    "    assert is_lower('A') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('abc') is True\n"
-    "    assert is_lower('abC') is False\n"
-    "    assert is_lower('ABC') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('abc123') is True\n"
-    "    assert is_lower('abc123!') is True\n"
-    "    assert is_lower('ABC123') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('with space') is True\n"
-    "    assert is_lower('with Space') is False\n"
-    "    assert is_lower(' ') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('ümlaut') is True\n"
-    "    assert is_lower('Ümlaut') is False\n"
-    "    assert is_lower('ß') is True\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('mañana') is True\n"
-    "    assert is_lower('Mañana') is False\n"
-    "    assert is_lower('ñ') is True\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('ωmega') is True\n"
-    "    assert is_lower('Ωmega') is False\n"
-    "    assert is_lower('ω') is True\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('lower_case') is True\n"
-    "    assert is_lower('Lower_case') is False\n"
-    "    assert is_lower('_') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('lower-case') is True\n"
-    "    assert is_lower('Lower-case') is False\n"
-    "    assert is_lower('-') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('abc\\n') is True\n"
-    "    assert is_lower('abc\\t') is True\n"
-    "    assert is_lower('Abc\\n') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('abc😊') is True\n"
-    "    assert is_lower('Abc😊') is False\n"
-    "    assert is_lower('😊') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('mixed123symbols!') is True\n"
-    "    assert is_lower('Mixed123symbols!') is False\n"
-    "    assert is_lower('123!') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('lowerlower') is True\n"
-    "    assert is_lower('LOWER') is False\n"
-    "    assert is_lower('LoWeR') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('a'*1000) is True\n"
-    "    assert is_lower(('a'*999)+'B') is False\n"
-    "    assert is_lower('') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('true') is True\n"
-    "    assert is_lower('false') is True\n"
-    "    assert is_lower('True') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('none') is True\n"
-    "    assert is_lower('None') is False\n"
-    "    assert is_lower('null') is True\n",
-
-    "def test_is_lower():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        is_lower(None)\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        is_lower(123)\n",
-
-    "def test_is_lower():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        is_lower(['a','b'])\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        is_lower({'a':1})\n",
-
-    "def test_is_lower():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        is_lower(True)\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        is_lower(False)\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('áéíóú') is True\n"
-    "    assert is_lower('ÁÉÍÓÚ') is False\n"
-    "    assert is_lower('áÉí') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('русский') is True\n"
-    "    assert is_lower('Русский') is False\n"
-    "    assert is_lower('РУССКИЙ') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('παράδειγμα') is True\n"
-    "    assert is_lower('Παράδειγμα') is False\n"
-    "    assert is_lower('ΠΑΡΑ') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('lower😊case') is True\n"
-    "    assert is_lower('Lower😊case') is False\n"
-    "    assert is_lower('😊lower') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('endswithspace ') is True\n"
-    "    assert is_lower('Endswithspace ') is False\n"
-    "    assert is_lower(' ') is False\n",
-
-    "def test_is_lower():\n"
-    "    assert is_lower('tab\\tcase') is True\n"
-    "    assert is_lower('Tab\\tcase') is False\n"
-    "    assert is_lower('\\t') is False\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('') == ''\n"
-    "    assert normalize_whitespace('   ') == ''\n"
-    "    assert normalize_whitespace('\\n\\t') == ''\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('a') == 'a'\n"
-    "    assert normalize_whitespace(' a ') == 'a'\n"
-    "    assert normalize_whitespace('   a') == 'a'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('a   b') == 'a b'\n"
-    "    assert normalize_whitespace('a\\tb') == 'a b'\n"
-    "    assert normalize_whitespace('a\\n b') == 'a b'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('a\\n\\n\\nb') == 'a b'\n"
-    "    assert normalize_whitespace('a\\t\\t b') == 'a b'\n"
-    "    assert normalize_whitespace('a   \\n\\t  b') == 'a b'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('  a   b   c  ') == 'a b c'\n"
-    "    assert normalize_whitespace('a\\tb\\tc') == 'a b c'\n"
-    "    assert normalize_whitespace('a\\n b\\n c') == 'a b c'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('word') == 'word'\n"
-    "    assert normalize_whitespace(' word') == 'word'\n"
-    "    assert normalize_whitespace('word ') == 'word'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('multiple     spaces') == 'multiple spaces'\n"
-    "    assert normalize_whitespace('multiple\\nspaces') == 'multiple spaces'\n"
-    "    assert normalize_whitespace('multiple\\tspaces') == 'multiple spaces'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('a\\r\\nb') == 'a b'\n"
-    "    assert normalize_whitespace('a\\r b') == 'a b'\n"
-    "    assert normalize_whitespace('\\r\\n') == ''\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace(' a  b\\n c\\t d ') == 'a b c d'\n"
-    "    assert normalize_whitespace('x\\ny\\tz') == 'x y z'\n"
-    "    assert normalize_whitespace(' x\\t y ') == 'x y'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('😊   😊') == '😊 😊'\n"
-    "    assert normalize_whitespace('😊\\n😊') == '😊 😊'\n"
-    "    assert normalize_whitespace(' 😊 ') == '😊'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('mix\\t of\\n whitespace') == 'mix of whitespace'\n"
-    "    assert normalize_whitespace('mix\\r\\nwhitespace') == 'mix whitespace'\n"
-    "    assert normalize_whitespace('mix   whitespace') == 'mix whitespace'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('A   B   C') == 'A B C'\n"
-    "    assert normalize_whitespace('A\\nB\\nC') == 'A B C'\n"
-    "    assert normalize_whitespace('A\\tB\\tC') == 'A B C'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('123   456') == '123 456'\n"
-    "    assert normalize_whitespace('123\\n456') == '123 456'\n"
-    "    assert normalize_whitespace('  123  ') == '123'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('!   @   #') == '! @ #'\n"
-    "    assert normalize_whitespace('!\\n@\\n#') == '! @ #'\n"
-    "    assert normalize_whitespace(' ! ') == '!'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('a\\u2003b') == 'a b'\n"
-    "    assert normalize_whitespace('a\\u2009b') == 'a b'\n"
-    "    assert normalize_whitespace('\\u2003') == ''\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('line1\\n\\nline2') == 'line1 line2'\n"
-    "    assert normalize_whitespace('line1\\t\\tline2') == 'line1 line2'\n"
-    "    assert normalize_whitespace('line1   line2') == 'line1 line2'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace(' spaced\\tout ') == 'spaced out'\n"
-    "    assert normalize_whitespace('\\tspaced\\t') == 'spaced'\n"
-    "    assert normalize_whitespace('\\nspaced\\n') == 'spaced'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('a\\fb') == 'a b'\n"
-    "    assert normalize_whitespace('a\\vb') == 'a b'\n"
-    "    assert normalize_whitespace('\\f') == ''\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('many\\n\\t\\r spaces') == 'many spaces'\n"
-    "    assert normalize_whitespace('many\\r\\nspaces') == 'many spaces'\n"
-    "    assert normalize_whitespace('many   spaces') == 'many spaces'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('中文   空格') == '中文 空格'\n"
-    "    assert normalize_whitespace('中文\\n空格') == '中文 空格'\n"
-    "    assert normalize_whitespace(' 中文 ') == '中文'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('русский   текст') == 'русский текст'\n"
-    "    assert normalize_whitespace('русский\\nтекст') == 'русский текст'\n"
-    "    assert normalize_whitespace(' русский ') == 'русский'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    assert normalize_whitespace('end   ') == 'end'\n"
-    "    assert normalize_whitespace('   start') == 'start'\n"
-    "    assert normalize_whitespace('   both   ') == 'both'\n",
-
-    "def test_normalize_whitespace():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        normalize_whitespace(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        normalize_whitespace(123)\n",
-
-    "def test_normalize_whitespace():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        normalize_whitespace(['a', 'b'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        normalize_whitespace({'a': 1})\n",
-
-    "def test_normalize_whitespace():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        normalize_whitespace(object())\n"
-    "    with pytest.raises(TypeError):\n"
-    "        normalize_whitespace(True)\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('') == ''\n"
-    "    assert strip_numbers('123') == ''\n"
-    "    assert strip_numbers('abc') == 'abc'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('a1b2c3') == 'abc'\n"
-    "    assert strip_numbers('1a2b3c') == 'abc'\n"
-    "    assert strip_numbers('abc123') == 'abc'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('123abc456') == 'abc'\n"
-    "    assert strip_numbers('0a0b0') == 'ab'\n"
-    "    assert strip_numbers('9x9') == 'x'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('no numbers here') == 'no numbers here'\n"
-    "    assert strip_numbers(' 1 2 3 ') == '   '\n"
-    "    assert strip_numbers('a 1 b 2') == 'a  b '\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('v2.0') == 'v.'\n"
-    "    assert strip_numbers('version10beta') == 'versionbeta'\n"
-    "    assert strip_numbers('file2024name') == 'filename'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('😊1😊2') == '😊😊'\n"
-    "    assert strip_numbers('1😊2') == '😊'\n"
-    "    assert strip_numbers('😊') == '😊'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('\\n1\\n2') == '\\n\\n'\n"
-    "    assert strip_numbers('\\t3\\t') == '\\t\\t'\n"
-    "    assert strip_numbers('4\\n5') == '\\n'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('mix123mix') == 'mixmix'\n"
-    "    assert strip_numbers('123mix123') == 'mix'\n"
-    "    assert strip_numbers('m1i2x3') == 'mix'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('000abc') == 'abc'\n"
-    "    assert strip_numbers('abc000') == 'abc'\n"
-    "    assert strip_numbers('0a0b0c0') == 'abc'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('1_2_3') == '__'\n"
-    "    assert strip_numbers('a1_b2') == 'a_b'\n"
-    "    assert strip_numbers('x9_y') == 'x_y'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('1-2-3') == '--'\n"
-    "    assert strip_numbers('2024-01-01') == '--'\n"
-    "    assert strip_numbers('v1-beta2') == 'v-beta'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('1.2.3') == '..'\n"
-    "    assert strip_numbers('pi3.14') == 'pi.'\n"
-    "    assert strip_numbers('0.001') == '.'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('abc\\t123') == 'abc\\t'\n"
-    "    assert strip_numbers('123\\tabc') == '\\tabc'\n"
-    "    assert strip_numbers('a\\t1\\tb') == 'a\\t\\tb'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('١٢٣abc') == 'abc'\n"
-    "    assert strip_numbers('abc٤٥٦') == 'abc'\n"
-    "    assert strip_numbers('٧a٨') == 'a'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('1e10') == 'e'\n"
-    "    assert strip_numbers('x2y3z') == 'xyz'\n"
-    "    assert strip_numbers('2fast4you') == 'fastyou'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers(' 123 ') == '  '\n"
-    "    assert strip_numbers(' a1 ') == ' a '\n"
-    "    assert strip_numbers('1 a 2') == ' a '\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('123\\n456') == '\\n'\n"
-    "    assert strip_numbers('\\n1\\n') == '\\n\\n'\n"
-    "    assert strip_numbers('a\\n1b') == 'a\\nb'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('room101') == 'room'\n"
-    "    assert strip_numbers('error404notfound') == 'errornotfound'\n"
-    "    assert strip_numbers('catch22') == 'catch'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('99bottles') == 'bottles'\n"
-    "    assert strip_numbers('bottles99') == 'bottles'\n"
-    "    assert strip_numbers('9lives') == 'lives'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('1😊2a3') == '😊a'\n"
-    "    assert strip_numbers('😊123') == '😊'\n"
-    "    assert strip_numbers('123😊') == '😊'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('1*2+3') == '*+'\n"
-    "    assert strip_numbers('a1+b2') == 'a+b'\n"
-    "    assert strip_numbers('9*9') == '*'\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('000') == ''\n"
-    "    assert strip_numbers('007bond') == 'bond'\n"
-    "    assert strip_numbers('bond007') == 'bond'\n",
-
-    "def test_strip_numbers():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        strip_numbers(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        strip_numbers(123)\n",
-
-    "def test_strip_numbers():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        strip_numbers(True)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        strip_numbers(['1','2'])\n",
-
-    "def test_strip_numbers():\n"
-    "    assert strip_numbers('१२३abc') == 'abc'\n"
-    "    assert strip_numbers('abc१२३') == 'abc'\n"
-    "    assert strip_numbers('१a२b३') == 'ab'\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('') == 0\n"
-    "    assert count_vowels('bcdfg') == 0\n"
-    "    assert count_vowels('aeiou') == 5\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('AEIOU') == 5\n"
-    "    assert count_vowels('AeIoU') == 5\n"
-    "    assert count_vowels('aEi') == 3\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('hello') == 2\n"
-    "    assert count_vowels('HELLO') == 2\n"
-    "    assert count_vowels('hEllO') == 2\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels(' ') == 0\n"
-    "    assert count_vowels('   ') == 0\n"
-    "    assert count_vowels(' a ') == 1\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('123') == 0\n"
-    "    assert count_vowels('a1e2i3') == 3\n"
-    "    assert count_vowels('1a2b3c') == 1\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('!@#$') == 0\n"
-    "    assert count_vowels('a!e@i#') == 3\n"
-    "    assert count_vowels('u?o!') == 2\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('😊') == 0\n"
-    "    assert count_vowels('😊a😊') == 1\n"
-    "    assert count_vowels('😊AE😊') == 2\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('\\n') == 0\n"
-    "    assert count_vowels('\\ta') == 1\n"
-    "    assert count_vowels('a\\n e') == 2\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('y') == 0\n"
-    "    assert count_vowels('Yay') == 1\n"
-    "    assert count_vowels('yay') == 1\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('queue') == 4\n"
-    "    assert count_vowels('beautiful') == 5\n"
-    "    assert count_vowels('education') == 5\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('AaAa') == 4\n"
-    "    assert count_vowels('EeEe') == 4\n"
-    "    assert count_vowels('IiIi') == 4\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('mixED CaSe') == 4\n"
-    "    assert count_vowels('LOWERcase') == 4\n"
-    "    assert count_vowels('UPPER') == 2\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('longstringwithoutvowels') == 7\n"
-    "    assert count_vowels('rhythm') == 0\n"
-    "    assert count_vowels('crypt') == 0\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('a'*100) == 100\n"
-    "    assert count_vowels('b'*100) == 0\n"
-    "    assert count_vowels(('ab'*50)) == 50\n",
-
-    "def test_count_vowels():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_vowels(None)\n",
-
-    "def test_count_vowels():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_vowels(123)\n",
-
-    "def test_count_vowels():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_vowels(['a','e','i'])\n",
-
-    "def test_count_vowels():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_vowels({'a':1})\n",
-
-    "def test_count_vowels():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_vowels(3.14)\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('a e i o u') == 5\n"
-    "    assert count_vowels('a-e-i-o-u') == 5\n"
-    "    assert count_vowels('a_e_i_o_u') == 5\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('áéíóú') == 0\n"
-    "    assert count_vowels('àèìòù') == 0\n"
-    "    assert count_vowels('âêîôû') == 0\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('a\\tb\\nc') == 1\n"
-    "    assert count_vowels('\\n\\t') == 0\n"
-    "    assert count_vowels('e\\n\\ta') == 2\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('0a0e0i0o0u0') == 5\n"
-    "    assert count_vowels('v0w1x2') == 0\n"
-    "    assert count_vowels('i9o8') == 2\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('end') == 1\n"
-    "    assert count_vowels('EDGE') == 2\n"
-    "    assert count_vowels('CASE') == 2\n",
-
-    "def test_count_vowels():\n"
-    "    assert count_vowels('a'*1) == 1\n"
-    "    assert count_vowels('e'*2) == 2\n"
-    "    assert count_vowels('o'*3) == 3\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('') == 0\n"
-    "    assert count_consonants('aeiou') == 0\n"
-    "    assert count_consonants('bcdfg') == 5\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('AEIOU') == 0\n"
-    "    assert count_consonants('BCDF') == 4\n"
-    "    assert count_consonants('AbCdE') == 2\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('hello') == 3\n"
-    "    assert count_consonants('HELLO') == 3\n"
-    "    assert count_consonants('hEllO') == 3\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants(' ') == 0\n"
-    "    assert count_consonants('   ') == 0\n"
-    "    assert count_consonants(' a ') == 0\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('123') == 0\n"
-    "    assert count_consonants('a1b2c3') == 2\n"
-    "    assert count_consonants('1a2e3') == 0\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('!@#$') == 0\n"
-    "    assert count_consonants('b!c@d#') == 3\n"
-    "    assert count_consonants('!a!') == 0\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('😊') == 0\n"
-    "    assert count_consonants('😊b😊') == 1\n"
-    "    assert count_consonants('😊AE😊') == 0\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('\\n') == 0\n"
-    "    assert count_consonants('\\tb') == 1\n"
-    "    assert count_consonants('b\\n c') == 2\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('y') == 1\n"
-    "    assert count_consonants('Yay') == 2\n"
-    "    assert count_consonants('rhythm') == 6\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('queue') == 0\n"
-    "    assert count_consonants('beautiful') == 4\n"
-    "    assert count_consonants('education') == 4\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('AaAa') == 0\n"
-    "    assert count_consonants('BbBb') == 4\n"
-    "    assert count_consonants('CcCc') == 4\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('mixED CaSe') == 5\n"
-    "    assert count_consonants('LOWERcase') == 5\n"
-    "    assert count_consonants('UPPER') == 3\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('longstringwithoutvowels') == 17\n"
-    "    assert count_consonants('crypt') == 5\n"
-    "    assert count_consonants('myths') == 5\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('b'*100) == 100\n"
-    "    assert count_consonants('a'*100) == 0\n"
-    "    assert count_consonants(('ab'*50)) == 50\n",
-
-    "def test_count_consonants():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_consonants(None)\n",
-
-    "def test_count_consonants():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_consonants(123)\n",
-
-    "def test_count_consonants():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_consonants(['b','c'])\n",
-
-    "def test_count_consonants():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_consonants({'a':1})\n",
-
-    "def test_count_consonants():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        count_consonants(3.14)\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('b c d') == 3\n"
-    "    assert count_consonants('b-c-d') == 3\n"
-    "    assert count_consonants('b_c_d') == 3\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('áéíóú') == 0\n"
-    "    assert count_consonants('çñß') == 3\n"
-    "    assert count_consonants('üöä') == 3\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('b\\tb\\nc') == 3\n"
-    "    assert count_consonants('\\n\\t') == 0\n"
-    "    assert count_consonants('d\\n\\tf') == 2\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('0b0c0d0') == 3\n"
-    "    assert count_consonants('v0w1x2') == 3\n"
-    "    assert count_consonants('i9o8') == 0\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('end') == 2\n"
-    "    assert count_consonants('EDGE') == 2\n"
-    "    assert count_consonants('CASE') == 2\n",
-
-    "def test_count_consonants():\n"
-    "    assert count_consonants('b'*1) == 1\n"
-    "    assert count_consonants('c'*2) == 2\n"
-    "    assert count_consonants('d'*3) == 3\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('CamelCase') == 'camel_case'\n"
-    "    assert to_snake_case('camelCase') == 'camel_case'\n"
-    "    assert to_snake_case('Camel') == 'camel'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('') == ''\n"
-    "    assert to_snake_case('A') == 'a'\n"
-    "    assert to_snake_case('a') == 'a'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('Already_Snake') == 'already__snake'\n"
-    "    assert to_snake_case('already_snake') == 'already_snake'\n"
-    "    assert to_snake_case('_Leading') == '_leading'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('HTTPServer') == 'h_t_t_p_server'\n"
-    "    assert to_snake_case('JSONDataAPI') == 'j_s_o_n_data_a_p_i'\n"
-    "    assert to_snake_case('XML') == 'x_m_l'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('lowercase') == 'lowercase'\n"
-    "    assert to_snake_case('UPPERCASE') == 'u_p_p_e_r_c_a_s_e'\n"
-    "    assert to_snake_case('MiXeD') == 'mi_xe_d'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('withNumber1') == 'with_number1'\n"
-    "    assert to_snake_case('Version2Test') == 'version2_test'\n"
-    "    assert to_snake_case('Test123Case') == 'test123_case'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('Space Here') == 'space _here'\n"
-    "    assert to_snake_case('Two Words') == 'two _words'\n"
-    "    assert to_snake_case('Word With Space') == 'word _with _space'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('dash-Case') == 'dash-_case'\n"
-    "    assert to_snake_case('dot.Case') == 'dot._case'\n"
-    "    assert to_snake_case('slash/Case') == 'slash/_case'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('ÜnicodeTest') == 'ünicode_test'\n"
-    "    assert to_snake_case('ÄÖÜ') == 'ä_ö_ü'\n"
-    "    assert to_snake_case('ßTest') == 'ß_test'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('Emoji😊Test') == 'emoji😊_test'\n"
-    "    assert to_snake_case('😊Smile') == '😊_smile'\n"
-    "    assert to_snake_case('Smile😊') == 'smile😊'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('123Test') == '123_test'\n"
-    "    assert to_snake_case('Test123') == 'test123'\n"
-    "    assert to_snake_case('1A2B') == '1_a2_b'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('___') == '___'\n"
-    "    assert to_snake_case('__Test') == '__test'\n"
-    "    assert to_snake_case('Test__Case') == 'test__case'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('aB') == 'a_b'\n"
-    "    assert to_snake_case('Ab') == 'ab'\n"
-    "    assert to_snake_case('AB') == 'a_b'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('Trailing_') == 'trailing_'\n"
-    "    assert to_snake_case('_Leading_') == '_leading_'\n"
-    "    assert to_snake_case('_Both_Ends_') == '_both__ends_'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('line\\nBreak') == 'line\\n_break'\n"
-    "    assert to_snake_case('tab\\tCase') == 'tab\\t_case'\n"
-    "    assert to_snake_case('new\\rLine') == 'new\\r_line'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('a'*50) == 'a'*50\n"
-    "    assert to_snake_case('A'*5) == 'a_a_a_a_a'\n"
-    "    assert to_snake_case('aA'*3) == 'a_a_a_a_a_a'\n",
-
-    "def test_to_snake_case():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        to_snake_case(None)\n",
-
-    "def test_to_snake_case():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        to_snake_case(123)\n",
-
-    "def test_to_snake_case():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        to_snake_case(['Test'])\n",
-
-    "def test_to_snake_case():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        to_snake_case({'a': 1})\n",
-
-    "def test_to_snake_case():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        to_snake_case(3.14)\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('EndsWithUpperX') == 'ends_with_upper_x'\n"
-    "    assert to_snake_case('xEndsWithUpper') == 'x_ends_with_upper'\n"
-    "    assert to_snake_case('XYz') == 'x_yz'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('Already__Snake') == 'already__snake'\n"
-    "    assert to_snake_case('snake__Case') == 'snake__case'\n"
-    "    assert to_snake_case('__snake') == '__snake'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('Z') == 'z'\n"
-    "    assert to_snake_case('zZ') == 'z_z'\n"
-    "    assert to_snake_case('Zz') == 'zz'\n",
-
-    "def test_to_snake_case():\n"
-    "    assert to_snake_case('FinalEdgeCase') == 'final_edge_case'\n"
-    "    assert to_snake_case('EdgeCASETest') == 'edge_c_a_s_e_test'\n"
-    "    assert to_snake_case('TestCASE') == 'test_c_a_s_e'\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('') == 0\n"
-    "    assert count_words(' ') == 0\n"
-    "    assert count_words('   ') == 0\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('one') == 1\n"
-    "    assert count_words('one two') == 2\n"
-    "    assert count_words('one two three') == 3\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('  leading') == 1\n"
-    "    assert count_words('trailing  ') == 1\n"
-    "    assert count_words('  both  ') == 1\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('multiple   spaces here') == 3\n"
-    "    assert count_words('a   b   c') == 3\n"
-    "    assert count_words('word    ') == 1\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('line\\nbreak') == 2\n"
-    "    assert count_words('line\\nline\\nline') == 3\n"
-    "    assert count_words('\\n') == 0\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('tab\\tseparated') == 2\n"
-    "    assert count_words('a\\tb\\tc') == 3\n"
-    "    assert count_words('\\t') == 0\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('mix \\t of \\n whitespace') == 4\n"
-    "    assert count_words(' \\n \\t ') == 0\n"
-    "    assert count_words('a \\n b') == 2\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('punctuation! here.') == 2\n"
-    "    assert count_words('hello, world!') == 2\n"
-    "    assert count_words('end.') == 1\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('😊') == 1\n"
-    "    assert count_words('😊 😊') == 2\n"
-    "    assert count_words('😊  😊  😊') == 3\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('数字 テスト') == 2\n"
-    "    assert count_words('こんにちは') == 1\n"
-    "    assert count_words('こんにちは 世界') == 2\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('123 456 789') == 3\n"
-    "    assert count_words('1  2   3') == 3\n"
-    "    assert count_words('42') == 1\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('UPPER lower MiXeD') == 3\n"
-    "    assert count_words('CASE') == 1\n"
-    "    assert count_words('case test') == 2\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('word-word test') == 2\n"
-    "    assert count_words('dash-separated-words') == 1\n"
-    "    assert count_words('dash - separated') == 3\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('a'*100) == 1\n"
-    "    assert count_words(('a '*50).strip()) == 50\n"
-    "    assert count_words(' '.join(['x']*10)) == 10\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('a\\rb\\rc') == 3\n"
-    "    assert count_words('\\r') == 0\n"
-    "    assert count_words('a\\r b') == 2\n",
-
-    "def test_count_words():\n"
-    "    assert count_words(' spaced   out   text ') == 3\n"
-    "    assert count_words('tight') == 1\n"
-    "    assert count_words(' very   spaced ') == 2\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('underscore_word') == 1\n"
-    "    assert count_words('two_words_here') == 1\n"
-    "    assert count_words('two words_here') == 2\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('! @ #') == 3\n"
-    "    assert count_words('@!') == 1\n"
-    "    assert count_words('!   !') == 2\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('a b\\n c') == 3\n"
-    "    assert count_words('a\\n\\n b') == 2\n"
-    "    assert count_words('\\n a \\n') == 1\n",
-
-    "def test_count_words():\n"
-    "    assert count_words('word\\tword') == 2\n"
-    "    assert count_words('word\\t\\tword') == 2\n"
-    "    assert count_words('\\tword') == 1\n",
-
-    "def test_count_words():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        count_words(None)\n",
-
-    "def test_count_words():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        count_words(123)\n",
-
-    "def test_count_words():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        count_words(['a', 'b'])\n",
-
-    "def test_count_words():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        count_words({'a': 1})\n",
-
-    "def test_count_words():\n"
-    "    with pytest.raises(AttributeError):\n"
-    "        count_words(3.14)\n",
-
-    "def test_is_positive():\n"
-    "    assert is_positive(1) == True\n"
-    "    assert is_positive(0) == False\n"
-    "    assert is_positive(-1) == False\n",
-
-    "def test_is_positive():\n"
-    "    assert is_positive(10**6) == True\n"
-    "    assert is_positive(-(10**6)) == False\n"
-    "    assert is_positive(1) == True\n",
-
-    "def test_is_positive():\n"
-    "    assert is_positive(0.0001) == True\n"
-    "    assert is_positive(-0.0001) == False\n"
-    "    assert is_positive(0.0) == False\n",
-
-    "def test_is_positive():\n"
-    "    assert is_positive(True) == True\n"
-    "    assert is_positive(False) == False\n"
-    "    assert is_positive(1) == True\n",
-
-    "def test_is_positive():\n"
-    "    assert is_positive(-999999999) == False\n"
-    "    assert is_positive(999999999) == True\n"
-    "    assert is_positive(0) == False\n",
-
-    "def test_is_positive():\n"
-    "    assert is_positive(1e9) == True\n"
-    "    assert is_positive(-1e9) == False\n"
-    "    assert is_positive(1e-9) == True\n",
-
-    "def test_is_positive():\n"
-    "    assert is_positive(-1e-9) == False\n"
-    "    assert is_positive(2.5) == True\n"
-    "    assert is_positive(-2.5) == False\n",
-
-    "def test_is_positive():\n"
-    "    assert is_positive(1) == True\n"
-    "    assert is_positive(-0) == False\n"
-    "    assert is_positive(+0) == False\n",
-
-    "def test_is_positive():\n"
-    "    assert is_positive(2147483647) == True\n"
-    "    assert is_positive(-2147483648) == False\n"
-    "    assert is_positive(0) == False\n",
-
-    "def test_is_positive():\n"
-    "    assert is_positive(3.14159) == True\n"
-    "    assert is_positive(-3.14159) == False\n"
-    "    assert is_positive(0.0000) == False\n",
-
-    "def test_is_positive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_positive(None)\n",
-
-    "def test_is_positive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_positive('1')\n",
-
-    "def test_is_positive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_positive('0')\n",
-
-    "def test_is_positive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_positive([1])\n",
-
-    "def test_is_positive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_positive([])\n",
-
-    "def test_is_positive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_positive({})\n",
-
-    "def test_is_positive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_positive({'a': 1})\n",
-
-    "def test_is_positive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_positive((1,))\n",
-
-    "def test_is_positive():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        is_positive(object())\n",
-
-    "def test_is_positive():\n"
-    "    assert is_positive(2**63) == True\n"
-    "    assert is_positive(-(2**63)) == False\n"
-    "    assert is_positive(1) == True\n",
-
-    "def test_is_positive():\n"
-    "    assert is_positive(0.0000000001) == True\n"
-    "    assert is_positive(-0.0000000001) == False\n"
-    "    assert is_positive(0) == False\n",
-
-    "def test_is_positive():\n"
-    "    assert is_positive(5) == True\n"
-    "    assert is_positive(-5) == False\n"
-    "    assert is_positive(0) == False\n",
-
-    "def test_is_positive():\n"
-    "    assert is_positive(42) == True\n"
-    "    assert is_positive(-42) == False\n"
-    "    assert is_positive(0) == False\n",
-
-    "def test_is_positive():\n"
-    "    assert is_positive(1.0) == True\n"
-    "    assert is_positive(-1.0) == False\n"
-    "    assert is_positive(0.0) == False\n",
-
-    "def test_is_positive():\n"
-    "    assert is_positive(7) == True\n"
-    "    assert is_positive(-7) == False\n"
-    "    assert is_positive(0) == False\n",
-
-    "def test_harmonic_mean():\n"
-    "    assert harmonic_mean([]) == 0\n"
-    "    assert harmonic_mean([1]) == 1\n"
-    "    assert harmonic_mean([2]) == 2\n",
-
-    "def test_harmonic_mean():\n"
-    "    assert harmonic_mean([1, 1]) == 1\n"
-    "    assert harmonic_mean([2, 2]) == 2\n"
-    "    assert harmonic_mean([1, 2]) == 4/3\n",
-
-    "def test_harmonic_mean():\n"
-    "    assert harmonic_mean([1, 2, 4]) == 3 / (1 + 0.5 + 0.25)\n"
-    "    assert harmonic_mean([2, 4, 8]) == 3 / (0.5 + 0.25 + 0.125)\n"
-    "    assert harmonic_mean([1, 3, 5]) > 0\n",
-
-    "def test_harmonic_mean():\n"
-    "    assert harmonic_mean([0.5, 0.5]) == 0.5\n"
-    "    assert harmonic_mean([0.25, 0.5]) == 2 / (4 + 2)\n"
-    "    assert harmonic_mean([1.0, 2.0]) == 4/3\n",
-
-    "def test_harmonic_mean():\n"
-    "    assert harmonic_mean([-1, -1]) == -1\n"
-    "    assert harmonic_mean([-1, -2]) == 2 / (-1 - 0.5)\n"
-    "    assert harmonic_mean([-2, -4]) == -8/3\n",
-
-    "def test_harmonic_mean():\n"
-    "    with pytest.raises(ZeroDivisionError):\n"
-    "        harmonic_mean([0])\n"
-    "    with pytest.raises(ZeroDivisionError):\n"
-    "        harmonic_mean([1, 0])\n",
-
-    "def test_harmonic_mean():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        harmonic_mean(None)\n"
-    "    with pytest.raises(TypeError):\n"
-    "        harmonic_mean(5)\n",
-
-    "def test_harmonic_mean():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        harmonic_mean(['1', '2'])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        harmonic_mean([1, '2'])\n",
-
-    "def test_harmonic_mean():\n"
-    "    assert harmonic_mean([10**6, 10**6]) == 10**6\n"
-    "    assert harmonic_mean([1e-6, 1e-6]) == 1e-6\n"
-    "    assert harmonic_mean([1e-3, 1e-6]) > 0\n",
-
-    "def test_harmonic_mean():\n"
-    "    assert harmonic_mean([True, True]) == 1\n"
-    "    assert harmonic_mean([True, False]) == 0\n"
-    "    assert harmonic_mean([False]) == 0\n",
-
-    "def test_harmonic_mean():\n"
-    "    with pytest.raises(ZeroDivisionError):\n"
-    "        harmonic_mean([0, 0, 1])\n",
-
-    "def test_harmonic_mean():\n"
-    "    assert harmonic_mean([3, 6]) == 2 * 3 * 6 / (3 + 6)\n"
-    "    assert harmonic_mean([5, 10]) == 2 * 5 * 10 / (5 + 10)\n"
-    "    assert harmonic_mean([7, 14]) == 2 * 7 * 14 / (7 + 14)\n",
-
-    "def test_harmonic_mean():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        harmonic_mean([1, None])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        harmonic_mean([object()])\n",
-
-    "def test_harmonic_mean():\n"
-    "    assert harmonic_mean([1, 1, 1, 1]) == 1\n"
-    "    assert harmonic_mean([2, 2, 2, 2]) == 2\n"
-    "    assert harmonic_mean([1, 2, 3, 6]) > 0\n",
-
-    "def test_harmonic_mean():\n"
-    "    assert harmonic_mean([0.1, 0.1]) == 0.1\n"
-    "    assert harmonic_mean([0.2, 0.4]) == 2 / (5 + 2.5)\n"
-    "    assert harmonic_mean([0.5, 1.0]) == 2 / (2 + 1)\n",
-
-    "def test_harmonic_mean():\n"
-    "    assert harmonic_mean([1, 2, 3]) == 3 / (1 + 0.5 + 1/3)\n"
-    "    assert harmonic_mean([3, 3, 3]) == 3\n"
-    "    assert harmonic_mean([2, 3, 6]) > 0\n",
-
-    "def test_harmonic_mean():\n"
-    "    with pytest.raises(ZeroDivisionError):\n"
-    "        harmonic_mean([0, 1, 2])\n"
-    "    with pytest.raises(ZeroDivisionError):\n"
-    "        harmonic_mean([2, 0, 2])\n",
-
-    "def test_harmonic_mean():\n"
-    "    assert harmonic_mean([1e-9, 1e-9]) == 1e-9\n"
-    "    assert harmonic_mean([1e-12, 1e-6]) > 0\n"
-    "    assert harmonic_mean([1e-3, 1e-3, 1e-3]) == 1e-3\n",
-
-    "def test_harmonic_mean():\n"
-    "    assert harmonic_mean([-0.5, -0.5]) == -0.5\n"
-    "    assert harmonic_mean([-1, -3]) == 2 / (-1 - 1/3)\n"
-    "    assert harmonic_mean([-2, -2, -2]) == -2\n",
-
-    "def test_harmonic_mean():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        harmonic_mean([True, 2])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        harmonic_mean([False, 1])\n",
-
-    "def test_harmonic_mean():\n"
-    "    assert harmonic_mean([100, 200]) == 2 / (0.01 + 0.005)\n"
-    "    assert harmonic_mean([50, 100, 200]) > 0\n"
-    "    assert harmonic_mean([10, 20, 40]) > 0\n",
-
-    "def test_harmonic_mean():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        harmonic_mean([[], []])\n"
-    "    with pytest.raises(TypeError):\n"
-    "        harmonic_mean([[1], [2]])\n",
+# ----------------------------
+# Config (edge-specific paths)
+# ----------------------------
+DATASET_FILE = "dataset.edge.jsonl"
+REJECTED_FILE = "dataset.edge.rejected.gen.jsonl"
 
-    "def test_harmonic_mean():\n"
-    "    assert harmonic_mean([1, 1, 2, 2]) == 4 / (1 + 1 + 0.5 + 0.5)\n"
-    "    assert harmonic_mean([4, 4, 4, 4]) == 4\n"
-    "    assert harmonic_mean([1, 4, 4]) > 0\n",
+# To limit how many test variants one input function can have:
+PER_INPUT_CAP = None  # None == no cap
 
-    "def test_harmonic_mean():\n"
-    "    with pytest.raises(TypeError):\n"
-    "        harmonic_mean('123')\n"
-    "    with pytest.raises(TypeError):\n"
-    "        harmonic_mean({'a': 1})\n",
+# Where dedupe digests live: "memory", or "sqlite" for datasets larger than RAM
+DEDUPE_INDEX = os.environ.get("DEDUPE_INDEX", "memory")
 
-    "def test_harmonic_mean():\n"
-    "    assert harmonic_mean([2, 2.0]) == 2\n"
-    "    assert harmonic_mean([1.0, 2.0, 4.0]) == 3 / (1 + 0.5 + 0.25)\n"
-    "    assert harmonic_mean([0.25, 0.25]) == 0.25\n",
-]
+# ----------------------------
+# Edge-case seeds
+# ----------------------------
+# The (function, test) pairs live in management/data/edge_seeds.jsonl.gz
+# (see management/seeds.py for how to append new ones).
+# These should be *edge-focused* tests, not the “normal” ones used for the base model.
 
 # ----------------------------
 # Helpers (same style as base)
@@ -17263,23 +55,27 @@ def is_valid_python(code_src: str) -> bool:
         return False
 
 
+def iter_jsonl(path: str):
+    """Stream the existing edge dataset as {'input': ..., 'output': ...} records."""
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            inp = (obj.get("input") or "").strip()
+            out = (obj.get("output") or "").strip()
+            if inp and out:
+                yield {"input": inp, "output": out}
+
+
 def load_jsonl(path: str):
     """Load existing edge dataset in the same shape: [{'input': ..., 'output': ...}, ...]."""
-    items = []
-    if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as fh:
-            for line in fh:
-                if not line.strip():
-                    continue
-                try:
-                    obj = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                inp = (obj.get("input") or "").strip()
-                out = (obj.get("output") or "").strip()
-                if inp and out:
-                    items.append({"input": inp, "output": out})
-    return items
+    return list(iter_jsonl(path))
 
 
 # ----------------------------
@@ -17287,65 +83,22 @@ def load_jsonl(path: str):
 # ----------------------------
 
 def main() -> None:
-    # 1) Load existing edge dataset (if any)
-    existing = load_jsonl(DATASET_FILE)
-
-    # 2) Build incoming examples from your seed lists
-    incoming_raw = [
-        {"input": f.strip(), "output": t.strip()}
-        for f, t in zip(edge_functions, edge_tests)
-    ]
-
-    # Guard: if accidentally mismatch lengths
-    if len(edge_functions) != len(edge_tests):
-        raise ValueError(
-            f"edge_functions ({len(edge_functions)}) and edge_tests "
-            f"({len(edge_tests)}) must have the same length"
-        )
-
-    items_in = existing + incoming_raw
-
-    seen_pairs = set()
-    per_input_counts = defaultdict(int)
-    clean = []
-    rejected = []
-
-    for ex in items_in:
-        in_src = ex["input"].strip()
-        tgt = ex["output"].strip()
-        key = (in_src, tgt)
-
-        # Exact pair dedupe
-        if key in seen_pairs:
-            continue
-
-        # Basic Python validity check
-        if not (is_valid_python(in_src) and is_valid_python(tgt)):
-            rejected.append(ex)
-            continue
-
-        if PER_INPUT_CAP is not None and per_input_counts[in_src] >= PER_INPUT_CAP:
-            continue
-
-        clean.append({"input": in_src, "output": tgt})
-        seen_pairs.add(key)
-        per_input_counts[in_src] += 1
-
-    # 3) Write back the updated edge dataset
-    with open(DATASET_FILE, "w", encoding="utf-8") as f:
-        for ex in clean:
-            f.write(json.dumps(ex, ensure_ascii=False) + "\n")
-
-    # 4) Save generation-time rejects
-    if rejected:
-        with open(REJECTED_FILE, "w", encoding="utf-8") as f:
-            for ex in rejected:
-                f.write(json.dumps(ex, ensure_ascii=False) + "\n")
+    # Append-only: the existing file seeds the index, new unique pairs are appended
+    stats = stream_dedupe(
+        DATASET_FILE,
+        REJECTED_FILE,
+        iter_jsonl(DATASET_FILE),
+        iter_seeds("edge"),
+        is_valid=is_valid_python,
+        per_input_cap=PER_INPUT_CAP,
+        index=DEDUPE_INDEX,
+    )
 
-    print(f"[edge-dataset] Existing loaded: {len(existing)}")
-    print(f"[edge-dataset] Incoming seeds: {len(incoming_raw)}")
-    print(f"[edge-dataset] Unique kept:    {len(clean)}")
-    print(f"[edge-dataset] Rejected saved: {len(rejected)} -> {REJECTED_FILE}")
+    print(f"[edge-dataset] Existing loaded: {stats.get('existing', 0)}")
+    print(f"[edge-dataset] Incoming seeds: {stats.get('incoming', 0)}")
+    print(f"[edge-dataset] Unique kept:    {stats.get('kept', 0)} "
+          f"(+{stats.get('appended', 0)} new)")
+    print(f"[edge-dataset] Rejected saved: {stats.get('rejected', 0)} -> {REJECTED_FILE}")
     print(f"[edge-dataset] Updated in-place: {DATASET_FILE}")
 
     # 5) Run edge-audit to produce dataset.edge.cleaned.jsonl
@@ -17360,7 +113,14 @@ def main() -> None:
     except Exception as e:  # pylint: disable=broad-exception-caught
         print(f"[edge-generate] Audit failed: {e}")
 
-    # 6) Build merged rejects snapshot (gen + audit)
+    # 6) Cluster near-duplicates in the cleaned file (+ per-cluster cap)
+    try:
+        from unittestgen.management.near_dupes import main as near_dupes_main
+        near_dupes_main("dataset.edge.cleaned.jsonl")
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        print(f"[edge-generate] Near-duplicate pass failed: {e}")
+
+    # 7) Build merged rejects snapshot (gen + audit)
     _merge_rejects()
 
 
@@ -0,0 +1,278 @@
+"""
+Near-duplicate detection for function-test pairs.
+
+Exact pair dedupe (dedupe.py) only catches byte-identical pairs. This pass
+clusters pairs that differ only cosmetically, then caps each cluster:
+
+- AST-normalized fingerprint: whitespace via ast.unparse, test_* functions
+  renamed to a placeholder, docstrings dropped, runs of asserts sorted
+  (so literal / assert order and test names no longer matter)
+- MinHash (64-bit token-shingle hashes, XOR-masked per permutation) with
+  LSH banding to find candidate pairs, confirmed by exact Jaccard on the
+  shingle sets
+- Every kept record gets a "cluster" id (train.py splits on it, so near
+  duplicates never straddle train / eval)
+- At most NEAR_DUP_CAP records per cluster are kept (first ones in file order)
+- A JSON report with cluster stats and the largest clusters is written
+
+Usage (in place on the cleaned dataset; generate_*_dataset.py call this
+after the audit):
+
+    python -m unittestgen.management.near_dupes [dataset.cleaned.jsonl]
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
+
+SRC = "dataset.cleaned.jsonl"
+
+# Jaccard similarity (on normalized token shingles) that counts as "near"
+THRESHOLD = float(os.environ.get("NEAR_DUP_THRESHOLD", "0.85"))
+# Records kept per cluster (0 = keep all, only tag clusters)
+CLUSTER_CAP = int(os.environ.get("NEAR_DUP_CAP", "8"))
+
+SHINGLE_TOKENS = 4
+NUM_PERM = 32
+BANDS = 8            # BANDS * ROWS == NUM_PERM
+ROWS = NUM_PERM // BANDS
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+# -----------------------------
+# Normalization
+# -----------------------------
+
+
+def _normalize_body(body: List[ast.stmt]) -> List[ast.stmt]:
+    # drop docstrings
+    if (body and isinstance(body[0], ast.Expr)
+            and isinstance(getattr(body[0], "value", None), ast.Constant)
+            and isinstance(body[0].value.value, str)):
+        body = body[1:] or [ast.Pass()]
+    # sort runs of consecutive asserts
+    out: List[ast.stmt] = []
+    run: List[ast.stmt] = []
+    for stmt in body:
+        if isinstance(stmt, ast.Assert):
+            run.append(stmt)
+            continue
+        out.extend(sorted(run, key=ast.dump))
+        run = []
+        out.append(stmt)
+    out.extend(sorted(run, key=ast.dump))
+    return out
+
+
+def normalize_source(src: str, *, tests: bool = False) -> str:
+    """Canonical text for `src`; falls back to collapsed whitespace."""
+    try:
+        tree = ast.parse(src)
+    except (SyntaxError, ValueError):
+        return " ".join((src or "").split())
+    if tests:
+        for node in ast.walk(tree):
+            if isinstance(node, ast.FunctionDef):
+                if node.name.startswith("test_"):
+                    node.name = "test_"
+                node.body = _normalize_body(node.body)
+        tree.body = _normalize_body(tree.body)
+    return ast.unparse(tree)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_input(src: str) -> str:
+    # inputs repeat heavily (many tests per function)
+    return normalize_source(src)
+
+
+def normalize_pair(inp: str, out: str) -> str:
+    return _normalize_input(inp or "") + "\n" + normalize_source(out or "", tests=True)
+
+
+def pair_fingerprint(inp: str, out: str) -> str:
+    norm = normalize_pair(inp, out)
+    return hashlib.blake2b(norm.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _h64(text: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def shingles(text: str) -> Set[int]:
+    toks = _TOKEN_RE.findall(text)
+    if len(toks) <= SHINGLE_TOKENS:
+        return {_h64(" ".join(toks))}
+    return {
+        _h64(" ".join(toks[i:i + SHINGLE_TOKENS]))
+        for i in range(len(toks) - SHINGLE_TOKENS + 1)
+    }
+
+
+# -----------------------------
+# MinHash / LSH
+# -----------------------------
+_rng = random.Random(1234)
+_MASKS = [_rng.getrandbits(64) for _ in range(NUM_PERM)]
+
+
+def minhash(sh: Set[int]) -> tuple:
+    return tuple(min(x ^ m for x in sh) for m in _MASKS)
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class _UnionFind:
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> None:
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            # smallest index wins, so cluster ids follow file order
+            self.parent[max(ri, rj)] = min(ri, rj)
+
+
+def cluster_records(records: List[dict], threshold: float = THRESHOLD) -> List[int]:
+    """Return a cluster id (index of the cluster's first record) per record."""
+    n = len(records)
+    uf = _UnionFind(n)
+
+    # 1) exact matches after normalization
+    reps: Dict[str, int] = {}
+    texts: Dict[int, str] = {}
+    for i, rec in enumerate(records):
+        norm = normalize_pair(rec.get("input", ""), rec.get("output", ""))
+        if norm in reps:
+            uf.union(reps[norm], i)
+        else:
+            reps[norm] = i
+            texts[i] = norm
+
+    # 2) MinHash + LSH over one representative per exact group
+    sets = {i: shingles(t) for i, t in texts.items()}
+    buckets: Dict[tuple, int] = {}
+    for i, sh in sets.items():
+        sig = minhash(sh)
+        for band in range(BANDS):
+            key = (band, sig[band * ROWS:(band + 1) * ROWS])
+            anchor = buckets.setdefault(key, i)
+            # compare to the bucket's first member only (linear per bucket)
+            if anchor != i and uf.find(anchor) != uf.find(i):
+                if jaccard(sets[anchor], sh) >= threshold:
+                    uf.union(anchor, i)
+
+    return [uf.find(i) for i in range(n)]
+
+
+def eval_clusters(cluster_ids, test_size: float = 0.1, seed: int = 42) -> Set[int]:
+    """The cluster ids held out for evaluation (same choice as split_by_cluster)."""
+    clusters = sorted(set(cluster_ids))
+    random.Random(seed).shuffle(clusters)
+    n_eval = max(1, int(round(len(clusters) * test_size)))
+    return set(clusters[:n_eval])
+
+
+def split_by_cluster(ds, test_size: float = 0.1, seed: int = 42) -> dict:
+    """
+    Train/eval split of a datasets.Dataset that keeps whole clusters on one
+    side. Falls back to a plain random split when there is no "cluster"
+    column (dataset not passed through this module yet).
+    """
+    if "cluster" not in ds.column_names:
+        return ds.train_test_split(test_size=test_size, seed=seed)
+
+    eval_ids = eval_clusters(ds["cluster"], test_size=test_size, seed=seed)
+    return {
+        "train": ds.filter(lambda c: c not in eval_ids, input_columns="cluster"),
+        "test": ds.filter(lambda c: c in eval_ids, input_columns="cluster"),
+    }
+
+
+# -----------------------------
+# Main
+# -----------------------------
+
+
+def main(
+    src: str = SRC,
+    cap: Optional[int] = None,
+    threshold: Optional[float] = None,
+) -> Dict[str, int]:
+    cap = CLUSTER_CAP if cap is None else cap
+    threshold = THRESHOLD if threshold is None else threshold
+    stem = src[:-len(".jsonl")] if src.endswith(".jsonl") else src
+    report_path = f"{stem}.near_dupes.json"
+
+    with open(src, "r", encoding="utf-8") as fh:
+        records = [json.loads(line) for line in fh if line.strip()]
+
+    clusters = cluster_records(records, threshold)
+    sizes = Counter(clusters)
+
+    kept = 0
+    dropped = 0
+    seen_per_cluster: Counter = Counter()
+    members: Dict[int, List[int]] = defaultdict(list)
+    tmp = f"{src}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fo:
+        for i, (rec, cid) in enumerate(zip(records, clusters)):
+            members[cid].append(i)
+            if cap and seen_per_cluster[cid] >= cap:
+                dropped += 1
+                continue
+            seen_per_cluster[cid] += 1
+            rec["cluster"] = cid
+            fo.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            kept += 1
+    os.replace(tmp, src)
+
+    largest = sorted(sizes.items(), key=lambda kv: (-kv[1], kv[0]))[:20]
+    report = {
+        "source": src,
+        "threshold": threshold,
+        "cap": cap,
+        "records": len(records),
+        "clusters": len(sizes),
+        "multi_member_clusters": sum(1 for s in sizes.values() if s > 1),
+        "kept": kept,
+        "dropped": dropped,
+        "largest": [
+            {
+                "cluster": cid,
+                "size": size,
+                "examples": [records[i].get("output", "") for i in members[cid][:3]],
+            }
+            for cid, size in largest if size > 1
+        ],
+    }
+    with open(report_path, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2, ensure_ascii=False)
+
+    print(f"[near-dupes] records={len(records)} clusters={len(sizes)} "
+          f"kept={kept} dropped={dropped} -> {src} (report: {report_path})")
+    return {"records": len(records), "clusters": len(sizes),
+            "kept": kept, "dropped": dropped}
+
+
+if __name__ == "__main__":
+    main(*(sys.argv[1:2] or [SRC]))
@@ -0,0 +1,102 @@
+"""
+Parity check between the torch and ONNX Runtime inference backends.
+
+Runs the deterministic beam phase of the serving pipeline (same prompt,
+preset, stopping criteria and decode constraints; the generate() kwargs
+come from the engine's _candidate_generate_kwargs) on both backends for
+every function of a corpus and compares the decoded candidates:
+
+- exact      share of functions whose full candidate list is identical
+- top1       share whose first beam is identical
+- latency    mean seconds per generate() call, per backend
+
+Sampling is not compared: the logits differ in the last float bits, so
+sampled sequences diverge even with the same seed.
+
+Used by `manage.py onnxexport`.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Iterable, List
+
+import torch
+
+from unittestgen.ai.codet5_engine import (
+    MAX_NEW_TOKENS,
+    _DECODE_PRESETS,
+    _candidate_generate_kwargs,
+    _decode_constraints,
+    _extract_function_defs,
+    _extract_function_name,
+    _guess_task_kind,
+    _load_model_and_tokenizer,
+    _prompt_for,
+)
+
+
+def beam_candidates(src: str, *, mode: str, backend: str,
+                    max_new_tokens: int = MAX_NEW_TOKENS) -> List[str]:
+    """Decoded beam candidates for one function, exactly as serving asks for them."""
+    tokenizer, model = _load_model_and_tokenizer(mode, backend)
+    defs = _extract_function_defs(src)
+    func_name = defs[0][0] if defs else _extract_function_name(src)
+    preset = _DECODE_PRESETS["numeric" if _guess_task_kind(src) == "numeric" else "string"]
+
+    prompt = _prompt_for(src, func_name)
+    enc = tokenizer(
+        prompt,
+        return_tensors="pt",
+        truncation=True,
+        max_length=512,
+        padding=True,
+        return_attention_mask=True,
+    ).to(model.device)
+
+    with torch.inference_mode():
+        outs = model.generate(
+            enc["input_ids"],
+            attention_mask=enc["attention_mask"],
+            **_candidate_generate_kwargs(
+                tokenizer,
+                max_new_tokens=max_new_tokens,
+                do_sample=False,
+                num_return=preset["beam_candidates"],
+                num_beams=preset["num_beams"],
+                constraints=_decode_constraints(tokenizer, [func_name], [prompt]),
+            ),
+        )
+    return tokenizer.batch_decode(outs, skip_special_tokens=True)
+
+
+def check_parity(functions: Iterable[str], *, mode: str = "base",
+                 on_progress=None) -> dict:
+    functions = list(functions)
+    backends = ("torch", "onnx")
+    for backend in backends:
+        _load_model_and_tokenizer(mode, backend)   # load / export outside the timings
+
+    latency = {b: [] for b in backends}
+    rows = []
+    for n, src in enumerate(functions, 1):
+        outs = {}
+        for backend in backends:
+            start = time.perf_counter()
+            outs[backend] = beam_candidates(src, mode=mode, backend=backend)
+            latency[backend].append(time.perf_counter() - start)
+        rows.append({
+            "exact": outs["torch"] == outs["onnx"],
+            "top1": outs["torch"][:1] == outs["onnx"][:1],
+        })
+        if on_progress:
+            on_progress(n, len(functions), rows[-1])
+
+    total = len(rows)
+    return {
+        "mode": mode,
+        "functions": total,
+        "exact": sum(r["exact"] for r in rows) / total if total else 0.0,
+        "top1": sum(r["top1"] for r in rows) / total if total else 0.0,
+        "latency_s": {b: (sum(v) / len(v) if v else 0.0) for b, v in latency.items()},
+    }
@@ -0,0 +1,98 @@
+"""
+Seed corpora for the dataset generators.
+
+The (function, test) seed pairs used to live in generate_dataset.py /
+generate_edge_dataset.py as two giant list literals each. They now live in
+gzip-compressed JSONL files under management/data/:
+
+    base_seeds.jsonl.gz   -> generate_dataset.py
+    edge_seeds.jsonl.gz   -> generate_edge_dataset.py
+
+One record per line: {"input": <function source>, "output": <test source>}.
+Records are streamed, so memory does not grow with the corpus.
+
+Adding seeds (gzip members can be appended, nothing is rewritten):
+
+    python -m unittestgen.management.seeds append base < new_pairs.jsonl
+    python -m unittestgen.management.seeds count edge
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import sys
+from typing import Iterable, Iterator, Tuple
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+SEED_FILES = {
+    "base": os.path.join(DATA_DIR, "base_seeds.jsonl.gz"),
+    "edge": os.path.join(DATA_DIR, "edge_seeds.jsonl.gz"),
+}
+
+
+def seed_path(kind: str) -> str:
+    try:
+        return SEED_FILES[kind]
+    except KeyError:
+        raise ValueError(
+            f"Unknown seed set {kind!r} (expected one of {sorted(SEED_FILES)})"
+        ) from None
+
+
+def iter_seeds(kind: str) -> Iterator[dict]:
+    """Yield {"input", "output"} seed records in file order."""
+    with gzip.open(seed_path(kind), "rt", encoding="utf-8") as fh:
+        for lineno, line in enumerate(fh, 1):
+            if not line.strip():
+                continue
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{seed_path(kind)}:{lineno}: {e}") from e
+            yield {"input": obj.get("input", ""), "output": obj.get("output", "")}
+
+
+def count_seeds(kind: str) -> int:
+    return sum(1 for _ in iter_seeds(kind))
+
+
+def append_seeds(kind: str, pairs: Iterable[Tuple[str, str]]) -> int:
+    """Append (function, test) pairs as a new gzip member. Returns the count."""
+    n = 0
+    with gzip.open(seed_path(kind), "at", encoding="utf-8") as fh:
+        for func, test in pairs:
+            fh.write(json.dumps({"input": func, "output": test},
+                                ensure_ascii=False) + "\n")
+            n += 1
+    return n
+
+
+def _read_pairs(stream) -> Iterator[Tuple[str, str]]:
+    for line in stream:
+        if not line.strip():
+            continue
+        obj = json.loads(line)
+        if not obj.get("input") or not obj.get("output"):
+            raise ValueError(f"Seed needs 'input' and 'output': {line.strip()[:80]}")
+        yield obj["input"], obj["output"]
+
+
+def main(argv=None) -> None:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if len(argv) != 2 or argv[0] not in {"append", "count"}:
+        print("usage: python -m unittestgen.management.seeds {append|count} {base|edge}")
+        raise SystemExit(2)
+
+    action, kind = argv
+    if action == "count":
+        print(f"[seeds] {kind}: {count_seeds(kind)}")
+    else:
+        n = append_seeds(kind, _read_pairs(sys.stdin))
+        print(f"[seeds] appended {n} -> {seed_path(kind)}")
+
+
+if __name__ == "__main__":
+    main()
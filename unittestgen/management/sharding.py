@@ -0,0 +1,271 @@
+"""
+Sharded, order-preserving runner for the JSONL dataset audits.
+
+- Splits the input into chunks of `chunk_size` lines
+- Audits chunks on a process pool (or inline when workers == 1)
+- Writes results strictly in input order, so cleaned / rejected files are
+  byte-identical to a serial run
+- Keeps at most `2 * workers` chunks in flight (bounded memory)
+- Optionally reuses verdicts from an AuditManifest, so only new / changed
+  records are audited again
+
+`audit_line(line) -> (kept, text)` must be a module-level function so it
+can be pickled to the worker processes; `text` is written as-is to the
+cleaned file when kept, otherwise to the rejected file. `kept=None` means
+"rejected, but don't remember the verdict" (e.g. a timeout).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import signal
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+AuditFn = Callable[[str], Tuple[Optional[bool], str]]
+Result = Tuple[Optional[bool], str]
+
+DEFAULT_CHUNK_SIZE = 512
+
+
+class RecordTimeout(BaseException):
+    """
+    Raised inside a record that ran past its time limit.
+    BaseException on purpose: user code under audit may `except Exception`.
+    """
+
+
+@contextmanager
+def time_limit(seconds: float):
+    """
+    Abort the block with RecordTimeout after `seconds` (wall clock).
+    Uses SIGALRM, so it is a no-op off the main thread or on platforms
+    without setitimer (Windows).
+    """
+    usable = (
+        seconds and seconds > 0
+        and hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    )
+    if not usable:
+        yield
+        return
+
+    def _raise(_signum, _frame):
+        raise RecordTimeout()
+
+    previous = signal.signal(signal.SIGALRM, _raise)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def default_workers() -> int:
+    """AUDIT_WORKERS env var, else one worker per core."""
+    env = os.environ.get("AUDIT_WORKERS")
+    if env:
+        return max(1, int(env))
+    return os.cpu_count() or 1
+
+
+# -----------------------------
+# Incremental manifest
+# -----------------------------
+class AuditManifest:
+    """
+    Verdict cache for one audit, stored as JSONL next to the outputs:
+
+        {"key": sha256(rules_version, input, output), "ok": bool, "output": str|null}
+
+    `output` is the (possibly corrected) test kept in the cleaned file.
+    Bump the audit's rules version to invalidate every entry. Only entries
+    seen in the current run are written back, so the file never outgrows
+    the dataset.
+    """
+
+    def __init__(self, path: str, rules_version: str):
+        self.path = path
+        self.rules_version = str(rules_version)
+        self._old: Dict[str, dict] = {}
+        self._new: Dict[str, dict] = {}
+        self.reused = 0
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                for row in fh:
+                    try:
+                        entry = json.loads(row)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(entry, dict) and "key" in entry:
+                        self._old[entry["key"]] = entry
+        except FileNotFoundError:
+            pass
+
+    def key_for(self, obj) -> Optional[str]:
+        if not isinstance(obj, dict):
+            return None
+        payload = json.dumps(
+            [self.rules_version, obj.get("input"), obj.get("output")],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def lookup(self, line: str) -> Tuple[Optional[str], Optional[Result]]:
+        """Return (key, cached_result); key is None for unparsable lines."""
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError:
+            return None, None
+        key = self.key_for(obj)
+        if key is None:
+            return None, None
+        entry = self._new.get(key) or self._old.get(key)
+        if entry is None:
+            return key, None
+
+        self._new[key] = entry
+        self.reused += 1
+        if not entry.get("ok"):
+            return key, (False, line if line.endswith("\n") else line + "\n")
+        obj["output"] = entry.get("output")
+        return key, (True, json.dumps(obj, ensure_ascii=False) + "\n")
+
+    def record(self, key: Optional[str], result: Result) -> None:
+        ok, text = result
+        if key is None or ok is None:
+            return
+        output = None
+        if ok:
+            try:
+                output = json.loads(text).get("output")
+            except (json.JSONDecodeError, AttributeError):
+                return
+        self._new[key] = {"key": key, "ok": bool(ok), "output": output}
+
+    def save(self) -> None:
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            for entry in self._new.values():
+                fh.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(tmp, self.path)
+
+
+def _audit_chunk(audit_line: AuditFn, lines: List[str]) -> List[Tuple[bool, str]]:
+    return [audit_line(line) for line in lines]
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    it = iter(lines)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _split_chunk(
+    chunk: List[str], manifest: Optional[AuditManifest]
+) -> Tuple[List[Optional[Result]], List[Tuple[int, Optional[str]]]]:
+    """Fill cached verdicts; return (results_with_holes, [(index, key)] to audit)."""
+    results: List[Optional[Result]] = [None] * len(chunk)
+    misses: List[Tuple[int, Optional[str]]] = []
+    for i, line in enumerate(chunk):
+        key, hit = manifest.lookup(line) if manifest else (None, None)
+        if hit is None:
+            misses.append((i, key))
+        else:
+            results[i] = hit
+    return results, misses
+
+
+def _fill_chunk(
+    results: List[Optional[Result]],
+    misses: List[Tuple[int, Optional[str]]],
+    audited: List[Result],
+    manifest: Optional[AuditManifest],
+) -> List[Result]:
+    for (i, key), res in zip(misses, audited):
+        results[i] = res
+        if manifest:
+            manifest.record(key, res)
+    return results  # type: ignore[return-value]
+
+
+def _iter_results(
+    lines: Iterable[str],
+    audit_line: AuditFn,
+    workers: int,
+    chunk_size: int,
+    manifest: Optional[AuditManifest] = None,
+) -> Iterator[List[Result]]:
+    if workers <= 1:
+        for chunk in _chunks(lines, chunk_size):
+            results, misses = _split_chunk(chunk, manifest)
+            audited = _audit_chunk(audit_line, [chunk[i] for i, _ in misses])
+            yield _fill_chunk(results, misses, audited, manifest)
+        return
+
+    job = partial(_audit_chunk, audit_line)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight: deque = deque()
+
+        def _drain_one():
+            results, misses, fut = in_flight.popleft()
+            audited = fut.result() if fut is not None else []
+            return _fill_chunk(results, misses, audited, manifest)
+
+        for chunk in _chunks(lines, chunk_size):
+            results, misses = _split_chunk(chunk, manifest)
+            fut = pool.submit(job, [chunk[i] for i, _ in misses]) if misses else None
+            in_flight.append((results, misses, fut))
+            if len(in_flight) >= 2 * workers:
+                yield _drain_one()
+        while in_flight:
+            yield _drain_one()
+
+
+def run_sharded_audit(
+    src: str,
+    out_clean: str,
+    out_reject: str,
+    audit_line: AuditFn,
+    *,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    manifest: Optional[AuditManifest] = None,
+) -> Tuple[int, int]:
+    """
+    Audit `src` into `out_clean` / `out_reject`. Returns (kept, rejected).
+    With a manifest, cached verdicts are reused and the manifest is saved
+    once the outputs are complete.
+    """
+    workers = default_workers() if workers is None else max(1, int(workers))
+    kept, rej = 0, 0
+
+    with open(src, "r", encoding="utf-8") as fi, \
+            open(out_clean, "w", encoding="utf-8") as fo, \
+            open(out_reject, "w", encoding="utf-8") as fr:
+
+        for results in _iter_results(fi, audit_line, workers,
+                                     max(1, chunk_size), manifest):
+            for ok, text in results:
+                if ok:
+                    fo.write(text)
+                    kept += 1
+                else:
+                    fr.write(text)
+                    rej += 1
+
+    if manifest is not None:
+        manifest.save()
+    return kept, rej
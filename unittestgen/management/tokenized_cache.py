@@ -0,0 +1,127 @@
+"""
+Pre-tokenized training data cache for the fine-tuning scripts.
+
+- Tokenizes once, with the tokenizer instance the trainer already loaded
+  (no from_pretrained per map batch), on `num_proc` map workers
+- Saves the tokenized train / eval splits as Arrow (save_to_disk) under
+  TOKENIZED_CACHE_DIR/<key>; later runs load_from_disk, which memory-maps
+  the files instead of re-reading the JSONL
+- <key> = sha256(dataset file bytes, tokenizer, prompt version + template,
+  max lengths, split params): changing any of them builds a fresh cache
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from typing import Callable
+
+from unittestgen.management.near_dupes import split_by_cluster
+
+CACHE_DIR = os.environ.get("TOKENIZED_CACHE_DIR", ".tokenized_cache")
+NUM_PROC = int(os.environ.get("TOKENIZE_NUM_PROC", str(min(4, os.cpu_count() or 1))))
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def cache_key(
+    dataset_path: str,
+    tokenizer,
+    build_prompt: Callable[[str], str],
+    prompt_version: str,
+    **params,
+) -> str:
+    meta = {
+        "data": file_sha256(dataset_path),
+        "tokenizer": [type(tokenizer).__name__,
+                      getattr(tokenizer, "name_or_path", ""), len(tokenizer)],
+        "prompt": [prompt_version, build_prompt("{func}")],
+        "params": params,
+        "schema": 2,   # + src_len / tgt_len columns
+    }
+    blob = json.dumps(meta, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()[:24]
+
+
+def _tokenize(batch, tokenizer, build_prompt, max_src_len, max_tgt_len):
+    inputs = [build_prompt(func) for func in batch["input"]]
+    model_inputs = tokenizer(inputs, max_length=max_src_len, truncation=True)
+    labels = tokenizer(text_target=batch["output"],
+                       max_length=max_tgt_len, truncation=True)
+    model_inputs["labels"] = labels["input_ids"]
+    # lengths for the token-budget batch sampler (dropped before the model sees them)
+    model_inputs["src_len"] = [len(ids) for ids in model_inputs["input_ids"]]
+    model_inputs["tgt_len"] = [len(ids) for ids in model_inputs["labels"]]
+    return model_inputs
+
+
+def load_tokenized_splits(
+    dataset_path: str,
+    tokenizer,
+    build_prompt: Callable[[str], str],
+    *,
+    prompt_version: str,
+    max_src_len: int,
+    max_tgt_len: int,
+    test_size: float = 0.1,
+    seed: int = 42,
+    num_proc: int | None = None,
+):
+    """Return a DatasetDict with tokenized "train" / "test", cached on disk."""
+    from datasets import DatasetDict, load_dataset, load_from_disk
+
+    key = cache_key(
+        dataset_path, tokenizer, build_prompt, prompt_version,
+        max_src_len=max_src_len, max_tgt_len=max_tgt_len,
+        test_size=test_size, seed=seed,
+    )
+    path = os.path.join(CACHE_DIR, key)
+    if os.path.isdir(path):
+        print(f"[tokenize] Using cached dataset: {path}")
+        return load_from_disk(path)
+
+    num_proc = NUM_PROC if num_proc is None else num_proc
+    if num_proc > 1:
+        # the map workers already parallelize; avoid fork warnings / oversubscription
+        os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+    raw = load_dataset("json", data_files=dataset_path)["train"]
+    split = split_by_cluster(raw, test_size=test_size, seed=seed)
+
+    fn_kwargs = {
+        "tokenizer": tokenizer,
+        "build_prompt": build_prompt,
+        "max_src_len": max_src_len,
+        "max_tgt_len": max_tgt_len,
+    }
+    tokenized = DatasetDict({
+        name: ds.map(
+            _tokenize,
+            fn_kwargs=fn_kwargs,
+            batched=True,
+            num_proc=num_proc if num_proc > 1 else None,
+            remove_columns=ds.column_names,
+            new_fingerprint=f"{key}_{name}",
+            desc=f"Tokenizing {name}",
+        )
+        for name, ds in split.items()
+    })
+
+    # write next to the final path, then rename so a crash never leaves a half cache
+    tmp = f"{path}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tokenized.save_to_disk(tmp)
+    os.replace(tmp, path)
+    print(f"[tokenize] Cached tokenized dataset: {path}")
+
+    # reload so training reads the memory-mapped Arrow files
+    return load_from_disk(path)
@@ -1,3 +1,1078 @@
-from django.test import TestCase
+import difflib
+import io
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import unittest
+import zipfile
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+
+from unittestgen.ai import codet5_engine
+from unittestgen.ai.codet5_engine import (
+    _ForcePrefix,
+    _candidate_key,
+    _check_test,
+    _collect_spares,
+    _decode_constraints,
+    _EXEC_LOCAL,
+    _exec_checks,
+    _fork_server,
+    _generate_time_limit,
+    _load_onnx_model,
+    _normalize_test_for_similarity,
+    _pick_passing_candidate,
+    _repair_assert_rhs,
+    _similarity_profile,
+    _test_end,
+    _too_similar,
+    _too_similar_any,
+    _trim_after_test,
+    _try_repair,
+    _validate_test,
+    _validator_mode,
+    fresh_verdict_cache,
+    regenerate_test_for_function,
+)
+from unittestgen.ai import verdict_cache
+from unittestgen.ai.verdict_cache import VerdictCache
+from unittestgen.management import evaluation, near_dupes, tokenized_cache
+from unittestgen.management.batching import TokenBudgetBatchSampler, padding_ratio
+from unittestgen.management.dedupe import stream_dedupe
+from unittestgen.management.sharding import AuditManifest, run_sharded_audit
+from unittestgen import views
+from unittestgen.models import TestItem, TestSession
+from unittestgen.views import function_fingerprints, reusable_tests
+
+
+def _write_jsonl(path, rows):
+    with open(path, "w", encoding="utf-8") as fh:
+        for row in rows:
+            fh.write(json.dumps(row) + "\n")
+
+
+def _read_jsonl(path):
+    with open(path, "r", encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+class _Seqs(list):
+    """Stand-in for a generate() output tensor: rows, .shape, slicing."""
+    @property
+    def shape(self):
+        return (len(self),)
+
+    def __getitem__(self, i):
+        rows = super().__getitem__(i)
+        return _Seqs(rows) if isinstance(i, slice) else rows
+
+
+class TmpDirMixin:
+    def setUp(self):
+        super().setUp()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+        super().tearDown()
+
+    def path(self, name):
+        return os.path.join(self.tmp, name)
+
+
+# -----------------------------
+# Sharded audits (management/sharding.py)
+# -----------------------------
+
+AUDITED = []
+
+
+def _audit_even(line: str):
+    """Keep records with an even "n"; n == 7 is a timeout (not remembered)."""
+    obj = json.loads(line)
+    AUDITED.append(obj["n"])
+    if obj["n"] == 7:
+        return None, line
+    if obj["n"] % 2:
+        return False, line
+    obj["output"] = obj["output"].upper()
+    return True, json.dumps(obj) + "\n"
+
+
+class ShardedAuditTests(TmpDirMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        AUDITED.clear()
+        self.src = self.path("in.jsonl")
+        _write_jsonl(self.src, [{"n": n, "input": f"f{n}", "output": f"t{n}"}
+                                for n in range(11)])
+
+    def _run(self, tag, **kwargs):
+        clean, reject = self.path(f"{tag}.clean"), self.path(f"{tag}.reject")
+        counts = run_sharded_audit(self.src, clean, reject, _audit_even, **kwargs)
+        with open(clean, "rb") as fc, open(reject, "rb") as fr:
+            return counts, fc.read(), fr.read()
+
+    def test_parallel_output_is_byte_identical_to_serial(self):
+        serial = self._run("serial", workers=1, chunk_size=3)
+        parallel = self._run("parallel", workers=2, chunk_size=2)
+        self.assertEqual(serial, parallel)
+        self.assertEqual(serial[0], (6, 5))
+        self.assertEqual([json.loads(l)["n"] for l in serial[1].splitlines()],
+                         [0, 2, 4, 6, 8, 10])
+
+    def test_manifest_reuses_verdicts_but_not_timeouts(self):
+        manifest_path = self.path("manifest.jsonl")
+        first = self._run("a", workers=1, chunk_size=4,
+                          manifest=AuditManifest(manifest_path, "1"))
+        self.assertEqual(len(AUDITED), 11)
+
+        AUDITED.clear()
+        manifest = AuditManifest(manifest_path, "1")
+        second = self._run("b", workers=1, chunk_size=4, manifest=manifest)
+        self.assertEqual(first, second)
+        self.assertEqual(AUDITED, [7])          # only the timed-out record
+        self.assertEqual(manifest.reused, 10)
+
+        AUDITED.clear()
+        self._run("c", workers=1, manifest=AuditManifest(manifest_path, "2"))
+        self.assertEqual(len(AUDITED), 11)      # new rules version: no reuse
+
+
+# -----------------------------
+# Dataset dedupe (management/dedupe.py)
+# -----------------------------
+
+def _is_valid(src: str) -> bool:
+    return "SYNTAX ERROR" not in src
+
+
+class StreamDedupeTests(TmpDirMixin, SimpleTestCase):
+    def _run(self, existing, incoming, **kwargs):
+        _write_jsonl(self.path("dataset.jsonl"), existing)
+        return self._run_on_file(incoming, **kwargs)
+
+    def _run_on_file(self, incoming, **kwargs):
+        dataset, rejected = self.path("dataset.jsonl"), self.path("rejected.jsonl")
+        with open(dataset, "r", encoding="utf-8") as fh:
+            stats = stream_dedupe(
+                dataset, rejected,
+                (json.loads(line) for line in fh),
+                iter(incoming),
+                is_valid=_is_valid,
+                **kwargs,
+            )
+        return stats, _read_jsonl(dataset), rejected
+
+    def test_appends_only_new_pairs_and_leaves_existing_lines_alone(self):
+        a = {"input": "def a(): pass", "output": "def test_a(): a()"}
+        b = {"input": "def b(): pass", "output": "def test_b(): b()"}
+        padded = dict(a, input="  def a(): pass  ")   # same pair after strip
+        dataset = self.path("dataset.jsonl")
+        _write_jsonl(dataset, [padded, padded])
+        with open(dataset, "rb") as fh:
+            before = fh.read()
+
+        stats, rows, _ = self._run_on_file([a, b])
+        with open(dataset, "rb") as fh:
+            after = fh.read()
+        self.assertTrue(after.startswith(before))
+        self.assertEqual(rows, [padded, padded, b])
+        self.assertEqual(stats["existing"], 2)
+        self.assertEqual(stats["kept"], 2)
+        self.assertEqual(stats["appended"], 1)
+        self.assertEqual(stats["duplicates"], 1)
+
+    def test_append_after_a_truncated_last_line(self):
+        a = {"input": "def a(): pass", "output": "def test_a(): a()"}
+        b = {"input": "def b(): pass", "output": "def test_b(): b()"}
+        with open(self.path("dataset.jsonl"), "w", encoding="utf-8") as fh:
+            fh.write(json.dumps(a))   # no trailing newline
+        _stats, rows, _ = self._run_on_file([b])
+        self.assertEqual(rows, [a, b])
+
+    def test_invalid_pairs_go_to_the_rejected_file(self):
+        good = {"input": "def a(): pass", "output": "def test_a(): a()"}
+        bad = {"input": "def b(: SYNTAX ERROR", "output": "def test_b(): b()"}
+        stats, rows, rejected = self._run([good], [bad])
+        self.assertEqual(rows, [good])
+        self.assertEqual(stats["rejected"], 1)
+        self.assertEqual(_read_jsonl(rejected), [bad])
+
+    def test_rejected_file_untouched_when_nothing_is_rejected(self):
+        _write_jsonl(self.path("rejected.jsonl"), [{"keep": True}])
+        _stats, _rows, rejected = self._run(
+            [], [{"input": "def a(): pass", "output": "def test_a(): a()"}])
+        self.assertEqual(_read_jsonl(rejected), [{"keep": True}])
+
+    def test_per_input_cap_and_sqlite_index(self):
+        incoming = [{"input": "def a(): pass", "output": f"def test_a{i}(): a()"}
+                    for i in range(4)]
+        for index in ("memory", "sqlite"):
+            stats, rows, _ = self._run([], incoming, per_input_cap=2, index=index)
+            self.assertEqual(rows, incoming[:2], index)
+            self.assertEqual(stats["kept"], 2, index)
+        self.assertFalse(os.path.exists(self.path("dataset.jsonl.dedupe.sqlite")))
+
+    def test_per_input_cap_counts_existing_records(self):
+        incoming = [{"input": "def a(): pass", "output": f"def test_a{i}(): a()"}
+                    for i in range(4)]
+        stats, rows, _ = self._run(incoming[:1], incoming, per_input_cap=2)
+        self.assertEqual(rows, incoming[:2])
+        self.assertEqual(stats["appended"], 1)
+
+
+# -----------------------------
+# Near-duplicate clustering (management/near_dupes.py)
+# -----------------------------
+
+ADD_SRC = "def add(a, b):\n    return a + b\n"
+
+
+class NearDupesTests(TmpDirMixin, SimpleTestCase):
+    def test_cosmetic_variants_share_a_cluster(self):
+        records = [
+            {"input": ADD_SRC,
+             "output": "def test_add():\n    assert add(1, 2) == 3\n    assert add(0, 0) == 0\n"},
+            # renamed test, reordered asserts, docstring, other spacing
+            {"input": "def add(a,b):\n  return a+b\n",
+             "output": 'def test_add_basic():\n    """Adds."""\n'
+                       "    assert add(0,0) == 0\n    assert add(1,2) == 3\n"},
+            {"input": "def upper(s):\n    return s.upper()\n",
+             "output": "def test_upper():\n    assert upper('ab') == 'AB'\n"},
+        ]
+        self.assertEqual(near_dupes.cluster_records(records), [0, 0, 2])
+
+    def test_different_literals_stay_apart(self):
+        records = [
+            {"input": ADD_SRC, "output": "def test_add():\n    assert add(1, 2) == 3\n"},
+            {"input": ADD_SRC, "output": "def test_add():\n    assert add(-7, 4) == -3\n"},
+        ]
+        self.assertEqual(near_dupes.cluster_records(records), [0, 1])
+
+    def test_eval_clusters_is_deterministic(self):
+        ids = list(range(0, 200, 2))
+        held_out = near_dupes.eval_clusters(ids, test_size=0.1, seed=42)
+        self.assertEqual(held_out, near_dupes.eval_clusters(ids, test_size=0.1, seed=42))
+        self.assertEqual(len(held_out), 10)
+        self.assertTrue(held_out <= set(ids))
+
+    def test_main_caps_clusters_and_tags_records(self):
+        src = self.path("cleaned.jsonl")
+        same = {"input": ADD_SRC, "output": "def test_add():\n    assert add(1, 2) == 3\n"}
+        other = {"input": ADD_SRC, "output": "def test_add():\n    assert add(-7, 4) == -3\n"}
+        _write_jsonl(src, [same, dict(same), dict(same), other])
+        near_dupes.main(src, cap=2, threshold=0.85)
+        rows = _read_jsonl(src)
+        self.assertEqual([r["cluster"] for r in rows], [0, 0, 3])
+        self.assertTrue(os.path.exists(self.path("cleaned.near_dupes.json")))
+
+
+# -----------------------------
+# Token-budget batching (management/batching.py)
+# -----------------------------
+
+class TokenBudgetBatchSamplerTests(SimpleTestCase):
+    def setUp(self):
+        rng = random.Random(0)
+        # mix of one-line seed tests and long edge tests
+        self.src = [rng.choice([20, 30, 200, 400]) for _ in range(500)]
+        self.tgt = [rng.choice([10, 15, 120, 250]) for _ in range(500)]
+
+    def test_every_index_once_and_batches_within_budget(self):
+        sampler = TokenBudgetBatchSampler(self.src, self.tgt, 2048,
+                                          max_batch_size=16, window=128)
+        batches = list(sampler)
+        flat = sorted(i for b in batches for i in b)
+        self.assertEqual(flat, list(range(500)))
+        for b in batches:
+            self.assertLessEqual(len(b), 16)
+            cost = len(b) * (max(self.src[i] for i in b) + max(self.tgt[i] for i in b))
+            self.assertTrue(cost <= 2048 or len(b) == 1)
+
+    def test_oversized_example_gets_its_own_batch(self):
+        sampler = TokenBudgetBatchSampler([10, 5000, 10], [10, 10, 10], 100)
+        self.assertIn([1], list(sampler))
+
+    def test_order_is_seeded_and_changes_per_epoch(self):
+        a = TokenBudgetBatchSampler(self.src, self.tgt, 2048, seed=7)
+        b = TokenBudgetBatchSampler(self.src, self.tgt, 2048, seed=7)
+        first = list(a)
+        self.assertEqual(first, list(b))
+        self.assertNotEqual(first, list(a))   # second pass reshuffles
+
+    def test_pads_less_than_fixed_random_batches(self):
+        sampler = TokenBudgetBatchSampler(self.src, self.tgt, 4096, max_batch_size=16)
+        order = list(range(500))
+        random.Random(1).shuffle(order)
+        fixed = [order[i:i + 16] for i in range(0, 500, 16)]
+        self.assertLess(sampler.padding_ratio(),
+                        padding_ratio(fixed, self.src, self.tgt))
+
+
+# -----------------------------
+# Tokenized dataset cache (management/tokenized_cache.py)
+# -----------------------------
+
+class _BatchTokenizer:
+    """Characters as ids, batched like a Hugging Face tokenizer."""
+    name_or_path = "fake/chars"
+
+    def __len__(self):
+        return 256
+
+    def __call__(self, text=None, *, text_target=None, max_length, truncation):
+        texts = text if text_target is None else text_target
+        return {"input_ids": [[ord(c) for c in t][:max_length] for t in texts]}
+
+
+def _prompt(func):
+    return f"Write tests:\n{func}"
+
+
+class TokenizedCacheKeyTests(TmpDirMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.data = self.path("data.jsonl")
+        _write_jsonl(self.data, [{"input": "def f(): pass", "output": "def test_f(): pass"}])
+
+    def key(self, build_prompt=_prompt, version="v1", **params):
+        params = {"max_src_len": 64, "max_tgt_len": 32, **params}
+        return tokenized_cache.cache_key(self.data, _BatchTokenizer(), build_prompt, version, **params)
+
+    def test_key_is_stable(self):
+        self.assertEqual(self.key(), self.key())
+
+    def test_any_input_change_gives_a_new_key(self):
+        base = self.key()
+        self.assertNotEqual(self.key(version="v2"), base)
+        self.assertNotEqual(self.key(build_prompt=lambda f: f"Tests for:\n{f}"), base)
+        self.assertNotEqual(self.key(max_tgt_len=64), base)
+        _write_jsonl(self.data, [{"input": "def g(): pass", "output": "def test_g(): pass"}])
+        self.assertNotEqual(self.key(), base)
+
+    def test_tokenize_adds_labels_and_lengths(self):
+        batch = {"input": ["def f(): pass"], "output": ["def test_f(): pass"]}
+        out = tokenized_cache._tokenize(batch, _BatchTokenizer(), _prompt,
+                                        max_src_len=8, max_tgt_len=100)
+        self.assertEqual(out["input_ids"], [[ord(c) for c in "Write te"]])
+        self.assertEqual(out["labels"], [[ord(c) for c in "def test_f(): pass"]])
+        self.assertEqual((out["src_len"], out["tgt_len"]), ([8], [18]))
+
+
+# -----------------------------
+# Test-end detection (ai/codet5_engine.py)
+# -----------------------------
+
+class TestEndTests(SimpleTestCase):
+    def test_def_inside_string_literal_is_not_a_boundary(self):
+        src = ("def test_reverse_words():\n"
+               "    assert reverse_words('abc def ghi jkl') == 'jkl ghi def abc'\n"
+               '    assert reverse_words("def") == "def"\n')
+        self.assertIsNone(_test_end(src))
+        self.assertEqual(_trim_after_test(src + "def test_other():\n    pass"),
+                         src.rstrip())
+
+    def test_def_in_unterminated_string_mid_generation(self):
+        self.assertIsNone(_test_end("def test_f():\n    assert f('abc def"))
+
+    def test_def_in_comment_or_call_is_not_a_boundary(self):
+        self.assertIsNone(_test_end("def test_f():\n    # def g(): nope\n    assert f(1)\n"))
+        self.assertIsNone(_test_end("def test_f():\n    assert f(def_x(1))\n"))
+
+    def test_one_liners_end_at_the_next_def(self):
+        src = "def test_a(): assert a() == 'def' def test_b(): assert b()"
+        self.assertEqual(_trim_after_test(src), "def test_a(): assert a() == 'def'")
+
+    def test_column_zero_string_or_bracket_continuation_is_not_a_dedent(self):
+        triple = 'def test_f():\n    s = """\nraw line\n"""\n    assert f(s)\n'
+        self.assertIsNone(_test_end(triple))
+        bracket = "def test_f():\n    assert f([1,\n2]) == 3\n"
+        self.assertIsNone(_test_end(bracket))
+
+    def test_dedent_nested_def_and_fence(self):
+        src = "def test_f():\n    def helper():\n        return 1\n    assert f(helper())\n"
+        self.assertIsNone(_test_end(src))
+        self.assertEqual(_trim_after_test(src + "print(f(1))\n"), src.rstrip())
+        self.assertEqual(_trim_after_test(src + "```\nmore"), src.rstrip())
+        self.assertIsNone(_test_end("    assert f(1) == 2\nx = 1\n"))   # body only
+
+
+# -----------------------------
+# Regeneration similarity check (ai/codet5_engine.py)
+# -----------------------------
+
+class TooSimilarTests(SimpleTestCase):
+    ADD_A = "def test_add():\n    assert add(2, 3) == 5\n    assert add(-1, 1) == 0\n"
+    ADD_B = "def test_add():\n    assert add(5, 3) == 8\n    assert add(-1, 1) == 0\n"
+
+    def _reference(self, a, b):
+        na = _normalize_test_for_similarity(a)
+        nb = _normalize_test_for_similarity(b)
+        return bool(na and nb) and difflib.SequenceMatcher(None, na, nb).ratio() >= 0.88
+
+    def test_literal_swaps_count_as_too_similar(self):
+        self.assertTrue(_too_similar(self.ADD_A, self.ADD_B))
+        self.assertTrue(_too_similar_any(_similarity_profile(self.ADD_B),
+                                         [_similarity_profile(self.ADD_A)]))
+
+    def test_different_tests_are_not_too_similar(self):
+        other = ("def test_add_raises():\n    with pytest.raises(TypeError):\n"
+                 "        add('a', None)\n")
+        self.assertFalse(_too_similar(self.ADD_A, other))
+        self.assertFalse(_too_similar(self.ADD_A, ""))
+
+    def test_matches_sequence_matcher_verdicts(self):
+        rng = random.Random(7)
+        calls = ["add", "sub", "mul", "div", "merge", "slugify"]
+        tests = []
+        for _ in range(20):
+            lines = [f"    assert {rng.choice(calls)}({rng.randint(0, 99)}, "
+                     f"{rng.randint(0, 99)}) == {rng.randint(0, 999)}"
+                     for _ in range(rng.randint(1, 12))]    # long ones hit autojunk
+            tests.append("def test_x():\n" + "\n".join(lines) + "\n")
+            lines[rng.randrange(len(lines))] = "    assert f(0) == 0"     # near miss
+            tests.append("def test_x():\n" + "\n".join(lines) + "\n")
+        tests += [self.ADD_A, self.ADD_B]
+        for a in tests:
+            for b in tests:
+                self.assertEqual(_too_similar(a, b), self._reference(a, b), (a, b))
+
+
+# -----------------------------
+# Request time budget (ai/codet5_engine.py)
+# -----------------------------
+
+class TimeBudgetTests(SimpleTestCase):
+    def test_generate_time_limit_follows_the_deadline(self):
+        self.assertEqual(_generate_time_limit(None), {})
+        self.assertEqual(_generate_time_limit(time.monotonic() - 5), {"max_time": 0.1})
+        self.assertAlmostEqual(_generate_time_limit(time.monotonic() + 30)["max_time"],
+                               30, delta=1)
+
+    def _spares(self, deadline):
+        seqs = _Seqs(range(8))
+        tests = iter(f"def test_f():\n    assert f({i}) == {i * 37 % 11}" for i in range(8))
+        with mock.patch.object(codet5_engine, "_decode_and_clean",
+                               side_effect=lambda *a, **k: next(tests)), \
+             mock.patch.object(codet5_engine, "_run_test_safely",
+                               return_value=False) as run:
+            _collect_spares(None, seqs, "def test_f():\n    pytest.raises(TypeError)",
+                            code_snippet="def f(x): ...", func_name="f", mode="base",
+                            seen=set(), on_event=lambda kind, data: None,
+                            deadline=deadline)
+        return run.call_count
+
+    def test_collect_spares_stops_at_the_deadline(self):
+        self.assertEqual(self._spares(time.monotonic() - 1), 0)
+        self.assertEqual(self._spares(None), 2 * codet5_engine.REGEN_RESERVOIR_SIZE)
+
+
+# -----------------------------
+# Spare-test reservoir (ai/codet5_engine.py)
+# -----------------------------
+
+class SpareReservoirTests(SimpleTestCase):
+    def _pick(self, **kwargs):
+        seqs = _Seqs(range(8))
+        tests = iter(f"def test_f():\n    assert f({i}) == {i * 3}" for i in range(8))
+        events = []
+        with mock.patch.object(codet5_engine, "_decode_and_clean",
+                               side_effect=lambda *a, **k: next(tests)), \
+             mock.patch.object(codet5_engine, "_too_similar_any", return_value=False), \
+             mock.patch.object(codet5_engine, "_run_test_safely",
+                               return_value=True) as run:
+            picked = _pick_passing_candidate(
+                None, seqs, code_snippet="def f(x):\n    return 3 * x\n",
+                func_name="f", on_event=lambda kind, data: events.append(kind),
+                **kwargs)
+        return picked, run.call_count, events
+
+    def test_spares_are_only_collected_when_asked(self):
+        picked, runs, events = self._pick()
+        self.assertIn("assert f(0) == 0", picked)
+        self.assertEqual((runs, events.count("spare")), (1, 0))
+        _picked, runs, events = self._pick(collect_spares=True)
+        self.assertGreater(runs, 1)
+        self.assertEqual(events.count("spare"), codet5_engine.REGEN_RESERVOIR_SIZE)
+
+    def test_spares_are_rechecked_against_the_function_source(self):
+        code = "def f(x):\n    return 3 * x\n\n\ndef g():\n    return f(1)\n"
+        spare = "def test_f():\n    for x in range(-5, 5):\n        assert f(x) == x + x + x\n"
+        with mock.patch.object(codet5_engine, "_run_test_safely",
+                               return_value=True) as run:
+            out = regenerate_test_for_function(
+                code, "f", previous_test="def test_f():\n    assert f(1) == 3\n",
+                reservoir=[spare])
+        self.assertTrue(out.endswith(spare))
+        self.assertEqual(run.call_args.args[0], "def f(x):\n    return 3 * x")
+
+
+# -----------------------------
+# Checkpoint evaluation (management/evaluation.py)
+# -----------------------------
+
+class EvaluateTests(SimpleTestCase):
+    def test_warm_up_is_untimed_and_verdicts_start_empty(self):
+        calls = []
+
+        def fake(src, *, mode="base", on_event=None):
+            calls.append((src, codet5_engine._VERDICTS))
+            if on_event is not None:
+                on_event("functions", {"names": ["f"]})
+                on_event("phase", {"function": "f", "phase": "beams"})
+            return ""
+
+        shared = codet5_engine._VERDICTS
+        with mock.patch.object(evaluation, "generate_test_from_code", side_effect=fake):
+            report = evaluation.evaluate(["def f(): ...", "def f(): pass"])
+
+        self.assertEqual(calls[0][0], evaluation.WARMUP_SNIPPET)
+        self.assertEqual(report["inputs"], 2)
+        self.assertEqual(report["pass_rate"], 1.0)
+        caches = {id(cache) for _src, cache in calls}
+        self.assertEqual(len(caches), 2)       # warm-up's, then one for the run
+        self.assertNotIn(id(shared), caches)
+        self.assertIs(codet5_engine._VERDICTS, shared)
+
+
+# -----------------------------
+# ONNX export cache (ai/codet5_engine.py)
+# -----------------------------
+
+class OnnxExportCacheTests(TmpDirMixin, SimpleTestCase):
+    def _load(self, model_dir):
+        exports = []
+
+        class FakeORT:
+            @staticmethod
+            def from_pretrained(path, export=False, **kwargs):
+                exports.append((path, export))
+                return mock.Mock(save_pretrained=lambda d: os.makedirs(d, exist_ok=True))
+
+        fake = mock.Mock(ORTModelForSeq2SeqLM=FakeORT)
+        with mock.patch.dict(sys.modules, {"optimum": mock.Mock(), "optimum.onnxruntime": fake}), \
+             mock.patch.object(codet5_engine, "ONNX_CACHE_DIR", self.path("onnx")):
+            _load_onnx_model(model_dir)
+        return exports
+
+    def test_export_is_redone_when_the_weights_change(self):
+        model_dir = self.path("student")
+        os.makedirs(model_dir)
+        weights = os.path.join(model_dir, "model.safetensors")
+        with open(weights, "wb") as fh:
+            fh.write(b"v1")
+
+        self.assertEqual(self._load(model_dir), [(model_dir, True)])
+        export_dir = self._load(model_dir)[0][0]           # reused
+        self.assertNotEqual(export_dir, model_dir)
+
+        with open(weights, "wb") as fh:
+            fh.write(b"v2 retrained")
+        self.assertEqual(self._load(model_dir), [(model_dir, True)])
+
+
+# -----------------------------
+# Constrained decoding (ai/codet5_engine.py)
+# -----------------------------
+
+class _FakeTokenizer:
+    """Characters as ids; special tokens like a RoBERTa-style tokenizer."""
+    bos_token_id, eos_token_id = 0, 2
+
+    def __call__(self, text=None, *, text_target=None, add_special_tokens=True):
+        ids = [ord(c) for c in (text if text_target is None else text_target)]
+        return {"input_ids": [0, *ids, 2] if add_special_tokens else ids}
+
+
+class _Scores:
+    """Just enough of a (rows, vocab) logits tensor for _ForcePrefix."""
+    def __init__(self, rows, vocab):
+        self.rows = [[0.0] * vocab for _ in range(rows)]
+
+    def __setitem__(self, key, value):
+        row, col = key
+        if isinstance(col, slice):
+            self.rows[row][col] = [value] * len(self.rows[row][col])
+        else:
+            self.rows[row][col] = value
+
+    def allowed(self):
+        return [[i for i, v in enumerate(r) if v != -float("inf")] for r in self.rows]
+
+
+class ForcePrefixTests(SimpleTestCase):
+    def test_header_is_tokenized_like_the_training_labels(self):
+        with mock.patch.object(codet5_engine, "_FORCE_TEST_HEADER", True), \
+             mock.patch.object(codet5_engine, "_BAN_FOREIGN_CALLS", False):
+            kwargs = _decode_constraints(_FakeTokenizer(), ["f"], ["prompt"])
+        (proc,) = kwargs["logits_processor"]
+        label = _FakeTokenizer()(text_target="def test_f():\n    assert f()")["input_ids"]
+        self.assertEqual(proc.prefixes, [label[:len(proc.prefixes[0])]])
+        self.assertEqual(proc.prefixes[0][0], _FakeTokenizer.bos_token_id)
+        self.assertNotIn(_FakeTokenizer.eos_token_id, proc.prefixes[0])
+
+    def test_each_prompt_group_gets_its_own_prefix(self):
+        proc = _ForcePrefix([[0, 5], [0, 7]])       # 2 prompts x 2 beams
+        allowed = []
+        for step in range(3):
+            scores = _Scores(4, 10)
+            proc(mock.Mock(shape=(4, step + 1)), scores)
+            allowed.append(scores.allowed())
+        self.assertEqual(allowed[0], [[0]] * 4)
+        self.assertEqual(allowed[1], [[5], [5], [7], [7]])
+        self.assertEqual(allowed[2], [list(range(10))] * 4)   # prefix done: untouched
+
+
+# -----------------------------
+# Assert value repair (ai/codet5_engine.py)
+# -----------------------------
+
+class AssertRepairTests(SimpleTestCase):
+    SLUGIFY = "def slugify(s):\n    return s.strip().lower().replace(' ', '-')\n"
+    DIV = "def div(a, b):\n    return a / b\n"
+
+    def setUp(self):
+        super().setUp()
+        self.enterContext(fresh_verdict_cache())   # keep the shared SQLite file out of it
+
+    def test_mismatched_literal_is_repaired(self):
+        test = ("def test_slugify():\n    assert slugify('Hello World') == 'hello world'\n"
+                "    assert slugify(' A ') == 'a'\n")
+        self.assertEqual(
+            _repair_assert_rhs(self.SLUGIFY, test, "slugify"),
+            "def test_slugify():\n    assert slugify('Hello World') == 'hello-world'\n"
+            "    assert slugify(' A ') == 'a'")
+
+    def test_repaired_test_still_passes_the_validator(self):
+        test = "def test_slugify():\n    assert slugify('Hello World') == 'Hello World'\n"
+        self.assertFalse(_check_test(self.SLUGIFY, test, func_name="slugify")[0])
+        repaired = _try_repair(self.SLUGIFY, test, "slugify", "base")
+        self.assertIn("== 'hello-world'", repaired)
+        self.assertEqual(_check_test(self.SLUGIFY, repaired, func_name="slugify"), (True, ""))
+
+    def test_non_literal_expected_value_is_not_rewritten(self):
+        test = ("def test_slugify():\n    expected = 'hello world'\n"
+                "    assert slugify('Hello World') == expected\n")
+        self.assertIsNone(_repair_assert_rhs(self.SLUGIFY, test, "slugify"))
+        self.assertIsNone(_try_repair(self.SLUGIFY, test, "slugify", "base"))
+
+    def test_raising_target_is_not_repaired(self):
+        test = "def test_div():\n    assert div(1, 0) == 0\n    assert div(6, 3) == 3\n"
+        repaired = _repair_assert_rhs(self.DIV, test, "div")
+        self.assertIn("div(1, 0) == 0", repaired)      # raising call left alone
+        self.assertIn("div(6, 3) == 2", repaired)
+        self.assertIsNone(_try_repair(self.DIV, test, "div", "base"))
+        self.assertIsNone(_repair_assert_rhs(self.DIV, "def test_div():\n    assert div(1, 0) == 0\n", "div"))
+
+
+# -----------------------------
+# Fork-server candidate execution (ai/codet5_engine.py)
+# -----------------------------
+
+class ForkServerTests(SimpleTestCase):
+    SRC = "import math\n\ndef area(r):\n    return math.pi * r * r\n"
+    GOOD = "def test_area():\n    assert area(1) == math.pi\n"
+    BAD = "def test_area():\n    assert area(1) == 3\n"
+
+    def verdicts(self):
+        return [_validate_test(self.SRC, t, "area", "base")[0] for t in (self.GOOD, self.BAD)]
+
+    def test_off_by_default_runs_in_process(self):
+        self.assertEqual(codet5_engine._EXEC_FORK_SERVER, "0")
+        with mock.patch.object(codet5_engine.os, "fork") as fork, _fork_server(self.SRC):
+            self.assertIsNone(getattr(_EXEC_LOCAL, "server", None))
+            self.assertEqual(self.verdicts(), [True, False])
+        fork.assert_not_called()
+
+    def test_failed_fork_falls_back_to_in_process(self):
+        with mock.patch.object(codet5_engine, "_USE_FORK_SERVER", True), \
+             mock.patch.object(codet5_engine, "_EXEC_FORK_SERVER", "1"), \
+             mock.patch.object(codet5_engine.os, "fork", side_effect=OSError("no fork")), \
+             _fork_server(self.SRC):
+            server = _EXEC_LOCAL.server
+            self.assertEqual(self.verdicts(), [True, False])
+            self.assertTrue(server.broken)
+        self.assertIsNone(_EXEC_LOCAL.server)
+
+    def test_auto_only_serves_snippets_with_imports(self):
+        with mock.patch.object(codet5_engine, "_USE_FORK_SERVER", True), \
+             mock.patch.object(codet5_engine, "_EXEC_FORK_SERVER", "auto"):
+            with _fork_server("def f():\n    return 1\n"):
+                self.assertIsNone(getattr(_EXEC_LOCAL, "server", None))
+            with mock.patch.object(codet5_engine.os, "fork", side_effect=OSError), \
+                 _fork_server(self.SRC):
+                self.assertIsNotNone(_EXEC_LOCAL.server)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs os.fork")
+    def test_fork_server_verdicts_match_in_process(self):
+        with mock.patch.object(codet5_engine, "_USE_FORK_SERVER", True), \
+             mock.patch.object(codet5_engine, "_EXEC_FORK_SERVER", "1"), \
+             _fork_server(self.SRC):
+            server = _EXEC_LOCAL.server
+            self.assertEqual(self.verdicts(), [True, False])
+            self.assertFalse(server.broken)
+            self.assertIsNotNone(server.pid)
+
+
+# -----------------------------
+# Validator rule sets per serving mode (ai/codet5_engine.py)
+# -----------------------------
+
+class ValidatorModeTests(SimpleTestCase):
+    ADD = "def add(a, b):\n    return a + b\n"
+
+    def test_small_uses_the_base_rules(self):
+        self.assertEqual(_validator_mode("small"), "base")
+        self.assertEqual(_validator_mode(" Edge "), "edge")
+        self.assertEqual(_validator_mode(None), "base")
+
+    def test_small_rejects_where_base_rejects(self):
+        unfocused = ("def test_add():\n    assert add(1, 2) == 3\n    assert add(2, 2) == 4\n"
+                     "    assert add(0, 0) == 0\n    assert 1 + 1 == 2\n")
+        for mode in ("base", "small"):
+            self.assertEqual(_validate_test(self.ADD, unfocused, "add", mode),
+                             (False, "assert focus ratio not satisfied"), mode)
+        self.assertTrue(_validate_test(self.ADD, unfocused, "add", "edge")[0])
+
+    def test_small_runs_the_arithmetic_oracle(self):
+        off_by_one = "def add(a, b):\n    return a + b + 1\n"
+        test = "def test_add():\n    assert add(2, 2) == 5\n"
+        for mode in ("base", "small"):
+            self.assertEqual(_exec_checks(off_by_one, test, "add", mode, 1),
+                             (False, "arithmetic oracle failed"), mode)
+
+
+# -----------------------------
+# Candidate dedupe keys (ai/codet5_engine.py)
+# -----------------------------
+
+class CandidateKeyTests(SimpleTestCase):
+    def test_formatting_and_comments_do_not_change_the_key(self):
+        a = "import pytest\n\ndef test_add():\n    assert add(1, 2) == 3\n"
+        b = "import pytest\ndef test_add():  # beam 3\n    assert add( 1,2 )==3"
+        self.assertEqual(_candidate_key(a), _candidate_key(b))
+
+    def test_different_tests_get_different_keys(self):
+        a = "def test_add():\n    assert add(1, 2) == 3\n"
+        self.assertNotEqual(_candidate_key(a), _candidate_key(a.replace("3", "4")))
+        self.assertNotEqual(_candidate_key(a), _candidate_key(a.replace("1, 2", "2, 1")))
+
+    def test_unparsable_candidates_fall_back_to_collapsed_text(self):
+        broken = "def test_add(:\n    assert add(1, 2) == 3"
+        self.assertEqual(_candidate_key(broken),
+                         _candidate_key("def test_add(:   assert add(1, 2) == 3"))
+        self.assertEqual(len(_candidate_key("def test_x():\n    x = '\0'\0")), 32)
+
+
+# -----------------------------
+# Validator verdict cache (ai/verdict_cache.py)
+# -----------------------------
+
+class VerdictCacheTests(TmpDirMixin, SimpleTestCase):
+    def test_memory_lru_evicts_least_recently_used(self):
+        cache = VerdictCache(None, max_entries=2)
+        cache.put("a", True)
+        cache.put("b", False, "no asserts")
+        self.assertEqual(cache.get("a"), (True, ""))     # "a" is now newest
+        cache.put("c", True)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), (True, ""))
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_sqlite_verdicts_survive_a_restart(self):
+        path = self.path("verdicts.sqlite3")
+        VerdictCache(path).put("k", False, "semantic re-check failed")
+        fresh = VerdictCache(path)
+        self.assertEqual(fresh.get("k"), (False, "semantic re-check failed"))
+        fresh.clear()
+        self.assertIsNone(VerdictCache(path).get("k"))
+
+    def test_sqlite_table_is_capped(self):
+        path = self.path("verdicts.sqlite3")
+        with mock.patch.object(verdict_cache, "PRUNE_EVERY", 5):
+            cache = VerdictCache(path, max_entries=2, max_db_entries=10)
+            for i in range(50):
+                cache.put(f"k{i}", True)
+        with sqlite3.connect(path) as db:
+            rows = db.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+        self.assertEqual(rows, 10)
+        fresh = VerdictCache(path, max_db_entries=10)
+        self.assertIsNone(fresh.get("k0"))           # oldest writes pruned
+        self.assertEqual(fresh.get("k49"), (True, ""))
+
+    def test_keys_separate_their_parts(self):
+        self.assertNotEqual(VerdictCache.key_for("ab", "c"), VerdictCache.key_for("a", "bc"))
+
+
+# -----------------------------
+# Item views (views.py)
+# -----------------------------
+
+THREE_FUNCS = (
+    "def add(a, b):\n    return a + b\n\n\n"
+    "def sub(a, b):\n    return a - b\n\n\n"
+    "def mul(a, b):\n    return a * b\n"
+)
+
+
+def _fake_generate(phases, calls=None):
+    """generate_test_from_code stand-in: emits `phases` ({name: [phase, ...]})
+    and returns one trivial test per function."""
+    def fake(code, *, reuse_tests=None, on_event=None, **kwargs):
+        if calls is not None:
+            calls.append((reuse_tests, kwargs))
+        tests = []
+        for name, seq in phases.items():
+            for phase in seq:
+                on_event("phase", {"function": name, "phase": phase})
+            test = f"def test_{name}():\n    assert {name}(1, 1) is not None\n"
+            on_event("accepted", {"function": name, "test": test})
+            tests.append(test)
+        return "import pytest\n\n" + "\n\n".join(tests)
+    return fake
+
+
+class ViewTestBase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = get_user_model().objects.create_user("alice", password="pw")
+        self.session = TestSession.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def create_item(self, phases, calls=None, mode="base"):
+        with mock.patch("unittestgen.views.generate_test_from_code",
+                        side_effect=_fake_generate(phases, calls)):
+            res = self.client.post(f"/api/sessions/{self.session.id}/items/",
+                                   {"pasted_code": THREE_FUNCS, "mode": mode},
+                                   format="json")
+        self.assertEqual(res.status_code, 201, res.content)
+        return TestItem.objects.get(id=res.data["id"])
+
+
+class ReusableTestsViewTests(ViewTestBase):
+    PHASES = {"add": ["beams"],
+              "sub": ["beams", "sampling", "fallback"],   # named template
+              "mul": ["fallback"]}                        # budget ran out
+
+    def test_only_validated_functions_are_recorded_and_reused(self):
+        item = self.create_item(self.PHASES)
+        self.assertEqual(item.meta["validated"], ["add"])
+
+        fps = function_fingerprints(THREE_FUNCS)
+        self.assertEqual(set(reusable_tests(self.session, "base")), {fps["add"]})
+        self.assertEqual(reusable_tests(self.session, "edge"), {})
+
+    def test_bypassed_validator_output_is_never_reused(self):
+        self.create_item({"add": [], "sub": [], "mul": []})
+        self.assertEqual(reusable_tests(self.session, "base"), {})
+
+    def test_reused_tests_stay_validated(self):
+        self.create_item(self.PHASES)
+        calls = []
+        item = self.create_item({"sub": ["sampling"], "mul": ["fallback"]}, calls)
+        fps = function_fingerprints(THREE_FUNCS)
+        reuse, kwargs = calls[0]
+        self.assertEqual(set(reuse), {fps["add"]})
+        self.assertTrue(kwargs["collect_spares"])
+        self.assertEqual(item.meta["reused"], ["add"])
+        self.assertEqual(item.meta["validated"], ["add", "sub"])
+
+    def _regenerate(self, item, phases, mode="base"):
+        def fake(code, *, previous_tests, on_event=None, **kwargs):
+            for name, phase in phases.items():
+                on_event("phase", {"function": name, "phase": phase})
+            return previous_tests
+        with mock.patch("unittestgen.views.regenerate_tests_from_code", side_effect=fake):
+            res = self.client.post(
+                f"/api/regenerate/{self.session.id}/?item_id={item.id}&mode={mode}")
+        self.assertEqual(res.status_code, 201, res.content)
+        item.refresh_from_db()
+        return item
+
+    def test_regeneration_updates_the_validated_functions(self):
+        item = self.create_item(self.PHASES)
+        item = self._regenerate(item, {"add": "fallback", "sub": "reservoir",
+                                       "mul": "fallback"})
+        self.assertEqual(item.meta["validated"], ["add", "sub"])   # add kept as is
+        item = self._regenerate(item, {"mul": "sampling"}, mode="edge")
+        self.assertEqual(item.meta["validated"], ["mul"])          # base checks don't carry over
+
+
+class SelectiveRegenerationViewTests(ViewTestBase):
+    PREVIOUS = (
+        "import pytest\n\n"
+        "def test_add():\n    assert add(1, 2) == 3\n\n"
+        "def test_sub():\n    # hand-edited, keep as is\n    assert sub(3, 1) == 2   # exact\n\n"
+        "def test_mul():\n    assert mul(2, 3) == 6\n"
+    )
+
+    def setUp(self):
+        super().setUp()
+        self.item = TestItem.objects.create(
+            session=self.session, source_code=THREE_FUNCS,
+            generated_tests=self.PREVIOUS, meta={"mode": "base"})
+
+    def regenerate(self, functions):
+        regenerated = []
+
+        def fake(code, func_name, *, previous_test, **kwargs):
+            regenerated.append(func_name)
+            return f"def test_{func_name}():\n    assert {func_name}(5, 5) == 99\n"
+
+        with mock.patch.object(codet5_engine, "regenerate_test_for_function", side_effect=fake):
+            res = self.client.post(
+                f"/api/regenerate/{self.session.id}/?item_id={self.item.id}&functions={functions}")
+        return res, regenerated
+
+    def test_only_selected_functions_are_regenerated(self):
+        res, regenerated = self.regenerate("add,mul")
+        self.assertEqual(res.status_code, 201, res.content)
+        self.assertEqual(regenerated, ["add", "mul"])
+        tests = res.data["generated_tests"]
+        self.assertIn("def test_sub():\n    # hand-edited, keep as is\n"
+                      "    assert sub(3, 1) == 2   # exact", tests)
+        self.assertIn("assert add(5, 5) == 99", tests)
+        self.assertNotIn("assert mul(2, 3) == 6", tests)
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.meta["regenerated"], ["add", "mul"])
+
+    def test_unknown_function_is_rejected(self):
+        res, regenerated = self.regenerate("add,nope")
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(regenerated, [])
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.generated_tests, self.PREVIOUS)
+
+
+class _InlineThread:
+    """Stands in for threading.Thread so the archive job runs inside the test."""
+
+    def __init__(self, target, args=(), daemon=None):
+        self.target, self.args = target, args
+
+    def start(self):
+        self.target(*self.args)
+
+
+class ArchiveJobViewTests(ViewTestBase):
+    MODULES = {
+        "pkg/ops.py": "def add(a, b):\n    return a + b\n\n\ndef sub(a, b):\n    return a - b\n",
+        "pkg/more.py": "def mul(a, b):\n    return a * b\n",
+    }
+
+    def upload(self, batched):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            for path, src in self.MODULES.items():
+                zf.writestr(path, src)
+        archive = SimpleUploadedFile("pkg.zip", buf.getvalue())
+        with mock.patch("unittestgen.views.threading.Thread", _InlineThread), \
+                mock.patch("unittestgen.views.connection"), \
+                mock.patch("unittestgen.views.generate_tests_batched", side_effect=batched):
+            res = self.client.post(f"/api/sessions/{self.session.id}/archive/",
+                                   {"archive": archive}, format="multipart")
+        self.assertEqual(res.status_code, 202, res.content)
+        return self.client.get(f"/api/sessions/{self.session.id}/archive/{res.data['job']}/").data
+
+    def test_modules_are_saved_as_their_functions_finish(self):
+        def batched(units, *, on_result, **kwargs):
+            # results arrive out of order across modules
+            for idx in reversed(range(len(units))):
+                name = units[idx][0]
+                on_result(idx, f"def test_{name}():\n    assert {name}(2, 2) is not None\n")
+
+        progress = self.upload(batched)
+        self.assertEqual((progress["total"], progress["done"], progress["failed"]), (2, 2, 0))
+        self.assertTrue(progress["finished"])
+        tests = {it["source_filename"]: it["generated_tests"] for it in progress["items"]}
+        self.assertIn("from pkg.ops import add, sub", tests["pkg/ops.py"])
+        self.assertLess(tests["pkg/ops.py"].index("def test_add"),
+                        tests["pkg/ops.py"].index("def test_sub"))
+        self.assertIn("from pkg.more import mul", tests["pkg/more.py"])
+        self.assertNotIn("test_add", tests["pkg/more.py"])
+
+    def test_unfinished_modules_fail_when_the_job_raises(self):
+        def batched(units, *, on_result, **kwargs):
+            for idx, (name, _) in enumerate(units):
+                if name == "mul":
+                    raise RuntimeError("out of memory")
+                on_result(idx, f"def test_{name}():\n    assert {name}(2, 2) is not None\n")
+
+        progress = self.upload(batched)
+        self.assertEqual((progress["done"], progress["failed"]), (1, 1))
+        meta = {it["source_filename"]: it["meta"] for it in progress["items"]}
+        self.assertEqual(meta["pkg/ops.py"]["status"], "done")
+        self.assertEqual(meta["pkg/more.py"]["status"], "failed")
+        self.assertEqual(meta["pkg/more.py"]["error"], "out of memory")
+
+
+def _parse_sse(body: str) -> list:
+    events = []
+    for block in body.split("\n\n"):
+        if block.startswith("event: "):
+            kind, data = block.split("\n", 1)
+            events.append((kind[len("event: "):], json.loads(data[len("data: "):])))
+        elif block:
+            events.append((block, None))   # comment lines (keep-alive)
+    return events
+
+
+class StreamItemViewTests(ViewTestBase):
+    def stream(self, generate):
+        with mock.patch("unittestgen.views.generate_test_from_code", side_effect=generate):
+            res = self.client.post(f"/api/sessions/{self.session.id}/items/stream/",
+                                   {"pasted_code": THREE_FUNCS}, format="json")
+            self.assertEqual(res["Content-Type"], "text/event-stream")
+            # the worker thread starts when the stream is consumed
+            body = b"".join(res.streaming_content).decode()
+        return _parse_sse(body)
+
+    def test_events_are_forwarded_in_order_and_item_comes_last(self):
+        fake = _fake_generate({"add": ["beams"], "sub": ["beams", "fallback"]})
+
+        def generate(code, *, on_event=None, **kwargs):
+            on_event("spare", {"function": "add", "test": "def test_add_spare():\n    pass\n"})
+            return fake(code, on_event=on_event, **kwargs)
+
+        events = self.stream(generate)
+        self.assertEqual([kind for kind, _ in events],
+                         ["phase", "accepted", "phase", "phase", "accepted", "item"])
+        self.assertEqual([d["function"] for k, d in events if k == "accepted"], ["add", "sub"])
+
+        item = TestItem.objects.get(id=events[-1][1]["id"])
+        self.assertEqual(item.meta["validated"], ["add"])
+        self.assertEqual(item.meta["reservoir"], {"add": ["def test_add_spare():\n    pass\n"]})
+
+    def test_heartbeat_while_the_worker_is_quiet(self):
+        fake = _fake_generate({"add": ["beams"]})
+
+        def generate(code, **kwargs):
+            time.sleep(0.3)
+            return fake(code, **kwargs)
+
+        with mock.patch.object(views.StreamTestItemView, "HEARTBEAT_SECONDS", 0.05):
+            events = self.stream(generate)
+        self.assertEqual(events[0], (": keep-alive", None))
+        self.assertEqual(events[-1][0], "item")
+
+    def test_generation_error_ends_the_stream_without_an_item(self):
+        def generate(code, *, on_event=None, **kwargs):
+            on_event("functions", {"names": ["add", "sub", "mul"]})
+            raise RuntimeError("CUDA out of memory")
+
+        with mock.patch("traceback.print_exc"):
+            events = self.stream(generate)
+        self.assertEqual(events[0], ("functions", {"names": ["add", "sub", "mul"]}))
+        self.assertEqual(events[-1], ("error", {"error": "Test generation failed: CUDA out of memory"}))
+        self.assertFalse(TestItem.objects.exists())
@@ -12,7 +12,11 @@ from .views import (
     SessionRetrieveUpdateDestroyView,
     # Items + Regenerate
     CreateTestItemView,
+    StreamTestItemView,
     RegenerateTestView,
+    # Project archives
+    CreateArchiveItemsView,
+    ArchiveProgressView,
     # (Optional legacy)
     # CreateTestSessionView,
 )
@@ -38,6 +42,20 @@ urlpatterns = [
     path("sessions/<int:session_id>/items/",
          CreateTestItemView.as_view(), name="session-items-create"),
 
+    # Same, but streams progress as server-sent events
+    # POST /api/sessions/<session_id>/items/stream/
+    path("sessions/<int:session_id>/items/stream/",
+         StreamTestItemView.as_view(), name="session-items-stream"),
+
+    # Project archive upload (zip/tar -> one item per module, background)
+    # POST /api/sessions/<session_id>/archive/
+    path("sessions/<int:session_id>/archive/",
+         CreateArchiveItemsView.as_view(), name="session-archive-create"),
+
+    # GET /api/sessions/<session_id>/archive/<job_id>/  -> progress
+    path("sessions/<int:session_id>/archive/<str:job_id>/",
+         ArchiveProgressView.as_view(), name="session-archive-progress"),
+
     # Regenerate (latest item by default or ?item_id=)
     # POST /api/regenerate/<session_id>/
     path("regenerate/<int:pk>/", RegenerateTestView.as_view(),
@@ -1,12 +1,15 @@
 # pylint: disable=broad-exception-caught
 # pylint: disable=no-member
 
+from django.conf import settings
 from django.core.cache import cache
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, permissions, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import BaseRenderer, JSONRenderer
 from rest_framework_simplejwt.views import TokenObtainPairView
 
 from .models import TestSession, TestItem
@@ -18,13 +21,31 @@ from .serializers import (
 )
 from .ai.codet5_engine import (
     generate_test_from_code,
+    generate_tests_batched,
+    SERVING_MODES,
     regenerate_test_for_function,
     regenerate_tests_from_code,
+    _extract_function_defs,
+    _function_fingerprint,
+    _merge_multi_function_tests,
+    _split_multi_function_tests,
+)
+from .archive import (
+    ArchiveError,
+    is_supported_archive,
+    iter_archive_modules,
+    module_name_for,
 )
 
 import ast
+import json
+import queue
 import re
+import threading
+import traceback
+import uuid
 from pathlib import Path
+from django.db import connection
 from django.utils import timezone
 
 
@@ -175,6 +196,60 @@ def maybe_set_session_title(session: TestSession, *, source_code: str | None, up
     session.save(update_fields=["title"])
 
 
+# -----------------------------
+# Incremental generation helpers
+# -----------------------------
+
+# How many earlier items of a session we look at for reusable tests
+REUSE_LOOKBACK_ITEMS = 20
+
+# Earlier tests per function kept in TestItem.meta["history"]; a
+# regeneration must differ from all of them, not only the current one
+REGEN_HISTORY_SIZE = 8
+
+# Last engine phase of a function whose test passed the validator; a
+# "fallback" phase (template) or none at all (BYPASS_VALIDATOR) is not
+_VALIDATED_PHASES = {"beams", "sampling", "reservoir"}
+
+
+def function_fingerprints(code: str) -> dict[str, str]:
+    """{func_name: normalized-AST hash} for every top-level function."""
+    return {
+        name: _function_fingerprint(src)
+        for name, src in _extract_function_defs(code)
+    }
+
+
+def validated_functions(collected: dict) -> set[str]:
+    """Functions whose test in this run passed the validator (see collect_item_events)."""
+    return {fn for fn, phase in (collected.get("phase") or {}).items()
+            if phase in _VALIDATED_PHASES}
+
+
+def reusable_tests(session: TestSession, mode: str) -> dict[str, str]:
+    """
+    Map fingerprint -> previously validated per-function test, collected
+    from the session's most recent items generated with the same mode.
+    Only functions listed in meta["validated"] count; newer items win when
+    the same function appears more than once.
+    """
+    reuse: dict[str, str] = {}
+    items = session.items.all()[:REUSE_LOOKBACK_ITEMS]   # newest first
+    for item in items:
+        meta = item.meta or {}
+        fps = meta.get("fingerprints") or {}
+        validated = set(meta.get("validated") or ())
+        if meta.get("mode", "base") != mode or not validated or not item.generated_tests:
+            continue
+        by_func = _split_multi_function_tests(item.generated_tests, list(fps))
+        for name, fp in fps.items():
+            test = by_func.get(name) or ""
+            if name not in validated or not test or fp in reuse:
+                continue
+            reuse[fp] = test
+    return reuse
+
+
 # -----------------------------
 # Sessions (NEW FLOW)
 # -----------------------------
@@ -233,14 +308,14 @@ class CreateTestItemView(APIView):
     """
     permission_classes = [IsAuthenticated]
 
-    def post(self, request, session_id: int):
-        session = get_object_or_404(
-            TestSession, id=session_id, user=request.user
-        )
-
+    def _read_submission(self, request, session: TestSession):
+        """
+        Validate the submitted code turn.
+        Returns (submission_dict, None) or (None, error Response).
+        """
         # Enforce per-session limit (optional)
         if session.items.count() >= session.item_limit:
-            return Response(
+            return None, Response(
                 {"error": "Session has reached its item limit."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
@@ -252,7 +327,7 @@ class CreateTestItemView(APIView):
         # Validate pasted code length
         # ------------------------------
         if pasted_code and len(pasted_code) > MAX_CODE_CHARS:
-            return Response(
+            return None, Response(
                 {"error": f"Code too long. Max allowed is {MAX_CODE_CHARS} characters."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
@@ -263,13 +338,13 @@ class CreateTestItemView(APIView):
 
         MAX_FILE_BYTES = 200_000  # ~200 KB, adjust as needed
         if uploaded_file and uploaded_file.size > MAX_FILE_BYTES:
-            return Response(
+            return None, Response(
                 {"error": f"Uploaded file too large. Limit is {MAX_FILE_BYTES // 1024} KB."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
         if not pasted_code and not uploaded_file:
-            return Response(
+            return None, Response(
                 {"error": "Provide pasted_code or uploaded_code."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
@@ -283,7 +358,7 @@ class CreateTestItemView(APIView):
                 raw_code = decode_uploaded_py(uploaded_file)
                 uploaded_file.seek(0)
             except Exception:
-                return Response(
+                return None, Response(
                     {"error": "Failed to read uploaded file as UTF-8."},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
@@ -291,7 +366,7 @@ class CreateTestItemView(APIView):
             # Validate uploaded file content length
             # ------------------------------
             if len(raw_code) > MAX_CODE_CHARS:
-                return Response(
+                return None, Response(
                     {"error": f"Uploaded code too long. Max allowed is {MAX_CODE_CHARS} characters."},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
@@ -300,7 +375,7 @@ class CreateTestItemView(APIView):
         try:
             tree = ast.parse(raw_code)
         except SyntaxError:
-            return Response(
+            return None, Response(
                 {"error": "Your code is not valid Python. "
                           "Please paste a valid Python function or .py file."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -309,40 +384,44 @@ class CreateTestItemView(APIView):
         # Require at least one function definition so we don’t try to test random text
         has_func_def = any(isinstance(n, ast.FunctionDef) for n in tree.body)
         if not has_func_def:
-            return Response(
+            return None, Response(
                 {"error": "No function definitions found. "
                           "Please paste Python code that defines at least one function."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Generate tests (first-pass: beam; regenerate uses sampling)
-        try:
-            mode = (
-                request.data.get("mode")
-                or request.query_params.get("mode")
-                or "base"
-            ).strip().lower()
-
-            if mode not in {"base", "edge"}:
-                mode = "base"
-
-            print(
-                f"[api] mode received = {mode!r}, content_type={request.content_type}")
-            print(f"[api] data keys = {list(request.data.keys())}")
-
-            test_output = generate_test_from_code(raw_code, mode=mode,)
-            # Validate generated Python to avoid returning broken code
-            ast.parse(test_output)
-        except SyntaxError as e:
-            return Response(
-                {"error": f"Generated invalid Python: {str(e)}"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
-        except Exception as e:
-            return Response(
-                {"error": f"Test generation failed: {str(e)}"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        mode = (
+            request.data.get("mode")
+            or request.query_params.get("mode")
+            or "base"
+        ).strip().lower()
+
+        if mode not in SERVING_MODES:
+            mode = "base"
+
+        print(
+            f"[api] mode received = {mode!r}, content_type={request.content_type}")
+        print(f"[api] data keys = {list(request.data.keys())}")
+
+        # Functions unchanged since an earlier item reuse its tests
+        fingerprints = function_fingerprints(raw_code)
+        reuse = reusable_tests(session, mode)
+
+        return {
+            "raw_code": raw_code,
+            "pasted_code": pasted_code,
+            "uploaded_file": uploaded_file,
+            "mode": mode,
+            "fingerprints": fingerprints,
+            "reuse": reuse,
+            "reused_names": [n for n, fp in fingerprints.items() if fp in reuse],
+        }, None
+
+    def _save_item(self, session: TestSession, sub: dict, test_output: str,
+                   collected: dict | None = None) -> TestItem:
+        raw_code = sub["raw_code"]
+        pasted_code = sub["pasted_code"]
+        uploaded_file = sub["uploaded_file"]
 
         # Create a new item; do NOT overwrite legacy fields on the session
         item = TestItem.objects.create(
@@ -356,7 +435,17 @@ class CreateTestItemView(APIView):
             uploaded_code=None,  # IMPORTANT: do not persist the file
 
             generated_tests=test_output,
-            meta={"origin": "generate", "strategy": "beam", "mode": mode},
+            meta={"origin": "generate", "strategy": "beam", "mode": sub["mode"],
+                  "fingerprints": sub["fingerprints"],
+                  "reused": sub["reused_names"],
+                  # functions whose test passed the validator (reusable_tests);
+                  # reused tests were validated when first generated
+                  "validated": sorted(validated_functions(collected or {})
+                                      | set(sub["reused_names"])),
+                  # spare passing tests per function, used by RegenerateTestView
+                  "reservoir": (collected or {}).get("reservoir", {}),
+                  # function -> why the time budget cut its generation short
+                  "degraded": (collected or {}).get("degraded", {})},
         )
 
         session.updated_at = timezone.now()
@@ -400,21 +489,407 @@ class CreateTestItemView(APIView):
                 session.save(update_fields=["title"])
 
         # -----------------------------------------------------------------
+        return item
+
+    def post(self, request, session_id: int):
+        session = get_object_or_404(
+            TestSession, id=session_id, user=request.user
+        )
+
+        sub, error = self._read_submission(request, session)
+        if error is not None:
+            return error
+
+        # Generate tests (first-pass: beam; regenerate uses sampling)
+        collected: dict = {}
+        try:
+            test_output = generate_test_from_code(
+                sub["raw_code"], mode=sub["mode"], reuse_tests=sub["reuse"],
+                budget_s=settings.GENERATION_BUDGET_S,
+                collect_spares=True,
+                on_event=lambda kind, data: collect_item_events(collected, kind, data),)
+            # Validate generated Python to avoid returning broken code
+            ast.parse(test_output)
+        except SyntaxError as e:
+            return Response(
+                {"error": f"Generated invalid Python: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except Exception as e:
+            return Response(
+                {"error": f"Test generation failed: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        item = self._save_item(session, sub, test_output, collected)
 
         return Response(
             TestItemSerializer(item).data, status=status.HTTP_201_CREATED
         )
 
+
+def collect_item_events(collected: dict, kind: str, data) -> bool:
+    """
+    Keep the engine events that end up in TestItem.meta: "spare" tests
+    (meta["reservoir"]), "degraded" reasons (meta["degraded"]) and each
+    function's last phase (meta["validated"], via validated_functions).
+    Returns True for events that are not meant for SSE clients.
+    """
+    if kind == "phase":
+        collected.setdefault("phase", {})[data["function"]] = data["phase"]
+        return False
+    if kind == "spare":
+        collected.setdefault("reservoir", {}).setdefault(
+            data["function"], []).append(data["test"])
+        return True
+    if kind == "degraded":
+        collected.setdefault("degraded", {}).setdefault(
+            data["function"], []).append(data["reason"])
+    return False
+
+
+def _sse(kind: str, data) -> str:
+    """Format one server-sent event."""
+    return f"event: {kind}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Lets clients send `Accept: text/event-stream`. Plain DRF Responses
+    (validation errors) are rendered as a single SSE `error` event.
+    """
+    media_type = "text/event-stream"
+    format = "sse"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return _sse("error", data).encode(self.charset)
+
+
+class StreamTestItemView(CreateTestItemView):
+    """
+    POST /api/sessions/<session_id>/items/stream/
+    Same input as CreateTestItemView, but the response is a text/event-stream:
+      functions  -> {"names": [...]}
+      phase      -> {"function", "phase": beams|sampling|fallback}
+      rejected   -> {"function", "candidate", "reason"}
+      duplicates -> {"function", "count", "total"}  (skipped repeat candidates)
+      degraded   -> {"function", "reason"}  (time budget cut this function short)
+      accepted   -> {"function", "test"}
+      item       -> the saved TestItem (last event)
+      error      -> {"error": "..."}
+    so the UI can render tests function by function while generation runs.
+    ("spare" events are kept for the item's reservoir, not forwarded.)
+    """
+    renderer_classes = [JSONRenderer, EventStreamRenderer]
+    HEARTBEAT_SECONDS = 15
+
+    def post(self, request, session_id: int):
+        session = get_object_or_404(
+            TestSession, id=session_id, user=request.user
+        )
+
+        sub, error = self._read_submission(request, session)
+        if error is not None:
+            return error
+
+        events: queue.Queue = queue.Queue()
+        result: dict = {}
+        collected: dict = {}
+
+        def _work():
+            try:
+                result["tests"] = generate_test_from_code(
+                    sub["raw_code"],
+                    mode=sub["mode"],
+                    reuse_tests=sub["reuse"],
+                    budget_s=settings.GENERATION_BUDGET_S,
+                    collect_spares=True,
+                    on_event=lambda kind, data: events.put((kind, data)),
+                )
+            except Exception as e:
+                traceback.print_exc()
+                result["error"] = f"Test generation failed: {e}"
+            finally:
+                events.put(None)   # sentinel: generation finished
+
+        def _stream():
+            threading.Thread(target=_work, daemon=True).start()
+            while True:
+                try:
+                    evt = events.get(timeout=self.HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                if evt is None:
+                    break
+                if collect_item_events(collected, *evt):
+                    continue
+                yield _sse(*evt)
+
+            if "error" in result:
+                yield _sse("error", {"error": result["error"]})
+                return
+            try:
+                ast.parse(result["tests"])
+            except SyntaxError as e:
+                yield _sse("error", {"error": f"Generated invalid Python: {e}"})
+                return
+
+            item = self._save_item(session, sub, result["tests"], collected)
+            yield _sse("item", TestItemSerializer(item).data)
+
+        response = StreamingHttpResponse(
+            _stream(), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"   # don't let a proxy buffer events
+        return response
+
+# -----------------------------
+# Project archives (zip / tar of a package -> one item per module)
+# -----------------------------
+
+MAX_ARCHIVE_BYTES = 20 * 1024 * 1024   # ~20 MB compressed
+MAX_ARCHIVE_FUNCTIONS = 300
+ARCHIVE_BATCH_SIZE = 8
+
+
+def _run_archive_job(item_ids: list[int], modules: list[dict], mode: str):
+    """
+    Background worker for an archive upload.
+
+    All functions of all modules go through generate_tests_batched; as soon
+    as every function of a module is done, that module's TestItem is saved
+    with status "done", which is what the progress endpoint counts.
+    """
+    units: list[tuple[str, str]] = []
+    owner: list[int] = []          # unit index -> module index
+    for m_idx, mod in enumerate(modules):
+        for name, src in mod["functions"]:
+            units.append((name, src))
+            owner.append(m_idx)
+
+    snippets: list[list[str | None]] = [
+        [None] * len(mod["functions"]) for mod in modules]
+    remaining = [len(mod["functions"]) for mod in modules]
+    slot: list[int] = []
+    for m_idx, mod in enumerate(modules):
+        slot.extend(range(len(mod["functions"])))
+
+    def _save_module(m_idx: int) -> None:
+        mod = modules[m_idx]
+        names = [name for name, _ in mod["functions"]]
+        tests = _merge_multi_function_tests(
+            snippets[m_idx],
+            origin=f"Archive (batched) - {mod['path']}",
+            extra_imports=[f"from {mod['module']} import {', '.join(names)}"],
+        )
+        item = TestItem.objects.get(id=item_ids[m_idx])
+        item.generated_tests = tests
+        item.meta = {**(item.meta or {}), "status": "done"}
+        item.save(update_fields=["generated_tests", "meta"])
+
+    def _on_result(idx: int, snippet: str) -> None:
+        m_idx = owner[idx]
+        snippets[m_idx][slot[idx]] = snippet
+        remaining[m_idx] -= 1
+        if remaining[m_idx] == 0:
+            _save_module(m_idx)
+
+    try:
+        generate_tests_batched(
+            units,
+            batch_size=ARCHIVE_BATCH_SIZE,
+            mode=mode,
+            on_result=_on_result,
+        )
+    except Exception as e:
+        traceback.print_exc()
+        for item in TestItem.objects.filter(id__in=item_ids):
+            if (item.meta or {}).get("status") != "done":
+                item.meta = {**(item.meta or {}),
+                             "status": "failed", "error": str(e)}
+                item.save(update_fields=["meta"])
+    finally:
+        # this thread opened its own DB connection
+        connection.close()
+
+
+def _archive_progress(session: TestSession, job_id: str) -> dict:
+    items = list(session.items.filter(meta__archive_job=job_id))
+    statuses = [(it.meta or {}).get("status") for it in items]
+    done = statuses.count("done")
+    failed = statuses.count("failed")
+    return {
+        "job": job_id,
+        "total": len(items),
+        "done": done,
+        "failed": failed,
+        "finished": done + failed == len(items),
+        "items": TestItemSerializer(items, many=True).data,
+    }
+
+
+class CreateArchiveItemsView(APIView):
+    """
+    POST /api/sessions/<session_id>/archive/
+    Upload a .zip / .tar(.gz) of a package. Every module with top-level
+    functions becomes one TestItem whose tests are generated in the
+    background (batched). Returns 202 + a job id to poll.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, session_id: int):
+        session = get_object_or_404(
+            TestSession, id=session_id, user=request.user
+        )
+
+        archive = request.FILES.get("archive")
+        if not archive:
+            return Response(
+                {"error": "Provide an archive (.zip, .tar, .tar.gz)."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not is_supported_archive(archive.name):
+            return Response(
+                {"error": "Unsupported archive type. Use .zip, .tar or .tar.gz."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if archive.size > MAX_ARCHIVE_BYTES:
+            return Response(
+                {"error": f"Archive too large. Limit is {MAX_ARCHIVE_BYTES // (1024 * 1024)} MB."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        mode = (
+            request.data.get("mode")
+            or request.query_params.get("mode")
+            or "base"
+        ).strip().lower()
+        if mode not in SERVING_MODES:
+            mode = "base"
+
+        # Walk the archive once; keep only modules with testable functions
+        modules: list[dict] = []
+        n_functions = 0
+        try:
+            archive.seek(0)
+            for path, source in iter_archive_modules(archive, archive.name):
+                fn_defs = _extract_function_defs(source)
+                if not fn_defs:
+                    continue
+                if n_functions + len(fn_defs) > MAX_ARCHIVE_FUNCTIONS:
+                    return Response(
+                        {"error": f"Archive has too many functions. Limit is {MAX_ARCHIVE_FUNCTIONS}."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                n_functions += len(fn_defs)
+                modules.append({
+                    "path": path,
+                    "module": module_name_for(path),
+                    "source": source,
+                    "functions": fn_defs,
+                })
+        except ArchiveError as e:
+            return Response({"error": str(e)},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        if not modules:
+            return Response(
+                {"error": "No Python modules with top-level functions found in the archive."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if session.items.count() + len(modules) > session.item_limit:
+            return Response(
+                {"error": f"Archive has {len(modules)} modules; "
+                          "that would exceed the session item limit."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        job_id = uuid.uuid4().hex
+        item_ids = []
+        for mod in modules:
+            item = TestItem.objects.create(
+                session=session,
+                source_code=mod["source"],
+                input_method="upload",
+                source_filename=mod["path"],
+                generated_tests=None,
+                meta={
+                    "origin": "archive",
+                    "strategy": "beam",
+                    "mode": mode,
+                    "archive_job": job_id,
+                    "archive_name": archive.name,
+                    "module": mod["module"],
+                    "functions": len(mod["functions"]),
+                    "fingerprints": {
+                        name: _function_fingerprint(src)
+                        for name, src in mod["functions"]
+                    },
+                    "status": "pending",
+                },
+            )
+            item_ids.append(item.id)
+
+        session.updated_at = timezone.now()
+        session.save(update_fields=["updated_at"])
+
+        print(f"[api] archive job {job_id}: {len(modules)} modules, "
+              f"{n_functions} functions, mode={mode!r}")
+        threading.Thread(
+            target=_run_archive_job,
+            args=(item_ids, modules, mode),
+            daemon=True,
+        ).start()
+
+        return Response(_archive_progress(session, job_id),
+                        status=status.HTTP_202_ACCEPTED)
+
+
+class ArchiveProgressView(APIView):
+    """
+    GET /api/sessions/<session_id>/archive/<job_id>/
+    Progress of an archive upload: total / done / failed modules + items.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, session_id: int, job_id: str):
+        session = get_object_or_404(
+            TestSession, id=session_id, user=request.user
+        )
+        progress = _archive_progress(session, job_id)
+        if not progress["total"]:
+            return Response({"error": "Unknown archive job."},
+                            status=status.HTTP_404_NOT_FOUND)
+        return Response(progress, status=status.HTTP_200_OK)
+
 # -----------------------------
 # Regenerate (sampling; newest item by default)
 # -----------------------------
 
 
+def parse_function_names(raw) -> list[str] | None:
+    """
+    Accept ?functions=a,b (or a JSON list in the body) and return the
+    cleaned list of names, or None when no selection was given.
+    """
+    if not raw:
+        return None
+    if isinstance(raw, str):
+        raw = raw.split(",")
+    names = [str(n).strip() for n in raw if str(n).strip()]
+    return names or None
+
+
 class RegenerateTestView(APIView):
     """
-    POST /api/regenerate/<session_id>/?item_id=<optional>
+    POST /api/regenerate/<session_id>/?item_id=<optional>&functions=a,b
     Regenerate tests for the latest item in the session,
     or for a specific item if item_id is given.
+    If `functions` is given, only those functions get new tests;
+    the others keep their current tests.
     """
     permission_classes = [IsAuthenticated]
 
@@ -442,6 +917,20 @@ class RegenerateTestView(APIView):
 
         previous_tests = item.generated_tests or ""
 
+        functions = parse_function_names(
+            request.query_params.get("functions")
+            or request.data.get("functions")
+        )
+        if functions:
+            known = {name for name, _ in _extract_function_defs(raw_code)}
+            unknown = [n for n in functions if n not in known]
+            if unknown:
+                return Response(
+                    {"error": f"Unknown function(s): {', '.join(unknown)}. "
+                              f"Available: {', '.join(sorted(known))}."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
         try:
             mode = (
                 request.data.get("mode")
@@ -449,17 +938,29 @@ class RegenerateTestView(APIView):
                 or "base"
             ).strip().lower()
 
-            if mode not in {"base", "edge"}:
+            if mode not in SERVING_MODES:
                 mode = "base"
 
             print(
                 f"[api] mode received = {mode!r}, content_type={request.content_type}")
             print(f"[api] data keys = {list(request.data.keys())}")
 
+            # Spares from the first generation only fit the same mode
+            meta = item.meta or {}
+            reservoir = (meta.get("reservoir") or {}
+                         if meta.get("mode", "base") == mode else {})
+            history = meta.get("history") or {}
+            collected: dict = {}
+
             new_tests = regenerate_tests_from_code(
                 raw_code,
                 previous_tests=previous_tests,
                 mode=mode,
+                functions=functions,
+                reservoir=reservoir,
+                history=history,
+                budget_s=settings.GENERATION_BUDGET_S,
+                on_event=lambda kind, data: collect_item_events(collected, kind, data),
             )
 
             # extra safety: make sure we got a string back
@@ -488,10 +989,30 @@ class RegenerateTestView(APIView):
 
         item.generated_tests = new_tests
 
+        # The replaced per-function tests join the item's history
+        names = [name for name, _ in _extract_function_defs(raw_code)]
+        old_by_func = _split_multi_function_tests(previous_tests, names)
+        for name in functions or names:
+            old = old_by_func.get(name)
+            past = history.setdefault(name, [])
+            if old and old not in past:
+                past.append(old)
+                del past[:-REGEN_HISTORY_SIZE]
+
+        # Kept tests stay validated only in the mode they were checked in
+        validated = (set(meta.get("validated") or ())
+                     if meta.get("mode", "base") == mode else set())
+        validated |= validated_functions(collected)
+
         # keep meta as dict, but mark that this came from regeneration
         meta = item.meta or {}
         meta.update({"origin": "regenerate",
-                    "strategy": "sample", "mode": mode})
+                    "strategy": "sample", "mode": mode,
+                    "regenerated": functions or "all",
+                    "history": history,
+                    "validated": sorted(validated),
+                    "degraded": collected.get("degraded", {}),
+                    "reservoir": {fn: tests for fn, tests in reservoir.items() if tests}})
         item.meta = meta
 
         item.save(update_fields=["generated_tests", "meta"])
@@ -536,7 +1057,8 @@ class CreateTestSessionView(generics.CreateAPIView):
             return
 
         try:
-            test_output = generate_test_from_code(raw_code, mode="base",)
+            test_output = generate_test_from_code(
+                raw_code, mode="base", budget_s=settings.GENERATION_BUDGET_S)
             ast.parse(test_output)  # Validate Python syntax
             session.generated_tests = test_output
         except SyntaxError as e: